@@ -15,6 +15,11 @@ a = Analysis(
     ],
     hiddenimports=[
         'stat_formulas_generated',
+        'economy_model',
+        'result_cache',
+        'cps_engine',
+        'run_simulator',
+        'trace_replay',
     ],
     hookspath=[],
     hooksconfig={},
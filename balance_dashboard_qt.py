@@ -7,22 +7,27 @@ import json
 import math
 import os
 import sys
+import threading
+import time
 from typing import Dict
 
+import numpy as np
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QTabWidget, QGroupBox, QLabel, QSpinBox, QDoubleSpinBox,
-    QPushButton, QTableWidget, QTableWidgetItem, QHeaderView,
+    QPushButton, QTableWidget, QTableWidgetItem, QTableView, QHeaderView,
     QMessageBox, QFormLayout, QGridLayout, QScrollArea, QFrame,
     QInputDialog, QComboBox, QPlainTextEdit, QLineEdit, QDockWidget,
-    QSplitter
+    QSplitter, QFileDialog
 )
-from PyQt6.QtCore import Qt, QProcess, QSettings, QByteArray
-from PyQt6.QtGui import QFont, QColor
+from PyQt6.QtCore import (
+    Qt, QProcess, QSettings, QByteArray, QTimer, QAbstractTableModel, QModelIndex, pyqtSignal
+)
+from PyQt6.QtGui import QFont, QColor, QKeySequence, QShortcut
 
 import matplotlib
 matplotlib.use('QtAgg')
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas, NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
 import matplotlib.font_manager as fm
 
@@ -38,6 +43,14 @@ def _get_tools_dir():
 
 sys.path.insert(0, _get_tools_dir())
 import stat_formulas_generated as SF
+import economy_model as EM
+from result_cache import ResultCache
+from cps_engine import ClickRecorder, SOURCE_KEYBOARD, SOURCE_MOUSE, analyze as analyze_clicks
+from trace_replay import replay as replay_traces, tile_trace
+from column_table import Column, ColumnTable, format_number
+from downsample import DownsamplingPlotter
+from edit_history import EditHistory
+from profiler import Profiler
 
 # 한글 폰트 설정 (Windows: Malgun Gothic)
 plt_font_path = None
@@ -73,6 +86,20 @@ def get_config_dir() -> str:
     return os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config')
 
 
+# 시뮬레이션 결과 디스크 캐시 (config 폴더 옆 .cache)
+RESULT_CACHE = ResultCache(
+    os.path.join(os.path.dirname(get_config_dir()), '.cache', 'sim_results.sqlite'),
+    config_dir=get_config_dir(),
+)
+
+# 탭 계산/그리기/표 구간 계측 (보기 → 성능 계측, F9: 다음 동작 cProfile)
+PROFILER = Profiler()
+PROFILE_DIR = os.path.join(os.path.dirname(get_config_dir()), '.cache', 'profiles')
+
+# 스탯 편집기 그래프 레벨/스테이지 상한 (곡선은 화면 폭만큼 다운샘플해서 그림)
+MAX_GRAPH_RANGE = 100_000
+
+
 def load_json(filename: str) -> dict:
     filepath = os.path.join(get_config_dir(), filename)
     with open(filepath, 'r', encoding='utf-8') as f:
@@ -119,6 +146,14 @@ class GameFormulas:
             return SF.calc_boss_hp(stage)
         return SF.calc_monster_hp(stage)
 
+    @staticmethod
+    def monster_hp_safe(stage: int):
+        """monster_hp 와 같되 float 범위를 넘으면 inf (고스테이지 표/차트용)"""
+        try:
+            return GameFormulas.monster_hp(stage)
+        except OverflowError:
+            return float('inf')
+
     @staticmethod
     def is_boss(stage: int) -> bool:
         """보스 스테이지인지"""
@@ -181,6 +216,142 @@ class GameFormulas:
         )
 
 
+# ============================================================
+# 표 모델 (열 배열 기반, 셀 객체 없음)
+# ============================================================
+
+_ALIGNMENT = {
+    'left': Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+    'right': Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+    'center': Qt.AlignmentFlag.AlignCenter,
+}
+
+
+class ColumnTableModel(QAbstractTableModel):
+    """ColumnTable 을 감싸는 모델 - 보이는 셀만 data() 에서 포맷, 정렬은 모델에서"""
+
+    def __init__(self, on_edit=None, parent=None):
+        super().__init__(parent)
+        self.table = ColumnTable()
+        # on_edit(source_row, column_key, text) -> bool (True 면 반영됨)
+        self.on_edit = on_edit
+        self._colors: Dict[str, QColor] = {}
+
+    def _qcolor(self, name):
+        if not name:
+            return None
+        color = self._colors.get(name)
+        if color is None:
+            color = self._colors[name] = QColor(name)
+        return color
+
+    # --- QAbstractTableModel ---
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.table.row_count
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.table.column_count
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.table.text(row, col)
+        if role == Qt.ItemDataRole.EditRole:
+            return str(self.table.value(row, col))
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self._qcolor(self.table.color(row, col))
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return self._qcolor(self.table.background(row, col))
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return _ALIGNMENT.get(self.table.columns[col].align)
+        if role == Qt.ItemDataRole.UserRole:
+            return self.table.value(row, col)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal:
+            if not 0 <= section < self.table.column_count:
+                return None
+            column = self.table.columns[section]
+            if role == Qt.ItemDataRole.DisplayRole:
+                return column.header
+            if role == Qt.ItemDataRole.ToolTipRole:
+                return column.tooltip
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return section + 1
+        return None
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.isValid() and self.table.columns[index.column()].editable:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if role != Qt.ItemDataRole.EditRole or not index.isValid() or self.on_edit is None:
+            return False
+        source = self.table.source_row(index.row())
+        key = self.table.columns[index.column()].key
+        return bool(self.on_edit(source, key, str(value)))
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        def apply():
+            if 0 <= column < self.table.column_count:
+                self.table.sort(column, descending=order == Qt.SortOrder.DescendingOrder)
+            else:
+                self.table.clear_sort()
+        self._relayout(apply)
+
+    def _relayout(self, change):
+        """행 순서가 바뀌는 변경 - 선택/현재 셀이 같은 원본 행을 따라가도록 재매핑"""
+        self.layoutAboutToBeChanged.emit()
+        old = self.persistentIndexList()
+        sources = [(self.table.source_row(i.row()), i.column()) for i in old]
+        result = change()
+        self.changePersistentIndexList(old, [self.index(self.table.view_row(src), col) for src, col in sources])
+        self.layoutChanged.emit()
+        return result
+
+    # --- 일괄 갱신 ---
+
+    def set_columns(self, columns):
+        """열 전체 교체 - 모양이 같으면 dataChanged 한 번, 다르면 모델 리셋"""
+        keys = [c.key for c in columns]
+        rows = len(columns[0].values) if columns else 0
+        if rows != self.table.row_count or keys != [c.key for c in self.table.columns]:
+            self.beginResetModel()
+            self.table.set_columns(columns)
+            self.endResetModel()
+            return
+        first, last = self._relayout(lambda: self.table.set_columns(columns))
+        if last >= first:
+            self.dataChanged.emit(self.index(first, 0), self.index(last, self.columnCount() - 1))
+        self.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, self.columnCount() - 1)
+
+    def refresh_source_row(self, source: int):
+        """원본 행 하나의 값이 바뀌었을 때 그 행만 알림"""
+        row = self.table.view_row(source)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+
+
+def create_table_view(model: ColumnTableModel, sortable: bool = True) -> QTableView:
+    """열 균등 분배 + 고정 행 높이 (보이는 행만 그리도록) 테이블 뷰"""
+    view = QTableView()
+    view.setModel(model)
+    view.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+    view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+    view.verticalHeader().setDefaultSectionSize(22)
+    if sortable:
+        # 처음에는 원본 순서 (지시자 -1), 헤더 클릭 시 모델이 정렬
+        view.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        view.setSortingEnabled(True)
+    return view
+
+
 # ============================================================
 # 스테이지 시뮬레이터 탭
 # ============================================================
@@ -201,7 +372,7 @@ class StageSimulatorTab(QWidget):
         left_layout = QFormLayout(left)
 
         self.target_stage = QSpinBox()
-        self.target_stage.setRange(1, 500)
+        self.target_stage.setRange(1, 10000)
         self.target_stage.setValue(30)
         left_layout.addRow("목표 스테이지:", self.target_stage)
 
@@ -250,10 +421,8 @@ class StageSimulatorTab(QWidget):
         right_layout.addLayout(cards)
 
         # 스테이지별 테이블
-        self.stage_table = QTableWidget()
-        self.stage_table.setColumnCount(5)
-        self.stage_table.setHorizontalHeaderLabels(["스테이지", "몬스터HP", "골드", "누적골드", "보스"])
-        self.stage_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.stage_model = ColumnTableModel()
+        self.stage_table = create_table_view(self.stage_model)
         right_layout.addWidget(self.stage_table)
 
         # 차트
@@ -291,6 +460,7 @@ class StageSimulatorTab(QWidget):
         for spine in self.ax.spines.values():
             spine.set_color('#555555')
 
+    @PROFILER.instrument()
     def _simulate(self):
         target = self.target_stage.value()
 
@@ -298,6 +468,12 @@ class StageSimulatorTab(QWidget):
         stat_values = {k: v.value() for k, v in self.perm_stats.items()}
         perm_config = self.config.get('permanent', {}).get('stats', {})
 
+        r = self._run_simulation(target, stat_values, perm_config)
+        self._show_result(r)
+
+    @RESULT_CACHE.memoize()
+    def _run_simulation(self, target: int, stat_values: dict, perm_config: dict) -> dict:
+        """스테이지 시뮬레이션 계산 (Qt 없음, 결과 캐시에 저장)"""
         # 효과 계산
         def get_effect(stat_id):
             lv = stat_values.get(stat_id, 0)
@@ -314,7 +490,7 @@ class StageSimulatorTab(QWidget):
         start_keyboard = get_effect('start_keyboard')
 
         # 목표 스테이지 몬스터 HP
-        target_hp = GameFormulas.monster_hp(target)
+        target_hp = GameFormulas.monster_hp_safe(target)
 
         # 예상 데미지 (키보드 공격력 = 10 + 시작 보너스 가정)
         base_power = 10 + int(start_keyboard)
@@ -328,52 +504,51 @@ class StageSimulatorTab(QWidget):
         dps = dmg['expected'] * clicks_per_sec
         time_to_kill = target_hp / dps if dps > 0 else float('inf')
 
-        # 골드 시뮬레이션
-        total_gold = int(start_gold)
-        stage_data = []
-
-        for stage in range(1, target + 1):
-            gold = GameFormulas.monster_gold(stage, int(gold_flat), gold_multi)
-            total_gold += gold
-            is_boss = GameFormulas.is_boss(stage)
-            stage_data.append({
-                'stage': stage,
-                'hp': GameFormulas.monster_hp(stage),
-                'gold': gold,
-                'total': total_gold,
-                'boss': is_boss
-            })
+        # 골드 시뮬레이션 (열 배열)
+        stages = np.arange(1, target + 1)
+        hps = [GameFormulas.monster_hp_safe(int(stage)) for stage in stages]
+        golds = np.array([GameFormulas.monster_gold(int(stage), int(gold_flat), gold_multi) for stage in stages],
+                         dtype=np.int64)
+        totals = int(start_gold) + np.cumsum(golds)
+        bosses = stages % GameFormulas.BOSS_INTERVAL == 0
+        total_gold = int(totals[-1])
 
         # 크리스탈 (보스 처치 시)
         boss_count = target // 10
         crystals = boss_count * 10  # 기본 10개씩
 
+        return {'target_hp': target_hp, 'dps': dps, 'time_to_kill': time_to_kill, 'stages': stages, 'hps': hps,
+                'golds': golds, 'totals': totals, 'bosses': bosses, 'total_gold': total_gold, 'crystals': crystals}
+
+    def _show_result(self, r: dict):
+        target_hp, dps, total_gold, crystals = r['target_hp'], r['dps'], r['total_gold'], r['crystals']
+        stages, hps, golds, totals, bosses = r['stages'], r['hps'], r['golds'], r['totals'], r['bosses']
+
         # 결과 업데이트
-        self.hp_label.findChild(QLabel, "value").setText(f"{target_hp:,}")
+        self.hp_label.findChild(QLabel, "value").setText(format_number(target_hp))
         self.dps_label.findChild(QLabel, "value").setText(f"{dps:,.0f}/s")
         self.gold_label.findChild(QLabel, "value").setText(f"{total_gold:,}")
         self.crystal_label.findChild(QLabel, "value").setText(f"{crystals}")
 
-        # 테이블 업데이트 (10단위만)
-        filtered = [d for d in stage_data if d['stage'] % 5 == 0 or d['stage'] == target]
-        self.stage_table.setRowCount(len(filtered))
-        for i, d in enumerate(filtered):
-            self.stage_table.setItem(i, 0, QTableWidgetItem(str(d['stage'])))
-            self.stage_table.setItem(i, 1, QTableWidgetItem(f"{d['hp']:,}"))
-            self.stage_table.setItem(i, 2, QTableWidgetItem(f"{d['gold']:,}"))
-            self.stage_table.setItem(i, 3, QTableWidgetItem(f"{d['total']:,}"))
-            self.stage_table.setItem(i, 4, QTableWidgetItem("BOSS" if d['boss'] else ""))
+        # 테이블 업데이트 (전 스테이지 - 보이는 행만 포맷됨)
+        self.stage_model.set_columns([
+            Column('stage', "스테이지", stages, align='right'),
+            Column('hp', "몬스터HP", hps, fmt=format_number, align='right'),
+            Column('gold', "골드", golds, fmt=format_number, align='right'),
+            Column('total', "누적골드", totals, fmt=format_number, align='right'),
+            Column('boss', "보스", bosses, fmt=lambda b: "BOSS" if b else "",
+                   color=lambda b: '#ff6b6b' if b else None, align='center'),
+        ])
 
-        # 차트
+        # 차트 (float 범위를 넘은 HP 는 그리지 않음)
         self.ax.clear()
         self._style_chart()
-        stages = [d['stage'] for d in stage_data]
-        hps = [d['hp'] for d in stage_data]
-        golds = [d['total'] for d in stage_data]
+        hp_line = np.array([float(h) for h in hps])
+        hp_line[~np.isfinite(hp_line)] = np.nan
 
-        self.ax.plot(stages, hps, 'r-', label='Monster HP')
+        self.ax.plot(stages, hp_line, 'r-', label='Monster HP')
         ax2 = self.ax.twinx()
-        ax2.plot(stages, golds, 'g--', label='Total Gold')
+        ax2.plot(stages, totals, 'g--', label='Total Gold')
         ax2.tick_params(colors='#b0b0b0')
 
         self.ax.set_xlabel('Stage', color='#b0b0b0')
@@ -483,17 +658,13 @@ class DPSCalculatorTab(QWidget):
         right_layout.addLayout(cards)
 
         # 계산 과정
-        self.steps_table = QTableWidget()
-        self.steps_table.setColumnCount(3)
-        self.steps_table.setHorizontalHeaderLabels(["단계", "계산", "결과"])
-        self.steps_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.steps_model = ColumnTableModel()
+        self.steps_table = create_table_view(self.steps_model, sortable=False)
         right_layout.addWidget(self.steps_table)
 
         # 몬스터 처치 시간
-        self.kill_table = QTableWidget()
-        self.kill_table.setColumnCount(3)
-        self.kill_table.setHorizontalHeaderLabels(["스테이지", "몬스터HP", "처치시간"])
-        self.kill_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.kill_model = ColumnTableModel()
+        self.kill_table = create_table_view(self.kill_model)
         right_layout.addWidget(self.kill_table)
 
         layout.addWidget(right, 2)
@@ -511,6 +682,7 @@ class DPSCalculatorTab(QWidget):
         layout.addWidget(value_label)
         return card
 
+    @PROFILER.instrument()
     def _calculate(self):
         dmg = GameFormulas.calc_damage(
             self.base_power.value(),
@@ -541,21 +713,22 @@ class DPSCalculatorTab(QWidget):
             ("콤보", f"× {dmg['combo_multi']:.2f}", f"{dmg['expected']:.1f}"),
         ]
 
-        self.steps_table.setRowCount(len(steps))
-        for i, (name, calc, result) in enumerate(steps):
-            self.steps_table.setItem(i, 0, QTableWidgetItem(name))
-            self.steps_table.setItem(i, 1, QTableWidgetItem(calc))
-            self.steps_table.setItem(i, 2, QTableWidgetItem(result))
+        names, calcs, results = zip(*steps)
+        self.steps_model.set_columns([
+            Column('step', "단계", names),
+            Column('calc', "계산", calcs),
+            Column('result', "결과", results),
+        ])
 
         # 몬스터 처치 시간
         test_stages = [1, 10, 20, 30, 50, 100]
-        self.kill_table.setRowCount(len(test_stages))
-        for i, stage in enumerate(test_stages):
-            hp = GameFormulas.monster_hp(stage)
-            time_to_kill = hp / dps if dps > 0 else float('inf')
-            self.kill_table.setItem(i, 0, QTableWidgetItem(str(stage)))
-            self.kill_table.setItem(i, 1, QTableWidgetItem(f"{hp:,}"))
-            self.kill_table.setItem(i, 2, QTableWidgetItem(f"{time_to_kill:.1f}초"))
+        hps = [GameFormulas.monster_hp(stage) for stage in test_stages]
+        times = [hp / dps if dps > 0 else float('inf') for hp in hps]
+        self.kill_model.set_columns([
+            Column('stage', "스테이지", test_stages, align='right'),
+            Column('hp', "몬스터HP", hps, fmt=format_number, align='right'),
+            Column('time', "처치시간", times, fmt="{:.1f}초", align='right'),
+        ])
 
 
 # ============================================================
@@ -591,14 +764,11 @@ class InvestmentGuideTab(QWidget):
         layout.addWidget(input_group)
 
         # 결과 테이블
-        self.result_table = QTableWidget()
-        self.result_table.setColumnCount(6)
-        self.result_table.setHorizontalHeaderLabels([
-            "스탯", "현재Lv", "다음비용", "효과", "효율(효과/비용)", "추천"
-        ])
-        self.result_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.result_model = ColumnTableModel()
+        self.result_table = create_table_view(self.result_model)
         layout.addWidget(self.result_table)
 
+    @PROFILER.instrument()
     def _calculate(self):
         budget = self.crystals.value()
         perm_config = self.config.get('permanent', {}).get('stats', {})
@@ -633,19 +803,19 @@ class InvestmentGuideTab(QWidget):
         results.sort(key=lambda x: x['efficiency'], reverse=True)
 
         # 테이블 업데이트
-        self.result_table.setRowCount(len(results))
-        for i, r in enumerate(results):
-            self.result_table.setItem(i, 0, QTableWidgetItem(r['name']))
-            self.result_table.setItem(i, 1, QTableWidgetItem(str(r['current_lv'])))
-            self.result_table.setItem(i, 2, QTableWidgetItem(f"{r['next_cost']:,}"))
-            self.result_table.setItem(i, 3, QTableWidgetItem(f"{r['effect']}"))
-            self.result_table.setItem(i, 4, QTableWidgetItem(f"{r['efficiency']:.4f}"))
-
-            recommend = "구매 가능" if r['affordable'] else "재화 부족"
-            item = QTableWidgetItem(recommend)
-            if r['affordable']:
-                item.setBackground(QColor("#28a745"))
-            self.result_table.setItem(i, 5, item)
+        def col(key):
+            return [r[key] for r in results]
+
+        self.result_model.set_columns([
+            Column('name', "스탯", col('name')),
+            Column('current_lv', "현재Lv", col('current_lv'), align='right'),
+            Column('next_cost', "다음비용", col('next_cost'), fmt=format_number, align='right'),
+            Column('effect', "효과", col('effect'), align='right'),
+            Column('efficiency', "효율(효과/비용)", col('efficiency'), fmt="{:.4f}", align='right'),
+            Column('affordable', "추천", col('affordable'),
+                   fmt=lambda ok: "구매 가능" if ok else "재화 부족",
+                   background=lambda ok: "#28a745" if ok else None),
+        ])
 
 
 # ============================================================
@@ -793,7 +963,7 @@ class StatEditorTab(QWidget):
         super().__init__()
         self.config = config
         self._file_values = {}  # {(type, id): {param: value}} 파일 원본값
-        self._current_values = {}  # {(type, id): {param: value}} 현재 편집값
+        self.history = EditHistory({})  # 현재 편집값 + 실행 취소 기록 (_load_all_from_file 에서 새로 생성)
         self._stat_rows = []  # [(type, id, stat_dict), ...]
         self.settings = QSettings("DeskWarrior", "BalanceDashboard")  # 레이아웃 상태 저장용
         self._load_all_from_file()
@@ -803,7 +973,6 @@ class StatEditorTab(QWidget):
     def _load_all_from_file(self):
         """파일에서 모든 원본값 로드"""
         self._file_values.clear()
-        self._current_values.clear()
 
         for stype, filename in [('permanent', 'PermanentStatGrowth.json'),
                                  ('ingame', 'InGameStatGrowth.json')]:
@@ -818,10 +987,17 @@ class StatEditorTab(QWidget):
                         'effect_per_level': stat.get('effect_per_level', 1),
                     }
                     self._file_values[(stype, sid)] = vals.copy()
-                    self._current_values[(stype, sid)] = vals.copy()
             except:
                 pass
 
+        # 저장/다시 읽기 후에는 파일값이 새 원본 (이전 기록은 버림)
+        self.history = EditHistory(self._file_values)
+
+    @property
+    def _current_values(self):
+        """현재 편집값 {(type, id): {param: value}} - 읽기 전용, 변경은 self.history 로"""
+        return self.history.state
+
     def _setup_ui(self):
         layout = QVBoxLayout(self)
 
@@ -841,20 +1017,10 @@ class StatEditorTab(QWidget):
         left = QGroupBox("스탯 편집")
         left_layout = QVBoxLayout(left)
 
-        self.stat_table = QTableWidget()
-        self.stat_table.setColumnCount(6)
-        self.stat_table.setHorizontalHeaderLabels([
-            "스탯명", "초기비용", "증가율", "급등배수", "급등주기", "Lv당효과"
-        ])
-        self.stat_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        self.stat_table.cellChanged.connect(self._on_cell_changed)
-        self.stat_table.itemSelectionChanged.connect(self._on_selection_changed)
-
-        # 헤더 툴팁 설정
-        for col, tooltip in self.HEADER_TOOLTIPS.items():
-            header_item = self.stat_table.horizontalHeaderItem(col)
-            if header_item:
-                header_item.setToolTip(tooltip)
+        # 헤더 툴팁은 열 정의(HEADER_TOOLTIPS)에서 모델이 제공
+        self.stat_model = ColumnTableModel(on_edit=self._on_cell_edited)
+        self.stat_table = create_table_view(self.stat_model)
+        self.stat_table.selectionModel().currentChanged.connect(lambda *_: self._on_selection_changed())
 
         left_layout.addWidget(self.stat_table)
 
@@ -903,6 +1069,38 @@ class StatEditorTab(QWidget):
 
         left_layout.addLayout(btn_layout)
 
+        # 편집 기록 (실행 취소/다시 실행/체크포인트)
+        history_layout = QHBoxLayout()
+
+        self.undo_btn = QPushButton("↶ 취소")
+        self.undo_btn.clicked.connect(self._undo)
+        history_layout.addWidget(self.undo_btn)
+
+        self.redo_btn = QPushButton("↷ 다시")
+        self.redo_btn.clicked.connect(self._redo)
+        history_layout.addWidget(self.redo_btn)
+
+        checkpoint_btn = QPushButton("📌 저장점")
+        checkpoint_btn.setToolTip("현재 편집 상태에 이름 붙이기")
+        checkpoint_btn.clicked.connect(self._add_checkpoint)
+        history_layout.addWidget(checkpoint_btn)
+
+        self.checkpoint_combo = QComboBox()
+        self.checkpoint_combo.currentIndexChanged.connect(self._restore_checkpoint)
+        history_layout.addWidget(self.checkpoint_combo, 1)
+
+        self.history_label = QLabel("")
+        self.history_label.setStyleSheet("color: #888; font-size: 10px;")
+        history_layout.addWidget(self.history_label)
+
+        left_layout.addLayout(history_layout)
+
+        # 이 탭이 보일 때만 (다른 탭의 입력 칸과 겹치지 않게)
+        for key, slot in [(QKeySequence.StandardKey.Undo, self._undo), (QKeySequence.StandardKey.Redo, self._redo)]:
+            shortcut = QShortcut(QKeySequence(key), self)
+            shortcut.setContext(Qt.ShortcutContext.WidgetWithChildrenShortcut)
+            shortcut.activated.connect(slot)
+
         # 변경 요약 (테이블 채우기 전에 생성)
         self.change_label = QLabel("변경 없음")
         self.change_label.setStyleSheet("color: #888; font-size: 10px;")
@@ -924,7 +1122,8 @@ class StatEditorTab(QWidget):
         self.graph_type_combo.addItems([
             "📊 비용/CPS (기본)",
             "💰 골드/크리스탈",
-            "📈 통합 (전체 적용)"
+            "📈 통합 (전체 적용)",
+            "🎯 민감도 (±30%)"
         ])
         self.graph_type_combo.currentIndexChanged.connect(self._update_graph)
         self.graph_type_combo.setMinimumWidth(150)
@@ -936,7 +1135,7 @@ class StatEditorTab(QWidget):
         param_layout = QHBoxLayout()
         param_layout.addWidget(QLabel("업글Lv:"))
         self.spin_level = QSpinBox()
-        self.spin_level.setRange(1, 100)
+        self.spin_level.setRange(1, MAX_GRAPH_RANGE)
         self.spin_level.setValue(30)
         self.spin_level.valueChanged.connect(self._update_graph)
         param_layout.addWidget(self.spin_level)
@@ -950,7 +1149,7 @@ class StatEditorTab(QWidget):
 
         param_layout.addWidget(QLabel("스테이지:"))
         self.spin_stage = QSpinBox()
-        self.spin_stage.setRange(1, 500)
+        self.spin_stage.setRange(1, MAX_GRAPH_RANGE)
         self.spin_stage.setValue(50)
         self.spin_stage.valueChanged.connect(self._update_graph)
         param_layout.addWidget(self.spin_stage)
@@ -958,9 +1157,12 @@ class StatEditorTab(QWidget):
         param_layout.addStretch()
         right_layout.addLayout(param_layout)
 
-        # 2x2 그래프 그리드
+        # 2x2 그래프 그리드 (확대/이동 시 보이는 구간만 다시 다운샘플)
         self.figure = Figure(figsize=(8, 6), facecolor='#1e1e2e')
         self.canvas = FigureCanvas(self.figure)
+        self.plotter = DownsamplingPlotter()
+        self.plotter.connect(self.canvas)
+        right_layout.addWidget(NavigationToolbar(self.canvas, self))
         right_layout.addWidget(self.canvas)
 
         # 정보
@@ -977,6 +1179,7 @@ class StatEditorTab(QWidget):
         layout.addWidget(self.splitter)
 
         self._selected_key = None  # (type, id)
+        self._update_history_controls()
 
     def _save_splitter_state(self):
         """splitter 상태 저장"""
@@ -994,61 +1197,59 @@ class StatEditorTab(QWidget):
             except (ValueError, TypeError):
                 pass  # 복원 실패 시 기본값 사용
 
+    @PROFILER.instrument()
     def _populate_table(self):
-        """테이블 채우기 - 원본/수정 비교 색상 표시"""
-        self.stat_table.blockSignals(True)
-        self.stat_table.setRowCount(0)
+        """테이블 채우기 - 원본/수정 비교 색상 표시 (모양이 같으면 dataChanged 한 번)"""
         self._stat_rows = []
+        names = []
+        params = {param: ([], [], []) for param in self.PARAM_KEYS}  # 값, 표시, 색상
 
         for stype in ['permanent', 'ingame']:
             stats = self.config.get(stype, {}).get('stats', {})
             for sid, stat in stats.items():
                 key = (stype, sid)
                 self._stat_rows.append((stype, sid, stat))
-                row = self.stat_table.rowCount()
-                self.stat_table.insertRow(row)
 
                 # 이름 (읽기 전용)
                 prefix = "🔷" if stype == 'permanent' else "🟡"
-                name_item = QTableWidgetItem(f"{prefix} {stat.get('name', sid)}")
-                name_item.setFlags(name_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self.stat_table.setItem(row, self.COL_NAME, name_item)
+                names.append(f"{prefix} {stat.get('name', sid)}")
 
                 # 파라미터들 (편집 가능)
                 file_vals = self._file_values.get(key, {})
                 curr_vals = self._current_values.get(key, {})
 
-                for col, param in enumerate(self.PARAM_KEYS, start=1):
+                for param in self.PARAM_KEYS:
                     file_val = file_vals.get(param, 1)
                     curr_val = curr_vals.get(param, file_val)
+                    values, labels, colors = params[param]
+                    values.append(curr_val)
 
                     # 원본과 다르면 "원본→수정" 형식, 같으면 값만
                     if abs(float(file_val) - float(curr_val)) > 0.0001:
-                        text = f"{file_val}→{curr_val}"
-                        color = QColor("#ff6b6b")
+                        labels.append(f"{file_val}→{curr_val}")
+                        colors.append("#ff6b6b")
                     else:
-                        text = str(curr_val)
-                        color = QColor("#4a90d9")
-
-                    item = QTableWidgetItem(text)
-                    item.setForeground(color)
-                    self.stat_table.setItem(row, col, item)
-
-        self.stat_table.blockSignals(False)
+                        labels.append(str(curr_val))
+                        colors.append("#4a90d9")
+
+        headers = ["스탯명", "초기비용", "증가율", "급등배수", "급등주기", "Lv당효과"]
+        columns = [Column('name', headers[self.COL_NAME], names, tooltip=self.HEADER_TOOLTIPS[self.COL_NAME])]
+        for col, param in enumerate(self.PARAM_KEYS, start=1):
+            values, labels, colors = params[param]
+            columns.append(Column(param, headers[col], values, labels=labels, color=colors,
+                                  tooltip=self.HEADER_TOOLTIPS[col], editable=True, align='right'))
+        self.stat_model.set_columns(columns)
         self._update_change_summary()
 
-    def _on_cell_changed(self, row, col):
-        """셀 편집 시 호출"""
-        if col == 0 or row >= len(self._stat_rows):
-            return
+    def _on_cell_edited(self, source_row: int, param: str, text: str) -> bool:
+        """셀 편집 시 호출 (모델 setData) - 반영되면 True"""
+        if param not in self.PARAM_KEYS or source_row >= len(self._stat_rows):
+            return False
 
-        stype, sid, _ = self._stat_rows[row]
+        stype, sid, _ = self._stat_rows[source_row]
         key = (stype, sid)
-        param = self.PARAM_KEYS[col - 1]
 
         # 값 파싱 (→ 포함 시 뒤의 값만)
-        item = self.stat_table.item(row, col)
-        text = item.text()
         if '→' in text:
             text = text.split('→')[-1]
 
@@ -1057,37 +1258,77 @@ class StatEditorTab(QWidget):
                 new_val = int(float(text))
             else:
                 new_val = float(text)
-        except:
-            # 파싱 실패 시 원래 값 복원
-            self._populate_table()
-            return
+        except ValueError:
+            # 파싱 실패 시 반영하지 않음 (뷰는 원래 값 유지)
+            return False
 
-        # 현재값 업데이트
-        if key not in self._current_values:
-            self._current_values[key] = self._file_values.get(key, {}).copy()
-        self._current_values[key][param] = new_val
+        # 현재값 업데이트 (같은 값이면 기록하지 않음)
+        self.history.set(key, param, new_val)
 
         # 선택 키 업데이트 (편집한 행을 선택 상태로)
         self._selected_key = key
 
-        # 테이블 갱신 (색상 업데이트) - 시그널 차단 상태로
-        self._populate_table()
-
-        # 행 선택 복원 (시그널 차단하여 _on_selection_changed 방지)
-        self.stat_table.blockSignals(True)
-        self.stat_table.selectRow(row)
-        self.stat_table.blockSignals(False)
+        # 테이블 갱신 (색상 업데이트) - 선택은 모델이 유지
+        self._refresh_after_edit()
+        return True
 
-        # 그래프 갱신 (항상) - 디버그 출력 추가
-        print(f"[DEBUG] _on_cell_changed: key={key}, param={param}, new_val={new_val}")
-        print(f"[DEBUG] file_vals={self._file_values.get(key, {})}")
-        print(f"[DEBUG] curr_vals={self._current_values.get(key, {})}")
+    def _refresh_after_edit(self, entry=None):
+        """편집/취소/복원 후 테이블·그래프·기록 버튼 갱신 (entry: 바뀐 셀의 스탯을 선택)"""
+        if entry is not None and entry.edits:
+            self._selected_key = entry.edits[-1].key
+        self._populate_table()
         self._update_graph()
+        self._update_history_controls()
+
+    def _undo(self):
+        entry = self.history.undo()
+        if entry is not None:
+            self._refresh_after_edit(entry)
+
+    def _redo(self):
+        entry = self.history.redo()
+        if entry is not None:
+            self._refresh_after_edit(entry)
+
+    def _add_checkpoint(self):
+        """현재 상태에 이름 붙이기"""
+        default = f"체크포인트 {len(self.history.checkpoints) + 1}"
+        name, ok = QInputDialog.getText(self, "체크포인트", "이름:", text=default)
+        name = name.strip()
+        if ok and name:
+            self.history.checkpoint(name)
+            self._update_history_controls()
+
+    def _restore_checkpoint(self, index: int):
+        """콤보에서 고른 체크포인트로 (복원도 실행 취소 가능)"""
+        if index <= 0:
+            return
+        name = self.checkpoint_combo.itemText(index)
+        self.checkpoint_combo.setCurrentIndex(0)
+        if self.history.restore(name):
+            self._refresh_after_edit(self.history.entry)
+
+    def _update_history_controls(self):
+        history = self.history
+        self.undo_btn.setEnabled(history.can_undo)
+        self.redo_btn.setEnabled(history.can_redo)
+        self.undo_btn.setToolTip(f"실행 취소: {history.entry.label}" if history.can_undo else "실행 취소 (Ctrl+Z)")
+        self.redo_btn.setToolTip(f"다시 실행: {history.entries[history.cursor + 1].label}"
+                                 if history.can_redo else "다시 실행 (Ctrl+Y)")
+        self.history_label.setText(f"기록 {history.cursor}/{len(history.entries) - 1}")
+
+        self.checkpoint_combo.blockSignals(True)
+        self.checkpoint_combo.clear()
+        self.checkpoint_combo.addItem("📌 체크포인트 복원…")
+        self.checkpoint_combo.addItems(list(history.checkpoints))
+        self.checkpoint_combo.setEnabled(bool(history.checkpoints))
+        self.checkpoint_combo.blockSignals(False)
 
     def _on_selection_changed(self):
         """행 선택 변경"""
-        row = self.stat_table.currentRow()
-        col = self.stat_table.currentColumn()
+        index = self.stat_table.currentIndex()
+        row = self.stat_model.table.source_row(index.row()) if index.isValid() else -1
+        col = index.column() if index.isValid() else -1
 
         if 0 <= row < len(self._stat_rows):
             stype, sid, _ = self._stat_rows[row]
@@ -1097,6 +1338,16 @@ class StatEditorTab(QWidget):
         # 스탯/파라미터 설명 업데이트
         self._update_param_description(row, col)
 
+    @staticmethod
+    def _cost_params(vals: dict) -> np.ndarray:
+        """비용 파라미터 (base_cost, growth_rate, multiplier, softcap_interval) - 값이 없으면 기본값"""
+        return np.array([float(vals.get(k, EM.PARAM_DEFAULTS[k])) for k in EM.COST_PARAM_KEYS])
+
+    def _total_costs(self, values, levels: np.ndarray) -> np.ndarray:
+        """여러 스탯의 레벨별 업그레이드 비용 합 (레벨 배열 길이)"""
+        params = np.array([self._cost_params(v) for v in values]).reshape(-1, len(EM.COST_PARAM_KEYS))
+        return EM.upgrade_costs(params, levels, truncate=False).sum(axis=0)
+
     def _calc_upgrade_cost(self, base_cost, growth_rate, multiplier, softcap_interval, level):
         """업그레이드 비용 계산: cost = base × (1 + level × growth_rate) × multiplier^(level / softcap_interval)"""
         import math
@@ -1137,132 +1388,89 @@ class StatEditorTab(QWidget):
             self.desc_detail.setText("테이블의 스탯 이름을 클릭하면 해당 스탯의 상세 설명과 데미지 공식 적용 위치가 표시됩니다.")
             self.desc_range.setText("")
 
+    @RESULT_CACHE.memoize()
     def _calc_sensitivity_analysis(self, file_vals: dict, max_level: int, max_stage: int, base_power: int):
-        """파라미터 민감도 분석 계산"""
+        """파라미터 민감도 분석 계산 (전 파라미터 × 전 변동폭을 한 번에 배열 계산)"""
         results = {}
-        variation_range = [-0.3, -0.2, -0.1, 0, 0.1, 0.2, 0.3]  # ±30% 변동
+        variation_range = np.array([-0.3, -0.2, -0.1, 0, 0.1, 0.2, 0.3])  # ±30% 변동
+
+        base_row = np.array([file_vals.get(k, EM.PARAM_DEFAULTS[k]) for k in self.PARAM_KEYS], dtype=np.float64)
 
         # 기준값 계산 (현재 파라미터로 Lv30 누적 비용)
-        base_cumulative = sum(
-            self._calc_upgrade_cost(
-                file_vals.get('base_cost', 1),
-                file_vals.get('growth_rate', 0.5),
-                file_vals.get('multiplier', 1.5),
-                file_vals.get('softcap_interval', 10),
-                lv
-            ) for lv in range(1, max_level + 1)
-        )
+        base_cumulative = float(EM.cumulative_costs(base_row, max_level, truncate=False))
 
-        for param_key in self.PARAM_KEYS:
-            param_results = []
-            base_val = file_vals.get(param_key, 1)
-
-            for var in variation_range:
-                # 파라미터 변동 적용
-                modified_vals = file_vals.copy()
-                modified_vals[param_key] = base_val * (1 + var)
-
-                # 누적 비용 계산
-                cumulative = sum(
-                    self._calc_upgrade_cost(
-                        modified_vals.get('base_cost', 1),
-                        modified_vals.get('growth_rate', 0.5),
-                        modified_vals.get('multiplier', 1.5),
-                        modified_vals.get('softcap_interval', 10),
-                        lv
-                    ) for lv in range(1, max_level + 1)
-                )
+        # (파라미터, 변동폭, 파라미터값) 그리드: i번째 파라미터만 변동
+        grid = np.tile(base_row, (len(self.PARAM_KEYS), len(variation_range), 1))
+        for i in range(len(self.PARAM_KEYS)):
+            grid[i, :, i] = base_row[i] * (1 + variation_range)
+        cumulative = EM.cumulative_costs(grid, max_level, truncate=False)
 
-                # 기준 대비 변화율
-                change_pct = ((cumulative - base_cumulative) / base_cumulative * 100) if base_cumulative > 0 else 0
-                param_results.append({
+        # 기준 대비 변화율
+        if base_cumulative > 0:
+            change_pct = (cumulative - base_cumulative) / base_cumulative * 100
+        else:
+            change_pct = np.zeros_like(cumulative)
+
+        for i, param_key in enumerate(self.PARAM_KEYS):
+            param_results = [
+                {
                     'variation': var * 100,
-                    'cumulative': cumulative,
-                    'change_pct': change_pct
-                })
+                    'cumulative': float(cumulative[i, j]),
+                    'change_pct': float(change_pct[i, j])
+                }
+                for j, var in enumerate(variation_range)
+            ]
 
             # 민감도 점수 (±30% 변동 시 비용 변화율의 절대값)
-            max_change = max(abs(r['change_pct']) for r in param_results)
             results[param_key] = {
                 'data': param_results,
-                'sensitivity': max_change
+                'sensitivity': float(np.abs(change_pct[i]).max())
             }
 
         return results
 
-    def _update_graph(self):
-        """선택된 스탯의 그래프 갱신 (2x2 그리드)"""
-        self.figure.clear()
-
-        if not self._selected_key:
-            self.canvas.draw()
-            self.info_label.setText("스탯을 선택하세요")
-            return
-
-        stype, sid = self._selected_key
-        file_vals = self._file_values.get(self._selected_key, {})
-        curr_vals = self._current_values.get(self._selected_key, {})
+    @PROFILER.instrument()
+    @np.errstate(over='ignore', invalid='ignore', divide='ignore')
+    def _compute_curves(self, key, graph_type: int, max_level: int, base_power: int, max_stage: int) -> dict:
+        """그래프 곡선 계산 (Qt/matplotlib 없음) - 편집 기록 항목별로 메모됨
 
-        max_level = self.spin_level.value()
-        base_power = self.spin_power.value()
-        max_stage = self.spin_stage.value()
+        원본(file_*)/수정(curr_*) 쌍과 정보 표시용 값을 담은 dict
+        """
+        stype, sid = key
+        file_vals = self._file_values.get(key, {})
+        curr_vals = self._current_values.get(key, {})
         time_limit = 30
+        c = {}
 
-        # 비용 곡선 계산 (레벨별)
-        levels = list(range(1, max_level + 1))
-
-        file_costs = []
-        curr_costs = []
-        for lv in levels:
-            file_cost = self._calc_upgrade_cost(
-                file_vals.get('base_cost', 1),
-                file_vals.get('growth_rate', 0.5),
-                file_vals.get('multiplier', 1.5),
-                file_vals.get('softcap_interval', 10),
-                lv
-            )
-            curr_cost = self._calc_upgrade_cost(
-                curr_vals.get('base_cost', 1),
-                curr_vals.get('growth_rate', 0.5),
-                curr_vals.get('multiplier', 1.5),
-                curr_vals.get('softcap_interval', 10),
-                lv
-            )
-            file_costs.append(file_cost)
-            curr_costs.append(curr_cost)
+        # 비용 곡선 계산 (레벨별 배열, float 범위를 넘으면 inf - 그리지 않음)
+        levels = np.arange(1, max_level + 1)
+        stages = np.arange(1, max_stage + 1)
+        c['levels'], c['stages'] = levels, stages
+        file_costs = EM.upgrade_costs(self._cost_params(file_vals), levels, truncate=False)
+        curr_costs = EM.upgrade_costs(self._cost_params(curr_vals), levels, truncate=False)
 
         # 누적 비용
-        file_cumulative = []
-        curr_cumulative = []
-        file_sum, curr_sum = 0, 0
-        for fc, cc in zip(file_costs, curr_costs):
-            file_sum += fc
-            curr_sum += cc
-            file_cumulative.append(file_sum)
-            curr_cumulative.append(curr_sum)
-
-        # CPS 계산 헬퍼
+        file_cumulative = np.cumsum(file_costs)
+        curr_cumulative = np.cumsum(curr_costs)
+
+        # CPS 계산 헬퍼 (lv 는 스칼라/배열)
         def calc_cps_for_level(vals, lv):
             effect = vals.get('effect_per_level', 1) * lv
             dmg = base_power
-            hp = GameFormulas.monster_hp(max_stage)
+            hp = EM.stage_hp(max_stage)
             if sid == 'base_attack':
                 dmg += effect
             elif sid == 'attack_percent':
                 dmg *= (1 + effect / 100)
             elif sid == 'crit_chance':
-                dmg *= (1 + min(0.1 + effect/100, 1.0))
+                dmg *= (1 + np.minimum(0.1 + effect/100, 1.0))
             elif sid == 'multi_hit':
                 dmg *= (1 + effect / 100)
             elif sid == 'time_extend':
-                return hp / max(dmg, 1) / (time_limit + effect)
+                return hp / np.maximum(dmg, 1) / (time_limit + effect)
             else:
                 dmg += effect * 0.5
-            return hp / max(dmg, 1) / time_limit
-
-        # 그래프 타입에 따라 다른 그래프 표시
-        graph_type = self.graph_type_combo.currentIndex()
-        stages = list(range(1, min(max_stage + 1, 101)))
+            return hp / np.maximum(dmg, 1) / time_limit
 
         # 공통 헬퍼 함수
         def calc_damage(effect):
@@ -1284,68 +1492,22 @@ class StatEditorTab(QWidget):
                 return time_limit + effect
             return time_limit
 
-        def setup_axes(axes_list):
-            for ax in axes_list:
-                ax.set_facecolor('#1e1e2e')
-                ax.tick_params(colors='#888', labelsize=7)
-                for spine in ax.spines.values():
-                    spine.set_color('#444')
-
         file_effect_val = file_vals.get('effect_per_level', 1) * max_level
         curr_effect_val = curr_vals.get('effect_per_level', 1) * max_level
 
         if graph_type == 0:  # 📊 비용/CPS (기본)
-            axes = self.figure.subplots(2, 2)
-            setup_axes([axes[0,0], axes[0,1], axes[1,0], axes[1,1]])
-
-            # (0,0) 업그레이드 비용
-            axes[0,0].plot(levels, file_costs, color='#4a90d9', linewidth=1.5, label='원본')
-            axes[0,0].plot(levels, curr_costs, color='#ff6b6b', linewidth=1.5, label='수정', linestyle='--')
-            axes[0,0].set_title('업그레이드 비용', color='#ddd', fontsize=9)
-            axes[0,0].set_xlabel('레벨', color='#888', fontsize=8)
-            axes[0,0].legend(fontsize=6, facecolor='#2a2a3a', labelcolor='#ddd')
-            axes[0,0].grid(True, alpha=0.2)
-
-            # (0,1) 누적 비용
-            axes[0,1].plot(levels, file_cumulative, color='#4a90d9', linewidth=1.5, label='원본')
-            axes[0,1].plot(levels, curr_cumulative, color='#ff6b6b', linewidth=1.5, label='수정', linestyle='--')
-            axes[0,1].set_title('누적 비용', color='#ddd', fontsize=9)
-            axes[0,1].set_xlabel('레벨', color='#888', fontsize=8)
-            axes[0,1].legend(fontsize=6, facecolor='#2a2a3a', labelcolor='#ddd')
-            axes[0,1].grid(True, alpha=0.2)
-
-            # (1,0) CPS 곡선 (레벨별)
-            file_cps_by_level = [calc_cps_for_level(file_vals, lv) for lv in levels]
-            curr_cps_by_level = [calc_cps_for_level(curr_vals, lv) for lv in levels]
-            axes[1,0].plot(levels, file_cps_by_level, color='#4a90d9', linewidth=1.5, label='원본')
-            axes[1,0].plot(levels, curr_cps_by_level, color='#ff6b6b', linewidth=1.5, label='수정', linestyle='--')
-            axes[1,0].axhline(y=15, color='#ff4444', alpha=0.5, linestyle=':', linewidth=1)
-            axes[1,0].axhline(y=5, color='#ffc107', alpha=0.5, linestyle=':', linewidth=1)
-            axes[1,0].set_title(f'필요 CPS (Stage {max_stage})', color='#ddd', fontsize=9)
-            axes[1,0].set_xlabel('레벨', color='#888', fontsize=8)
-            axes[1,0].legend(fontsize=6, facecolor='#2a2a3a', labelcolor='#ddd')
-            axes[1,0].grid(True, alpha=0.2)
-
-            # (1,1) CPS vs 스테이지
+            c['file_costs'], c['curr_costs'] = file_costs, curr_costs
+            c['file_cumulative'], c['curr_cumulative'] = file_cumulative, curr_cumulative
+            c['file_cps_by_level'] = calc_cps_for_level(file_vals, levels)
+            c['curr_cps_by_level'] = calc_cps_for_level(curr_vals, levels)
             file_dmg = calc_damage(file_effect_val)
             curr_dmg = calc_damage(curr_effect_val)
             file_time = calc_time(file_effect_val)
             curr_time = calc_time(curr_effect_val)
-            file_cps_stage = [(GameFormulas.monster_hp(s) / file_dmg) / file_time for s in stages]
-            curr_cps_stage = [(GameFormulas.monster_hp(s) / curr_dmg) / curr_time for s in stages]
-            axes[1,1].plot(stages, file_cps_stage, color='#4a90d9', linewidth=1.5, label='원본')
-            axes[1,1].plot(stages, curr_cps_stage, color='#ff6b6b', linewidth=1.5, label='수정', linestyle='--')
-            axes[1,1].axhline(y=15, color='#ff4444', alpha=0.5, linestyle=':', linewidth=1)
-            axes[1,1].axhline(y=5, color='#ffc107', alpha=0.5, linestyle=':', linewidth=1)
-            axes[1,1].set_title(f'CPS vs 스테이지 (Lv{max_level})', color='#ddd', fontsize=9)
-            axes[1,1].set_xlabel('스테이지', color='#888', fontsize=8)
-            axes[1,1].legend(fontsize=6, facecolor='#2a2a3a', labelcolor='#ddd')
-            axes[1,1].grid(True, alpha=0.2)
+            c['file_cps_stage'] = EM.stage_hp(stages) / file_dmg / file_time
+            c['curr_cps_stage'] = EM.stage_hp(stages) / curr_dmg / curr_time
 
         elif graph_type == 1:  # 💰 골드/크리스탈
-            axes = self.figure.subplots(2, 2)
-            setup_axes([axes[0,0], axes[0,1], axes[1,0], axes[1,1]])
-
             # 골드 계산 (스테이지별)
             def calc_gold(stage, gold_flat=0, gold_multi=0):
                 base_gold = stage * 1.5
@@ -1357,51 +1519,23 @@ class StatEditorTab(QWidget):
             curr_gold_flat = curr_effect_val if sid == 'gold_flat' else 0
             curr_gold_multi = curr_effect_val if sid == 'gold_multi' else 0
 
-            # (0,0) 스테이지별 골드 획득
-            file_gold = [calc_gold(s, gold_flat_effect, gold_multi_effect) for s in stages]
-            curr_gold = [calc_gold(s, curr_gold_flat, curr_gold_multi) for s in stages]
-            axes[0,0].plot(stages, file_gold, color='#ffc107', linewidth=1.5, label='원본')
-            axes[0,0].plot(stages, curr_gold, color='#ff6b6b', linewidth=1.5, label='수정', linestyle='--')
-            axes[0,0].set_title('스테이지별 골드 획득', color='#ddd', fontsize=9)
-            axes[0,0].set_xlabel('스테이지', color='#888', fontsize=8)
-            axes[0,0].legend(fontsize=6, facecolor='#2a2a3a', labelcolor='#ddd')
-            axes[0,0].grid(True, alpha=0.2)
-
-            # (0,1) 누적 골드 (100마리 처치 가정)
-            file_cumul_gold = [sum(file_gold[:i+1]) for i in range(len(file_gold))]
-            curr_cumul_gold = [sum(curr_gold[:i+1]) for i in range(len(curr_gold))]
-            axes[0,1].plot(stages, file_cumul_gold, color='#ffc107', linewidth=1.5, label='원본')
-            axes[0,1].plot(stages, curr_cumul_gold, color='#ff6b6b', linewidth=1.5, label='수정', linestyle='--')
-            axes[0,1].set_title('누적 골드 (진행 기준)', color='#ddd', fontsize=9)
-            axes[0,1].set_xlabel('스테이지', color='#888', fontsize=8)
-            axes[0,1].legend(fontsize=6, facecolor='#2a2a3a', labelcolor='#ddd')
-            axes[0,1].grid(True, alpha=0.2)
-
-            # (1,0) 크리스탈 환산 (1000골드 = 1크리스탈)
-            file_crystal = [g / 1000 for g in file_cumul_gold]
-            curr_crystal = [g / 1000 for g in curr_cumul_gold]
-            axes[1,0].plot(stages, file_crystal, color='#17a2b8', linewidth=1.5, label='원본')
-            axes[1,0].plot(stages, curr_crystal, color='#ff6b6b', linewidth=1.5, label='수정', linestyle='--')
-            axes[1,0].set_title('예상 크리스탈 (누적 골드/1000)', color='#ddd', fontsize=9)
-            axes[1,0].set_xlabel('스테이지', color='#888', fontsize=8)
-            axes[1,0].legend(fontsize=6, facecolor='#2a2a3a', labelcolor='#ddd')
-            axes[1,0].grid(True, alpha=0.2)
-
-            # (1,1) 골드 효율 (골드/비용)
-            gold_efficiency_file = [g / max(c, 1) for g, c in zip(file_gold, file_cumulative[:len(stages)] if len(file_cumulative) >= len(stages) else file_cumulative + [file_cumulative[-1]]*(len(stages)-len(file_cumulative)))]
-            gold_efficiency_curr = [g / max(c, 1) for g, c in zip(curr_gold, curr_cumulative[:len(stages)] if len(curr_cumulative) >= len(stages) else curr_cumulative + [curr_cumulative[-1]]*(len(stages)-len(curr_cumulative)))]
-            axes[1,1].plot(stages[:len(gold_efficiency_file)], gold_efficiency_file, color='#28a745', linewidth=1.5, label='원본')
-            axes[1,1].plot(stages[:len(gold_efficiency_curr)], gold_efficiency_curr, color='#ff6b6b', linewidth=1.5, label='수정', linestyle='--')
-            axes[1,1].set_title('골드/업글비용 효율', color='#ddd', fontsize=9)
-            axes[1,1].set_xlabel('스테이지', color='#888', fontsize=8)
-            axes[1,1].legend(fontsize=6, facecolor='#2a2a3a', labelcolor='#ddd')
-            axes[1,1].grid(True, alpha=0.2)
+            file_gold = calc_gold(stages, gold_flat_effect, gold_multi_effect)
+            curr_gold = calc_gold(stages, curr_gold_flat, curr_gold_multi)
+            c['file_gold'], c['curr_gold'] = file_gold, curr_gold
+            c['file_cumul_gold'], c['curr_cumul_gold'] = np.cumsum(file_gold), np.cumsum(curr_gold)
+            # 크리스탈 환산 (1000골드 = 1크리스탈)
+            c['file_crystal'] = c['file_cumul_gold'] / 1000
+            c['curr_crystal'] = c['curr_cumul_gold'] / 1000
+
+            # 누적 비용을 스테이지 수에 맞춤 (짧으면 마지막 값 유지)
+            def fit_to_stages(cumulative):
+                if len(cumulative) >= len(stages):
+                    return cumulative[:len(stages)]
+                return np.concatenate([cumulative, np.full(len(stages) - len(cumulative), cumulative[-1])])
+            c['file_gold_efficiency'] = file_gold / np.maximum(fit_to_stages(file_cumulative), 1)
+            c['curr_gold_efficiency'] = curr_gold / np.maximum(fit_to_stages(curr_cumulative), 1)
 
         elif graph_type == 2:  # 📈 통합 (모든 수정 스탯 반영)
-            axes = self.figure.subplots(2, 3)
-            all_axes = [axes[0,0], axes[0,1], axes[0,2], axes[1,0], axes[1,1], axes[1,2]]
-            setup_axes(all_axes)
-
             # 변경된 스탯 목록 확인
             changed_stats = []
             for (st, stat_id), curr_vals_item in self._current_values.items():
@@ -1410,11 +1544,11 @@ class StatEditorTab(QWidget):
                     if abs(float(curr_vals_item.get(param, 0)) - float(file_vals_item.get(param, 0))) > 0.0001:
                         changed_stats.append(stat_id)
                         break
-            changed_stats = list(set(changed_stats))
+            c['changed_count'] = len(set(changed_stats))
 
-            # 전체 스탯 효과를 합산한 데미지/시간 계산
+            # 전체 스탯 효과를 합산한 데미지/시간 계산 (level 은 스칼라/배열)
             def calc_total_damage_and_time(vals_dict, level):
-                dmg = base_power
+                dmg = np.full(np.shape(level), float(base_power))
                 extra_time = 0
                 crit_chance_val = 0.1  # 기본 크리티컬 확률
                 crit_multi = 2.0  # 기본 크리티컬 배수
@@ -1426,7 +1560,7 @@ class StatEditorTab(QWidget):
                     elif stat_id == 'attack_percent':
                         dmg *= (1 + effect / 100)
                     elif stat_id == 'crit_chance':
-                        crit_chance_val = min(0.1 + effect/100, 1.0)
+                        crit_chance_val = np.minimum(0.1 + effect/100, 1.0)
                     elif stat_id == 'crit_damage':
                         crit_multi = 2.0 + effect
                     elif stat_id == 'multi_hit':
@@ -1438,100 +1572,156 @@ class StatEditorTab(QWidget):
                 crit_expected = 1 + crit_chance_val * (crit_multi - 1)
                 dmg *= crit_expected
 
-                return max(dmg, 1), time_limit + extra_time
-
-            # (0,0) 총 데미지 (모든 스탯)
-            file_total_dmg = [calc_total_damage_and_time(self._file_values, lv)[0] for lv in levels]
-            curr_total_dmg = [calc_total_damage_and_time(self._current_values, lv)[0] for lv in levels]
-            axes[0,0].plot(levels, file_total_dmg, color='#4a90d9', linewidth=1.5, label='원본')
-            axes[0,0].plot(levels, curr_total_dmg, color='#ff6b6b', linewidth=1.5, label='수정', linestyle='--')
-            title_suffix = f" ({len(changed_stats)}개 변경)" if changed_stats else ""
-            axes[0,0].set_title(f'총 데미지{title_suffix}', color='#ddd', fontsize=9)
-            axes[0,0].set_xlabel('레벨', color='#888', fontsize=8)
-            axes[0,0].legend(fontsize=6, facecolor='#2a2a3a', labelcolor='#ddd')
-            axes[0,0].grid(True, alpha=0.2)
-
-            # (0,1) 필요 CPS (전체 스탯 + 시간 연장 반영)
-            file_cps_total = []
-            curr_cps_total = []
-            for lv in levels:
-                f_dmg, f_time = calc_total_damage_and_time(self._file_values, lv)
-                c_dmg, c_time = calc_total_damage_and_time(self._current_values, lv)
-                file_cps_total.append(GameFormulas.monster_hp(max_stage) / f_dmg / f_time)
-                curr_cps_total.append(GameFormulas.monster_hp(max_stage) / c_dmg / c_time)
-
-            axes[0,1].plot(levels, file_cps_total, color='#4a90d9', linewidth=1.5, label='원본')
-            axes[0,1].plot(levels, curr_cps_total, color='#ff6b6b', linewidth=1.5, label='수정', linestyle='--')
-            axes[0,1].axhline(y=15, color='#ff4444', alpha=0.5, linestyle=':', linewidth=1)
-            axes[0,1].axhline(y=5, color='#ffc107', alpha=0.5, linestyle=':', linewidth=1)
-            axes[0,1].set_title(f'필요 CPS (Stage {max_stage})', color='#ddd', fontsize=9)
-            axes[0,1].set_xlabel('레벨', color='#888', fontsize=8)
-            axes[0,1].legend(fontsize=6, facecolor='#2a2a3a', labelcolor='#ddd')
-            axes[0,1].grid(True, alpha=0.2)
-
-            # (0,2) 총 비용 (전체 스탯)
-            all_file_costs = [sum(self._calc_upgrade_cost(v.get('base_cost',1), v.get('growth_rate',0.5), v.get('multiplier',1.5), v.get('softcap_interval',10), lv) for v in self._file_values.values()) for lv in levels]
-            all_curr_costs = [sum(self._calc_upgrade_cost(v.get('base_cost',1), v.get('growth_rate',0.5), v.get('multiplier',1.5), v.get('softcap_interval',10), lv) for v in self._current_values.values()) for lv in levels]
-            axes[0,2].plot(levels, all_file_costs, color='#4a90d9', linewidth=1.5, label='원본')
-            axes[0,2].plot(levels, all_curr_costs, color='#ff6b6b', linewidth=1.5, label='수정', linestyle='--')
-            axes[0,2].set_title('총 업글 비용 (전체)', color='#ddd', fontsize=9)
-            axes[0,2].set_xlabel('레벨', color='#888', fontsize=8)
-            axes[0,2].legend(fontsize=6, facecolor='#2a2a3a', labelcolor='#ddd')
-            axes[0,2].grid(True, alpha=0.2)
-
-            # (1,0) CPS vs 스테이지 (전체 스탯)
+                return np.maximum(dmg, 1), time_limit + extra_time
+
+            # 총 데미지 / 필요 CPS (전체 스탯 + 시간 연장 반영)
+            f_dmg, f_time = calc_total_damage_and_time(self._file_values, levels)
+            c_dmg, c_time = calc_total_damage_and_time(self._current_values, levels)
+            c['file_total_dmg'], c['curr_total_dmg'] = f_dmg, c_dmg
+            c['file_cps_total'] = EM.stage_hp(max_stage) / f_dmg / f_time
+            c['curr_cps_total'] = EM.stage_hp(max_stage) / c_dmg / c_time
+
+            # 총 비용 (전체 스탯)
+            c['file_all_costs'] = self._total_costs(self._file_values.values(), levels)
+            c['curr_all_costs'] = self._total_costs(self._current_values.values(), levels)
+            c['file_all_cumul'] = np.cumsum(c['file_all_costs'])
+            c['curr_all_cumul'] = np.cumsum(c['curr_all_costs'])
+
+            # CPS vs 스테이지 (전체 스탯)
             f_dmg_max, f_time_max = calc_total_damage_and_time(self._file_values, max_level)
             c_dmg_max, c_time_max = calc_total_damage_and_time(self._current_values, max_level)
-            file_cps_stage_total = [GameFormulas.monster_hp(s) / f_dmg_max / f_time_max for s in stages]
-            curr_cps_stage_total = [GameFormulas.monster_hp(s) / c_dmg_max / c_time_max for s in stages]
-            axes[1,0].plot(stages, file_cps_stage_total, color='#4a90d9', linewidth=1.5, label='원본')
-            axes[1,0].plot(stages, curr_cps_stage_total, color='#ff6b6b', linewidth=1.5, label='수정', linestyle='--')
-            axes[1,0].axhline(y=15, color='#ff4444', alpha=0.5, linestyle=':', linewidth=1)
-            axes[1,0].axhline(y=5, color='#ffc107', alpha=0.5, linestyle=':', linewidth=1)
-            axes[1,0].set_title(f'CPS vs 스테이지 (Lv{max_level})', color='#ddd', fontsize=9)
-            axes[1,0].set_xlabel('스테이지', color='#888', fontsize=8)
-            axes[1,0].legend(fontsize=6, facecolor='#2a2a3a', labelcolor='#ddd')
-            axes[1,0].grid(True, alpha=0.2)
-
-            # (1,1) 누적 비용 비교
-            all_file_cumul = []
-            all_curr_cumul = []
-            f_sum, c_sum = 0, 0
-            for f_c, c_c in zip(all_file_costs, all_curr_costs):
-                f_sum += f_c
-                c_sum += c_c
-                all_file_cumul.append(f_sum)
-                all_curr_cumul.append(c_sum)
-            axes[1,1].plot(levels, all_file_cumul, color='#4a90d9', linewidth=1.5, label='원본')
-            axes[1,1].plot(levels, all_curr_cumul, color='#ff6b6b', linewidth=1.5, label='수정', linestyle='--')
-            axes[1,1].set_title('누적 총 비용', color='#ddd', fontsize=9)
-            axes[1,1].set_xlabel('레벨', color='#888', fontsize=8)
-            axes[1,1].legend(fontsize=6, facecolor='#2a2a3a', labelcolor='#ddd')
-            axes[1,1].grid(True, alpha=0.2)
+            c['file_cps_stage_total'] = EM.stage_hp(stages) / f_dmg_max / f_time_max
+            c['curr_cps_stage_total'] = EM.stage_hp(stages) / c_dmg_max / c_time_max
+
+            # 변경 효과 요약 (데미지 증가율)
+            c['dmg_increase_pct'] = (c_dmg - f_dmg) / np.maximum(f_dmg, 1) * 100
+
+        elif graph_type == 3:  # 🎯 민감도 (파라미터별 ±30% → Lv 누적 비용 변화율)
+            c['file_sensitivity'] = self._calc_sensitivity_analysis(dict(file_vals), max_level, max_stage, base_power)
+            c['curr_sensitivity'] = self._calc_sensitivity_analysis(dict(curr_vals), max_level, max_stage, base_power)
+
+        # 정보 표시
+        c['file_total'] = float(file_costs.sum())
+        c['curr_total'] = float(curr_costs.sum())
+        c['file_final_cps'] = float(calc_cps_for_level(file_vals, max_level))
+        c['curr_final_cps'] = float(calc_cps_for_level(curr_vals, max_level))
+        return c
+
+    @PROFILER.instrument()
+    def _update_graph(self):
+        """선택된 스탯의 그래프 갱신 (곡선은 편집 기록 항목별 메모, 화면 폭만큼 다운샘플)"""
+        self.plotter.clear()
+        self.figure.clear()
+
+        if not self._selected_key:
+            self.canvas.draw()
+            self.info_label.setText("스탯을 선택하세요")
+            return
+
+        max_level = self.spin_level.value()
+        base_power = self.spin_power.value()
+        max_stage = self.spin_stage.value()
+
+        # 그래프 타입에 따라 다른 그래프 표시
+        graph_type = self.graph_type_combo.currentIndex()
+        view = (self._selected_key, graph_type, max_level, base_power, max_stage)
+        c = self.history.curves(view, lambda: self._compute_curves(*view))
+        levels, stages = c['levels'], c['stages']
+
+        def setup_axes(axes_list):
+            for ax in axes_list:
+                ax.set_facecolor('#1e1e2e')
+                ax.tick_params(colors='#888', labelsize=7)
+                for spine in ax.spines.values():
+                    spine.set_color('#444')
+
+        # 원본/수정 곡선 한 쌍
+        def plot_pair(ax, x, name, title, xlabel, color='#4a90d9', cps_lines=False):
+            self.plotter.plot(ax, x, c['file_' + name], color=color, linewidth=1.5, label='원본')
+            self.plotter.plot(ax, x, c['curr_' + name], color='#ff6b6b', linewidth=1.5, label='수정', linestyle='--')
+            if cps_lines:
+                ax.axhline(y=15, color='#ff4444', alpha=0.5, linestyle=':', linewidth=1)
+                ax.axhline(y=5, color='#ffc107', alpha=0.5, linestyle=':', linewidth=1)
+            ax.set_title(title, color='#ddd', fontsize=9)
+            ax.set_xlabel(xlabel, color='#888', fontsize=8)
+            ax.legend(fontsize=6, facecolor='#2a2a3a', labelcolor='#ddd')
+            ax.grid(True, alpha=0.2)
+
+        if graph_type == 0:  # 📊 비용/CPS (기본)
+            axes = self.figure.subplots(2, 2)
+            setup_axes([axes[0,0], axes[0,1], axes[1,0], axes[1,1]])
+            plot_pair(axes[0,0], levels, 'costs', '업그레이드 비용', '레벨')
+            plot_pair(axes[0,1], levels, 'cumulative', '누적 비용', '레벨')
+            plot_pair(axes[1,0], levels, 'cps_by_level', f'필요 CPS (Stage {max_stage})', '레벨', cps_lines=True)
+            plot_pair(axes[1,1], stages, 'cps_stage', f'CPS vs 스테이지 (Lv{max_level})', '스테이지', cps_lines=True)
+
+        elif graph_type == 1:  # 💰 골드/크리스탈
+            axes = self.figure.subplots(2, 2)
+            setup_axes([axes[0,0], axes[0,1], axes[1,0], axes[1,1]])
+            plot_pair(axes[0,0], stages, 'gold', '스테이지별 골드 획득', '스테이지', color='#ffc107')
+            plot_pair(axes[0,1], stages, 'cumul_gold', '누적 골드 (진행 기준)', '스테이지', color='#ffc107')
+            plot_pair(axes[1,0], stages, 'crystal', '예상 크리스탈 (누적 골드/1000)', '스테이지', color='#17a2b8')
+            plot_pair(axes[1,1], stages, 'gold_efficiency', '골드/업글비용 효율', '스테이지', color='#28a745')
+
+        elif graph_type == 2:  # 📈 통합 (모든 수정 스탯 반영)
+            axes = self.figure.subplots(2, 3)
+            setup_axes([axes[0,0], axes[0,1], axes[0,2], axes[1,0], axes[1,1], axes[1,2]])
+            title_suffix = f" ({c['changed_count']}개 변경)" if c['changed_count'] else ""
+            plot_pair(axes[0,0], levels, 'total_dmg', f'총 데미지{title_suffix}', '레벨')
+            plot_pair(axes[0,1], levels, 'cps_total', f'필요 CPS (Stage {max_stage})', '레벨', cps_lines=True)
+            plot_pair(axes[0,2], levels, 'all_costs', '총 업글 비용 (전체)', '레벨')
+            plot_pair(axes[1,0], stages, 'cps_stage_total', f'CPS vs 스테이지 (Lv{max_level})', '스테이지', cps_lines=True)
+            plot_pair(axes[1,1], levels, 'all_cumul', '누적 총 비용', '레벨')
 
             # (1,2) 변경 효과 요약 (데미지 증가율)
-            dmg_increase_pct = [(c - f) / max(f, 1) * 100 for f, c in zip(file_total_dmg, curr_total_dmg)]
-            axes[1,2].plot(levels, dmg_increase_pct, color='#28a745', linewidth=1.5)
+            dmg_increase_pct = c['dmg_increase_pct']
+            self.plotter.plot(axes[1,2], levels, dmg_increase_pct, color='#28a745', linewidth=1.5)
             axes[1,2].axhline(y=0, color='#888', linestyle=':', alpha=0.5)
-            axes[1,2].fill_between(levels, 0, dmg_increase_pct, alpha=0.3,
+            self.plotter.fill_between(axes[1,2], levels, dmg_increase_pct, 0, alpha=0.3,
                                    color='#28a745' if dmg_increase_pct[-1] >= 0 else '#ff6b6b')
             axes[1,2].set_title('데미지 변화율 (%)', color='#ddd', fontsize=9)
             axes[1,2].set_xlabel('레벨', color='#888', fontsize=8)
             axes[1,2].grid(True, alpha=0.2)
 
+        elif graph_type == 3:  # 🎯 민감도
+            axes = self.figure.subplots(1, 2)
+            setup_axes(axes)
+            sens = c['curr_sensitivity']
+            for i, param in enumerate(self.PARAM_KEYS):
+                data = sens[param]['data']
+                axes[0].plot([d['variation'] for d in data], [d['change_pct'] for d in data], marker='o',
+                             markersize=3, linewidth=1.2, color=DEFAULT_COLORS[i % len(DEFAULT_COLORS)], label=param)
+            axes[0].axhline(y=0, color='#888', linestyle=':', alpha=0.5)
+            axes[0].set_title(f'Lv{max_level} 누적 비용 변화율 (수정값 기준)', color='#ddd', fontsize=9)
+            axes[0].set_xlabel('파라미터 변동 (%)', color='#888', fontsize=8)
+            axes[0].legend(fontsize=6, facecolor='#2a2a3a', labelcolor='#ddd')
+            axes[0].grid(True, alpha=0.2)
+
+            x = np.arange(len(self.PARAM_KEYS))
+            axes[1].bar(x - 0.2, [c['file_sensitivity'][p]['sensitivity'] for p in self.PARAM_KEYS], 0.4,
+                        color='#4a90d9', label='원본')
+            axes[1].bar(x + 0.2, [sens[p]['sensitivity'] for p in self.PARAM_KEYS], 0.4,
+                        color='#ff6b6b', label='수정')
+            axes[1].set_xticks(x)
+            axes[1].set_xticklabels(self.PARAM_KEYS, rotation=20, fontsize=6)
+            axes[1].set_title('민감도 점수 (최대 |변화율| %)', color='#ddd', fontsize=9)
+            axes[1].legend(fontsize=6, facecolor='#2a2a3a', labelcolor='#ddd')
+            axes[1].grid(True, alpha=0.2, axis='y')
+
         self.figure.tight_layout()
         self.canvas.draw()
 
         # 정보 표시
-        file_total = sum(file_costs)
-        curr_total = sum(curr_costs)
-        cost_diff_pct = ((curr_total - file_total) / file_total * 100) if file_total > 0 else 0
-        file_final_cps = calc_cps_for_level(file_vals, max_level)
-        curr_final_cps = calc_cps_for_level(curr_vals, max_level)
+        file_total, curr_total = c['file_total'], c['curr_total']
+        cost_diff_pct = ((curr_total - file_total) / file_total * 100) if 0 < file_total < math.inf else 0
+
+        # 큰 레벨/스테이지는 지수 표기 / ∞
+        def fmt_cps(v):
+            return f"{float(v):.2f}" if abs(v) < 1e15 else format_number(float(v))
 
         self.info_label.setText(
-            f"Lv{max_level} 총비용: {file_total:.0f}→{curr_total:.0f} ({cost_diff_pct:+.1f}%) | "
-            f"Stage{max_stage} CPS: {file_final_cps:.2f}→{curr_final_cps:.2f}"
+            f"Lv{max_level} 총비용: {format_number(file_total)}→{format_number(curr_total)} ({cost_diff_pct:+.1f}%) | "
+            f"Stage{max_stage} CPS: {fmt_cps(c['file_final_cps'])}→{fmt_cps(c['curr_final_cps'])}"
         )
 
     def _update_change_summary(self):
@@ -1555,10 +1745,9 @@ class StatEditorTab(QWidget):
             self.change_label.setStyleSheet("color: #888; font-size: 10px;")
 
     def _reset_all(self):
-        """모든 수정 취소"""
-        self._current_values = {k: v.copy() for k, v in self._file_values.items()}
-        self._populate_table()
-        self._update_graph()
+        """모든 수정 취소 (기록에 남으므로 다시 실행 가능)"""
+        self.history.reset()
+        self._refresh_after_edit()
 
     def _save_all(self):
         """모든 변경 저장"""
@@ -1598,8 +1787,7 @@ class StatEditorTab(QWidget):
         if perm_changed or ingame_changed:
             # 파일값 갱신
             self._load_all_from_file()
-            self._populate_table()
-            self._update_graph()
+            self._refresh_after_edit()
             QMessageBox.information(self, "저장 완료", "모든 변경이 저장되었습니다.")
         else:
             QMessageBox.information(self, "알림", "변경된 내용이 없습니다.")
@@ -1649,15 +1837,26 @@ class PresetListItem(QWidget):
 class CpsMeasureTab(QWidget):
     """CPS 측정기: 실제 입력 속도 측정"""
 
+    # (측정 번호, 결과 줄) - 리듬 재생은 작업 스레드에서, 표시는 UI 스레드에서
+    replayed = pyqtSignal(int, str)
+
     def __init__(self, config: dict):
         super().__init__()
         self.config = config
         self.is_measuring = False
-        self.input_count = 0
-        self.start_time = None
+        self.recorder = ClickRecorder()
+        self.last_trace = None
+        self._measure_id = 0
+        self._detail_lines = []
+        self.replayed.connect(self._on_replayed)
+        self._shown_count = -1
         self.measure_duration = 10  # 측정 시간 (초)
         self._setup_ui()
 
+    @property
+    def input_count(self) -> int:
+        return self.recorder.total
+
     def _setup_ui(self):
         layout = QVBoxLayout(self)
 
@@ -1724,6 +1923,16 @@ class CpsMeasureTab(QWidget):
         self.grade_result.setStyleSheet("font-size: 18px;")
         result_layout.addWidget(self.grade_result)
 
+        # 상세 분석 (간격 분포/버스트/피로/콤보)
+        self.detail_result = QLabel("")
+        self.detail_result.setStyleSheet("font-size: 13px; color: #c0c0c0;")
+        result_layout.addWidget(self.detail_result)
+
+        self.export_btn = QPushButton("기록 내보내기 (.dwct)")
+        self.export_btn.setEnabled(False)
+        self.export_btn.clicked.connect(self._export_trace)
+        result_layout.addWidget(self.export_btn)
+
         # 밸런스 기준 참고
         ref_label = QLabel("""
 <b>밸런스 판정 기준:</b><br>
@@ -1739,9 +1948,9 @@ class CpsMeasureTab(QWidget):
         layout.addWidget(self.result_group)
         layout.addStretch()
 
-        # 타이머
-        from PyQt6.QtCore import QTimer
+        # 화면 갱신 타이머 (입력마다 갱신하지 않고 프레임 단위로 묶어서 갱신)
         self.timer = QTimer()
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
         self.timer.timeout.connect(self._update_timer)
 
         # 키보드/마우스 이벤트 캡처
@@ -1755,9 +1964,10 @@ class CpsMeasureTab(QWidget):
 
     def _start_measure(self):
         self.is_measuring = True
-        self.input_count = 0
+        self._measure_id += 1  # 이전 측정의 재생 결과는 버림
+        self.recorder.reset()  # 첫 입력 시 측정 시작
+        self._shown_count = -1
         self.measure_duration = self.duration_spin.value()
-        self.start_time = None  # 첫 입력 시 시작
 
         self.counter_label.setText("0")
         self.counter_label.setStyleSheet("""
@@ -1779,22 +1989,31 @@ class CpsMeasureTab(QWidget):
         """)
         self.cps_result.setText("측정 중...")
         self.grade_result.setText("")
+        self.detail_result.setText("")
 
+        self.timer.start(16)  # 약 60fps
         self.setFocus()
 
     def _stop_measure(self):
         self.is_measuring = False
         self.timer.stop()
 
-        # 결과 계산
-        if self.start_time and self.input_count > 0:
-            import time
-            elapsed = time.time() - self.start_time
+        # 결과 계산 (측정 시간 초과분은 제외)
+        if self.input_count > 0:
+            elapsed = min(self.recorder.elapsed(), self.measure_duration)
+            self.counter_label.setText(str(self.input_count))
             if elapsed > 0:
-                cps = self.input_count / elapsed
-                self._show_result(cps, elapsed)
+                self._show_result(self.input_count / elapsed, elapsed)
             else:
                 self._show_result(0, 0)
+            self.last_trace = self.recorder.trace()
+            self.export_btn.setEnabled(len(self.last_trace) > 1)
+            if len(self.last_trace) > 2:
+                report = analyze_clicks(self.last_trace)
+                self._detail_lines = report.summary_lines()
+                self.detail_result.setText("\n".join(self._detail_lines + ["도달 스테이지 계산 중..."]))
+                threading.Thread(target=self._replay_worker, args=(self._measure_id, self.last_trace),
+                                 daemon=True).start()
         else:
             self._show_result(0, 0)
 
@@ -1810,29 +2029,45 @@ class CpsMeasureTab(QWidget):
         self.status_label.setText("측정 완료!")
         self.status_label.setStyleSheet("font-size: 18px; color: #4ad94a;")
 
-    def _update_timer(self):
-        import time
-        if self.start_time:
-            elapsed = time.time() - self.start_time
-            remaining = self.measure_duration - elapsed
-            if remaining <= 0:
-                self._stop_measure()
-            else:
-                self.status_label.setText(f"남은 시간: {remaining:.1f}초")
-
-    def _register_input(self):
-        if not self.is_measuring:
+    def _replay_worker(self, measure_id: int, trace):
+        """측정한 리듬을 5분 길이로 반복 재생 (현재 영구 레벨 기준) - 작업 스레드"""
+        try:
+            perm_levels = load_json('PlayerLevels.json').get('permanent_levels', {})
+            result = replay_traces([tile_trace(trace, 300.0)], perm_levels, workers=1)
+            line = f"이 리듬으로 플레이 시 도달 스테이지: {int(result.max_stage[0])}"
+        except (OSError, ValueError):
+            line = ""
+        self.replayed.emit(measure_id, line)
+
+    def _on_replayed(self, measure_id: int, line: str):
+        if measure_id != self._measure_id:
             return
+        self.detail_result.setText("\n".join(self._detail_lines + ([line] if line else [])))
 
-        import time
+    def _update_timer(self):
+        """프레임 단위 화면 갱신 (변경된 경우에만 라벨 갱신)"""
+        if self.recorder.first_ns is None:
+            return
+        remaining = self.measure_duration - self.recorder.elapsed()
+        if remaining <= 0:
+            self._stop_measure()
+            return
+        if self.input_count != self._shown_count:
+            self._shown_count = self.input_count
+            self.counter_label.setText(str(self.input_count))
+        self.status_label.setText(f"남은 시간: {remaining:.1f}초")
 
-        # 첫 입력 시 타이머 시작
-        if self.start_time is None:
-            self.start_time = time.time()
-            self.timer.start(100)  # 0.1초마다 업데이트
+    def _register_input(self, source: int = SOURCE_KEYBOARD):
+        if self.is_measuring:
+            self.recorder.record(source)
 
-        self.input_count += 1
-        self.counter_label.setText(str(self.input_count))
+    def _export_trace(self):
+        if self.last_trace is None:
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "클릭 기록 저장", "cps_trace.dwct", "Click trace (*.dwct)")
+        if path:
+            size = self.last_trace.save(path)
+            self.status_label.setText(f"저장 완료: {os.path.basename(path)} ({size:,} bytes)")
 
     def _show_result(self, cps: float, elapsed: float):
         if cps <= 0:
@@ -1873,14 +2108,15 @@ class CpsMeasureTab(QWidget):
 
     def keyPressEvent(self, event):
         if self.is_measuring:
-            self._register_input()
+            if not event.isAutoRepeat():
+                self._register_input(SOURCE_KEYBOARD)
         elif event.key() == Qt.Key.Key_Space:
             self._toggle_measure()
 
     def mousePressEvent(self, event):
         # 버튼 클릭은 제외
         if self.is_measuring and not self.start_btn.underMouse():
-            self._register_input()
+            self._register_input(SOURCE_MOUSE)
 
 
 class ComparisonAnalyzerTab(QWidget):
@@ -2204,7 +2440,9 @@ class ComparisonAnalyzerTab(QWidget):
         right_layout.addWidget(self.chart)
 
         # 비교 테이블
-        self.compare_table = QTableWidget()
+        # 행마다 종류가 다른 비교표라 정렬은 끔
+        self.compare_model = ColumnTableModel()
+        self.compare_table = create_table_view(self.compare_model, sortable=False)
         self.compare_table.setMaximumHeight(280)
         right_layout.addWidget(self.compare_table)
 
@@ -2448,26 +2686,56 @@ class ComparisonAnalyzerTab(QWidget):
 
     # ==================== 분석 ====================
 
+    @RESULT_CACHE.memoize()
+    def _preset_analysis(self, perm_config: dict, levels: dict, start_stage: int, end_stage: int) -> dict:
+        """프리셋 하나의 효과/DPS/비용 + 스테이지별 필요 클릭수·CPS (Qt 없음, 결과 캐시에 저장)
+
+        perm_config 는 캐시 키용 (self.config 의 영구 스탯 설정과 같은 값)
+        """
+        effects = self._calc_total_effect(levels)
+        result = self._calc_dps(effects)
+        damage, time_limit = result['damage'], result['time_limit']
+        clicks = [GameFormulas.monster_hp(stage) / damage if damage > 0 else 9999
+                  for stage in range(start_stage, end_stage + 1)]
+        return {
+            'effects': effects,
+            'result': result,
+            'upgrade': self._calc_upgrade_cost(levels),
+            'clicks': clicks,
+            'cps': [c / time_limit for c in clicks],
+        }
+
+    @PROFILER.instrument()
     def _analyze(self):
         """선택된 프리셋들 분석"""
         if not self.selected_preset_ids:
             QMessageBox.warning(self, "경고", "비교할 프리셋을 선택하세요.")
             return
 
+        start_stage = self.start_stage_spin.value()
+        end_stage = self.end_stage_spin.value()
+        if start_stage > end_stage:
+            start_stage, end_stage = end_stage, start_stage
+        perm_config = self.config.get('permanent', {}).get('stats', {})
+
         # 선택된 프리셋 데이터 수집
         selected_presets = []
         for preset_id in self.selected_preset_ids:
             if preset_id in self.presets:
                 preset = self.presets[preset_id]
-                effects = self._calc_total_effect(preset.get('levels', {}))
-                result = self._calc_dps(effects)
+                levels = dict(preset.get('levels', {}))
+                analysis = self._preset_analysis(perm_config, levels, start_stage, end_stage)
                 selected_presets.append({
                     'id': preset_id,
                     'name': preset.get('name', preset_id),
                     'color': preset.get('color', '#4a90d9'),
-                    'levels': preset.get('levels', {}),
-                    'effects': effects,
-                    'dps': result['dps']
+                    'levels': levels,
+                    'effects': analysis['effects'],
+                    'dps': analysis['result']['dps'],
+                    'result': analysis['result'],
+                    'upgrade': analysis['upgrade'],
+                    'clicks': analysis['clicks'],
+                    'cps': analysis['cps'],
                 })
 
         # DPS 카드 업데이트
@@ -2509,7 +2777,7 @@ class ComparisonAnalyzerTab(QWidget):
             card_layout.addWidget(name_label)
 
             # 계산 결과
-            result = self._calc_dps(preset['effects'])
+            result = preset['result']
             damage = result['damage']
             time_limit = result['time_limit']
 
@@ -2559,7 +2827,7 @@ class ComparisonAnalyzerTab(QWidget):
             card_layout.addWidget(line)
 
             # 업그레이드 비용
-            upgrade_info = self._calc_upgrade_cost(preset['levels'])
+            upgrade_info = preset['upgrade']
             cost_label = QLabel(f"💎 {upgrade_info['total_cost']:,} 크리스탈")
             cost_label.setStyleSheet("color: #17a2b8; font-size: 10px;")
             card_layout.addWidget(cost_label)
@@ -2593,24 +2861,9 @@ class ComparisonAnalyzerTab(QWidget):
         all_cps = []
 
         for idx, preset in enumerate(presets):
-            effects = preset['effects']
-            result = self._calc_dps(effects)
-            damage_per_hit = result['damage']
-            preset_time_limit = result['time_limit']
-
-            clicks_list = []
-            cps_list = []
-
-            for stage in stages:
-                hp = GameFormulas.monster_hp(stage)
-
-                # 필요 클릭 수 (핵심!)
-                clicks = hp / damage_per_hit if damage_per_hit > 0 else 9999
-                clicks_list.append(clicks)
-
-                # 필요 CPS (프리셋별 제한시간 사용)
-                cps = clicks / preset_time_limit
-                cps_list.append(cps)
+            # 필요 클릭 수 (핵심!) / 필요 CPS (프리셋별 제한시간 사용) - _preset_analysis 에서 계산됨
+            clicks_list = preset['clicks']
+            cps_list = preset['cps']
 
             all_clicks.extend(clicks_list)
             all_cps.extend(cps_list)
@@ -2671,22 +2924,14 @@ class ComparisonAnalyzerTab(QWidget):
 
     def _update_compare_table(self, presets: list):
         """비교 테이블 업데이트"""
-        # 컬럼 설정
-        headers = ["항목"] + [p['name'] for p in presets]
-        self.compare_table.setColumnCount(len(headers))
-        self.compare_table.setHorizontalHeaderLabels(headers)
-        self.compare_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-
         rows = []
 
         # 각 프리셋의 계산 결과 미리 계산
         preset_results = []
         upgrade_infos = []
         for p in presets:
-            result = self._calc_dps(p['effects'])
-            preset_results.append(result)
-            upgrade_info = self._calc_upgrade_cost(p['levels'])
-            upgrade_infos.append(upgrade_info)
+            preset_results.append(p['result'])
+            upgrade_infos.append(p['upgrade'])
 
         # === ⏱️ 제한시간 ===
         time_values = []
@@ -2762,20 +3007,14 @@ class ComparisonAnalyzerTab(QWidget):
             rows.append(clicks_row)
             rows.append(cps_row)
 
-        self.compare_table.setRowCount(len(rows))
-        for i, row in enumerate(rows):
-            name_item = QTableWidgetItem(row['name'])
-            name_item.setForeground(QColor('#e0e0e0'))
-            self.compare_table.setItem(i, 0, name_item)
-
-            for j, val in enumerate(row['values']):
-                item = QTableWidgetItem(val)
-                # 행별 색상이 있으면 사용, 없으면 프리셋 색상 사용
-                if 'colors' in row and j < len(row['colors']):
-                    item.setForeground(QColor(row['colors'][j]))
-                else:
-                    item.setForeground(QColor(presets[j]['color']))
-                self.compare_table.setItem(i, j + 1, item)
+        # 컬럼 = 항목 + 프리셋별 (프리셋 id 가 같으면 dataChanged 로 일괄 갱신)
+        columns = [Column('item', "항목", [row['name'] for row in rows], color='#e0e0e0')]
+        for j, p in enumerate(presets):
+            # 행별 색상이 있으면 사용, 없으면 프리셋 색상 사용
+            colors = [row['colors'][j] if 'colors' in row and j < len(row['colors']) else p['color']
+                      for row in rows]
+            columns.append(Column(p['id'], p['name'], [row['values'][j] for row in rows], color=colors))
+        self.compare_model.set_columns(columns)
 
 
 # ============================================================
@@ -2967,6 +3206,92 @@ class TerminalTab(QWidget):
         return prompt
 
 
+# ============================================================
+# 성능 계측
+# ============================================================
+
+class ProfilerPanel(QWidget):
+    """단계별 p50/p95 소요 시간 + 다음 동작 cProfile 캡처 (F9)"""
+
+    REFRESH_MS = 500
+    captured = pyqtSignal(str)      # 내보내기 스레드 → UI 스레드 (큐 연결)
+
+    def __init__(self, config: dict):
+        super().__init__()
+        self.config = config
+        PROFILER.defer_finish = lambda finish: QTimer.singleShot(0, finish)
+        # flamegraph 변환은 UI 스레드 밖에서 (큰 redraw 캡처도 화면이 멈추지 않게)
+        PROFILER.background_export = True
+        PROFILER.on_capture = lambda path: self.captured.emit(str(path))
+        self.captured.connect(self._on_capture)
+        self._setup_ui()
+
+        # 보이는 동안만 주기적으로 갱신
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self._refresh)
+
+    def _setup_ui(self):
+        layout = QVBoxLayout(self)
+
+        btn_layout = QHBoxLayout()
+        self.capture_btn = QPushButton("다음 동작 프로파일 (F9)")
+        self.capture_btn.clicked.connect(self.arm_capture)
+        btn_layout.addWidget(self.capture_btn)
+
+        reset_btn = QPushButton("기록 초기화")
+        reset_btn.clicked.connect(self._reset)
+        btn_layout.addWidget(reset_btn)
+        btn_layout.addStretch()
+        layout.addLayout(btn_layout)
+
+        self.status_label = QLabel("계측 구간: 탭 계산 / 그래프 / 표 갱신")
+        self.status_label.setStyleSheet("color: #888;")
+        layout.addWidget(self.status_label)
+
+        self.phase_model = ColumnTableModel()
+        layout.addWidget(create_table_view(self.phase_model))
+
+    def showEvent(self, event):
+        self._refresh()
+        self.timer.start(self.REFRESH_MS)
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.timer.stop()
+        super().hideEvent(event)
+
+    def _refresh(self):
+        rows = PROFILER.rows()
+        ms = "{:.1f}ms"
+        self.phase_model.set_columns([
+            Column('phase', "단계", [r.name for r in rows]),
+            Column('count', "횟수", [r.count for r in rows], fmt=format_number, align='right'),
+            Column('last', "최근", [r.last for r in rows], fmt=ms, align='right'),
+            Column('p50', "p50", [r.p50 for r in rows], fmt=ms, align='right'),
+            Column('p95', "p95", [r.p95 for r in rows], fmt=ms, align='right',
+                   color=lambda v: '#ff6b6b' if v > 100 else None),
+            Column('max', "최대", [r.max for r in rows], fmt=ms, align='right'),
+        ])
+
+    def _reset(self):
+        PROFILER.reset()
+        self._refresh()
+
+    def arm_capture(self):
+        """다음 계측 구간이 시작될 때부터 그 이벤트 처리가 끝날 때까지 cProfile 기록"""
+        if PROFILER.capturing:
+            PROFILER.cancel_capture()
+            self.status_label.setText("프로파일 캡처 취소")
+            return
+        name = time.strftime('profile-%Y%m%d-%H%M%S')
+        PROFILER.arm_capture(os.path.join(PROFILE_DIR, name))
+        self.status_label.setText("다음 동작을 기다리는 중... (F9: 취소)")
+
+    def _on_capture(self, path: str):
+        self.status_label.setText(f"저장: {path} (+ .prof)")
+        self._refresh()
+
+
 # ============================================================
 # 메인 윈도우
 # ============================================================
@@ -2996,6 +3321,22 @@ class BalanceDashboard(QMainWindow):
         self._apply_style()
         self._restore_layout()  # 저장된 레이아웃 복원
 
+        # 결과 캐시 현황 (적중/미스 카운터가 바뀔 때만 다시 표시)
+        self._cache_counts = None
+        self._refresh_cache_status()
+        self.cache_timer = QTimer(self)
+        self.cache_timer.timeout.connect(self._refresh_cache_status)
+        self.cache_timer.start(1000)
+
+    def _refresh_cache_status(self):
+        counts = (RESULT_CACHE.hits, RESULT_CACHE.misses)
+        if counts == self._cache_counts:
+            return
+        self._cache_counts = counts
+        stats = RESULT_CACHE.stats()
+        self.statusBar().showMessage(
+            f"결과 캐시: {stats['entries']}개 항목 (이번 실행 적중 {stats['hits']} / 미스 {stats['misses']})")
+
     def _save_layout(self):
         """레이아웃 상태 저장"""
         self.settings.setValue("geometry", self.saveGeometry())
@@ -3060,6 +3401,22 @@ class BalanceDashboard(QMainWindow):
             action = dock.toggleViewAction()
             view_menu.addAction(action)
 
+        # 성능 계측 독 (기본 숨김, F8 로 토글)
+        self.profiler_panel = ProfilerPanel(self.config)
+        profiler_dock = QDockWidget("성능 계측", self)
+        profiler_dock.setWidget(self.profiler_panel)
+        self.addDockWidget(Qt.DockWidgetArea.BottomDockWidgetArea, profiler_dock)
+        profiler_dock.hide()
+        self.docks["성능 계측"] = profiler_dock
+
+        view_menu.addSeparator()
+        toggle_action = profiler_dock.toggleViewAction()
+        toggle_action.setShortcut(QKeySequence("F8"))
+        view_menu.addAction(toggle_action)
+        capture_action = view_menu.addAction("⏱ 다음 동작 프로파일")
+        capture_action.setShortcut(QKeySequence("F9"))
+        capture_action.triggered.connect(self.profiler_panel.arm_capture)
+
         view_menu.addSeparator()
         reset_action = view_menu.addAction("🔄 레이아웃 초기화")
         reset_action.triggered.connect(self._reset_layout)
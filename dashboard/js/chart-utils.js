@@ -223,6 +223,70 @@ const ChartUtils = {
         return labels;
     },
 
+    /**
+     * Decode a packed curve buffer (tools/curve_transport.py format)
+     * 'DWA1' + uint32 header length + JSON header + 8-byte aligned little-endian blocks.
+     * Arrays are views into the buffer (no per-element parsing).
+     * @param {ArrayBuffer} buffer
+     * @returns {{meta: Object, arrays: Object<string, Float64Array|BigInt64Array>}}
+     */
+    decodeArrays(buffer) {
+        const view = new DataView(buffer);
+        const magic = String.fromCharCode(...new Uint8Array(buffer, 0, 4));
+        if (magic !== 'DWA1') {
+            throw new Error('Not a curve buffer');
+        }
+        const headerLength = view.getUint32(4, true);
+        const header = JSON.parse(new TextDecoder().decode(new Uint8Array(buffer, 8, headerLength)));
+        const dataStart = 8 + headerLength;
+        const arrays = {};
+        for (const entry of header.arrays) {
+            const Type = entry.dtype === 'i8' ? BigInt64Array : Float64Array;
+            arrays[entry.name] = new Type(buffer, dataStart + entry.offset, entry.length);
+        }
+        return { meta: header.meta, arrays };
+    },
+
+    /**
+     * Base64 string (pywebview transport) -> ArrayBuffer
+     */
+    base64ToBuffer(text) {
+        const binary = atob(text);
+        const bytes = new Uint8Array(binary.length);
+        for (let i = 0; i < binary.length; i++) {
+            bytes[i] = binary.charCodeAt(i);
+        }
+        return bytes.buffer;
+    },
+
+    /**
+     * Fetch curve arrays from Python
+     * Uses the local simulation server (raw bytes) when running, otherwise the pywebview API (base64).
+     * @param {string} kind - 'stage' | 'upgrade_costs'
+     */
+    async fetchCurves(kind, params = {}) {
+        const serverUrl = window.ConfigLoader?.serverUrl;
+        if (serverUrl) {
+            const response = await fetch(`${serverUrl}/curves/${kind}`, {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify(params)
+            });
+            if (!response.ok) {
+                throw new Error((await response.json()).error || `Curve request failed: ${response.status}`);
+            }
+            return this.decodeArrays(await response.arrayBuffer());
+        }
+        if (window.pywebview?.api?.get_curves) {
+            const result = await window.pywebview.api.get_curves(kind, params);
+            if (!result.success) {
+                throw new Error(result.error);
+            }
+            return this.decodeArrays(this.base64ToBuffer(result.data));
+        }
+        throw new Error('Python curve source is not available');
+    },
+
     /**
      * Destroy chart if exists
      */
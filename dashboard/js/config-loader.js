@@ -12,12 +12,26 @@ const ConfigLoader = {
         inGameStats: null
     },
 
+    // Content hashes of cached files (PyWebView mode, for conditional loads and save conflict checks)
+    _hashes: {},
+
+    // Cache key -> config file
+    _files: {
+        statFormulas: 'StatFormulas.json',
+        permanentStats: 'PermanentStatGrowth.json',
+        inGameStats: 'InGameStatGrowth.json'
+    },
+
     // Base path to config files (for fetch fallback)
     basePath: '../config/',
 
     // Check if running in PyWebView
     _isPyWebView: false,
 
+    // Local simulation server (tools/sim_server.py)
+    defaultServerUrl: 'http://127.0.0.1:8765',
+    serverUrl: null,
+
     /**
      * Initialize - detect environment
      */
@@ -36,15 +50,100 @@ const ConfigLoader = {
                 console.log('Running in browser mode');
             }
         }
+        await this._detectServer();
         return this._isPyWebView;
     },
 
+    /**
+     * Find the simulation server (desktop app passes its URL, browser mode tries the default port)
+     */
+    async _detectServer() {
+        let url = this.defaultServerUrl;
+        if (this._isPyWebView && window.pywebview?.api?.get_server_url) {
+            url = await window.pywebview.api.get_server_url();
+        }
+        this.serverUrl = null;
+        if (!url) {
+            return null;
+        }
+        try {
+            const response = await fetch(url + '/health');
+            if (response.ok) {
+                this.serverUrl = url;
+                console.log(`Simulation server: ${url}`);
+            }
+        } catch (error) {
+            console.log('Simulation server not available');
+        }
+        return this.serverUrl;
+    },
+
+    /**
+     * Check if the simulation server is available
+     */
+    canSimulate() {
+        return this.serverUrl !== null;
+    },
+
+    /**
+     * Call a JSON-RPC method on the simulation server
+     * @param {AbortSignal} [signal] - aborting cancels the job unless another caller shares it
+     */
+    async rpc(method, params = {}, signal = undefined) {
+        if (!this.serverUrl) {
+            throw new Error('Simulation server is not running');
+        }
+        const response = await fetch(this.serverUrl + '/rpc', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ jsonrpc: '2.0', id: Date.now(), method, params }),
+            signal
+        });
+        const reply = await response.json();
+        if (reply.error) {
+            const error = new Error(reply.error.message);
+            error.code = reply.error.code;
+            throw error;
+        }
+        return reply.result;
+    },
+
+    /**
+     * Run a simulation as a background job with progress events
+     * @param {Function} [onProgress] - called with {done, total}
+     * @returns {{id: Promise<string>, result: Promise<Object>, cancel: Function}}
+     */
+    runJob(method, params = {}, onProgress = null) {
+        let source = null;
+        let jobId = null;
+        const id = this.rpc('submit', { method, params }).then(job => (jobId = job.job));
+        const result = id.then(() => new Promise((resolve, reject) => {
+            source = new EventSource(`${this.serverUrl}/jobs/${jobId}/events`);
+            source.addEventListener('progress', e => onProgress?.(JSON.parse(e.data)));
+            source.addEventListener('result', e => { source.close(); resolve(JSON.parse(e.data).result); });
+            source.addEventListener('error', e => {
+                source.close();
+                reject(new Error(e.data ? JSON.parse(e.data).error : 'Job stream failed'));
+            });
+            source.addEventListener('cancelled', () => { source.close(); reject(new Error('Job cancelled')); });
+        }));
+        const cancel = async () => {
+            source?.close();
+            const resolved = jobId ?? await id;
+            return this.rpc('cancel', { job: resolved });
+        };
+        return { id, result, cancel };
+    },
+
     /**
      * Load all configuration files
      * @returns {Promise<Object>} All configs combined
      */
     async loadAll() {
         try {
+            if (this._isPyWebView && window.pywebview?.api?.load_configs) {
+                await this.loadMany(Object.keys(this._files));
+            }
             const [statFormulas, permanentStats, inGameStats] = await Promise.all([
                 this.loadStatFormulas(),
                 this.loadPermanentStats(),
@@ -63,6 +162,37 @@ const ConfigLoader = {
         }
     },
 
+    /**
+     * Load several cached configs in one bridge call (PyWebView only)
+     * Files whose content hash is unchanged keep their cached data.
+     * @param {string[]} keys - cache keys (see _files)
+     */
+    async loadMany(keys, force = false) {
+        const names = keys.map(key => this._files[key]);
+        const known = {};
+        for (const key of keys) {
+            const name = this._files[key];
+            if (!force && this._cache[key] && this._hashes[name]) {
+                known[name] = this._hashes[name];
+            }
+        }
+        const result = await window.pywebview.api.load_configs(names, known);
+        if (!result.success) {
+            throw new Error(result.error);
+        }
+        for (const key of keys) {
+            const file = result.files[this._files[key]];
+            if (!file.success) {
+                throw new Error(file.error);
+            }
+            this._hashes[this._files[key]] = file.hash;
+            if (!file.unchanged) {
+                this._cache[key] = file.data;
+            }
+        }
+        return keys.map(key => this._cache[key]);
+    },
+
     /**
      * Load a JSON file (auto-detect method)
      */
@@ -70,6 +200,7 @@ const ConfigLoader = {
         if (this._isPyWebView && window.pywebview?.api) {
             const result = await window.pywebview.api.load_config(filename);
             if (result.success) {
+                this._hashes[filename] = result.hash;
                 return result.data;
             } else {
                 throw new Error(result.error);
@@ -87,18 +218,37 @@ const ConfigLoader = {
      * Save a JSON file (PyWebView only)
      */
     async saveFile(filename, data) {
-        if (this._isPyWebView && window.pywebview?.api) {
-            const result = await window.pywebview.api.save_config(filename, data);
-            if (result.success) {
-                // Clear cache for this file
-                this.clearCache();
-                return { success: true, message: result.message };
-            } else {
-                return { success: false, error: result.error };
-            }
-        } else {
+        return this.saveFiles({ [filename]: data });
+    },
+
+    /**
+     * Save several JSON files atomically (all or nothing, PyWebView only)
+     * Fails with `conflicts` if a file changed on disk since it was loaded.
+     * @param {Object<string, Object>} files - filename -> data
+     */
+    async saveFiles(files) {
+        if (!(this._isPyWebView && window.pywebview?.api)) {
             return { success: false, error: 'Save is only available in desktop app mode' };
         }
+        const base = {};
+        for (const name of Object.keys(files)) {
+            if (this._hashes[name]) {
+                base[name] = this._hashes[name];
+            }
+        }
+        const result = await window.pywebview.api.save_configs(files, base);
+        if (!result.success) {
+            return { success: false, error: result.error, conflicts: result.conflicts };
+        }
+        for (const [key, name] of Object.entries(this._files)) {
+            if (name in files) {
+                this._cache[key] = files[name];
+            }
+        }
+        for (const [name, saved] of Object.entries(result.files)) {
+            this._hashes[name] = saved.hash;
+        }
+        return { success: true, message: result.message };
     },
 
     /**
@@ -253,6 +403,7 @@ const ConfigLoader = {
         this._cache.statFormulas = null;
         this._cache.permanentStats = null;
         this._cache.inGameStats = null;
+        this._hashes = {};
     }
 };
 
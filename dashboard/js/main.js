@@ -174,7 +174,10 @@ const Dashboard = {
      * Reload config and refresh UI
      */
     async reloadConfig() {
-        ConfigLoader.clearCache();
+        // Desktop mode revalidates by content hash (unchanged files are not re-sent)
+        if (!ConfigLoader.canSave()) {
+            ConfigLoader.clearCache();
+        }
         this.config = await ConfigLoader.loadAll();
         await this.initTabs();
         this.showNotification('Configuration reloaded', 'success');
@@ -8,6 +8,11 @@ const SessionPredictorTab = {
     progressChart: null,
     statLevelChart: null,
 
+    // Stage reach from the simulation server (run simulator, off the UI thread)
+    serverRuns: 20,
+    _job: null,
+    _run: 0,
+
     // Investment strategies
     strategies: {
         damage: {
@@ -44,24 +49,68 @@ const SessionPredictorTab = {
 
     /**
      * Run simulation
+     * With the simulation server, each session's level is the run simulator's median stage reach
+     * for the current permanent levels; otherwise Average Level ±2.
      */
-    runSimulation() {
+    async runSimulation() {
         const numSessions = parseInt(document.getElementById('num-sessions')?.value) || 10;
         const avgLevel = parseInt(document.getElementById('avg-level')?.value) || 20;
+        const cps = parseFloat(document.getElementById('session-cps')?.value) || 5;
         const strategyName = document.querySelector('input[name="strategy"]:checked')?.value || 'damage';
+        const runBtn = document.getElementById('run-simulation');
+
+        // A new run replaces the one in progress
+        const run = ++this._run;
+        this._job?.cancel();
+        this._job = null;
 
         const strategy = this.strategies[strategyName];
-        const results = this.simulate(numSessions, avgLevel, strategy);
+        const reach = ConfigLoader.canSimulate()
+            ? (permLevels, session) => {
+                if (run !== this._run) {
+                    throw new Error('Job cancelled');
+                }
+                if (runBtn) runBtn.textContent = `Simulating ${session}/${numSessions}...`;
+                return this.serverReach(permLevels, cps);
+            }
+            : () => Math.max(1, avgLevel + Math.floor(Math.random() * 5) - 2);  // -2 to +2
+
+        try {
+            const results = await this.simulate(numSessions, strategy, reach);
+            this.renderProgressChart(results);
+            this.renderStatLevelChart(results);
+            this.renderTable(results);
+        } catch (error) {
+            if (error.message !== 'Job cancelled') {
+                Dashboard.showNotification(`Simulation failed: ${error.message}`, 'error');
+            }
+        } finally {
+            if (runBtn && run === this._run) runBtn.textContent = 'Run Simulation';
+        }
+    },
 
-        this.renderProgressChart(results);
-        this.renderStatLevelChart(results);
-        this.renderTable(results);
+    /**
+     * Median max stage of one session on the simulation server
+     */
+    async serverReach(permLevels, cps) {
+        const job = ConfigLoader.runJob('stage_reach', {
+            levels: permLevels,
+            cps: [cps],
+            sessions: this.serverRuns
+        });
+        this._job = job;
+        const result = await job.result;
+        if (this._job === job) {
+            this._job = null;
+        }
+        return Math.max(1, Math.round(result.rows[0].p50));
     },
 
     /**
      * Simulate multiple sessions
+     * @param {Function} reach - (permLevels, session) => level reached (or a Promise of it)
      */
-    simulate(numSessions, avgLevel, strategy) {
+    async simulate(numSessions, strategy, reach) {
         const permanentStats = this.config.permanentStats?.stats || {};
         const results = [];
         let totalCrystals = 0;
@@ -74,8 +123,7 @@ const SessionPredictorTab = {
 
         for (let session = 1; session <= numSessions; session++) {
             // Simulate session
-            const levelVariance = Math.floor(Math.random() * 5) - 2;  // -2 to +2
-            const actualLevel = Math.max(1, avgLevel + levelVariance);
+            const actualLevel = await reach({ ...permLevels }, session);
 
             // Calculate crystals earned
             const bossesKilled = Math.floor(actualLevel / 10);
@@ -7,6 +7,7 @@ const StatGrowthTab = {
     config: null,
     chart: null,
     selectedStats: new Set(),
+    _run: 0,
 
     /**
      * Initialize the tab
@@ -112,8 +113,10 @@ const StatGrowthTab = {
 
     /**
      * Update the chart
+     * Costs come from Python (curve_transport via the simulation server or pywebview) when available.
+     * Cost params are sent from the in-memory config, so unsaved edits are reflected.
      */
-    updateChart() {
+    async updateChart() {
         const minLevel = parseInt(document.getElementById('level-min')?.value) || 1;
         const maxLevel = parseInt(document.getElementById('level-max')?.value) || 50;
         const showCost = document.getElementById('show-cost')?.checked;
@@ -129,9 +132,21 @@ const StatGrowthTab = {
         const datasets = [];
         const milestoneData = [];
 
+        // Milestones go up to Lv.100, so fetch at least that far
+        const run = ++this._run;
+        const keys = [...this.selectedStats];
+        const curves = await Promise.all(keys.map(key => {
+            const [type, statId] = key.split(':');
+            return this.fetchCostCurve(type, statId, Math.max(maxLevel, 100));
+        }));
+        if (run !== this._run) {
+            return;  // a newer update started while this one was fetching
+        }
+
         let colorIndex = 0;
-        for (const key of this.selectedStats) {
+        for (const [index, key] of keys.entries()) {
             const [type, statId] = key.split(':');
+            const curve = curves[index];
             const stats = type === 'permanent'
                 ? this.config.permanentStats.stats
                 : this.config.inGameStats.stats;
@@ -140,7 +155,7 @@ const StatGrowthTab = {
             if (!stat) continue;
 
             const color = ChartUtils.colors[colorIndex % ChartUtils.colors.length];
-            const { costs, cumulativeCosts, effects } = this.calculateGrowthData(stat, minLevel, maxLevel);
+            const { costs, cumulativeCosts, effects } = this.calculateGrowthData(stat, minLevel, maxLevel, curve);
 
             if (showCost) {
                 datasets.push({
@@ -175,10 +190,10 @@ const StatGrowthTab = {
             // Milestone data
             milestoneData.push({
                 name: stat.name,
-                lv10: this.getMilestoneData(stat, 10),
-                lv25: this.getMilestoneData(stat, 25),
-                lv50: this.getMilestoneData(stat, 50),
-                lv100: this.getMilestoneData(stat, 100)
+                lv10: this.getMilestoneData(stat, 10, curve),
+                lv25: this.getMilestoneData(stat, 25, curve),
+                lv50: this.getMilestoneData(stat, 50, curve),
+                lv100: this.getMilestoneData(stat, 100, curve)
             });
 
             colorIndex++;
@@ -188,15 +203,58 @@ const StatGrowthTab = {
         this.renderMilestoneTable(milestoneData);
     },
 
+    /**
+     * Fetch level 1..maxLevel cost arrays ({level, cost, cumulative}) from Python
+     * Returns null when no Python source is available (FormulaEngine fallback).
+     */
+    async fetchCostCurve(type, statId, maxLevel) {
+        if (!ConfigLoader.canSimulate() && !window.pywebview?.api?.get_curves) {
+            return null;
+        }
+        const stats = type === 'permanent'
+            ? this.config.permanentStats?.stats
+            : this.config.inGameStats?.stats;
+        const stat = stats?.[statId] || {};
+        try {
+            const { arrays } = await ChartUtils.fetchCurves('upgrade_costs', {
+                stat: statId,
+                kind: type,
+                max_level: maxLevel,
+                // Edited (possibly unsaved) values instead of the file on disk
+                overrides: {
+                    base_cost: stat.base_cost,
+                    growth_rate: stat.growth_rate,
+                    multiplier: stat.multiplier,
+                    softcap_interval: stat.softcap_interval
+                }
+            });
+            return arrays;
+        } catch (error) {
+            console.warn(`Curve fetch failed for ${statId}, using FormulaEngine:`, error);
+            return null;
+        }
+    },
+
     /**
      * Calculate growth data for a stat
+     * @param {Object} [curve] - arrays from fetchCostCurve (cumulative counts from Lv.1)
      */
-    calculateGrowthData(stat, minLevel, maxLevel) {
+    calculateGrowthData(stat, minLevel, maxLevel, curve = null) {
         const costs = [];
         const cumulativeCosts = [];
         const effects = [];
         let cumulative = 0;
 
+        if (curve) {
+            const before = minLevel > 1 ? curve.cumulative[minLevel - 2] : 0;
+            for (let lv = minLevel; lv <= maxLevel; lv++) {
+                costs.push(curve.cost[lv - 1]);
+                cumulativeCosts.push(curve.cumulative[lv - 1] - before);
+                effects.push(FormulaEngine.calcStatEffect(stat.effect_per_level, lv));
+            }
+            return { costs, cumulativeCosts, effects };
+        }
+
         for (let lv = minLevel; lv <= maxLevel; lv++) {
             const cost = FormulaEngine.calcUpgradeCost(
                 stat.base_cost,
@@ -219,15 +277,15 @@ const StatGrowthTab = {
     /**
      * Get milestone data for a specific level
      */
-    getMilestoneData(stat, level) {
-        const cost = FormulaEngine.calcUpgradeCost(
+    getMilestoneData(stat, level, curve = null) {
+        const cost = curve ? curve.cost[level - 1] : FormulaEngine.calcUpgradeCost(
             stat.base_cost,
             stat.growth_rate,
             stat.multiplier,
             stat.softcap_interval,
             level
         );
-        const totalCost = FormulaEngine.calcTotalCost(
+        const totalCost = curve ? curve.cumulative[level - 1] : FormulaEngine.calcTotalCost(
             stat.base_cost,
             stat.growth_rate,
             stat.multiplier,
@@ -1,9 +1,10 @@
 """
 DeskWarrior Balance Dashboard - Standalone Application
 PyWebView 기반 데스크톱 앱
+- 시뮬레이션은 tools/sim_server.py 로컬 JSON-RPC 서버(프로세스 풀)에서 실행
 """
 
-import json
+import multiprocessing
 import os
 import sys
 import webview
@@ -28,38 +29,74 @@ def get_config_dir() -> str:
         return os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config')
 
 
+def add_tools_path():
+    """tools/ 모듈(시뮬레이터, 곡선 전송) import 경로 추가"""
+    tools_dir = get_resource_path('tools')
+    if tools_dir not in sys.path:
+        sys.path.insert(0, tools_dir)
+
+
+def start_sim_server():
+    """로컬 시뮬레이션 서버를 백그라운드 스레드로 시작 → URL (실패 시 None)"""
+    add_tools_path()
+    try:
+        from sim_server import DEFAULT_PORT, SimServer
+    except ImportError as e:
+        print(f"시뮬레이션 서버 비활성화 (의존성 없음): {e}")
+        return None
+
+    # 브라우저 모드와 같은 기본 포트, 사용 중이면 빈 포트
+    for port in (DEFAULT_PORT, 0):
+        try:
+            return SimServer(port=port).start_in_thread()
+        except OSError:
+            continue
+    return None
+
+
 class Api:
     """JavaScript에서 호출 가능한 Python API"""
 
+    def __init__(self, server_url: str = None):
+        self._server_url = server_url
+        self._config_store = None
+
+    def _store(self):
+        if self._config_store is None:
+            add_tools_path()
+            from config_store import ConfigStore
+            self._config_store = ConfigStore(get_config_dir())
+        return self._config_store
+
     def load_config(self, filename: str) -> dict:
         """JSON 설정 파일 로드"""
         try:
-            filepath = os.path.join(get_config_dir(), filename)
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return {'success': True, 'data': json.load(f)}
+            return self._store().load_one(filename)
         except Exception as e:
             return {'success': False, 'error': str(e)}
 
-    def save_config(self, filename: str, data: dict) -> dict:
-        """JSON 설정 파일 저장"""
+    def load_configs(self, filenames: list, known_hashes: dict = None) -> dict:
+        """여러 설정 파일을 한 번에 로드 (known_hashes 와 같은 파일은 내용 생략)"""
         try:
-            filepath = os.path.join(get_config_dir(), filename)
-
-            # 백업 생성
-            if os.path.exists(filepath):
-                backup_path = filepath + '.backup'
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    backup_data = f.read()
-                with open(backup_path, 'w', encoding='utf-8') as f:
-                    f.write(backup_data)
+            return {'success': True, 'files': self._store().load_many(filenames, known_hashes)}
+        except Exception as e:
+            return {'success': False, 'error': str(e)}
 
-            # 저장
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+    def save_config(self, filename: str, data: dict) -> dict:
+        """JSON 설정 파일 저장"""
+        result = self.save_configs({filename: data})
+        if result['success']:
+            result['message'] = f'{filename} 저장 완료'
+        return result
 
-            return {'success': True, 'message': f'{filename} 저장 완료'}
+    def save_configs(self, files: dict, base_hashes: dict = None) -> dict:
+        """여러 설정 파일을 원자적으로 저장 (base_hashes 와 현재 파일이 다르면 저장 안 함)"""
+        try:
+            saved = self._store().save_many(files, base_hashes)
+            return {'success': True, 'files': saved, 'message': f'{len(saved)}개 파일 저장 완료'}
         except Exception as e:
-            return {'success': False, 'error': str(e)}
+            # ConfigConflict 는 충돌 파일의 현재 해시를 함께 반환
+            return {'success': False, 'error': str(e), 'conflicts': getattr(e, 'conflicts', {})}
 
     def list_configs(self) -> dict:
         """config 폴더의 JSON 파일 목록"""
@@ -74,6 +111,20 @@ class Api:
         """config 폴더 경로 반환"""
         return get_config_dir()
 
+    def get_curves(self, kind: str, params: dict = None) -> dict:
+        """곡선 배열 (curve_transport 바이너리를 base64로, JS에서 Float64Array 뷰로 매핑)"""
+        try:
+            add_tools_path()
+            from curve_transport import build_curves, encode_base64
+            payload = build_curves(kind, params or {})
+            return {'success': True, 'encoding': 'base64', 'data': encode_base64(payload)}
+        except Exception as e:
+            return {'success': False, 'error': str(e)}
+
+    def get_server_url(self) -> str:
+        """시뮬레이션 서버 URL (없으면 빈 문자열)"""
+        return self._server_url or ''
+
 
 def main():
     # dashboard/index.html 경로
@@ -86,8 +137,8 @@ def main():
     # 파일 URL로 변환
     html_url = f'file:///{html_path.replace(os.sep, "/")}'
 
-    # API 인스턴스 생성
-    api = Api()
+    # API 인스턴스 생성 (시뮬레이션 서버 URL 전달)
+    api = Api(start_sim_server())
 
     # 웹뷰 창 생성
     window = webview.create_window(
@@ -105,4 +156,5 @@ def main():
 
 
 if __name__ == '__main__':
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DeskWarrior 업적 해금 시점 예측
+- Achievements.json 을 메트릭별 정렬된 목표값 배열로 색인
+- 진행 모델: prestige_simulator 구간별 런 메트릭(run_simulator 카운터)을 누적한 곡선
+  (CPS 격자 × 전략별 1회 계산, 결과 캐시)
+- 목표값 배열 전체를 누적 곡선에 이진 탐색(searchsorted) → 해금 플레이 시간
+- 세션 메트릭(세션 수/플레이 시간/연속 일수)은 플레이어별 하루 플레이 시간으로 해석적으로 계산
+- population_simulator 와 같은 플레이어 표본 → 진행 속도와 업적 속도를 같은 집단에서 비교
+- 출력: 업적별 기간 내 해금 비율, 해금 일수 백분위, 해금 시점 최대 스테이지
+
+게임의 AchievementManager.GetMetricValue 에 없는 메트릭(special_*)은 항상 0 → 해금 불가로 보고
+
+사용법:
+    python tools/achievement_projector.py --players 100000 --days 30 --workers 8
+"""
+
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from economy_model import load_json
+from localization import Localizer
+from population_simulator import CPS_GRID, PopulationConfig, TRAJECTORY_CONFIGS, sample_players
+from prestige_simulator import PERM_POLICIES, PrestigeSimulator
+from result_cache import RESULT_CACHE
+from streaming_stats import Summary
+
+# 업적 메트릭 → 런 메트릭 (prestige_simulator.Segment.metrics 키)
+SUM_METRICS = {
+    'total_damage': 'damage',
+    'critical_hits': 'crits',
+    'monster_kills': 'kills',
+    'bosses_defeated': 'bosses',
+    'total_gold_earned': 'gold_earned',
+    'total_gold_spent': 'gold_spent',
+    'keyboard_inputs': 'keyboard_inputs',
+    'mouse_inputs': 'mouse_inputs',
+}
+# 최고 기록형 (런마다 누적이 아닌 최대값)
+PEAK_METRICS = {
+    'max_level': 'max_stage',
+    'max_damage': 'max_hit',
+}
+# 플레이 패턴으로 정해지는 메트릭
+SESSION_METRICS = ('total_sessions', 'total_playtime_minutes', 'consecutive_days')
+
+
+# ============================================================
+# 업적 색인
+# ============================================================
+
+@dataclass
+class Achievement:
+    id: str
+    metric: str
+    target: float
+    name: str = ''
+    hidden: bool = False
+
+
+def _name(loc: Localizer, achievement: dict) -> str:
+    """컴파일된 로컬라이제이션 표의 이름 (없으면 업적 id)"""
+    key = f"achievement.{achievement['id']}.name"
+    return loc.get(key) if loc.key_id(key) >= 0 else achievement['id']
+
+
+class AchievementIndex:
+    """메트릭별 정렬된 목표값 배열 (+ 원래 업적 순서로 되돌리는 위치)"""
+
+    def __init__(self, achievements: Sequence[Achievement]):
+        self.achievements = list(achievements)
+        self.metrics: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        by_metric: Dict[str, List[int]] = {}
+        for i, a in enumerate(self.achievements):
+            by_metric.setdefault(a.metric, []).append(i)
+        for metric, positions in by_metric.items():
+            targets = np.array([self.achievements[i].target for i in positions], dtype=np.float64)
+            order = np.argsort(targets, kind='stable')
+            self.metrics[metric] = (targets[order], np.array(positions)[order])
+
+    @classmethod
+    def load(cls, filename: str = 'Achievements.json', locale: str = 'ko-KR') -> 'AchievementIndex':
+        data = load_json(filename)
+        loc = Localizer(locale)
+        return cls([
+            Achievement(a['id'], a['metric'], float(a['target']),
+                        _name(loc, a),
+                        bool(a.get('is_hidden', False)))
+            for a in data.get('achievements', [])
+        ])
+
+    def __len__(self) -> int:
+        return len(self.achievements)
+
+    @property
+    def ids(self) -> List[str]:
+        return [a.id for a in self.achievements]
+
+    @staticmethod
+    def supported(metric: str) -> bool:
+        return metric in SUM_METRICS or metric in PEAK_METRICS or metric in SESSION_METRICS
+
+    def unsupported(self) -> List[Achievement]:
+        return [a for a in self.achievements if not self.supported(a.metric)]
+
+
+# ============================================================
+# 누적 메트릭 곡선
+# ============================================================
+
+@dataclass
+class MetricCurve:
+    """한 (CPS, 전략)의 누적 플레이 시간 → 누적 메트릭 (구간 끝 값, 구간 안은 선형)"""
+    t1: np.ndarray                      # 구간 끝 누적 초
+    first_run: np.ndarray               # 구간 첫 런이 끝나는 누적 초 (최고 기록 갱신 시점)
+    stage: np.ndarray                   # 구간 최대 스테이지
+    totals: Dict[str, np.ndarray]       # 누적형: 구간 끝 누적값
+    peaks: Dict[str, np.ndarray]        # 최고 기록형: 구간까지의 최대값
+
+    def crossing_seconds(self, metric: str, targets: np.ndarray) -> np.ndarray:
+        """정렬된 목표값 배열 → 처음 도달하는 누적 플레이 시간 (미도달 inf)"""
+        targets = np.asarray(targets, dtype=np.float64)
+        out = np.full(len(targets), np.inf)
+        if metric in PEAK_METRICS:
+            running = self.peaks[PEAK_METRICS[metric]]
+            i = np.searchsorted(running, targets, side='left')
+            hit = i < len(running)
+            out[hit] = self.first_run[i[hit]]
+            return out
+        values = np.concatenate([[0.0], self.totals[SUM_METRICS[metric]]])
+        seconds = np.concatenate([[0.0], self.t1])
+        i = np.searchsorted(values, targets, side='left')
+        out[i == 0] = 0.0
+        hit = (i > 0) & (i < len(values))
+        lo, hi = i[hit] - 1, i[hit]
+        frac = (targets[hit] - values[lo]) / np.maximum(values[hi] - values[lo], 1e-12)
+        out[hit] = seconds[lo] + frac * (seconds[hi] - seconds[lo])
+        return out
+
+    def stage_at(self, seconds: np.ndarray) -> np.ndarray:
+        """누적 플레이 시간 → 최대 스테이지 (궤적 끝 이후는 마지막 구간)"""
+        i = np.minimum(np.searchsorted(self.t1, seconds, side='left'), len(self.t1) - 1)
+        return self.stage[i]
+
+
+@RESULT_CACHE.memoize(*TRAJECTORY_CONFIGS)
+def build_curve(cps: float, strategy: str, runs: int, start_crystals: float) -> MetricCurve:
+    sim = PrestigeSimulator(cps=cps, perm_policy=strategy)
+    result = sim.simulate(runs, crystals=start_crystals)
+    segments = result.segments
+    starts = np.array([s.start_run for s in segments])
+    counts = np.array([s.runs for s in segments])
+    seconds = np.concatenate([[0.0], result.play_seconds])
+    t0, t1 = seconds[starts], seconds[starts + counts]
+    stage = np.array([s.max_stage for s in segments])
+
+    # 구간 메트릭은 런 1회 값 → 런 수를 곱해 누적 (스트리밍 카운터)
+    totals = {key: np.cumsum([s.metrics.get(key, 0.0) * s.runs for s in segments])
+              for key in SUM_METRICS.values()}
+    peaks = {'max_stage': np.maximum.accumulate(stage.astype(np.float64)),
+             'max_hit': np.maximum.accumulate([s.metrics.get('max_hit', 0.0) for s in segments])}
+    return MetricCurve(t1=t1, first_run=t0 + (t1 - t0) / counts, stage=stage, totals=totals, peaks=peaks)
+
+
+def _curve_task(args) -> Tuple[int, int, MetricCurve]:
+    i, j, cps, strategy, runs, start_crystals = args
+    return i, j, build_curve(cps, strategy, runs, start_crystals)
+
+
+# ============================================================
+# 집계
+# ============================================================
+
+@dataclass
+class ProjectionConfig(PopulationConfig):
+    sessions_per_day: float = 1.0       # 하루 세션 수 (매일 접속 가정)
+
+
+@dataclass
+class AchievementStats:
+    """병합 가능한 업적별 집계 (플레이어별 해금 시점은 보관하지 않음)"""
+    ids: Tuple[str, ...]
+    unlocked: np.ndarray                # (A,) 기간 내 해금한 플레이어 수
+    days: List[Summary] = field(default_factory=list)      # 해금 일수
+    stages: List[Summary] = field(default_factory=list)    # 해금 시점 최대 스테이지
+    players: int = 0
+
+    @classmethod
+    def empty(cls, ids: Sequence[str]) -> 'AchievementStats':
+        return cls(tuple(ids), np.zeros(len(ids), dtype=np.int64),
+                   [Summary() for _ in ids], [Summary() for _ in ids])
+
+    def merge(self, other: 'AchievementStats') -> 'AchievementStats':
+        self.unlocked += other.unlocked
+        for mine, theirs in zip(self.days + self.stages, other.days + other.stages):
+            mine.merge(theirs)
+        self.players += other.players
+        return self
+
+    def rate(self, i: int) -> float:
+        return float(self.unlocked[i]) / max(self.players, 1)
+
+    def day_percentiles(self, i: int, percentiles=(10, 50, 90)) -> Dict[int, Optional[float]]:
+        """해금 일수 백분위 (기간 내 해금 못한 플레이어 포함, 도달 못하면 None)"""
+        out = {}
+        for p in percentiles:
+            q = p / 100 * self.players / self.unlocked[i] if self.unlocked[i] else np.inf
+            out[p] = float(self.days[i].digest.quantile(q)[0]) if q <= 1 else None
+        return out
+
+
+_INDEX: Optional[AchievementIndex] = None
+_CURVES: Dict[Tuple[int, int], MetricCurve] = {}
+
+
+def _init_worker(index, curves):
+    global _INDEX, _CURVES
+    _INDEX, _CURVES = index, curves
+
+
+def unlock_seconds(curve: MetricCurve, index: AchievementIndex) -> np.ndarray:
+    """(A,) 진행 메트릭 업적의 해금 누적 플레이 시간 (세션/미지원 메트릭은 nan)"""
+    out = np.full(len(index), np.nan)
+    for metric, (targets, positions) in index.metrics.items():
+        if metric in SUM_METRICS or metric in PEAK_METRICS:
+            out[positions] = curve.crossing_seconds(metric, targets)
+    return out
+
+
+def session_days(index: AchievementIndex, per_day: np.ndarray, sessions_per_day: float) -> np.ndarray:
+    """(N, A) 세션 메트릭 업적의 해금 일수 (그 외 nan)"""
+    out = np.full((len(per_day), len(index)), np.nan)
+    for metric, (targets, positions) in index.metrics.items():
+        if metric == 'total_sessions':
+            # 세션 종료 시 +1 (StatisticsCalculator.UpdateLifetimeStats)
+            out[:, positions] = targets[None, :] / sessions_per_day
+        elif metric == 'total_playtime_minutes':
+            out[:, positions] = targets[None, :] * 60 / per_day[:, None]
+        elif metric == 'consecutive_days':
+            out[:, positions] = np.maximum(targets - 1, 0)[None, :]
+        elif not AchievementIndex.supported(metric):
+            out[:, positions] = np.inf
+    return out
+
+
+def _project_batch(args) -> AchievementStats:
+    start, n, config = args
+    index = _INDEX
+    players = sample_players(config, start, n)
+    per_day = players.per_day
+
+    days = session_days(index, per_day, config.sessions_per_day)
+    stages = np.zeros(days.shape, dtype=np.int64)
+    for key, members in players.groups(len(config.strategy_weights)):
+        curve = _CURVES[key]
+        progress = unlock_seconds(curve, index)
+        column = ~np.isnan(progress)
+        days[np.ix_(members, np.flatnonzero(column))] = progress[None, column] / per_day[members, None]
+        seconds = np.where(np.isfinite(days[members]), days[members], 0.0) * per_day[members, None]
+        stages[members] = curve.stage_at(seconds)
+
+    stats = AchievementStats.empty(index.ids)
+    stats.players = n
+    within = days <= config.days
+    stats.unlocked += within.sum(axis=0)
+    for i in range(len(index)):
+        sel = within[:, i]
+        stats.days[i].update(days[sel, i])
+        stats.stages[i].update(stages[sel, i])
+    return stats
+
+
+def project_achievements(config: ProjectionConfig, index: Optional[AchievementIndex] = None,
+                         workers: int = 0) -> AchievementStats:
+    """집단 업적 해금 시뮬레이션 (workers: 0 = CPU 수, 1 = 현재 프로세스)"""
+    index = index or AchievementIndex.load()
+    names = list(config.strategy_weights)
+    for name in names:
+        if name not in PERM_POLICIES:
+            raise ValueError(f"알 수 없는 전략: {name}")
+
+    curve_tasks = [(i, j, float(c), s, config.runs, config.start_crystals)
+                   for i, c in enumerate(CPS_GRID) for j, s in enumerate(names)]
+    batch_tasks = [(k, min(config.batch, config.players - k), config) for k in range(0, config.players, config.batch)]
+
+    stats = AchievementStats.empty(index.ids)
+    if workers == 1:
+        _init_worker(index, {(i, j): c for i, j, c in map(_curve_task, curve_tasks)})
+        for part in map(_project_batch, batch_tasks):
+            stats.merge(part)
+        return stats
+
+    with ProcessPoolExecutor(max_workers=workers or None) as pool:
+        curves = {(i, j): c for i, j, c in pool.map(_curve_task, curve_tasks)}
+    with ProcessPoolExecutor(max_workers=workers or None, initializer=_init_worker,
+                             initargs=(index, curves)) as pool:
+        for part in pool.map(_project_batch, batch_tasks):
+            stats.merge(part)
+    return stats
+
+
+# ============================================================
+# 메인
+# ============================================================
+
+def print_report(stats: AchievementStats, index: AchievementIndex, config: ProjectionConfig):
+    print(f"\n{'='*96}")
+    print(f" 업적 해금 예측 ({stats.players:,}명, {config.days:g}일, 하루 세션 {config.sessions_per_day:g}회)")
+    print(f"{'='*96}")
+    print(f" {'업적':<22} {'메트릭':<22} {'목표':>10} | {'해금':>6} | {'p10':>7} {'p50':>7} {'p90':>7} | "
+          f"{'스테이지':>7} |")
+    print(f"{'-'*96}")
+    fmt_day = lambda d: f"{d:>6.2f}일" if d is not None else f"{'-':>7}"
+    for i, a in enumerate(index.achievements):
+        if not index.supported(a.metric):
+            continue
+        dp = stats.day_percentiles(i)
+        stage = f"{stats.stages[i].percentiles((50,))[50]:>7.0f}" if stats.unlocked[i] else f"{'-':>7}"
+        rate = stats.rate(i)
+        note = " 도달 불가" if rate == 0 else (" 희귀" if rate < 0.1 else "")
+        print(f" {a.id:<22} {a.metric:<22} {a.target:>10,.0f} | {rate * 100:>5.1f}% | "
+              f"{fmt_day(dp[10])} {fmt_day(dp[50])} {fmt_day(dp[90])} | {stage} |{note}")
+
+    unsupported = index.unsupported()
+    if unsupported:
+        print("\n 게임에서 집계하지 않는 메트릭 (항상 0, 해금 불가): "
+              + ", ".join(f"{a.id}({a.metric})" for a in unsupported))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DeskWarrior 업적 해금 시점 예측")
+    parser.add_argument('--players', type=int, default=100000)
+    parser.add_argument('--days', type=float, default=30.0)
+    parser.add_argument('--minutes', type=float, default=30.0, help="하루 플레이 시간 중앙값 (분)")
+    parser.add_argument('--sessions-per-day', type=float, default=1.0)
+    parser.add_argument('--start-crystals', type=float, default=0.0)
+    parser.add_argument('--runs', type=int, default=20000, help="궤적 최대 런 수")
+    parser.add_argument('--workers', type=int, default=0)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    config = ProjectionConfig(players=args.players, days=args.days, minutes_median=args.minutes,
+                              start_crystals=args.start_crystals, runs=args.runs, seed=args.seed,
+                              sessions_per_day=args.sessions_per_day)
+    index = AchievementIndex.load()
+    started = time.perf_counter()
+    stats = project_achievements(config, index, workers=args.workers)
+    elapsed = time.perf_counter() - started
+    print_report(stats, index, config)
+    print(f"\n {elapsed:.1f}초 ({stats.players / max(elapsed, 1e-9):,.0f}명/초)")
+
+
+if __name__ == '__main__':
+    main()
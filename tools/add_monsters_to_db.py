@@ -1,8 +1,5 @@
 
-import json
-import os
-
-DB_FILE = os.path.join(os.path.dirname(__file__), "monster_db.json")
+from monster_store import add_species
 
 new_monsters = [
     {
@@ -104,29 +101,15 @@ new_monsters = [
 ]
 
 def main():
-    print(f"Loading {DB_FILE}...")
-    try:
-        with open(DB_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-    except FileNotFoundError:
-        print("DB file not found, creating new.")
-        data = []
-
-    existing_ids = {entry['id'] for entry in data}
-    
-    added_count = 0
-    for monster in new_monsters:
-        if monster['id'] not in existing_ids:
-            data.append(monster)
-            existing_ids.add(monster['id'])
-            added_count += 1
-            print(f"Added {monster['id']}")
+    results = add_species(new_monsters)
+    for monster_id, result in results.items():
+        if result == 'added':
+            print(f"Added {monster_id}")
         else:
-            print(f"Skipping {monster['id']} (already exists)")
+            print(f"Skipping {monster_id} (already exists)")
 
+    added_count = sum(1 for r in results.values() if r == 'added')
     if added_count > 0:
-        with open(DB_FILE, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
         print(f"Successfully added {added_count} new monsters to DB.")
     else:
         print("No new monsters added.")
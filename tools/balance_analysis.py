@@ -20,6 +20,13 @@ from stat_formulas_generated import (
     calc_damage,
     calc_combo_multiplier,
 )
+from result_cache import RESULT_CACHE
+
+# 분석 결과에 영향을 주는 설정 파일 (내용이 바뀌면 캐시 무효화)
+ANALYSIS_CONFIGS = (
+    "StatFormulas.json", "PermanentStatGrowth.json", "InGameStatGrowth.json",
+    "PlayerLevels.json", "CharacterData.json", "GameData.json",
+)
 
 
 class BalanceAnalyzer:
@@ -133,6 +140,7 @@ class BalanceAnalyzer:
             level=level
         )
 
+    @RESULT_CACHE.memoize(*ANALYSIS_CONFIGS)
     def analyze_level_progression(self, max_level: int = 50) -> List[dict]:
         """레벨별 진행 분석"""
         results = []
@@ -193,6 +201,7 @@ class BalanceAnalyzer:
 
         return results
 
+    @RESULT_CACHE.memoize(*ANALYSIS_CONFIGS)
     def analyze_upgrade_economy(self) -> dict:
         """업그레이드 경제 분석"""
         # 키보드/마우스 레벨별 비용
@@ -514,7 +523,9 @@ def main():
 
     print("\n" + "=" * 80)
     print("=" + " 분석 완료".center(78) + "=")
-    print("=" * 80 + "\n")
+    print("=" * 80)
+    stats = RESULT_CACHE.stats()
+    print(f" 결과 캐시: 적중 {stats['hits']} / 미스 {stats['misses']} ({RESULT_CACHE.path})\n")
 
 
 if __name__ == '__main__':
@@ -349,6 +349,9 @@ def main():
         print("  4. 플레이 시뮬레이션")
         print("  5. 파라미터 비교")
         print("  6. 전체 스탯 요약")
+        print("  7. 런 시뮬레이션 (이벤트 기반)")
+        print("  8. 프레스티지 루프 (장기 진행)")
+        print("  9. 플레이어 집단 시뮬레이션")
         print("  0. 종료")
         print("-"*50)
 
@@ -455,6 +458,37 @@ def main():
                 c50 = stat.calculate_total_cost(1, 51)
                 print(f" {stat.name:>20} | {c10:>12,} | {c30:>12,} | {c50:>12,}")
 
+        elif choice == '7':
+            try:
+                sessions = int(input(" 세션 수 (기본 10000): ") or "10000")
+                cps = float(input(" 평균 CPS (기본 5): ") or "5")
+                from run_simulator import RunSimulator, print_summary
+                result = RunSimulator().simulate(sessions, cps=cps)
+                print_summary(result)
+            except ValueError:
+                print(" 잘못된 입력")
+
+        elif choice == '8':
+            try:
+                runs = int(input(" 런 수 (기본 10000): ") or "10000")
+                cps = float(input(" 평균 CPS (기본 5): ") or "5")
+                target = int(input(" 목표 스테이지 (기본 200): ") or "200")
+                from prestige_simulator import PrestigeSimulator, print_report
+                sim = PrestigeSimulator(cps=cps)
+                print_report(sim.simulate(runs), target, 60.0, sim.table)
+            except ValueError:
+                print(" 잘못된 입력")
+
+        elif choice == '9':
+            try:
+                players = int(input(" 플레이어 수 (기본 100000): ") or "100000")
+                days = float(input(" 기간 일수 (기본 30): ") or "30")
+                from population_simulator import PopulationConfig, simulate_population, print_report as print_population
+                config = PopulationConfig(players=players, days=days)
+                print_population(simulate_population(config), config)
+            except ValueError:
+                print(" 잘못된 입력")
+
 
 if __name__ == "__main__":
     main()
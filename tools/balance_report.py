@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DeskWarrior 밸런스 리포트 (헤드리스 일괄 렌더링)
+- 스탯 편집기(StatEditorTab)의 스탯별 패널: 업그레이드 비용 / 누적 비용 / 필요 CPS / CPS vs 스테이지 / 골드 / 누적 골드
+- 비교 분석기(ComparisonAnalyzerTab)의 프리셋 비교: 필요 클릭 수 / 필요 CPS
+- Qt 없이 matplotlib Agg 캔버스로 렌더링, 그림 단위로 프로세스 병렬화
+- 프로세스마다 스타일을 입힌 Figure 템플릿을 한 번 만들고 선만 바꿔 재사용
+- 결과: 단일 HTML (PNG 내장) 또는 PDF
+
+--baseline 으로 다른 config 폴더를 주면 기준(파랑) / 현재(빨강 점선) 비교
+
+사용법:
+    python tools/balance_report.py                                  # balance_report.html
+    python tools/balance_report.py -o review.pdf --max-level 50 --max-stage 100
+    python tools/balance_report.py --baseline old_config --workers 4
+"""
+
+import argparse
+import base64
+import html
+import io
+import os
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import matplotlib
+import matplotlib.font_manager as fm
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+import economy_model as EM
+import stat_formulas_generated as SF
+
+STAT_FILES = (('permanent', 'PermanentStatGrowth.json'), ('ingame', 'InGameStatGrowth.json'))
+GOLD_FLAT_STATS = ('gold_flat', 'gold_flat_perm')
+GOLD_MULTI_STATS = ('gold_multi', 'gold_multi_perm')
+CPS_HARD, CPS_EASY = 15, 5
+
+# 대시보드와 같은 색
+BG = '#1e1e2e'
+BASE_COLOR = '#4a90d9'
+CURRENT_COLOR = '#ff6b6b'
+GOLD_COLOR = '#ffc107'
+
+
+@dataclass
+class ReportConfig:
+    config_dir: Path = EM.CONFIG_DIR
+    baseline_dir: Optional[Path] = None
+    max_level: int = 30             # 스탯 편집기 업글Lv
+    base_power: int = 20            # 기본공격력
+    max_stage: int = 50             # 필요 CPS 기준 스테이지 / 스테이지 곡선 끝
+    stage_range: Tuple[int, int] = (1, 50)      # 프리셋 비교 스테이지 범위
+    dpi: int = 100
+
+
+@dataclass
+class RenderedFigure:
+    key: str
+    title: str
+    png: bytes
+    summary: Dict[str, str] = field(default_factory=dict)
+
+
+# ============================================================
+# 데이터
+# ============================================================
+
+@lru_cache(maxsize=None)
+def load_sources(config_dir: Path) -> dict:
+    """{'stats': {(kind, id): 파라미터}, 'names': {...}, 'presets': {...}} (프로세스당 1회)"""
+    stats, names = {}, {}
+    for kind, filename in STAT_FILES:
+        for sid, stat in EM.load_json(filename, config_dir).get('stats', {}).items():
+            if sid.startswith('_'):
+                continue
+            stats[(kind, sid)] = stat
+            names[(kind, sid)] = stat.get('name', sid)
+
+    try:
+        presets = EM.load_json('BalancePresets.json', config_dir).get('presets', {})
+    except FileNotFoundError:
+        presets = {}
+    if 'live' in presets:           # ComparisonAnalyzerTab._sync_live_preset 과 동일
+        try:
+            presets['live']['levels'] = EM.load_json('PlayerLevels.json', config_dir).get('permanent_levels', {})
+        except FileNotFoundError:
+            pass
+    return {'stats': stats, 'names': names, 'presets': presets}
+
+
+def stat_damage(sid: str, effect, base_power: float) -> Tuple[np.ndarray, np.ndarray]:
+    """스탯 하나만 반영한 (타격 데미지, 제한시간) - StatEditorTab 그래프와 같은 근사"""
+    effect = np.asarray(effect, dtype=np.float64)
+    dmg = np.full_like(effect, float(base_power))
+    limit = np.full_like(effect, float(SF.BASE_TIME_LIMIT))
+    if sid == 'base_attack':
+        dmg = dmg + effect
+    elif sid in ('attack_percent', 'multi_hit'):
+        dmg = dmg * (1 + effect / 100)
+    elif sid == 'crit_chance':
+        dmg = dmg * (1 + np.minimum(SF.BASE_CRIT_CHANCE + effect / 100, 1.0))
+    elif sid == 'time_extend':
+        limit = limit + effect
+    else:
+        dmg = dmg + effect * 0.5
+    return np.maximum(dmg, 1), limit
+
+
+def stat_curves(sid: str, vals: dict, cfg: ReportConfig) -> Dict[str, np.ndarray]:
+    """스탯 하나의 패널 곡선 (레벨 1..max_level, 스테이지 1..max_stage)"""
+    levels = np.arange(1, cfg.max_level + 1)
+    params = np.array([float(vals.get(k, EM.PARAM_DEFAULTS[k])) for k in EM.COST_PARAM_KEYS])
+    with np.errstate(over='ignore'):
+        cost = EM.upgrade_costs(params, levels)
+    per_level = float(vals.get('effect_per_level', 1))
+
+    dmg, limit = stat_damage(sid, per_level * levels, cfg.base_power)
+    cps_level = EM.stage_hp(cfg.max_stage) / dmg / limit
+
+    stages = np.arange(1, cfg.max_stage + 1)
+    effect_max = per_level * cfg.max_level
+    dmg_max, limit_max = stat_damage(sid, effect_max, cfg.base_power)
+    gold = EM.stage_gold(stages, effect_max if sid in GOLD_FLAT_STATS else 0.0,
+                         effect_max if sid in GOLD_MULTI_STATS else 0.0)
+    return {
+        'levels': levels, 'cost': cost, 'cumulative': np.cumsum(cost), 'cps_level': cps_level,
+        'stages': stages, 'cps_stage': EM.stage_hp(stages) / dmg_max / limit_max,
+        'gold': gold, 'gold_cumulative': np.cumsum(gold),
+    }
+
+
+def preset_curves(levels: Dict[str, int], perm_stats: Dict[str, dict],
+                  stages: np.ndarray) -> Dict[str, np.ndarray]:
+    """프리셋 레벨 → 스테이지별 필요 클릭 수 / 필요 CPS (ComparisonAnalyzerTab._calc_dps 와 같은 가정)"""
+    effects = EM.perm_effects(levels, perm_stats)
+    base_power = (20 + effects.get('start_keyboard', 0) + effects.get('start_mouse', 0)) / 2
+    damage = float(EM.damage_from_effects(effects, base_power, combo_stack=1.5))
+    clicks = EM.stage_hp(stages) / damage if damage > 0 else np.full(len(stages), 9999.0)
+    return {'clicks': clicks, 'cps': clicks / EM.time_limit_from_effects(effects)}
+
+
+# ============================================================
+# 렌더링 (워커)
+# ============================================================
+
+_TEMPLATES: Dict[Tuple[int, int], Tuple[Figure, np.ndarray]] = {}
+
+
+def _init_worker():
+    """한글 폰트 (대시보드와 같은 후보) + 누락 글리프 경고 숨김"""
+    for font in fm.fontManager.ttflist:
+        if 'Malgun' in font.name or 'malgun' in font.fname.lower():
+            matplotlib.rcParams['font.family'] = fm.FontProperties(fname=font.fname).get_name()
+            break
+    else:
+        matplotlib.rcParams['font.family'] = 'sans-serif'
+        matplotlib.rcParams['font.sans-serif'] = ['Malgun Gothic', 'NanumGothic', 'Arial Unicode MS', 'DejaVu Sans']
+    matplotlib.rcParams['axes.unicode_minus'] = False
+    warnings.filterwarnings('ignore', message='Glyph .* missing')
+
+
+def _template(rows: int, cols: int) -> Tuple[Figure, np.ndarray]:
+    """스타일이 적용된 Figure (프로세스당 격자 모양별 1개, 매번 데이터 아티스트만 지움)"""
+    template = _TEMPLATES.get((rows, cols))
+    if template is None:
+        fig = Figure(figsize=(4.2 * cols, 3.2 * rows), facecolor=BG)
+        FigureCanvasAgg(fig)
+        axes = fig.subplots(rows, cols, squeeze=False).ravel()
+        for ax in axes:
+            ax.set_facecolor(BG)
+            ax.tick_params(colors='#888', labelsize=7)
+            for spine in ax.spines.values():
+                spine.set_color('#444')
+            ax.grid(True, alpha=0.2)
+        fig.subplots_adjust(left=0.06, right=0.98, top=1 - 0.24 / rows, bottom=0.2 / rows, wspace=0.25, hspace=0.4)
+        template = _TEMPLATES[(rows, cols)] = (fig, axes)
+
+    fig, axes = template
+    for ax in axes:
+        for artist in list(ax.lines) + list(ax.collections):
+            artist.remove()
+        if ax.get_legend() is not None:
+            ax.get_legend().remove()
+        ax.relim()
+        ax.autoscale()
+    return fig, axes
+
+
+def _panel(ax, title: str, xlabel: str, x, current, baseline=None, color: str = BASE_COLOR,
+           cps_lines: bool = False):
+    if baseline is not None:
+        ax.plot(x, baseline, color=color, linewidth=1.5, label='기준')
+        ax.plot(x, current, color=CURRENT_COLOR, linewidth=1.5, linestyle='--', label='현재')
+        ax.legend(fontsize=6, facecolor='#2a2a3a', labelcolor='#ddd')
+    else:
+        ax.plot(x, current, color=color, linewidth=1.5)
+    if cps_lines:
+        ax.axhline(y=CPS_HARD, color='#ff4444', alpha=0.5, linestyle=':', linewidth=1)
+        ax.axhline(y=CPS_EASY, color='#ffc107', alpha=0.5, linestyle=':', linewidth=1)
+    ax.set_title(title, color='#ddd', fontsize=9)
+    ax.set_xlabel(xlabel, color='#888', fontsize=8)
+
+
+def _png(fig: Figure, dpi: int) -> bytes:
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=dpi, facecolor=fig.get_facecolor())
+    return buf.getvalue()
+
+
+def render_stat(kind: str, sid: str, cfg: ReportConfig) -> RenderedFigure:
+    sources = load_sources(Path(cfg.config_dir))
+    vals = sources['stats'][(kind, sid)]
+    curves = stat_curves(sid, vals, cfg)
+    base = None
+    if cfg.baseline_dir is not None:
+        base_vals = load_sources(Path(cfg.baseline_dir))['stats'].get((kind, sid))
+        base = stat_curves(sid, base_vals, cfg) if base_vals is not None else None
+    b = (lambda k: base[k]) if base else (lambda k: None)
+
+    fig, axes = _template(2, 3)
+    name = sources['names'][(kind, sid)]
+    fig.suptitle(f"{name} ({sid})", color='#eee', fontsize=11)
+    _panel(axes[0], '업그레이드 비용', '레벨', curves['levels'], curves['cost'], b('cost'))
+    _panel(axes[1], '누적 비용', '레벨', curves['levels'], curves['cumulative'], b('cumulative'))
+    _panel(axes[2], f'필요 CPS (Stage {cfg.max_stage})', '레벨', curves['levels'], curves['cps_level'],
+           b('cps_level'), cps_lines=True)
+    _panel(axes[3], f'CPS vs 스테이지 (Lv{cfg.max_level})', '스테이지', curves['stages'], curves['cps_stage'],
+           b('cps_stage'), cps_lines=True)
+    _panel(axes[4], '스테이지별 골드 획득', '스테이지', curves['stages'], curves['gold'], b('gold'), GOLD_COLOR)
+    _panel(axes[5], '누적 골드', '스테이지', curves['stages'], curves['gold_cumulative'],
+           b('gold_cumulative'), GOLD_COLOR)
+
+    total = float(curves['cumulative'][-1])
+    summary = {
+        '구분': kind, '스탯': f"{name} ({sid})",
+        f'Lv{cfg.max_level} 총비용': f"{total:,.0f}",
+        f'Stage{cfg.max_stage} CPS': f"{curves['cps_level'][-1]:.2f}",
+    }
+    if base:
+        base_total = float(base['cumulative'][-1])
+        diff = (total - base_total) / base_total * 100 if base_total > 0 else 0.0
+        summary[f'Lv{cfg.max_level} 총비용'] = f"{base_total:,.0f} → {total:,.0f} ({diff:+.1f}%)"
+        summary[f'Stage{cfg.max_stage} CPS'] = f"{base['cps_level'][-1]:.2f} → {curves['cps_level'][-1]:.2f}"
+    return RenderedFigure(f"{kind}.{sid}", f"{name} ({sid})", _png(fig, cfg.dpi), summary)
+
+
+def render_comparison(cfg: ReportConfig) -> RenderedFigure:
+    sources = load_sources(Path(cfg.config_dir))
+    perm_stats = {sid: s for (kind, sid), s in sources['stats'].items() if kind == 'permanent'}
+    start, end = sorted(cfg.stage_range)
+    stages = np.arange(start, end + 1)
+
+    fig, axes = _template(1, 2)
+    fig.suptitle("프리셋 비교", color='#eee', fontsize=11)
+    linestyles = ['-', '--', '-.', ':']
+    summary = {}
+    for idx, (pid, preset) in enumerate(sources['presets'].items()):
+        curves = preset_curves(preset.get('levels', {}), perm_stats, stages)
+        style = dict(color=preset.get('color', BASE_COLOR), linestyle=linestyles[idx % len(linestyles)],
+                     linewidth=2, label=preset.get('name', pid), marker='o', markersize=3, markevery=5)
+        axes[0].plot(stages, curves['clicks'], **style)
+        axes[1].plot(stages, curves['cps'], **style)
+        summary[preset.get('name', pid)] = f"Stage{end} 필요 CPS {curves['cps'][-1]:.2f}"
+
+    for label, cps, color in (('쉬움 (5 CPS)', 5, '#28a745'), ('보통 (10 CPS)', 10, '#ffc107'),
+                              ('어려움 (15 CPS)', 15, '#ff6b6b')):
+        axes[1].axhline(y=cps, color=color, linestyle=':', label=label, alpha=0.7)
+    for ax, title in ((axes[0], '스테이지별 필요 클릭 횟수'), (axes[1], '클리어에 필요한 입력 속도')):
+        ax.set_title(title, color='#ddd', fontsize=10)
+        ax.set_xlabel('Stage', color='#888', fontsize=8)
+        ax.legend(loc='upper left', fontsize=7, facecolor='#353535', labelcolor='#e0e0e0')
+    return RenderedFigure('comparison', '프리셋 비교', _png(fig, cfg.dpi), summary)
+
+
+def _render_task(task: tuple) -> RenderedFigure:
+    kind, sid, cfg = task
+    if kind == 'comparison':
+        return render_comparison(cfg)
+    return render_stat(kind, sid, cfg)
+
+
+# ============================================================
+# 리포트
+# ============================================================
+
+def report_tasks(cfg: ReportConfig) -> List[tuple]:
+    stats = load_sources(Path(cfg.config_dir))['stats']
+    return [(kind, sid, cfg) for kind, sid in stats] + [('comparison', None, cfg)]
+
+
+def render_report(cfg: ReportConfig, workers: int = 0) -> List[RenderedFigure]:
+    """모든 그림 렌더링 (workers: 0 = CPU 수, 1 = 현재 프로세스), 순서 유지"""
+    tasks = report_tasks(cfg)
+    if workers == 1:
+        _init_worker()
+        return [_render_task(t) for t in tasks]
+    workers = min(workers or os.cpu_count() or 1, len(tasks))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        return list(pool.map(_render_task, tasks, chunksize=max(1, len(tasks) // (workers * 2))))
+
+
+def write_html(figures: List[RenderedFigure], cfg: ReportConfig, path: Path):
+    stat_rows = [f for f in figures if f.key != 'comparison']
+    headers = list(stat_rows[0].summary) if stat_rows else []
+    table = ''.join(
+        '<tr>' + ''.join(f"<td>{html.escape(f.summary.get(h, ''))}</td>" for h in headers) + '</tr>'
+        for f in stat_rows
+    )
+    sections = ''.join(
+        f'<section id="{html.escape(f.key)}"><h2>{html.escape(f.title)}</h2>'
+        f'<img src="data:image/png;base64,{base64.b64encode(f.png).decode("ascii")}" alt="{html.escape(f.title)}">'
+        '</section>'
+        for f in figures
+    )
+    baseline = f" / 기준: {html.escape(str(cfg.baseline_dir))}" if cfg.baseline_dir else ""
+    doc = f"""<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><title>DeskWarrior 밸런스 리포트</title>
+<style>
+body {{ background: #2b2b2b; color: #e0e0e0; font-family: 'Malgun Gothic', sans-serif; margin: 24px; }}
+table {{ border-collapse: collapse; margin-bottom: 24px; }}
+td, th {{ border: 1px solid #555; padding: 4px 10px; font-size: 12px; }}
+th {{ background: #353535; }}
+img {{ max-width: 100%; }}
+h2 {{ color: #5c9ce6; font-size: 15px; }}
+</style></head><body>
+<h1>DeskWarrior 밸런스 리포트</h1>
+<p>{time.strftime('%Y-%m-%d %H:%M')} / config: {html.escape(str(cfg.config_dir))}{baseline}
+ / 업글Lv {cfg.max_level}, 기본공격력 {cfg.base_power}, 스테이지 {cfg.max_stage}</p>
+<table><tr>{''.join(f'<th>{html.escape(h)}</th>' for h in headers)}</tr>{table}</table>
+{sections}
+</body></html>
+"""
+    path.write_text(doc, encoding='utf-8')
+
+
+def write_pdf(figures: List[RenderedFigure], path: Path, dpi: int):
+    """렌더링된 PNG 를 한 페이지씩 PDF 로 묶음"""
+    from matplotlib.backends.backend_pdf import PdfPages
+    from matplotlib.image import imread
+
+    with PdfPages(path) as pdf:
+        for f in figures:
+            image = imread(io.BytesIO(f.png), format='png')
+            h, w = image.shape[:2]
+            page = Figure(figsize=(w / dpi, h / dpi), dpi=dpi)
+            FigureCanvasAgg(page)
+            page.figimage(image, 0, 0)
+            pdf.savefig(page, dpi=dpi)
+
+
+def write_report(figures: List[RenderedFigure], cfg: ReportConfig, path: Path) -> Path:
+    path = Path(path)
+    if path.suffix.lower() == '.pdf':
+        write_pdf(figures, path, cfg.dpi)
+    else:
+        write_html(figures, cfg, path)
+    return path
+
+
+# ============================================================
+# 메인
+# ============================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="DeskWarrior 밸런스 리포트 (헤드리스)")
+    parser.add_argument('-o', '--output', default='balance_report.html', help=".html 또는 .pdf")
+    parser.add_argument('--config', type=Path, default=EM.CONFIG_DIR, help="config 폴더")
+    parser.add_argument('--baseline', type=Path, help="비교 기준 config 폴더")
+    parser.add_argument('--max-level', type=int, default=30)
+    parser.add_argument('--base-power', type=int, default=20)
+    parser.add_argument('--max-stage', type=int, default=50)
+    parser.add_argument('--stages', type=int, nargs=2, default=(1, 50), metavar=('START', 'END'),
+                        help="프리셋 비교 스테이지 범위")
+    parser.add_argument('--dpi', type=int, default=100)
+    parser.add_argument('--workers', type=int, default=0)
+    args = parser.parse_args()
+
+    cfg = ReportConfig(args.config.resolve(), args.baseline.resolve() if args.baseline else None,
+                       args.max_level, args.base_power, args.max_stage, tuple(args.stages), args.dpi)
+    start = time.perf_counter()
+    figures = render_report(cfg, workers=args.workers)
+    path = write_report(figures, cfg, Path(args.output))
+    print(f"리포트: {path} (그림 {len(figures)}개, {time.perf_counter() - start:.1f}초)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DeskWarrior 빌드 파레토 탐색기
+- 고정 크리스탈 예산으로 영구 스탯 19종 레벨 배분을 진화 탐색
+- 목적 (모두 최대화): 기대 DPS, 런당 골드, 제한시간, 런당 크리스탈
+  (DPS는 비교 분석 탭 _calc_dps와 같은 가정: 기본 파워 10, 5 CPS, 콤보 1.5스택)
+  런 = 시작 스테이지(1 + 시작 레벨)부터 ref_stage 스테이지, 시작 골드+/* 는 인게임 골드+/* 시작 효과,
+  골드는 업그레이드 할인을 반영한 구매력 (run_simulator 와 같은 효과 해석)
+- 유전자 = 스탯 우선순위 벡터, 해석 = 우선순위/다음 비용 비율이 가장 높은 업그레이드부터
+  예산이 허락하는 만큼 구매 (배치 전체를 NumPy로 동시 해석/채점)
+- 비지배 보관소 + 혼잡도 거리 가지치기
+- 결과: 파레토 전선, 지배적 빌드, 죽은 스탯(전선에 한 번도 안 쓰이는 스탯),
+  BalancePresets.json 프리셋으로 내보내기
+
+사용법:
+    python tools/build_explorer.py --budget 2000
+    python tools/build_explorer.py --budget 5000 --export 6
+"""
+
+import argparse
+import json
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from economy_model import (
+    CONFIG_DIR,
+    StatTable,
+    expected_damage,
+    is_boss_stage,
+    load_json,
+    stage_gold,
+)
+from prestige_simulator import BossDropConfig
+from rng_streams import RandomStreams
+import stat_formulas_generated as SF
+
+PRESETS_FILE = 'BalancePresets.json'
+OBJECTIVES = ('dps', 'gold', 'time_limit', 'crystals')
+OBJECTIVE_NAMES = {'dps': 'DPS', 'gold': '골드', 'time_limit': '제한시간', 'crystals': '크리스탈'}
+
+# 목적에 영향을 주는 스탯 (나머지는 이 모델에서 중립)
+OBJECTIVE_STATS = {
+    'dps': ('base_attack', 'attack_percent', 'crit_chance', 'crit_damage', 'multi_hit',
+            'start_keyboard', 'start_mouse', 'start_combo_damage'),
+    'gold': ('gold_flat_perm', 'gold_multi_perm', 'start_gold', 'start_gold_flat', 'start_gold_multi',
+             'start_level', 'upgrade_discount'),
+    'time_limit': ('time_extend',),
+    'crystals': ('crystal_flat', 'crystal_multi', 'gold_flat_perm', 'gold_multi_perm', 'start_gold',
+                 'start_gold_flat', 'start_gold_multi', 'start_level'),
+}
+
+# 비교 분석 탭 _calc_dps 가정
+BASE_POWER = 10
+DEFAULT_CPS = 5.0
+AVG_COMBO_STACK = 1.5
+DEFAULT_REF_STAGE = 50      # 골드/크리스탈 기준 런 길이 (스테이지 수)
+MAX_DISCOUNT = 90.0         # 할인 구매력 계산 상한 (%, calc_discounted_cost 에는 상한 없음)
+
+DEFAULT_COLORS = ["#4a90d9", "#28a745", "#dc3545", "#ffc107", "#17a2b8", "#6f42c1", "#fd7e14", "#20c997"]
+
+
+# ============================================================
+# 채점
+# ============================================================
+
+class BuildScorer:
+    """레벨 행렬 (N, S) → 목적 행렬 (N, 4)"""
+
+    def __init__(self, table: StatTable, drops: Optional[BossDropConfig] = None,
+                 ref_stage: int = DEFAULT_REF_STAGE, cps: float = DEFAULT_CPS):
+        self.table = table
+        self.effect = table.column('effect_per_level')
+        self.ref_stage = ref_stage
+        self.cps = cps
+        self.offsets = np.arange(ref_stage)            # 시작 스테이지부터 런에서 지나는 스테이지
+        self.drops = drops or BossDropConfig.load()
+
+    def _e(self, eff: np.ndarray, stat_id: str) -> np.ndarray:
+        return eff[:, self.table.index(stat_id)] if stat_id in self.table.ids else np.zeros(len(eff))
+
+    def score(self, levels: np.ndarray) -> np.ndarray:
+        eff = levels * self.effect[None, :]
+        e = lambda sid: self._e(eff, sid)
+
+        power = BASE_POWER + (e('start_keyboard') + e('start_mouse')) / 2
+        damage = expected_damage(power, e('base_attack'), e('attack_percent'), e('crit_chance'),
+                                 e('crit_damage'), e('multi_hit'), AVG_COMBO_STACK, e('start_combo_damage'))
+        dps = damage * self.cps
+
+        # 런: 시작 레벨만큼 앞선 스테이지에서 시작, 시작 골드+/* 는 처치 골드의 인게임 골드+/* 에 더해짐
+        stages = (1 + np.trunc(e('start_level')))[:, None] + self.offsets[None, :]
+        gold_flat = (e('gold_flat_perm') + e('start_gold_flat'))[:, None]
+        gold_multi = (e('gold_multi_perm') + e('start_gold_multi'))[:, None]
+        gold = stage_gold(stages, gold_flat, gold_multi).sum(axis=1) + np.trunc(e('start_gold'))
+        discount = np.minimum(e('upgrade_discount'), MAX_DISCOUNT)
+
+        time_limit = SF.BASE_TIME_LIMIT + e('time_extend')
+
+        boss = is_boss_stage(stages)
+        chance = self.drops.drop_chances(stages, e('crystal_multi')[:, None])
+        amount = self.drops.base_amounts(stages, e('crystal_flat')[:, None])
+        drops = np.where(boss, chance * np.maximum(amount, 1), 0.0).sum(axis=1)
+        crystals = drops + np.floor(gold / SF.GOLD_TO_CRYSTAL_RATE)
+        return np.stack([dps, gold / (1 - discount / 100), time_limit, crystals], axis=1)
+
+
+# ============================================================
+# 파레토 유틸
+# ============================================================
+
+def non_dominated(points: np.ndarray, block: int = 512) -> np.ndarray:
+    """최대화 기준 비지배 마스크 (N,) - 블록 단위 쌍 비교"""
+    n = len(points)
+    keep = np.ones(n, dtype=bool)
+    for start in range(0, n, block):
+        p = points[start:start + block, None, :]
+        ge = (points[None, :, :] >= p).all(axis=2)
+        gt = (points[None, :, :] > p).any(axis=2)
+        keep[start:start + block] = ~(ge & gt).any(axis=1)
+    return keep
+
+
+def crowding_distance(points: np.ndarray) -> np.ndarray:
+    """NSGA-II 혼잡도 거리 (양 끝은 inf)"""
+    n, m = points.shape
+    dist = np.zeros(n)
+    if n <= 2:
+        return np.full(n, np.inf)
+    for j in range(m):
+        order = np.argsort(points[:, j], kind='stable')
+        span = points[order[-1], j] - points[order[0], j]
+        dist[order[[0, -1]]] = np.inf
+        if span > 0:
+            dist[order[1:-1]] += (points[order[2:], j] - points[order[:-2], j]) / span
+    return dist
+
+
+# ============================================================
+# 탐색기
+# ============================================================
+
+@dataclass
+class ParetoFront:
+    budget: float
+    stat_ids: List[str]
+    levels: np.ndarray          # (F, S)
+    scores: np.ndarray          # (F, 4)
+    costs: np.ndarray           # (F,)
+    evaluated: int
+    elapsed: float
+
+    def __len__(self) -> int:
+        return len(self.levels)
+
+    def usage(self) -> Dict[str, float]:
+        """스탯별 전선 빌드 사용 비율 (레벨 > 0)"""
+        return {sid: float((self.levels[:, i] > 0).mean()) for i, sid in enumerate(self.stat_ids)}
+
+    def dead_stats(self) -> List[str]:
+        """목적에 영향을 주지만 전선 어디에도 쓰이지 않는 스탯"""
+        relevant = {sid for stats in OBJECTIVE_STATS.values() for sid in stats}
+        return [sid for sid, u in self.usage().items() if sid in relevant and u == 0.0]
+
+    def extremes(self) -> Dict[str, int]:
+        """목적별 최고 빌드 인덱스"""
+        return {name: int(np.argmax(self.scores[:, j])) for j, name in enumerate(OBJECTIVES)}
+
+    def representatives(self, count: int) -> List[int]:
+        """내보낼 대표 빌드: 목적별 최고 + 정규화 공간에서 서로 가장 먼 빌드 순"""
+        if not len(self):
+            return []
+        lo, hi = self.scores.min(axis=0), self.scores.max(axis=0)
+        norm = (self.scores - lo) / np.where(hi > lo, hi - lo, 1.0)
+        chosen = []
+        for i in self.extremes().values():
+            if i not in chosen:
+                chosen.append(i)
+        if not chosen:
+            chosen.append(0)
+        while len(chosen) < min(count, len(self)):
+            d = np.min(np.linalg.norm(norm[:, None, :] - norm[None, chosen, :], axis=2), axis=1)
+            chosen.append(int(np.argmax(d)))
+        return chosen[:count]
+
+
+class BuildExplorer:
+    """예산 고정 빌드 진화 탐색 (우선순위 유전자 → 탐욕 해석)"""
+
+    def __init__(self, budget: float, config: Optional[dict] = None, scorer: Optional[BuildScorer] = None,
+                 stats: Optional[Sequence[str]] = None):
+        self.config = config if config is not None else load_json('PermanentStatGrowth.json')
+        self.table = StatTable.from_config(self.config)
+        self.budget = float(budget)
+        self.scorer = scorer or BuildScorer(self.table)
+        # 기본: 목적에 영향을 주는 스탯만 (중립 스탯에 쓰는 크리스탈은 항상 손해)
+        allowed = set(stats) if stats else {sid for group in OBJECTIVE_STATS.values() for sid in group}
+        self.allowed = np.array([sid in allowed for sid in self.table.ids])
+
+        # 레벨 l (1부터) 구매 비용, 예산으로 살 수 있는 범위까지
+        cap = 1
+        while True:
+            cum = self.table.cumulative_table(cap)
+            if cap >= 5000 or (cum[:, -1] > self.budget).all():
+                break
+            cap *= 2
+        costs = self.table.cost_table(cap)
+        limited = (self.table.max_level > 0)[:, None] & (np.arange(1, cap + 1)[None, :] > self.table.max_level[:, None])
+        costs = np.where(limited | ~self.allowed[:, None], np.inf, costs)
+        self.step_costs = np.concatenate([costs, np.full((len(self.table), 1), np.inf)], axis=1)
+
+    def decode(self, priority: np.ndarray) -> np.ndarray:
+        """우선순위 (N, S) → 레벨 (N, S): 예산 안에서 우선순위/비용 최대 업그레이드를 반복 구매"""
+        n, s = priority.shape
+        levels = np.zeros((n, s), dtype=np.int64)
+        left = np.full(n, self.budget)
+        rows = np.arange(n)
+        active = np.ones(n, dtype=bool)
+        while active.any():
+            idx = rows[active]
+            cost = self.step_costs[np.arange(s)[None, :], levels[idx]]              # (n_act, S)
+            ok = cost <= left[idx, None]
+            ratio = np.where(ok, priority[idx] / np.maximum(cost, 1e-9), -np.inf)
+            pick = np.argmax(ratio, axis=1)
+            can = ok.any(axis=1)
+            buy = idx[can]
+            levels[buy, pick[can]] += 1
+            left[buy] -= cost[can, pick[can]]
+            active[idx[~can]] = False
+        return levels
+
+    def spent(self, levels: np.ndarray) -> np.ndarray:
+        cum = np.concatenate([np.zeros((len(self.table), 1)), np.cumsum(np.where(np.isfinite(self.step_costs),
+                                                                                 self.step_costs, 0), axis=1)], axis=1)
+        return cum[np.arange(len(self.table))[None, :], levels].sum(axis=1)
+
+    def explore(self, generations: int = 40, population: int = 512, archive_size: int = 256,
+                seed: int = 0) -> ParetoFront:
+        started = time.perf_counter()
+        streams = RandomStreams(seed, 'build_explorer')
+        s = len(self.table)
+
+        # 초기 개체: 무작위 우선순위 + 단일 스탯 집중 + 목적별 스탯 묶음 + 균등
+        rng = streams.generator('init')
+        genomes = rng.lognormal(0, 1.5, (max(population, s + len(OBJECTIVES) + 1), s))
+        genomes[:s] = np.where(np.eye(s, dtype=bool), 1.0, 1e-6)
+        for j, name in enumerate(OBJECTIVES):
+            genomes[s + j] = [1.0 if sid in OBJECTIVE_STATS[name] else 1e-6 for sid in self.table.ids]
+        genomes[s + len(OBJECTIVES)] = 1.0
+        genomes *= self.allowed[None, :]
+
+        arch_g = np.zeros((0, s))
+        arch_l = np.zeros((0, s), dtype=np.int64)
+        arch_f = np.zeros((0, len(OBJECTIVES)))
+        evaluated = 0
+
+        for gen in range(generations + 1):
+            levels = self.decode(genomes)
+            scores = self.scorer.score(levels)
+            evaluated += len(levels)
+
+            # 보관소 갱신: 중복 레벨 제거 → 비지배만 → 혼잡도로 크기 제한
+            all_g = np.vstack([arch_g, genomes])
+            all_l = np.vstack([arch_l, levels])
+            all_f = np.vstack([arch_f, scores])
+            _, unique = np.unique(all_l, axis=0, return_index=True)
+            unique = np.sort(unique)
+            all_g, all_l, all_f = all_g[unique], all_l[unique], all_f[unique]
+            keep = non_dominated(all_f)
+            arch_g, arch_l, arch_f = all_g[keep], all_l[keep], all_f[keep]
+            if len(arch_f) > archive_size:
+                order = np.argsort(-crowding_distance(arch_f), kind='stable')[:archive_size]
+                arch_g, arch_l, arch_f = arch_g[order], arch_l[order], arch_f[order]
+
+            if gen == generations:
+                break
+
+            # 자식: 보관소에서 부모 선택 → 균등 교차 + 로그정규 변이 + 일부 스탯 0으로
+            rng = streams.generator('generation', gen)
+            pa = arch_g[rng.integers(len(arch_g), size=population)]
+            pb = arch_g[rng.integers(len(arch_g), size=population)]
+            child = np.where(rng.random((population, s)) < 0.5, pa, pb)
+            child = child * np.exp(rng.normal(0, 0.5, (population, s)))
+            child = np.where(rng.random((population, s)) < 0.05, 1e-6, child)
+            genomes = child * self.allowed[None, :]
+
+        order = np.lexsort(arch_f.T[::-1])[::-1]
+        return ParetoFront(
+            budget=self.budget,
+            stat_ids=list(self.table.ids),
+            levels=arch_l[order],
+            scores=arch_f[order],
+            costs=self.spent(arch_l[order]),
+            evaluated=evaluated,
+            elapsed=time.perf_counter() - started,
+        )
+
+
+# ============================================================
+# 프리셋 내보내기
+# ============================================================
+
+def build_label(front: ParetoFront, i: int) -> str:
+    """빌드가 가장 강한 목적 (전선 내 정규화 순위 기준)"""
+    lo, hi = front.scores.min(axis=0), front.scores.max(axis=0)
+    norm = (front.scores[i] - lo) / np.where(hi > lo, hi - lo, 1.0)
+    return OBJECTIVE_NAMES[OBJECTIVES[int(np.argmax(norm))]]
+
+
+def export_presets(front: ParetoFront, count: int, filename: str = PRESETS_FILE,
+                   prefix: str = 'pareto', config_dir: Optional[Path] = None) -> List[str]:
+    """대표 빌드를 BalancePresets.json 프리셋으로 추가 (같은 prefix의 이전 결과는 교체)"""
+    path = Path(config_dir or CONFIG_DIR) / filename
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    presets = data.setdefault('presets', {})
+    for pid in [p for p in presets if p.startswith(f"{prefix}_")]:
+        del presets[pid]
+
+    colors = data.get('default_colors', DEFAULT_COLORS)
+    added = []
+    for n, i in enumerate(front.representatives(count), 1):
+        pid = f"{prefix}_{int(front.budget)}_{n}"
+        dps, gold, time_limit, crystals = front.scores[i]
+        presets[pid] = {
+            'name': f"파레토 #{n} ({build_label(front, i)}형)",
+            'description': (f"예산 {front.budget:,.0f} 크리스탈 자동 탐색 - DPS {dps:,.0f}, 런 골드 {gold:,.0f}, "
+                            f"제한시간 {time_limit:g}초, 런 크리스탈 {crystals:,.1f}"),
+            'is_locked': False,
+            'color': colors[(n - 1) % len(colors)],
+            'levels': {sid: int(front.levels[i, j]) for j, sid in enumerate(front.stat_ids)},
+        }
+        added.append(pid)
+
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    return added
+
+
+# ============================================================
+# 메인
+# ============================================================
+
+def print_report(front: ParetoFront, top: int = 10):
+    print(f"\n{'='*90}")
+    print(f" 빌드 파레토 전선 (예산 {front.budget:,.0f} 크리스탈)")
+    print(f" 비지배 빌드 {len(front)}개 / 평가 {front.evaluated:,}개 / {front.elapsed:.1f}초")
+    print(f"{'='*90}")
+
+    print(f"\n [목적별 최고 빌드]")
+    for name, i in front.extremes().items():
+        lv = {sid: int(v) for sid, v in zip(front.stat_ids, front.levels[i]) if v > 0}
+        dps, gold, tl, cr = front.scores[i]
+        print(f"  {OBJECTIVE_NAMES[name]:<6} DPS {dps:>10,.0f} | 골드 {gold:>9,.0f} | 시간 {tl:>5g} | 크리스탈 {cr:>7,.1f}")
+        print(f"         {lv}")
+
+    print(f"\n [스탯 사용 비율 (전선 빌드 중 레벨 > 0)]")
+    usage = sorted(front.usage().items(), key=lambda kv: -kv[1])
+    for sid, u in usage:
+        bar = '#' * int(round(u * 30))
+        print(f"  {sid:<20} {u * 100:>5.1f}% {bar}")
+
+    dead = front.dead_stats()
+    relevant = {sid for stats in OBJECTIVE_STATS.values() for sid in stats}
+    neutral = [sid for sid in front.stat_ids if sid not in relevant]
+    print(f"\n 죽은 스탯 (목적에 영향이 있으나 전선에 없음): {', '.join(dead) or '없음'}")
+    print(f" 모델 중립 스탯 (이 목적들에 영향 없음): {', '.join(neutral) or '없음'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DeskWarrior 빌드 파레토 탐색기")
+    parser.add_argument('--budget', type=float, default=2000, help="크리스탈 예산")
+    parser.add_argument('--generations', type=int, default=40)
+    parser.add_argument('--population', type=int, default=512)
+    parser.add_argument('--archive', type=int, default=256, help="보관소 최대 크기")
+    parser.add_argument('--ref-stage', type=int, default=DEFAULT_REF_STAGE, help="골드/크리스탈 기준 런 길이")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--export', type=int, default=0, help="BalancePresets.json에 내보낼 대표 빌드 수")
+    args = parser.parse_args()
+
+    table = StatTable.load('PermanentStatGrowth.json')
+    explorer = BuildExplorer(args.budget, scorer=BuildScorer(table, ref_stage=args.ref_stage))
+    front = explorer.explore(args.generations, args.population, args.archive, args.seed)
+    print_report(front)
+
+    if args.export:
+        added = export_presets(front, args.export)
+        print(f"\n 프리셋 {len(added)}개 내보냄 → config/{PRESETS_FILE}: {', '.join(added)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DeskWarrior 대시보드 표 데이터 (열 단위 배열)
+- 셀마다 객체를 만들지 않고 열 배열 + 포맷터로 보관
+- 표시 문자열/색상은 요청된 셀만 계산 (Qt 모델의 data() 에서 호출)
+- 정렬은 원본 배열을 건드리지 않고 행 순서(order)만 바꿈
+- 모양이 같은 열 교체는 행 범위를 돌려줘 dataChanged 한 번으로 알릴 수 있게 함
+
+Qt 에 의존하지 않음 (balance_dashboard_qt.ColumnTableModel 이 감싸서 사용)
+
+사용 예:
+    table = ColumnTable([
+        Column('stage', '스테이지', stages),
+        Column('hp', '몬스터HP', hps, fmt=format_number),
+        Column('boss', '보스', bosses, fmt=lambda b: "BOSS" if b else ""),
+    ])
+    table.sort('hp', descending=True)
+    table.text(0, 1)
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+# 값 → 문자열 / 값 → 색상
+Formatter = Union[str, Callable[[Any], str], None]
+ColorSpec = Union[str, Sequence[Optional[str]], Callable[[Any], Optional[str]], None]
+
+
+def format_number(value: Any) -> str:
+    """천 단위 구분 정수, 너무 크면 지수 표기, 무한대는 ∞"""
+    if value is None:
+        return ""
+    if isinstance(value, float) or isinstance(value, np.floating):
+        if math.isnan(value):
+            return "-"
+        if math.isinf(value):
+            return "∞" if value > 0 else "-∞"
+    if abs(value) >= 1e15:
+        return f"{float(value):.3e}"
+    return f"{int(value):,}"
+
+
+def _as_array(values: Sequence[Any]) -> np.ndarray:
+    if isinstance(values, np.ndarray):
+        return values
+    values = list(values)
+    # 큰 정수/문자열 혼합은 object 로 (정밀도 유지)
+    if values and all(isinstance(v, (bool, np.bool_)) for v in values):
+        return np.asarray(values, dtype=bool)
+    if values and all(isinstance(v, (int, np.integer)) and not isinstance(v, bool) for v in values) \
+            and max(abs(int(v)) for v in values) < 2 ** 62:
+        return np.asarray(values, dtype=np.int64)
+    if values and all(isinstance(v, (float, np.floating)) for v in values):
+        return np.asarray(values, dtype=float)
+    arr = np.empty(len(values), dtype=object)
+    arr[:] = values
+    return arr
+
+
+@dataclass
+class Column:
+    """표의 열 하나 (값 배열 + 표시 규칙)"""
+    key: str
+    header: str
+    values: Sequence[Any]
+    fmt: Formatter = None
+    color: ColorSpec = None
+    background: ColorSpec = None
+    tooltip: Optional[str] = None
+    editable: bool = False
+    align: str = 'left'              # left / right / center
+    labels: Optional[Sequence[str]] = None   # 미리 만든 표시 문자열 (있으면 fmt 대신 사용)
+
+    def __post_init__(self):
+        self.values = _as_array(self.values)
+
+    def text(self, i: int) -> str:
+        if self.labels is not None:
+            return self.labels[i]
+        value = self.values[i]
+        if self.fmt is None:
+            return "" if value is None else str(value)
+        if isinstance(self.fmt, str):
+            return self.fmt.format(value)
+        return self.fmt(value)
+
+    def _resolve(self, spec: ColorSpec, i: int) -> Optional[str]:
+        if spec is None or isinstance(spec, str):
+            return spec
+        if callable(spec):
+            return spec(self.values[i])
+        return spec[i]
+
+    def color_at(self, i: int) -> Optional[str]:
+        return self._resolve(self.color, i)
+
+    def background_at(self, i: int) -> Optional[str]:
+        return self._resolve(self.background, i)
+
+
+class ColumnTable:
+    """열 배열 묶음 + 정렬 순서"""
+
+    def __init__(self, columns: Sequence[Column] = ()):
+        self.columns: List[Column] = []
+        self.order: Optional[np.ndarray] = None     # 표시 행 → 원본 행 (None = 원본 순서)
+        self.sort_key: Optional[Tuple[int, bool]] = None
+        self.set_columns(columns)
+
+    # --- 모양 ---
+
+    @property
+    def row_count(self) -> int:
+        return len(self.columns[0].values) if self.columns else 0
+
+    @property
+    def column_count(self) -> int:
+        return len(self.columns)
+
+    def headers(self) -> List[str]:
+        return [c.header for c in self.columns]
+
+    def index_of(self, key: str) -> int:
+        for i, c in enumerate(self.columns):
+            if c.key == key:
+                return i
+        raise KeyError(key)
+
+    def column(self, key_or_index: Union[str, int]) -> Column:
+        if isinstance(key_or_index, str):
+            return self.columns[self.index_of(key_or_index)]
+        return self.columns[key_or_index]
+
+    # --- 셀 접근 (표시 행 기준) ---
+
+    def source_row(self, row: int) -> int:
+        return int(self.order[row]) if self.order is not None else row
+
+    def view_row(self, source: int) -> int:
+        if self.order is None:
+            return source
+        return int(np.flatnonzero(self.order == source)[0])
+
+    def value(self, row: int, col: int) -> Any:
+        return self.columns[col].values[self.source_row(row)]
+
+    def text(self, row: int, col: int) -> str:
+        return self.columns[col].text(self.source_row(row))
+
+    def color(self, row: int, col: int) -> Optional[str]:
+        return self.columns[col].color_at(self.source_row(row))
+
+    def background(self, row: int, col: int) -> Optional[str]:
+        return self.columns[col].background_at(self.source_row(row))
+
+    def set_value(self, row: int, col: int, value: Any):
+        column = self.columns[col]
+        if column.values.dtype != object:
+            try:
+                column.values[self.source_row(row)] = value
+                return
+            except (TypeError, ValueError, OverflowError):
+                column.values = column.values.astype(object)
+        column.values[self.source_row(row)] = value
+
+    # --- 정렬 ---
+
+    def sort(self, col: Union[str, int], descending: bool = False):
+        """안정 정렬 (같은 값은 원래 순서 유지, 다시 설정돼도 정렬 유지)"""
+        index = self.index_of(col) if isinstance(col, str) else col
+        values = self.columns[index].values
+        if values.dtype == object:
+            # None 은 항상 마지막 (sorted 는 reverse 여도 안정)
+            present = [i for i, v in enumerate(values) if v is not None]
+            missing = [i for i, v in enumerate(values) if v is None]
+            present.sort(key=values.__getitem__, reverse=descending)
+            order = np.asarray(present + missing, dtype=np.int64)
+        elif descending:
+            _, rank = np.unique(values, return_inverse=True)
+            order = np.argsort(-rank.ravel(), kind='stable')
+        else:
+            order = np.argsort(values, kind='stable')
+        self.order = order
+        self.sort_key = (index, descending)
+
+    def clear_sort(self):
+        self.order = None
+        self.sort_key = None
+
+    # --- 일괄 갱신 ---
+
+    def set_columns(self, columns: Sequence[Column]) -> Optional[Tuple[int, int]]:
+        """열 전체 교체 → 모양(행 수/열 키)이 같으면 표시 행 범위 (0, n-1), 다르면 None
+
+        None 이면 모델 리셋, 범위가 있으면 그 구간을 dataChanged 한 번으로 알림
+        (뷰는 보이는 셀만 다시 요청). 열 키가 같으면 정렬 상태를 다시 적용한다.
+        """
+        columns = list(columns)
+        n = len(columns[0].values) if columns else 0
+        if any(len(c.values) != n for c in columns):
+            raise ValueError("열 길이가 서로 다릅니다")
+        same_keys = [c.key for c in columns] == [c.key for c in self.columns]
+        same_shape = same_keys and n == self.row_count
+        self.columns = columns
+        if not same_keys:
+            self.clear_sort()
+        elif self.sort_key is not None:
+            self.sort(*self.sort_key)
+        return (0, n - 1) if same_shape else None
@@ -0,0 +1,468 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DeskWarrior config 리비전 비교 / 밸런스 회귀 검사
+- 두 git 리비전(또는 작업 폴더)의 config/*.json 을 읽어 같은 모델을 돌리고 차이를 출력
+  진행: 스테이지별 HP / 골드 / 프리셋별 필요 CPS / 벽 스테이지 (필요 CPS > 15)
+  비용: 스탯별 Lv{max_level} 누적 비용 / 효과
+- 임계값을 넘는 악화(비용·필요 CPS 증가, 골드·효과 감소, 벽 스테이지 앞당김)를 회귀로 표시 → 종료 코드 1
+- 결과는 관련 파일의 git blob 해시 기준으로 ResultCache 에 저장
+  config 가 같은 리비전은 파일을 다시 읽지도, 모델을 다시 돌리지도 않음
+- --bisect: 기준 리비전 대비 회귀가 처음 생긴 커밋을 이진 탐색
+
+사용법:
+    python tools/config_diff.py                         # HEAD → 작업 폴더
+    python tools/config_diff.py HEAD                    # HEAD~1 → HEAD (커밋 하나가 바꾼 것)
+    python tools/config_diff.py v1.2 HEAD --max-stage 200 --cps-pct 5
+    python tools/config_diff.py --bisect v1.2 HEAD      # 회귀를 처음 만든 커밋
+"""
+
+import argparse
+import hashlib
+import json
+import subprocess
+import sys
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+import economy_model as EM
+import stat_formulas_generated as SF
+from column_table import format_number
+from result_cache import RESULT_CACHE, ResultCache, code_fingerprint, content_hash
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# 모델에 들어가는 파일 (이 파일들의 내용이 같으면 결과도 같음)
+REVISION_FILES = (
+    'StatFormulas.json', 'PermanentStatGrowth.json', 'InGameStatGrowth.json',
+    'BalancePresets.json', 'PlayerLevels.json',
+)
+STAT_FILES = (('permanent', 'PermanentStatGrowth.json'), ('ingame', 'InGameStatGrowth.json'))
+WORKTREE = 'WORKTREE'           # 가상 리비전: 디스크의 현재 파일
+CPS_HARD = 15                   # 벽 스테이지 기준 (대시보드 "어려움")
+COMBO_STACK = 1.5               # ComparisonAnalyzerTab / balance_report 와 같은 가정
+
+
+@dataclass
+class ModelParams:
+    max_level: int = 30         # 스탯 누적 비용/효과 기준 레벨
+    max_stage: int = 100
+    base_power: float = 20.0
+
+
+@dataclass
+class Thresholds:
+    """회귀 판정 기준 (% 는 원래 값 대비)"""
+    cost_pct: float = 10.0      # 스탯 누적 비용 증가
+    effect_pct: float = 10.0    # 스탯 효과 감소
+    cps_pct: float = 10.0       # 프리셋 필요 CPS 증가 (어느 스테이지든)
+    gold_pct: float = 10.0      # 스테이지 골드 감소 (어느 스테이지든)
+    wall_stages: int = 1        # 벽 스테이지가 이만큼 앞당겨짐
+
+
+@dataclass
+class Regression:
+    area: str                   # 'cost' | 'effect' | 'cps' | 'wall' | 'gold' | 'stat'
+    subject: str
+    message: str
+
+
+@dataclass
+class DiffReport:
+    old_rev: str
+    new_rev: str
+    params: ModelParams
+    stage_rows: List[tuple] = field(default_factory=list)   # (stage, hp, hp', gold, gold', live cps, live cps')
+    stat_rows: List[tuple] = field(default_factory=list)    # (key, name, cost, cost', effect, effect')
+    wall_rows: List[tuple] = field(default_factory=list)    # (preset, wall, wall')
+    regressions: List[Regression] = field(default_factory=list)
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.stage_rows or self.stat_rows or self.wall_rows)
+
+
+# ============================================================
+# git 에서 config 읽기
+# ============================================================
+
+def _blob_id(data: bytes) -> str:
+    """git hash-object 와 같은 blob 해시 (작업 폴더 파일도 커밋과 같은 키를 쓰도록)"""
+    return hashlib.sha1(b'blob %d\0' % len(data) + data).hexdigest()
+
+
+class RevisionSource:
+    """리비전 → config 파일 (ls-tree 로 blob 해시만 먼저, 내용은 캐시 미스일 때만 git show)"""
+
+    def __init__(self, repo: Path = ROOT, config_path: str = 'config'):
+        self.repo = Path(repo)
+        self.config_path = config_path.strip('/')
+        self._blobs: Dict[str, Dict[str, Optional[str]]] = {}
+
+    def _git(self, *args: str) -> bytes:
+        result = subprocess.run(['git', *args], cwd=self.repo, capture_output=True)
+        if result.returncode != 0:
+            raise ValueError(result.stderr.decode('utf-8', 'replace').strip() or f"git {' '.join(args)} 실패")
+        return result.stdout
+
+    def resolve(self, rev: str) -> str:
+        """커밋 해시 (WORKTREE 는 그대로)"""
+        if rev == WORKTREE:
+            return rev
+        return self._git('rev-parse', '--verify', '--quiet', f'{rev}^{{commit}}').decode('ascii').strip()
+
+    def rev_list(self, good: str, bad: str) -> List[str]:
+        """good 이후 ~ bad 까지의 커밋 (오래된 순, 첫 부모만)"""
+        out = self._git('rev-list', '--reverse', '--first-parent', f'{good}..{bad}')
+        return out.decode('ascii').split()
+
+    def blob_ids(self, rev: str) -> Dict[str, Optional[str]]:
+        """{파일명: blob 해시 (없으면 None)}"""
+        if rev == WORKTREE:
+            ids = {}
+            for name in REVISION_FILES:
+                path = self.repo / self.config_path / name
+                ids[name] = _blob_id(path.read_bytes()) if path.exists() else None
+            return ids
+        commit = self.resolve(rev)
+        ids = self._blobs.get(commit)
+        if ids is None:
+            out = self._git('ls-tree', '-z', commit, '--', f'{self.config_path}/')
+            listed = {}
+            for entry in out.split(b'\0'):
+                if entry:
+                    meta, path = entry.split(b'\t', 1)
+                    listed[path.decode('utf-8').rsplit('/', 1)[-1]] = meta.split()[2].decode('ascii')
+            ids = self._blobs[commit] = {name: listed.get(name) for name in REVISION_FILES}
+        return ids
+
+    def content_key(self, rev: str) -> str:
+        return content_hash(sorted(self.blob_ids(rev).items(), key=lambda kv: kv[0]))
+
+    def read(self, rev: str) -> Dict[str, dict]:
+        """{파일명: JSON} (없는 파일은 빈 dict)"""
+        configs = {}
+        for name, blob in self.blob_ids(rev).items():
+            if blob is None:
+                configs[name] = {}
+            elif rev == WORKTREE:
+                configs[name] = json.loads((self.repo / self.config_path / name).read_text(encoding='utf-8'))
+            else:
+                configs[name] = json.loads(self._git('show', f'{self.resolve(rev)}:{self.config_path}/{name}'))
+        return configs
+
+
+# ============================================================
+# 모델 (리비전의 StatFormulas 상수 사용)
+# ============================================================
+
+def _constants(configs: Dict[str, dict]) -> Dict[str, float]:
+    """리비전의 상수 (없는 값은 현재 생성 코드 기본값)"""
+    names = ('BASE_CRIT_CHANCE', 'BASE_CRIT_MULTIPLIER', 'BASE_TIME_LIMIT', 'BASE_HP',
+             'HP_GROWTH', 'BOSS_INTERVAL', 'BOSS_HP_MULTI', 'BASE_GOLD_MULTI')
+    consts = configs.get('StatFormulas.json', {}).get('constants', {})
+    return {name: float(consts.get(name, getattr(SF, name))) for name in names}
+
+
+@np.errstate(over='ignore', invalid='ignore')
+def run_models(configs: Dict[str, dict], params: ModelParams) -> dict:
+    """진행/비용/DPS 모델 → 비교용 값 (pickle 가능한 dict)"""
+    c = _constants(configs)
+    stages = np.arange(1, params.max_stage + 1, dtype=np.float64)
+    levels = np.arange(1, params.max_level + 1)
+
+    stats, perm_stats = {}, {}
+    for kind, filename in STAT_FILES:
+        for sid, stat in configs.get(filename, {}).get('stats', {}).items():
+            if sid.startswith('_'):
+                continue
+            if kind == 'permanent':
+                perm_stats[sid] = stat
+            cost_params = np.array([float(stat.get(k, EM.PARAM_DEFAULTS[k])) for k in EM.COST_PARAM_KEYS])
+            stats[f'{kind}.{sid}'] = {
+                'name': stat.get('name', sid),
+                'cost': float(EM.upgrade_costs(cost_params, levels).sum()),
+                'effect': float(SF.calc_stat_effect(stat.get('effect_per_level', 1), params.max_level)),
+            }
+
+    presets = {pid: dict(p) for pid, p in configs.get('BalancePresets.json', {}).get('presets', {}).items()}
+    live = configs.get('PlayerLevels.json', {}).get('permanent_levels')
+    if live is not None:        # ComparisonAnalyzerTab._sync_live_preset 과 동일
+        presets.setdefault('live', {'name': 'live'})['levels'] = live
+
+    # 공식은 economy_model 것을 그대로 쓰고 상수만 리비전 값으로
+    hp = EM.stage_hp(stages, c)
+    cps, walls, names = {}, {}, {}
+    for pid, preset in presets.items():
+        effects = EM.perm_effects(preset.get('levels', {}), perm_stats)
+        power = (params.base_power + effects.get('start_keyboard', 0) + effects.get('start_mouse', 0)) / 2
+        damage = float(EM.damage_from_effects(effects, power, COMBO_STACK, constants=c))
+        cps[pid] = hp / max(damage, 1e-9) / EM.time_limit_from_effects(effects, c)
+        hard = np.flatnonzero(cps[pid] > CPS_HARD)
+        walls[pid] = int(stages[hard[0]]) if len(hard) else None
+        names[pid] = preset.get('name', pid)
+
+    return {
+        'stages': stages.astype(np.int64), 'hp': hp,
+        'gold': EM.stage_gold(stages, constants=c),         # 보너스 없음
+        'cps': cps, 'walls': walls, 'preset_names': names, 'stats': stats,
+    }
+
+
+@lru_cache(maxsize=None)
+def _model_code() -> str:
+    """모델 코드 지문 (이 파일 + economy_model / 생성 공식 등 - 고치면 이전 캐시 무효화)"""
+    return code_fingerprint(run_models)
+
+
+def evaluate(source: RevisionSource, rev: str, params: ModelParams,
+             cache: ResultCache = RESULT_CACHE) -> dict:
+    """리비전의 모델 결과 (config 내용 해시 + 모델 코드가 같으면 캐시)"""
+    key = [source.content_key(rev), asdict(params)]
+    return cache.get_or_compute('config_diff.run_models', lambda: run_models(source.read(rev), params), key,
+                                code=_model_code())
+
+
+# ============================================================
+# 비교
+# ============================================================
+
+def _pct(old: float, new: float) -> float:
+    if old == new:
+        return 0.0
+    if not (np.isfinite(old) and np.isfinite(new)) or old == 0:
+        return float('inf') if new > old else float('-inf')
+    return (new - old) / abs(old) * 100
+
+
+def _differs(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return ~np.isclose(a, b, rtol=1e-9, atol=0, equal_nan=True)
+
+
+def compare(old: dict, new: dict, thresholds: Optional[Thresholds] = None, stage_step: int = 10,
+            old_rev: str = '', new_rev: str = '', params: Optional[ModelParams] = None) -> DiffReport:
+    """두 모델 결과의 차이 + 회귀 목록"""
+    thresholds = thresholds or Thresholds()
+    report = DiffReport(old_rev, new_rev, params or ModelParams())
+    regs = report.regressions
+    stages = new['stages']
+    n = min(len(old['stages']), len(stages))
+
+    # --- 진행 (스테이지) ---
+    live = 'live' if 'live' in old['cps'] and 'live' in new['cps'] else None
+    changed = _differs(old['hp'][:n], new['hp'][:n]) | _differs(old['gold'][:n], new['gold'][:n])
+    if live:
+        changed |= _differs(old['cps'][live][:n], new['cps'][live][:n])
+    for i in np.flatnonzero(changed):
+        stage = int(stages[i])
+        if stage == 1 or stage % stage_step == 0 or i == n - 1:
+            cps_pair = (float(old['cps'][live][i]), float(new['cps'][live][i])) if live else (None, None)
+            report.stage_rows.append((stage, float(old['hp'][i]), float(new['hp'][i]),
+                                      float(old['gold'][i]), float(new['gold'][i])) + cps_pair)
+
+    gold_pct = np.array([_pct(a, b) for a, b in zip(old['gold'][:n], new['gold'][:n])])
+    if len(gold_pct) and gold_pct.min() < -thresholds.gold_pct:
+        i = int(gold_pct.argmin())
+        regs.append(Regression('gold', f'stage {int(stages[i])}',
+                               f"골드 {old['gold'][i]:,.0f} → {new['gold'][i]:,.0f} ({gold_pct[i]:+.1f}%)"))
+
+    for pid in sorted(set(old['cps']) & set(new['cps'])):
+        name = new['preset_names'].get(pid, pid)
+        a, b = old['cps'][pid][:n], new['cps'][pid][:n]
+        pct = np.array([_pct(x, y) for x, y in zip(a, b)])
+        if len(pct) and pct.max() > thresholds.cps_pct:
+            i = int(np.flatnonzero(pct > thresholds.cps_pct)[0])
+            regs.append(Regression('cps', name, f"Stage {int(stages[i])} 필요 CPS {_pair(a[i], b[i])} ({pct[i]:+.1f}%)"))
+
+        w_old, w_new = old['walls'].get(pid), new['walls'].get(pid)
+        if w_old != w_new:
+            report.wall_rows.append((name, w_old, w_new))
+            # None = 범위 안에 벽 없음 (max_stage 다음으로 취급)
+            limit = len(stages) + 1
+            if (w_old or limit) - (w_new or limit) >= thresholds.wall_stages:
+                regs.append(Regression('wall', name, f"벽 스테이지 {w_old or '-'} → {w_new or '-'}"))
+
+    # --- 비용 (스탯) ---
+    for key in sorted(set(old['stats']) | set(new['stats'])):
+        a, b = old['stats'].get(key), new['stats'].get(key)
+        if a is None or b is None:
+            row = b or a
+            report.stat_rows.append((key, row['name'], a and a['cost'], b and b['cost'],
+                                     a and a['effect'], b and b['effect']))
+            if b is None:
+                regs.append(Regression('stat', key, "스탯 삭제됨"))
+            continue
+        if a['cost'] == b['cost'] and a['effect'] == b['effect']:
+            continue
+        report.stat_rows.append((key, b['name'], a['cost'], b['cost'], a['effect'], b['effect']))
+        cost_pct = _pct(a['cost'], b['cost'])
+        if cost_pct > thresholds.cost_pct:
+            regs.append(Regression('cost', key, f"Lv{report.params.max_level} 누적 비용 "
+                                   f"{a['cost']:,.0f} → {b['cost']:,.0f} ({cost_pct:+.1f}%)"))
+        effect_pct = _pct(a['effect'], b['effect'])
+        if effect_pct < -thresholds.effect_pct:
+            regs.append(Regression('effect', key, f"Lv{report.params.max_level} 효과 "
+                                   f"{a['effect']:g} → {b['effect']:g} ({effect_pct:+.1f}%)"))
+    return report
+
+
+def diff_revisions(source: RevisionSource, old_rev: str, new_rev: str, params: Optional[ModelParams] = None,
+                   thresholds: Optional[Thresholds] = None, stage_step: int = 10,
+                   cache: ResultCache = RESULT_CACHE) -> DiffReport:
+    params = params or ModelParams()
+    old = evaluate(source, old_rev, params, cache)
+    new = evaluate(source, new_rev, params, cache)
+    return compare(old, new, thresholds, stage_step, old_rev, new_rev, params)
+
+
+def bisect(source: RevisionSource, good: str, bad: str, params: Optional[ModelParams] = None,
+           thresholds: Optional[Thresholds] = None, cache: ResultCache = RESULT_CACHE
+           ) -> Tuple[Optional[str], int]:
+    """good 대비 회귀가 처음 나타나는 커밋 (없으면 None), 평가한 리비전 수"""
+    params = params or ModelParams()
+    revs = source.rev_list(good, bad)
+    base = evaluate(source, good, params, cache)
+    tested = 0
+
+    def regressed(rev: str) -> bool:
+        nonlocal tested
+        tested += 1
+        return bool(compare(base, evaluate(source, rev, params, cache), thresholds).regressions)
+
+    if not revs or not regressed(revs[-1]):
+        return None, tested
+    lo, hi = 0, len(revs) - 1           # revs[hi] 는 회귀
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if regressed(revs[mid]):
+            hi = mid
+        else:
+            lo = mid + 1
+    return revs[hi], tested
+
+
+# ============================================================
+# 출력
+# ============================================================
+
+def _fmt(value) -> str:
+    if value is None:
+        return '-'
+    if isinstance(value, float) and np.isfinite(value) and abs(value) < 100 and value != int(value):
+        return f"{value:.3g}"
+    return format_number(value)
+
+
+def _change(old, new) -> str:
+    if old is None or new is None:
+        return '추가' if old is None else '삭제'
+    pct = _pct(old, new)
+    return f"{pct:+.1f}%" if np.isfinite(pct) else ('+∞' if pct > 0 else '-∞')
+
+
+def _pair(old, new) -> str:
+    return f"{_fmt(old)} → {_fmt(new)}"
+
+
+def _print_table(headers: List[str], rows: List[List[str]], indent: str = '   '):
+    """열 너비를 내용에 맞춘 표 (첫 열 왼쪽, 나머지 오른쪽 정렬)"""
+    widths = [max(len(str(cell)) for cell in col) for col in zip(headers, *rows)]
+    for row in [headers] + rows:
+        cells = [str(row[0]).ljust(widths[0])] + [str(c).rjust(w) for c, w in zip(row[1:], widths[1:])]
+        print(indent + '  '.join(cells))
+
+
+def print_report(report: DiffReport):
+    print(f"\n config 비교: {report.old_rev} → {report.new_rev}")
+    print(f" 기준: Lv{report.params.max_level} / Stage 1~{report.params.max_stage} / 기본공격력 {report.params.base_power}")
+    if not report.changed:
+        print("  변경 없음")
+
+    if report.stage_rows:
+        print("\n [스테이지]")
+        _print_table(['Stage', 'HP', '골드', '필요 CPS (live)', ''],
+                     [[stage, _pair(hp0, hp1), _pair(g0, g1), _pair(c0, c1) if c0 is not None else '-',
+                       _change(c0, c1) if c0 is not None else '']
+                      for stage, hp0, hp1, g0, g1, c0, c1 in report.stage_rows])
+
+    if report.wall_rows:
+        print(f"\n [벽 스테이지] (필요 CPS > {CPS_HARD})")
+        _print_table(['프리셋', '벽'], [[name, _pair(w0, w1)] for name, w0, w1 in report.wall_rows])
+
+    if report.stat_rows:
+        print("\n [스탯]")
+        _print_table(['스탯', f'Lv{report.params.max_level} 누적 비용', '', '효과', ''],
+                     [[f"{key} ({name})", _pair(c0, c1), _change(c0, c1), _pair(e0, e1), _change(e0, e1)]
+                      for key, name, c0, c1, e0, e1 in report.stat_rows])
+
+    if report.regressions:
+        print(f"\n ⚠ 회귀 {len(report.regressions)}건")
+        for reg in report.regressions:
+            print(f"   [{reg.area}] {reg.subject}: {reg.message}")
+    else:
+        print("\n ✓ 회귀 없음")
+
+
+# ============================================================
+# 메인
+# ============================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="DeskWarrior config 리비전 비교 / 회귀 검사")
+    parser.add_argument('revs', nargs='*', help=f"비교할 리비전 (없음: HEAD→작업 폴더, 1개: REV~1→REV, "
+                                                f"{WORKTREE} = 작업 폴더)")
+    parser.add_argument('--bisect', nargs=2, metavar=('GOOD', 'BAD'), help="회귀를 처음 만든 커밋 찾기")
+    parser.add_argument('--max-level', type=int, default=30)
+    parser.add_argument('--max-stage', type=int, default=100)
+    parser.add_argument('--base-power', type=float, default=20.0)
+    parser.add_argument('--stage-step', type=int, default=10, help="스테이지 표 간격")
+    parser.add_argument('--cost-pct', type=float, default=10.0)
+    parser.add_argument('--effect-pct', type=float, default=10.0)
+    parser.add_argument('--cps-pct', type=float, default=10.0)
+    parser.add_argument('--gold-pct', type=float, default=10.0)
+    parser.add_argument('--wall-stages', type=int, default=1)
+    parser.add_argument('--no-cache', action='store_true')
+    args = parser.parse_args()
+
+    params = ModelParams(args.max_level, args.max_stage, args.base_power)
+    thresholds = Thresholds(args.cost_pct, args.effect_pct, args.cps_pct, args.gold_pct, args.wall_stages)
+    cache = ResultCache(enabled=not args.no_cache)
+    source = RevisionSource()
+
+    try:
+        if args.bisect:
+            good, bad = args.bisect
+            found, tested = bisect(source, good, bad, params, thresholds, cache)
+            if found is None:
+                print(f" {good}..{bad}: 회귀 없음 ({tested}개 리비전 평가)")
+                return 0
+            subject = source._git('log', '-1', '--format=%h %s', found).decode('utf-8').strip()
+            print(f" 회귀 시작 커밋: {subject} ({tested}개 리비전 평가)")
+            print_report(diff_revisions(source, good, found, params, thresholds, args.stage_step, cache))
+            return 1
+
+        if len(args.revs) > 2:
+            parser.error("리비전은 최대 2개")
+        if not args.revs:
+            old_rev, new_rev = 'HEAD', WORKTREE
+        elif len(args.revs) == 1:
+            old_rev, new_rev = f'{args.revs[0]}~1', args.revs[0]
+        else:
+            old_rev, new_rev = args.revs
+        report = diff_revisions(source, old_rev, new_rev, params, thresholds, args.stage_step, cache)
+    except ValueError as e:
+        print(f" 오류: {e}", file=sys.stderr)
+        return 2
+
+    print_report(report)
+    stats = cache.stats()
+    print(f"\n 캐시: 적중 {stats['hits']} / 미스 {stats['misses']}")
+    return 1 if report.regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
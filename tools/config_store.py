@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DeskWarrior config 묶음 읽기/쓰기 (dashboard_app.Api 가 사용)
+- load_many: 여러 파일을 동시에 읽고 내용 해시(sha256) 반환
+  클라이언트가 알고 있는 해시와 같으면 내용을 보내지 않음 (조건부 로드)
+- save_many: 여러 파일을 한 번에 커밋
+  1) 기준 해시 확인 (다른 곳에서 바뀌었으면 아무것도 쓰지 않음)
+  2) 모든 파일을 임시 파일로 쓰고 fsync
+  3) 바뀐 파일만 .backup 후 os.replace, 중간에 실패하면 이미 교체한 파일을 되돌림
+  → 여러 파일 편집이 반쯤 저장된 상태로 남지 않음
+
+사용 예:
+    store = ConfigStore(config_dir)
+    store.load_many(['StatFormulas.json', 'PermanentStatGrowth.json'], known={'StatFormulas.json': 'ab12...'})
+    store.save_many({'PermanentStatGrowth.json': data}, base={'PermanentStatGrowth.json': 'cd34...'})
+"""
+
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+READ_WORKERS = 8
+
+
+class ConfigConflict(Exception):
+    """저장 기준 해시와 현재 파일이 다름"""
+
+    def __init__(self, conflicts: Dict[str, Optional[str]]):
+        super().__init__("다른 곳에서 변경된 파일: " + ", ".join(sorted(conflicts)))
+        self.conflicts = conflicts
+
+
+def content_hash(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()
+
+
+def serialize(data) -> bytes:
+    """Api.save_config 와 같은 형식 (UTF-8, indent=2)"""
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+class ConfigStore:
+    """config 폴더의 JSON 파일 묶음 접근"""
+
+    def __init__(self, config_dir):
+        self.config_dir = Path(config_dir)
+        self._write_lock = threading.Lock()       # pywebview 는 API 호출마다 스레드
+
+    def path(self, name: str) -> Path:
+        """파일 이름 → 경로 (config 폴더 밖/하위 폴더 금지)"""
+        if not name.endswith('.json') or Path(name).name != name or name.startswith('.'):
+            raise ValueError(f"잘못된 config 파일 이름: {name}")
+        return self.config_dir / name
+
+    def _read(self, name: str) -> Optional[bytes]:
+        try:
+            return self.path(name).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def current_hash(self, name: str) -> Optional[str]:
+        raw = self._read(name)
+        return content_hash(raw) if raw is not None else None
+
+    # --- 읽기 ---
+
+    def load_one(self, name: str, known: Optional[str] = None) -> dict:
+        try:
+            raw = self._read(name)
+            if raw is None:
+                return {'success': False, 'error': f"{name} 없음"}
+            digest = content_hash(raw)
+            if digest == known:
+                return {'success': True, 'hash': digest, 'unchanged': True}
+            return {'success': True, 'hash': digest, 'data': json.loads(raw.decode('utf-8'))}
+        except Exception as e:
+            return {'success': False, 'error': str(e)}
+
+    def load_many(self, names: Iterable[str], known: Optional[Dict[str, str]] = None) -> Dict[str, dict]:
+        """{이름: {success, hash, data | unchanged | error}} (파일별 실패는 그 파일만)"""
+        names = list(dict.fromkeys(names))
+        known = known or {}
+        with ThreadPoolExecutor(max_workers=min(READ_WORKERS, max(len(names), 1))) as pool:
+            results = pool.map(lambda n: self.load_one(n, known.get(n)), names)
+            return dict(zip(names, results))
+
+    # --- 쓰기 ---
+
+    def save_many(self, files: Dict[str, object], base: Optional[Dict[str, Optional[str]]] = None,
+                  backup: bool = True) -> Dict[str, dict]:
+        """
+        여러 파일 원자적 저장 → {이름: {hash, changed}}
+
+        base: {이름: 편집을 시작한 시점의 해시} (없는 이름은 확인 안 함, None = 새 파일이어야 함)
+        """
+        payloads = {name: serialize(data) for name, data in files.items()}
+        paths = {name: self.path(name) for name in payloads}
+        with self._write_lock:
+            return self._commit(payloads, paths, base, backup)
+
+    def _commit(self, payloads: Dict[str, bytes], paths: Dict[str, Path],
+                base: Optional[Dict[str, Optional[str]]], backup: bool) -> Dict[str, dict]:
+
+        # 1) 기준 해시 확인
+        current = {name: self.current_hash(name) for name in payloads}
+        conflicts = {name: current[name] for name, expected in (base or {}).items()
+                     if name in current and current[name] != expected}
+        if conflicts:
+            raise ConfigConflict(conflicts)
+
+        new_hashes = {name: content_hash(raw) for name, raw in payloads.items()}
+        changed = [name for name in payloads if new_hashes[name] != current[name]]
+
+        # 2) 임시 파일 준비 (실패하면 원본은 그대로)
+        temps: Dict[str, Path] = {}
+        try:
+            for name in changed:
+                tmp = paths[name].with_name(f".{name}.{os.getpid()}.tmp")
+                with open(tmp, 'wb') as f:
+                    f.write(payloads[name])
+                    f.flush()
+                    os.fsync(f.fileno())
+                temps[name] = tmp
+
+            # 3) 백업 후 교체 (실패 시 교체한 파일 복원)
+            originals: Dict[str, Optional[bytes]] = {}
+            try:
+                for name in changed:
+                    originals[name] = self._read(name)
+                    if backup and originals[name] is not None:
+                        paths[name].with_name(name + '.backup').write_bytes(originals[name])
+                    os.replace(temps[name], paths[name])
+                    del temps[name]
+            except BaseException:
+                for name, raw in originals.items():
+                    if raw is None:
+                        paths[name].unlink(missing_ok=True)
+                    else:
+                        paths[name].write_bytes(raw)
+                raise
+        finally:
+            for tmp in temps.values():
+                tmp.unlink(missing_ok=True)
+
+        return {name: {'hash': new_hashes[name], 'changed': name in changed} for name in payloads}
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DeskWarrior CPS 측정 엔진
+- perf_counter_ns 타임스탬프를 미리 할당한 링 버퍼에 기록 (입력 이벤트당 할당 없음)
+- 입력 간격 분포/히스토그램, 버스트 CPS, 피로 감쇠, 콤보 유지 가능 여부 분석
+- ComboTracker.cs와 동일한 규칙의 콤보 스택 계산 (NumPy 벡터화)
+- 측정 기록을 압축 바이너리(.dwct)로 저장/로드
+
+사용법:
+    python tools/cps_engine.py trace.dwct     # 저장된 기록 분석
+"""
+
+import argparse
+import struct
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+import stat_formulas_generated as SF
+
+# 입력 장치
+SOURCE_KEYBOARD = 0
+SOURCE_MOUSE = 1
+
+# ComboTracker.cs 상수
+COMBO_EXPIRE_TIME = SF.COMBO_DURATION
+
+# 분석 설정
+HISTOGRAM_BIN_MS = 10
+HISTOGRAM_MAX_MS = 500
+BURST_WINDOW_S = 1.0
+MAX_FLEX_SEARCH = 40        # 콤보 유지에 필요한 combo_flex 탐색 상한
+
+# 바이너리 포맷: 헤더 + uint32 µs 간격 + 입력 장치 비트열
+TRACE_MAGIC = b'DWCT'
+TRACE_VERSION = 1
+_HEADER = struct.Struct('<4sBBHIq')   # magic, version, flags, reserved, count, t0_ns
+
+
+# ============================================================
+# 기록
+# ============================================================
+
+class ClickRecorder:
+    """고정 크기 링 버퍼 입력 기록기 (가장 최근 capacity개 유지)"""
+
+    def __init__(self, capacity: int = 16384):
+        self.capacity = capacity
+        self._ts = np.zeros(capacity, dtype=np.int64)
+        self._src = np.zeros(capacity, dtype=np.uint8)
+        self.total = 0
+        self.first_ns: Optional[int] = None
+
+    def record(self, source: int = SOURCE_KEYBOARD, t_ns: Optional[int] = None) -> int:
+        """입력 1회 기록, 기록 시각(ns) 반환"""
+        t = time.perf_counter_ns() if t_ns is None else t_ns
+        i = self.total % self.capacity
+        self._ts[i] = t
+        self._src[i] = source
+        self.total += 1
+        if self.first_ns is None:
+            self.first_ns = t
+        return t
+
+    def reset(self):
+        self.total = 0
+        self.first_ns = None
+
+    def __len__(self) -> int:
+        return min(self.total, self.capacity)
+
+    @property
+    def last_ns(self) -> Optional[int]:
+        return int(self._ts[(self.total - 1) % self.capacity]) if self.total else None
+
+    def elapsed(self, now_ns: Optional[int] = None) -> float:
+        """첫 입력 이후 경과 시간 (초)"""
+        if self.first_ns is None:
+            return 0.0
+        return ((time.perf_counter_ns() if now_ns is None else now_ns) - self.first_ns) / 1e9
+
+    def trace(self) -> 'ClickTrace':
+        """시간순 기록 복사본"""
+        n = len(self)
+        if self.total <= self.capacity:
+            order = np.arange(n)
+        else:
+            order = (np.arange(n) + self.total) % self.capacity
+        return ClickTrace(self._ts[order].copy(), self._src[order].copy())
+
+
+@dataclass
+class ClickTrace:
+    """입력 기록 (타임스탬프 ns, 입력 장치)"""
+    timestamps_ns: np.ndarray
+    sources: np.ndarray = None
+
+    def __post_init__(self):
+        self.timestamps_ns = np.asarray(self.timestamps_ns, dtype=np.int64)
+        if self.sources is None:
+            self.sources = np.zeros(len(self.timestamps_ns), dtype=np.uint8)
+        self.sources = np.asarray(self.sources, dtype=np.uint8)
+
+    def __len__(self) -> int:
+        return len(self.timestamps_ns)
+
+    @classmethod
+    def from_intervals(cls, intervals_s: np.ndarray, sources: Optional[np.ndarray] = None) -> 'ClickTrace':
+        """입력 간격(초) 배열로 생성 (첫 입력 t=0)"""
+        t = np.concatenate([[0], np.cumsum(np.round(np.asarray(intervals_s) * 1e9))]).astype(np.int64)
+        return cls(t, sources)
+
+    def seconds(self) -> np.ndarray:
+        """첫 입력 기준 시각 (초)"""
+        if not len(self):
+            return np.zeros(0)
+        return (self.timestamps_ns - self.timestamps_ns[0]) / 1e9
+
+    def intervals(self) -> np.ndarray:
+        """입력 간격 (초)"""
+        return np.diff(self.timestamps_ns) / 1e9
+
+    def duration(self) -> float:
+        return float(self.timestamps_ns[-1] - self.timestamps_ns[0]) / 1e9 if len(self) > 1 else 0.0
+
+    # --- 바이너리 직렬화 ---
+
+    def to_bytes(self) -> bytes:
+        """압축 바이너리: 간격은 µs 단위 uint32 (클릭당 4바이트 + 1비트)"""
+        n = len(self)
+        t0 = int(self.timestamps_ns[0]) if n else 0
+        deltas_us = np.round(np.diff(self.timestamps_ns) / 1000)
+        deltas_us = np.clip(deltas_us, 0, np.iinfo(np.uint32).max).astype('<u4')
+        header = _HEADER.pack(TRACE_MAGIC, TRACE_VERSION, 0, 0, n, t0)
+        return header + deltas_us.tobytes() + np.packbits(self.sources & 1).tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'ClickTrace':
+        magic, version, _, _, n, t0 = _HEADER.unpack_from(data, 0)
+        if magic != TRACE_MAGIC:
+            raise ValueError("DeskWarrior 클릭 기록 파일이 아닙니다")
+        if version != TRACE_VERSION:
+            raise ValueError(f"지원하지 않는 기록 버전: {version}")
+        offset = _HEADER.size
+        deltas = np.frombuffer(data, dtype='<u4', count=max(n - 1, 0), offset=offset)
+        offset += deltas.nbytes
+        bits = np.frombuffer(data, dtype=np.uint8, count=(n + 7) // 8, offset=offset)
+        sources = np.unpackbits(bits)[:n].astype(np.uint8)
+        timestamps = t0 + np.concatenate([[0], np.cumsum(deltas.astype(np.int64) * 1000)]) if n else np.zeros(0)
+        return cls(timestamps.astype(np.int64), sources)
+
+    def save(self, path) -> int:
+        data = self.to_bytes()
+        Path(path).write_bytes(data)
+        return len(data)
+
+    @classmethod
+    def load(cls, path) -> 'ClickTrace':
+        return cls.from_bytes(Path(path).read_bytes())
+
+
+# ============================================================
+# 콤보 (ComboTracker.cs 벡터화)
+# ============================================================
+
+def combo_stacks(intervals_s: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    입력 간격 배열 → 두 번째 입력부터의 콤보 스택 (ComboTracker.ProcessInput과 동일)
+
+    - 간격 > 3초: 만료 (스택 0, 다음 입력은 첫 리듬으로 취급)
+    - 첫 리듬(첫 간격 또는 만료 직후): 스택 1
+    - 직전 간격과 차이 ≤ tolerance: 스택 +1 (최대 MAX_COMBO_STACK)
+    - 리듬 깨짐: 스택 0
+    """
+    d = np.asarray(intervals_s, dtype=np.float64)
+    n = len(d)
+    if not n:
+        return np.zeros(0, dtype=np.int64)
+    prev = np.concatenate([[np.inf], d[:-1]])
+    expire = d > COMBO_EXPIRE_TIME
+    start = ~expire & (prev > COMBO_EXPIRE_TIME)
+    match = ~expire & ~start & (np.abs(d - prev) <= tolerance)
+    reset = ~match
+
+    # 마지막 리셋 지점 기준 누적 일치 횟수
+    last = np.maximum.accumulate(np.where(reset, np.arange(n), 0))
+    matches = np.cumsum(match)
+    stack = start[last].astype(np.int64) + matches - matches[last]
+    stack = np.minimum(stack, SF.MAX_COMBO_STACK)
+    stack[expire] = 0
+    return stack
+
+
+def combo_streaks(times_s: np.ndarray, stacks: np.ndarray) -> np.ndarray:
+    """콤보(스택 ≥ 1)가 끊기지 않고 유지된 구간 길이 (초)"""
+    active = stacks > 0
+    if not active.any():
+        return np.zeros(0)
+    edges = np.diff(np.concatenate([[0], active.astype(np.int8), [0]]))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1) - 1
+    return times_s[ends] - times_s[starts]
+
+
+# ============================================================
+# 분석
+# ============================================================
+
+@dataclass
+class CpsReport:
+    """측정 분석 결과"""
+    clicks: int
+    duration: float
+    mean_cps: float
+    interval_ms: Dict[str, float]          # mean/median/p10/p90/std/cv
+    histogram_edges_ms: np.ndarray
+    histogram_counts: np.ndarray           # 마지막 칸 = HISTOGRAM_MAX_MS 초과
+    burst_cps: float                       # BURST_WINDOW_S 창 최대 입력 수 / 창 길이
+    per_second: np.ndarray                 # 1초 단위 CPS
+    fatigue_slope: float                   # CPS/초 (음수 = 감소)
+    fatigue_pct: float                     # 앞 1/3 대비 뒤 1/3 감소율 (%)
+    combo: Dict[str, float] = field(default_factory=dict)
+
+    def summary_lines(self) -> List[str]:
+        iv = self.interval_ms
+        c = self.combo
+        flex = c.get('flex_needed')
+        return [
+            f"평균 CPS {self.mean_cps:.2f} / 버스트 {self.burst_cps:.1f} ({self.clicks}회, {self.duration:.1f}초)",
+            f"입력 간격 {iv['median']:.0f}ms (p10 {iv['p10']:.0f} ~ p90 {iv['p90']:.0f}, CV {iv['cv']:.2f})",
+            f"피로 감쇠 {self.fatigue_pct:+.1f}% ({self.fatigue_slope:+.2f} CPS/초)",
+            f"콤보 가동률 {c['uptime'] * 100:.0f}%, 최대 {c['max_stack']:.0f}스택, "
+            f"최장 유지 {c['longest_streak']:.1f}초 → "
+            + ("유지 가능" if c['sustainable'] else "유지 불가")
+            + (f" (combo_flex {flex:.0f} 필요)" if flex is not None and flex > 0 else ""),
+        ]
+
+
+def _combo_metrics(times: np.ndarray, intervals: np.ndarray, combo_flex: float) -> Dict[str, float]:
+    tolerance = SF.calc_combo_tolerance(combo_flex)
+    stacks = combo_stacks(intervals, tolerance)
+    streaks = combo_streaks(times[1:], stacks)
+    longest = float(streaks.max()) if len(streaks) else 0.0
+    return {
+        'tolerance': tolerance,
+        'uptime': float((stacks > 0).mean()) if len(stacks) else 0.0,
+        'mean_stack': float(stacks.mean()) if len(stacks) else 0.0,
+        'max_stack': float(stacks.max()) if len(stacks) else 0.0,
+        'longest_streak': longest,
+        'sustainable': longest >= SF.COMBO_DURATION,
+    }
+
+
+def analyze(trace: ClickTrace, combo_flex: float = 0.0) -> CpsReport:
+    """측정 기록 분석"""
+    times = trace.seconds()
+    intervals = trace.intervals()
+    duration = trace.duration()
+    n = len(trace)
+
+    if len(intervals):
+        ms = intervals * 1000
+        mean = float(ms.mean())
+        interval_ms = {
+            'mean': mean,
+            'median': float(np.median(ms)),
+            'p10': float(np.percentile(ms, 10)),
+            'p90': float(np.percentile(ms, 90)),
+            'std': float(ms.std()),
+            'cv': float(ms.std() / mean) if mean > 0 else 0.0,
+        }
+    else:
+        ms = np.zeros(0)
+        interval_ms = dict.fromkeys(('mean', 'median', 'p10', 'p90', 'std', 'cv'), 0.0)
+
+    edges = np.arange(0, HISTOGRAM_MAX_MS + HISTOGRAM_BIN_MS, HISTOGRAM_BIN_MS)
+    counts, _ = np.histogram(np.minimum(ms, HISTOGRAM_MAX_MS + 1), bins=np.append(edges, np.inf))
+
+    # 버스트: 창 안의 최대 입력 수
+    if n:
+        in_window = np.searchsorted(times, times + BURST_WINDOW_S, side='left') - np.arange(n)
+        burst = float(in_window.max()) / BURST_WINDOW_S
+    else:
+        burst = 0.0
+
+    # 피로: 1초 단위 CPS 추세 (마지막 불완전 구간 제외)
+    seconds = int(duration)
+    per_second = np.bincount(times.astype(np.int64), minlength=seconds + 1)[:max(seconds, 1)].astype(np.float64)
+    slope = float(np.polyfit(np.arange(len(per_second)), per_second, 1)[0]) if len(per_second) >= 2 else 0.0
+    third = max(len(per_second) // 3, 1)
+    head, tail = per_second[:third].mean(), per_second[-third:].mean()
+    fatigue_pct = float((tail - head) / head * 100) if head > 0 else 0.0
+
+    combo = _combo_metrics(times, intervals, combo_flex)
+    combo['flex_needed'] = None
+    for flex in range(MAX_FLEX_SEARCH + 1):
+        if flex >= combo_flex and _combo_metrics(times, intervals, flex)['sustainable']:
+            combo['flex_needed'] = float(flex)
+            break
+
+    return CpsReport(
+        clicks=n,
+        duration=duration,
+        mean_cps=(n - 1) / duration if duration > 0 else 0.0,
+        interval_ms=interval_ms,
+        histogram_edges_ms=edges,
+        histogram_counts=counts,
+        burst_cps=burst,
+        per_second=per_second,
+        fatigue_slope=slope,
+        fatigue_pct=fatigue_pct,
+        combo=combo,
+    )
+
+
+# ============================================================
+# 메인
+# ============================================================
+
+def print_histogram(report: CpsReport, width: int = 40):
+    counts = report.histogram_counts
+    top = counts.max() if len(counts) and counts.max() > 0 else 1
+    labels = [f"{e:>4}ms" for e in report.histogram_edges_ms] + [f">{HISTOGRAM_MAX_MS}ms"]
+    for label, c in zip(labels, counts):
+        if c:
+            print(f"  {label:>7} | {'█' * max(1, int(c / top * width)):<{width}} {c}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DeskWarrior CPS 측정 기록 분석")
+    parser.add_argument('trace', type=Path, help=".dwct 클릭 기록 파일")
+    parser.add_argument('--flex', type=float, default=0.0, help="combo_flex 레벨")
+    args = parser.parse_args()
+
+    trace = ClickTrace.load(args.trace)
+    report = analyze(trace, args.flex)
+    print(f"\n{'='*60}")
+    print(f" CPS 분석: {args.trace.name}")
+    print(f"{'='*60}")
+    for line in report.summary_lines():
+        print(f" {line}")
+    print(f"\n 입력 간격 분포")
+    print_histogram(report)
+
+
+if __name__ == '__main__':
+    main()
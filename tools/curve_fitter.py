@@ -0,0 +1,581 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DeskWarrior 영구 스탯 곡선 자동 맞춤 (역문제 솔버)
+- 목표 곡선을 주면 PermanentStatGrowth.json의 base_cost / growth_rate / multiplier /
+  softcap_interval 을 미분 없는 최적화로 탐색
+- 목표 종류
+  · 스탯별: 레벨 L까지 누적 비용 = X 크리스탈, 레벨 L 비용 = Y
+  · 진행: 스테이지 구간의 필요 CPS를 [min_cps, max_cps] 안에 유지
+    (보스 드롭 기대 크리스탈 예산을 가장 싼 업그레이드부터 구매하는 플레이어 모델)
+  · 제약: 최대 레벨 없는 스탯은 비용이 MAX_DOUBLING_LEVELS 레벨마다 2배 이상,
+    모델 지평(LEVEL_CAP)까지 다 팔리면 벌점 (평평한 비용으로 목표를 맞추는 것 방지)
+- 최적화: 스탯별 4차원 Nelder-Mead 다중 시작 (시작점들을 NumPy로 한 번에 평가)
+  스탯끼리는 진행 목표로 결합되므로 야코비 라운드로 반복, 라운드 안에서는 스탯별 병렬
+- 결과: 제안 설정 JSON + 현재 설정과의 unified diff
+
+사용법:
+    python tools/curve_fitter.py                              # 기본 목표 (필요 CPS 3~15)
+    python tools/curve_fitter.py --targets tools/curve_targets_example.json --output proposed.json
+    python tools/curve_fitter.py --targets my_targets.json --apply   # 백업 후 덮어쓰기
+"""
+
+import argparse
+import copy
+import difflib
+import json
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from economy_model import (
+    CONFIG_DIR,
+    COST_PARAM_KEYS,
+    PARAM_KEYS,
+    StatTable,
+    expected_damage,
+    is_boss_stage,
+    load_json,
+    required_cps,
+    stage_gold,
+    upgrade_costs,
+)
+from prestige_simulator import MODELED_STATS, BossDropConfig
+import stat_formulas_generated as SF
+
+PERM_FILE = 'PermanentStatGrowth.json'
+LEVEL_CAP = 200             # 진행 모델에서 스탯별 최대 구매 레벨 (모델 지평)
+HORIZON_WEIGHT = 1.0        # 최대 레벨 없는 스탯이 지평(LEVEL_CAP)까지 다 팔리는 것에 대한 벌점
+MAX_DOUBLING_LEVELS = 100   # 최대 레벨 없는 스탯의 비용은 적어도 이 레벨마다 2배 (multiplier^(L/softcap))
+GROWTH_WEIGHT = 10.0
+
+# 탐색 범위 (단위 큐브 [0,1]^4 ↔ 파라미터, log=True는 로그 스케일)
+# growth_rate/multiplier 하한: 비용이 레벨에 따라 항상 증가 (평평한 비용 = 무한 구매 방지)
+PARAM_BOUNDS = {
+    'base_cost': (1.0, 100.0, True),
+    'growth_rate': (0.05, 3.0, False),
+    'multiplier': (1.05, 3.0, False),
+    'softcap_interval': (1.0, 50.0, True),
+}
+# 제안값 반올림 (JSON에 사람이 쓴 값처럼 남도록)
+PARAM_DECIMALS = {'base_cost': 0, 'growth_rate': 2, 'multiplier': 2, 'softcap_interval': 0}
+
+DEFAULT_PROGRESSION = {
+    'min_cps': 3.0,
+    'max_cps': 15.0,
+    'stages': [10, 100],
+    'runs_per_boss': 5,
+    'weight': 1.0,
+}
+DEFAULT_ANCHOR_WEIGHT = 0.05        # 현재 값에서 멀어지는 것에 대한 벌점 (diff 최소화)
+
+
+# ============================================================
+# 파라미터 공간
+# ============================================================
+
+def to_unit(params: np.ndarray) -> np.ndarray:
+    """(..., 4) 비용 파라미터 → 단위 큐브"""
+    out = np.empty_like(np.asarray(params, dtype=np.float64))
+    for j, key in enumerate(COST_PARAM_KEYS):
+        lo, hi, log = PARAM_BOUNDS[key]
+        v = np.clip(params[..., j], lo, hi)
+        out[..., j] = (np.log(v / lo) / np.log(hi / lo)) if log else (v - lo) / (hi - lo)
+    return out
+
+
+def from_unit(unit: np.ndarray) -> np.ndarray:
+    """단위 큐브 → (..., 4) 비용 파라미터 (범위 밖은 경계로 자름)"""
+    u = np.clip(unit, 0.0, 1.0)
+    out = np.empty_like(u)
+    for j, key in enumerate(COST_PARAM_KEYS):
+        lo, hi, log = PARAM_BOUNDS[key]
+        out[..., j] = lo * np.power(hi / lo, u[..., j]) if log else lo + (hi - lo) * u[..., j]
+    return out
+
+
+def round_params(params: np.ndarray) -> np.ndarray:
+    out = np.array(params, dtype=np.float64)
+    for j, key in enumerate(COST_PARAM_KEYS):
+        out[..., j] = np.round(out[..., j], PARAM_DECIMALS[key])
+        lo, hi, _ = PARAM_BOUNDS[key]
+        out[..., j] = np.clip(out[..., j], lo, hi)
+    return out
+
+
+# ============================================================
+# 목표
+# ============================================================
+
+@dataclass
+class CostTarget:
+    stat_id: str
+    kind: str           # 'cumulative' (레벨 1..L 합) / 'cost' (레벨 L 비용)
+    level: int
+    value: float
+    weight: float = 1.0
+
+
+@dataclass
+class CurveTargets:
+    """목표 곡선 묶음 (JSON: {"stats": {...}, "progression": {...}, "anchor_weight": w})"""
+    costs: List[CostTarget] = field(default_factory=list)
+    progression: Optional[dict] = field(default_factory=lambda: dict(DEFAULT_PROGRESSION))
+    anchor_weight: float = DEFAULT_ANCHOR_WEIGHT
+    free_stats: Optional[List[str]] = None      # None = 전체 스탯 탐색
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'CurveTargets':
+        costs = []
+        for sid, spec in data.get('stats', {}).items():
+            weight = float(spec.get('weight', 1.0))
+            for kind in ('cumulative', 'cost'):
+                for level, value in spec.get(kind, {}).items():
+                    costs.append(CostTarget(sid, kind, int(level), float(value), weight))
+        progression = data.get('progression', DEFAULT_PROGRESSION)
+        if progression is not None:
+            progression = {**DEFAULT_PROGRESSION, **progression}
+        return cls(costs=costs, progression=progression,
+                   anchor_weight=float(data.get('anchor_weight', DEFAULT_ANCHOR_WEIGHT)),
+                   free_stats=data.get('free_stats'))
+
+    @classmethod
+    def load(cls, path: Path) -> 'CurveTargets':
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+
+# ============================================================
+# 목적 함수 (후보 K개 배치 평가)
+# ============================================================
+
+class CurveObjective:
+    """
+    후보 비용 파라미터 (K, S, 4) → 벌점 (K,)
+    진행 모델: 스테이지 s 도달 전 예산 B(s) 크리스탈을 가장 싼 업그레이드부터 구매
+    (모든 스탯 비용이 레벨에 대해 증가하므로 = 전체 비용을 정렬한 앞부분)
+    """
+
+    def __init__(self, table: StatTable, targets: CurveTargets, ingame: Optional[StatTable] = None,
+                 drops: Optional[BossDropConfig] = None):
+        self.table = table
+        self.targets = targets
+        self.nominal = table.params[:, :4].copy()
+        self.nominal_unit = to_unit(self.nominal)
+        self.effect = table.column('effect_per_level')
+        self.allowed = np.array([sid in MODELED_STATS for sid in table.ids])
+        self.level_cap = np.where(table.max_level > 0, np.minimum(table.max_level, LEVEL_CAP), LEVEL_CAP)
+        # 실제 최대 레벨이 지평보다 높은 스탯 (지평까지 다 사면 그 뒤 구매를 모델이 못 봄)
+        self.truncated = self.allowed & ((table.max_level <= 0) | (table.max_level > LEVEL_CAP))
+        self._index = {sid: i for i, sid in enumerate(table.ids)}
+
+        prog = targets.progression
+        self.progression = prog
+        if prog:
+            self.stages = np.arange(int(prog['stages'][0]), int(prog['stages'][1]) + 1)
+            self.budget = self._budget_curve(drops or BossDropConfig.load(), prog)
+            self.ingame_levels = self._ingame_levels(ingame or StatTable.load('InGameStatGrowth.json'))
+
+    # --- 고정 곡선 (파라미터와 무관) ---
+
+    def _budget_curve(self, drops: BossDropConfig, prog: dict) -> np.ndarray:
+        """스테이지별 도달 전 누적 크리스탈 예산"""
+        last = int(self.stages[-1])
+        all_stages = np.arange(1, last + 1)
+        bosses = all_stages[is_boss_stage(all_stages)]
+        per_boss = drops.drop_chances(bosses) * drops.expected_amounts(bosses) if len(bosses) else np.zeros(0)
+        gold_before = np.concatenate([[0.0], np.cumsum(stage_gold(all_stages))])
+        # 벽 w에서 실패하는 런 1회 수입 = w 이전 보스 드롭 + 획득 골드 환산
+        run_crystals = np.array([per_boss[bosses < w].sum() + np.floor(gold_before[w - 1] / SF.GOLD_TO_CRYSTAL_RATE)
+                                 for w in bosses])
+        spent_runs = float(prog['runs_per_boss']) * run_crystals
+        return np.array([spent_runs[bosses <= s].sum() for s in self.stages])
+
+    def _ingame_levels(self, ingame: StatTable) -> np.ndarray:
+        """스테이지별 인게임 키보드/마우스 레벨 (누적 골드를 반씩 투자)"""
+        gold_before = np.concatenate([[0.0], np.cumsum(stage_gold(np.arange(1, int(self.stages[-1]) + 1)))])
+        budget = gold_before[self.stages - 1] / 2
+        out = np.zeros((len(self.stages), 2))
+        self.ingame_effect = np.zeros(2)
+        for j, sid in enumerate(('keyboard_power', 'mouse_power')):
+            if sid in ingame.ids:
+                i = ingame.index(sid)
+                cum = np.cumsum(upgrade_costs(ingame.params[i, :4], np.arange(1, 2001)))
+                out[:, j] = np.searchsorted(cum, budget, side='right')
+                self.ingame_effect[j] = ingame.params[i, PARAM_KEYS.index('effect_per_level')]
+        return out
+
+    # --- 평가 ---
+
+    def cost_penalty(self, params: np.ndarray) -> np.ndarray:
+        """스탯별 비용 목표 (log 오차 제곱)"""
+        total = np.zeros(params.shape[0])
+        for t in self.targets.costs:
+            i = self._index.get(t.stat_id)
+            if i is None:
+                continue
+            if t.kind == 'cumulative':
+                model = upgrade_costs(params[:, i], np.arange(1, t.level + 1)).sum(axis=-1)
+            else:
+                model = upgrade_costs(params[:, i], np.array([t.level]))[:, 0]
+            total += t.weight * np.log(np.maximum(model, 1.0) / max(t.value, 1.0)) ** 2
+        return total
+
+    def levels_at_budget(self, params: np.ndarray) -> np.ndarray:
+        """(K, S, 4) → (K, n_stages, S) 예산 B(s)로 산 레벨"""
+        k, s = params.shape[:2]
+        costs = upgrade_costs(params, np.arange(1, LEVEL_CAP + 1))         # (K, S, L)
+        lv = np.arange(1, LEVEL_CAP + 1)
+        blocked = ~self.allowed[:, None] | (lv[None, :] > self.level_cap[:, None])
+        costs = np.where(blocked[None], np.inf, costs).reshape(k, -1)
+        order = np.argsort(costs, axis=1, kind='stable')
+        sorted_cost = np.take_along_axis(costs, order, axis=1)
+        cum = np.cumsum(sorted_cost, axis=1)
+        n = costs.shape[1]
+        bought = np.stack([np.searchsorted(cum[j], self.budget, side='right') for j in range(k)])   # (K, T)
+
+        # 정렬 순위: 한 스탯의 레벨들은 순위가 증가 → 구매 수 n 이내 레벨 수 = 순위 배열의 searchsorted
+        rank = np.empty_like(order)
+        np.put_along_axis(rank, order, np.arange(n)[None, :], axis=1)
+        rows = np.arange(k * s).reshape(k, s)
+        keys = (rows[:, :, None] * (n + 1) + rank.reshape(k, s, LEVEL_CAP)).ravel()
+        query = rows[:, None, :] * (n + 1) + bought[:, :, None]                   # (K, T, S)
+        return np.searchsorted(keys, query) - rows[:, None, :] * LEVEL_CAP
+
+    def required_cps(self, params: np.ndarray, levels: Optional[np.ndarray] = None) -> np.ndarray:
+        """(K, S, 4) → (K, n_stages) 필요 CPS"""
+        if levels is None:
+            levels = self.levels_at_budget(params)
+        eff = levels * self.effect[None, None, :]
+
+        def e(stat_id):
+            i = self._index.get(stat_id)
+            return eff[..., i] if i is not None else 0.0
+
+        kb = 1 + self.ingame_effect[0] * (self.ingame_levels[:, 0] + e('start_keyboard'))
+        ms = 1 + self.ingame_effect[1] * (self.ingame_levels[:, 1] + e('start_mouse'))
+        damage = expected_damage((kb + ms) / 2, e('base_attack'), e('attack_percent'), e('crit_chance'),
+                                 e('crit_damage'), e('multi_hit'), 0, e('start_combo_damage'))
+        return required_cps(self.stages, damage, SF.BASE_TIME_LIMIT + e('time_extend'))
+
+    def progression_penalty(self, params: np.ndarray) -> np.ndarray:
+        if not self.progression:
+            return np.zeros(params.shape[0])
+        levels = self.levels_at_budget(params)
+        cps = self.required_cps(params, levels)
+        over = np.maximum(np.log(cps / self.progression['max_cps']), 0)
+        under = np.maximum(np.log(self.progression['min_cps'] / cps), 0)
+        # 지평에 닿은 스탯은 실제로 더 사지만 모델은 LEVEL_CAP 에서 멈춤 → 필요 CPS를 믿을 수 없음
+        saturated = (levels >= LEVEL_CAP) & self.truncated[None, None, :]
+        return (float(self.progression['weight']) * ((over ** 2 + under ** 2).mean(axis=1))
+                + HORIZON_WEIGHT * saturated.sum(axis=2).mean(axis=1))
+
+    def growth_penalty(self, params: np.ndarray) -> np.ndarray:
+        """최대 레벨 없는 스탯의 비용 증가 하한 (평평한 비용 = 무한 구매 방지)"""
+        rate = np.log(params[..., 2]) / params[..., 3]                      # (K, S) 레벨당 지수 증가율
+        short = np.maximum(np.log(np.log(2) / MAX_DOUBLING_LEVELS / np.maximum(rate, 1e-12)), 0)
+        return GROWTH_WEIGHT * (short ** 2 * self.truncated[None, :]).sum(axis=1)
+
+    def __call__(self, params: np.ndarray) -> np.ndarray:
+        anchor = ((to_unit(params) - self.nominal_unit[None]) ** 2).sum(axis=(1, 2))
+        return (self.cost_penalty(params) + self.progression_penalty(params) + self.growth_penalty(params)
+                + self.targets.anchor_weight * anchor)
+
+
+# ============================================================
+# Nelder-Mead (시작점 배치)
+# ============================================================
+
+def nelder_mead_batch(func, starts: np.ndarray, step: float = 0.1, iterations: int = 120,
+                      tol: float = 1e-7) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    여러 시작점의 Nelder-Mead를 동시에 진행 (func: (M, d) → (M,))
+    반환: 시작점별 (최적점 (K, d), 값 (K,))
+    """
+    k, d = starts.shape
+    simplex = np.repeat(starts[:, None, :], d + 1, axis=1)
+    simplex[:, 1:] += step * np.eye(d)[None]
+    values = func(simplex.reshape(-1, d)).reshape(k, d + 1)
+
+    for _ in range(iterations):
+        order = np.argsort(values, axis=1)
+        simplex = np.take_along_axis(simplex, order[:, :, None], axis=1)
+        values = np.take_along_axis(values, order, axis=1)
+        if np.all(values[:, -1] - values[:, 0] <= tol):
+            break
+        centroid = simplex[:, :-1].mean(axis=1)
+        worst = simplex[:, -1]
+        # 반사/확장/바깥 수축/안쪽 수축 후보를 한 번에 평가
+        cand = np.stack([centroid + (centroid - worst), centroid + 2 * (centroid - worst),
+                         centroid + 0.5 * (centroid - worst), centroid - 0.5 * (centroid - worst)], axis=1)
+        fc = func(cand.reshape(-1, d)).reshape(k, 4)
+        fr, fe, fo, fi = fc.T
+        best, second = values[:, 0], values[:, -2]
+
+        pick = np.full(k, -1)
+        pick = np.where((fr < second) & (fr >= best), 0, pick)
+        pick = np.where((fr < best) & (fe < fr), 1, pick)
+        pick = np.where((fr < best) & (fe >= fr), 0, pick)
+        pick = np.where((fr >= second) & (fr < values[:, -1]) & (fo <= fr), 2, pick)
+        pick = np.where((fr >= values[:, -1]) & (fi < values[:, -1]), 3, pick)
+        ok = pick >= 0
+        simplex[ok, -1] = cand[ok, pick[ok]]
+        values[ok, -1] = fc[ok, pick[ok]]
+
+        # 축소
+        shrink = np.flatnonzero(~ok)
+        if len(shrink):
+            pts = simplex[shrink, :1] + 0.5 * (simplex[shrink, 1:] - simplex[shrink, :1])
+            simplex[shrink, 1:] = pts
+            values[shrink, 1:] = func(pts.reshape(-1, d)).reshape(len(shrink), d)
+
+    i = np.argmin(values, axis=1)
+    return simplex[np.arange(k), i], values[np.arange(k), i]
+
+
+# ============================================================
+# 솔버
+# ============================================================
+
+_OBJECTIVE: Optional[CurveObjective] = None
+
+
+def _init_worker(objective: CurveObjective):
+    global _OBJECTIVE
+    _OBJECTIVE = objective
+
+
+def _fit_stat(args) -> Tuple[int, np.ndarray, float]:
+    """다른 스탯을 고정하고 스탯 i의 4개 파라미터 탐색 (단위 큐브)"""
+    i, current, starts, iterations = args
+    objective = _OBJECTIVE
+
+    def func(unit):
+        params = np.repeat(current[None], len(unit), axis=0)
+        params[:, i] = from_unit(unit)
+        return objective(params)
+
+    points, values = nelder_mead_batch(func, starts, iterations=iterations)
+    best = int(np.argmin(values))
+    return i, from_unit(points[best]), float(values[best])
+
+
+def _polish_stat(args) -> Tuple[int, np.ndarray, float]:
+    """정수 파라미터(base_cost, softcap_interval)를 내림/올림으로 고정하고 나머지 2개를 재탐색 후 반올림"""
+    i, current, iterations = args
+    objective = _OBJECTIVE
+    x = current[i]
+    int_cols = [j for j, key in enumerate(COST_PARAM_KEYS) if PARAM_DECIMALS[key] == 0]
+    free_cols = [j for j in range(len(COST_PARAM_KEYS)) if j not in int_cols]
+    best_params, best_value = round_params(x), np.inf
+    for combo in np.array(np.meshgrid(*[[np.floor(x[j]), np.ceil(x[j])] for j in int_cols])).T.reshape(-1, len(int_cols)):
+        fixed = x.copy()
+        fixed[int_cols] = combo
+
+        def func(unit, fixed=fixed):
+            full = np.repeat(to_unit(fixed)[None], len(unit), axis=0)
+            full[:, free_cols] = unit
+            params = np.repeat(current[None], len(unit), axis=0)
+            params[:, i] = from_unit(full)
+            params[:, i, int_cols] = fixed[int_cols]
+            return objective(params)
+
+        points, _ = nelder_mead_batch(func, to_unit(fixed)[None, free_cols], step=0.05, iterations=iterations)
+        candidate = fixed.copy()
+        candidate[free_cols] = from_unit(_replace_cols(to_unit(fixed), free_cols, points[0]))[free_cols]
+        candidate = round_params(candidate)
+        trial = current.copy()
+        trial[i] = candidate
+        value = float(objective(trial[None])[0])
+        if value < best_value:
+            best_params, best_value = candidate, value
+    return i, best_params, best_value
+
+
+def _replace_cols(unit: np.ndarray, cols: Sequence[int], values: np.ndarray) -> np.ndarray:
+    out = unit.copy()
+    out[cols] = values
+    return out
+
+
+@dataclass
+class FitResult:
+    params: np.ndarray          # (S, 4) 반올림된 제안값
+    initial_value: float
+    final_value: float
+    rounds: int
+    elapsed: float
+    changed: List[str]
+
+
+class CurveFitter:
+    """PermanentStatGrowth 역문제 솔버"""
+
+    def __init__(self, targets: CurveTargets, config: Optional[dict] = None):
+        self.config = config if config is not None else load_json(PERM_FILE)
+        self.table = StatTable.from_config(self.config)
+        self.targets = targets
+        self.objective = CurveObjective(self.table, targets)
+        free = targets.free_stats or self.table.ids
+        self.free = [self.table.index(sid) for sid in free if sid in self.table.ids]
+
+    def fit(self, rounds: int = 3, starts: int = 4, iterations: int = 80, workers: int = 0,
+            seed: int = 0) -> FitResult:
+        started = time.perf_counter()
+        current = self.objective.nominal.copy()
+        initial = float(self.objective(current[None])[0])
+        value = initial
+        rng = np.random.default_rng(seed)
+
+        pool = None
+        if workers != 1:
+            pool = ProcessPoolExecutor(max_workers=workers or None, initializer=_init_worker,
+                                       initargs=(self.objective,))
+        else:
+            _init_worker(self.objective)
+        try:
+            done = 0
+            for done in range(1, rounds + 1):
+                tasks = []
+                for i in self.free:
+                    # 시작점: 현재 값 + 단위 큐브 무작위 점
+                    pts = np.vstack([to_unit(current[i])[None], rng.random((starts - 1, 4))])
+                    tasks.append((i, current.copy(), pts, iterations))
+                results = list(pool.map(_fit_stat, tasks)) if pool else [_fit_stat(t) for t in tasks]
+
+                # 야코비 결합: 스탯별 최적을 동시에 적용, 악화되면 감쇠
+                proposal = current.copy()
+                for i, params, _ in results:
+                    proposal[i] = params
+                improved = False
+                for alpha in (1.0, 0.5, 0.25):
+                    trial = from_unit(to_unit(current) + alpha * (to_unit(proposal) - to_unit(current)))
+                    trial_value = float(self.objective(trial[None])[0])
+                    if trial_value < value - 1e-9:
+                        current, value, improved = trial, trial_value, True
+                        break
+                if not improved:
+                    # 결합이 실패하면 개선폭이 가장 큰 스탯 하나만 반영
+                    i, params, v = min(results, key=lambda r: r[2])
+                    trial = current.copy()
+                    trial[i] = params
+                    trial_value = float(self.objective(trial[None])[0])
+                    if trial_value < value - 1e-9:
+                        current, value = trial, trial_value
+                    else:
+                        break
+        finally:
+            if pool:
+                pool.shutdown()
+
+        # 정수/소수 자릿수 맞춤: 스탯 순서대로 (가우스-자이델) 반올림 후 재탐색
+        _init_worker(self.objective)
+        rounded = current.copy()
+        for i in self.free:
+            rounded[i] = _polish_stat((i, rounded, max(iterations // 2, 10)))[1]
+        # 그래도 현재 값이 더 나은 스탯은 현재 값 유지
+        final = float(self.objective(rounded[None])[0])
+        for i in self.free:
+            trial = rounded.copy()
+            trial[i] = self.objective.nominal[i]
+            trial_value = float(self.objective(trial[None])[0])
+            if trial_value <= final:
+                rounded, final = trial, trial_value
+
+        changed = [sid for i, sid in enumerate(self.table.ids)
+                   if not np.allclose(rounded[i], self.objective.nominal[i])]
+        return FitResult(rounded, initial, final, done, time.perf_counter() - started, changed)
+
+    def proposed_config(self, result: FitResult) -> dict:
+        """현재 설정을 복사해 비용 파라미터만 바꾼 dict (키 순서 유지)"""
+        data = copy.deepcopy(self.config)
+        for i, sid in enumerate(self.table.ids):
+            stat = data['stats'][sid]
+            for j, key in enumerate(COST_PARAM_KEYS):
+                value = float(result.params[i, j])
+                stat[key] = int(value) if PARAM_DECIMALS[key] == 0 else value
+        return data
+
+
+def config_text(data: dict) -> str:
+    """대시보드 저장 형식과 같은 JSON 텍스트"""
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
+def config_diff(before: dict, after: dict, name: str = PERM_FILE) -> str:
+    return "".join(difflib.unified_diff(
+        config_text(before).splitlines(keepends=True), config_text(after).splitlines(keepends=True),
+        fromfile=f"a/config/{name}", tofile=f"b/config/{name}",
+    ))
+
+
+# ============================================================
+# 메인
+# ============================================================
+
+def print_report(fitter: CurveFitter, result: FitResult):
+    obj = fitter.objective
+    print(f"\n{'='*72}")
+    print(f" 곡선 맞춤 결과 ({result.rounds}라운드, {result.elapsed:.1f}초)")
+    print(f"{'='*72}")
+    print(f" 목적 함수: {result.initial_value:.4f} → {result.final_value:.4f}")
+    print(f" 변경 스탯: {', '.join(result.changed) or '없음'}")
+
+    if obj.progression:
+        before = obj.required_cps(obj.nominal[None])[0]
+        after = obj.required_cps(result.params[None])[0]
+        lo, hi = obj.progression['min_cps'], obj.progression['max_cps']
+        print(f"\n [필요 CPS] 목표 {lo:g} ~ {hi:g}")
+        print(f" {'스테이지':>8} | {'예산':>10} | {'현재':>10} | {'제안':>10}")
+        step = max(1, len(obj.stages) // 10)
+        for t in sorted(set(range(0, len(obj.stages), step)) | {len(obj.stages) - 1}):
+            print(f" {obj.stages[t]:>8} | {obj.budget[t]:>10,.0f} | {before[t]:>10.2f} | {after[t]:>10.2f}")
+
+    for target in fitter.targets.costs:
+        i = fitter.table.index(target.stat_id)
+        levels = np.arange(1, target.level + 1) if target.kind == 'cumulative' else np.array([target.level])
+        before = upgrade_costs(obj.nominal[i], levels).sum()
+        after = upgrade_costs(result.params[i], levels).sum()
+        label = f"Lv.1~{target.level} 누적" if target.kind == 'cumulative' else f"Lv.{target.level} 비용"
+        print(f"  {target.stat_id:<20} {label:<14} 목표 {target.value:>10,.0f}  현재 {before:>10,.0f}  제안 {after:>10,.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DeskWarrior 영구 스탯 곡선 자동 맞춤")
+    parser.add_argument('--targets', type=Path, default=None, help="목표 JSON (없으면 필요 CPS 기본 목표)")
+    parser.add_argument('--rounds', type=int, default=3)
+    parser.add_argument('--starts', type=int, default=4, help="스탯별 다중 시작점 수")
+    parser.add_argument('--iterations', type=int, default=80)
+    parser.add_argument('--workers', type=int, default=0)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', type=Path, default=None, help="제안 설정 저장 경로")
+    parser.add_argument('--apply', action='store_true', help="config를 덮어씀 (.backup 생성)")
+    args = parser.parse_args()
+
+    targets = CurveTargets.load(args.targets) if args.targets else CurveTargets()
+    fitter = CurveFitter(targets)
+    result = fitter.fit(rounds=args.rounds, starts=args.starts, iterations=args.iterations,
+                        workers=args.workers, seed=args.seed)
+    print_report(fitter, result)
+
+    proposed = fitter.proposed_config(result)
+    diff = config_diff(fitter.config, proposed)
+    print(f"\n{diff or ' (변경 없음)'}")
+
+    if args.output:
+        args.output.write_text(config_text(proposed), encoding='utf-8')
+        print(f" 제안 설정 저장: {args.output}")
+    if args.apply and diff:
+        path = CONFIG_DIR / PERM_FILE
+        shutil.copy2(path, path.with_name(path.name + '.backup'))
+        path.write_text(config_text(proposed), encoding='utf-8')
+        print(f" 적용 완료: {path} (백업 {path.name}.backup)")
+
+
+if __name__ == '__main__':
+    main()
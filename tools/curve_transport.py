@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DeskWarrior 곡선 데이터 바이너리 전송 (웹 대시보드 chart-utils.js 용)
+- 여러 배열을 작은 JSON 헤더 + little-endian float64/int64 원시 버퍼 하나로 묶음
+- 각 배열은 8바이트 정렬 → JS 가 원소 파싱 없이 Float64Array / BigInt64Array 뷰로 매핑
+- 전달 경로: dashboard_app.Api.get_curves (pywebview, base64) / sim_server POST /curves/<kind> (원시)
+
+형식:
+    0  'DWA1'                       매직
+    4  uint32 LE                    헤더 길이 H (8바이트 정렬 패딩 포함)
+    8  JSON (H 바이트)              {"meta": {...}, "arrays": [{name, dtype, length, offset}]}
+    8+H 데이터                      offset 은 데이터 시작 기준, 모두 8의 배수
+
+사용 예:
+    payload = pack_arrays({'stage': stages, 'hp': hp}, meta={'kind': 'stage'})
+    arrays, meta = unpack_arrays(payload)
+    build_curves('upgrade_costs', {'stat': 'base_attack', 'max_level': 5000})
+"""
+
+import base64
+import json
+import struct
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from economy_model import COST_PARAM_KEYS, StatTable, is_boss_stage, load_json, stage_gold, stage_hp
+
+MAGIC = b'DWA1'
+ALIGN = 8
+DTYPES = {'f8': np.dtype('<f8'), 'i8': np.dtype('<i8')}
+MAX_POINTS = 1_000_000
+
+
+def _pad(n: int) -> int:
+    return -n % ALIGN
+
+
+# ============================================================
+# 인코딩
+# ============================================================
+
+def pack_arrays(arrays: Dict[str, Any], meta: Optional[dict] = None) -> bytes:
+    """{이름: 1차원 배열} → 바이너리 (정수는 int64, 나머지는 float64)"""
+    entries, blocks, offset = [], [], 0
+    for name, values in arrays.items():
+        arr = np.asarray(values)
+        if arr.ndim != 1:
+            raise ValueError(f"{name}: 1차원 배열만 지원합니다 ({arr.shape})")
+        code = 'i8' if arr.dtype.kind in 'iub' else 'f8'
+        data = np.ascontiguousarray(arr, dtype=DTYPES[code]).tobytes()
+        entries.append({'name': name, 'dtype': code, 'length': len(arr), 'offset': offset})
+        blocks.append(data + b'\0' * _pad(len(data)))
+        offset += len(blocks[-1])
+
+    header = json.dumps({'meta': meta or {}, 'arrays': entries}, ensure_ascii=False).encode('utf-8')
+    header += b' ' * _pad(len(header))
+    return MAGIC + struct.pack('<I', len(header)) + header + b''.join(blocks)
+
+
+def unpack_arrays(payload: bytes) -> Tuple[Dict[str, np.ndarray], dict]:
+    """바이너리 → ({이름: 배열 (원본 버퍼 뷰)}, meta)"""
+    if payload[:4] != MAGIC:
+        raise ValueError("곡선 데이터 형식이 아닙니다")
+    (size,) = struct.unpack_from('<I', payload, 4)
+    header = json.loads(payload[8:8 + size].decode('utf-8'))
+    start = 8 + size
+    arrays = {
+        e['name']: np.frombuffer(payload, dtype=DTYPES[e['dtype']], count=e['length'], offset=start + e['offset'])
+        for e in header['arrays']
+    }
+    return arrays, header['meta']
+
+
+def encode_base64(payload: bytes) -> str:
+    return base64.b64encode(payload).decode('ascii')
+
+
+# ============================================================
+# 곡선
+# ============================================================
+
+def _points(params: dict, key: str, default: int) -> int:
+    n = int(params.get(key, default))
+    if not 1 <= n <= MAX_POINTS:
+        raise ValueError(f"{key} 는 1~{MAX_POINTS:,} 이어야 합니다")
+    return n
+
+
+def stage_curves(params: dict) -> Tuple[Dict[str, np.ndarray], dict]:
+    """스테이지 1..max_stage: HP (오버플로는 inf), 처치 골드, 보스 여부"""
+    stages = np.arange(1, _points(params, 'max_stage', 1000) + 1, dtype=np.int64)
+    with np.errstate(over='ignore'):
+        hp = stage_hp(stages)
+    gold = stage_gold(stages, float(params.get('gold_flat', 0)), float(params.get('gold_multi', 0)))
+    return {'stage': stages, 'hp': hp, 'gold': gold, 'boss': is_boss_stage(stages)}, {}
+
+
+def upgrade_cost_curves(params: dict) -> Tuple[Dict[str, np.ndarray], dict]:
+    """스탯 1개의 레벨 1..max_level 비용/누적 비용 (kind: permanent / ingame)
+
+    overrides: 저장 전 편집 중인 비용 파라미터 (없는 키는 파일 값)
+    """
+    filename = 'InGameStatGrowth.json' if params.get('kind') == 'ingame' else 'PermanentStatGrowth.json'
+    config = load_json(filename)
+    stat = params.get('stat')
+    overrides = {k: float(v) for k, v in (params.get('overrides') or {}).items()
+                 if k in COST_PARAM_KEYS and v is not None}
+    if overrides and stat in config.get('stats', {}):
+        config = dict(config, stats=dict(config['stats'], **{stat: dict(config['stats'][stat], **overrides)}))
+    table = StatTable.from_config(config)
+    if stat not in table.ids:
+        raise ValueError(f"알 수 없는 스탯: {stat}")
+    max_level = _points(params, 'max_level', 1000)
+    with np.errstate(over='ignore'):
+        cost = table.cost_table(max_level)[table.index(stat)]
+    return ({'level': np.arange(1, max_level + 1, dtype=np.int64), 'cost': cost, 'cumulative': np.cumsum(cost)},
+            {'stat': stat, 'name': table.names[table.index(stat)], 'max_level': int(table.max_level[table.index(stat)])})
+
+
+CURVES: Dict[str, Callable[[dict], Tuple[Dict[str, np.ndarray], dict]]] = {
+    'stage': stage_curves,
+    'upgrade_costs': upgrade_cost_curves,
+}
+
+
+def build_curves(kind: str, params: Optional[dict] = None) -> bytes:
+    """곡선 종류 + 파라미터 → 바이너리 (meta 에 kind 포함)"""
+    if kind not in CURVES:
+        raise ValueError(f"알 수 없는 곡선: {kind}")
+    arrays, meta = CURVES[kind](params or {})
+    return pack_arrays(arrays, dict(meta, kind=kind))
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DeskWarrior 그래프 다운샘플링 (긴 레벨/스테이지 범위용)
+- lttb(): Largest-Triangle-Three-Buckets - 모양을 유지하는 점 n개 선택
+  + 구간 최솟값/최댓값 인덱스를 항상 포함 (보스 스테이지 같은 튀는 값이 사라지지 않음)
+- DownsamplingPlotter: 전체 배열은 보관하고 선에는 화면 폭(픽셀)만큼의 점만 넘김
+  확대/이동(xlim 변경)·크기 변경 시 보이는 구간만 다시 추림
+- inf/nan 과 float 한계 근처 값은 제외 (matplotlib 이 그리지 못하는 점)
+
+Qt 에 의존하지 않음 (balance_dashboard_qt.StatEditorTab 이 사용)
+
+사용 예:
+    plotter = DownsamplingPlotter()
+    plotter.connect(canvas)                               # 크기 변경 시 다시 추림
+    plotter.plot(ax, levels, costs, color='#4a90d9')      # 100,000점 → 약 축 폭 픽셀 수
+    plotter.clear()                                       # figure.clear() 전에
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+POINTS_PER_PIXEL = 1.0
+MIN_POINTS = 64
+MAX_PLOT_VALUE = 1e300          # 이보다 크면 matplotlib 축 눈금 계산이 넘침 → inf 처럼 제외
+
+
+# ============================================================
+# LTTB
+# ============================================================
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """정렬된 x 의 (x, y) 에서 남길 인덱스 (오름차순, 첫/끝 점과 전체 최솟값/최댓값 포함)"""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    scale = np.abs(y).max()
+    if scale > 0:
+        y = y / scale           # 넓이 비교는 y 배율과 무관 - 큰 HP 값의 합 오버플로 방지
+    # 가운데 n-2 점을 n_out-2 개 버킷으로 (첫/끝 점은 고정)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    starts, ends = edges[:-1], edges[1:]
+    ends = np.maximum(ends, starts + 1)
+    sizes = ends - starts
+    # 다음 버킷 평균 (마지막 버킷의 다음은 끝 점)
+    avg_x = np.append(np.add.reduceat(x[:n - 1], starts) / sizes, x[-1])[1:]
+    avg_y = np.append(np.add.reduceat(y[:n - 1], starts) / sizes, y[-1])[1:]
+
+    picked = np.empty(n_out, dtype=np.int64)
+    picked[0], picked[-1] = 0, n - 1
+    prev = 0
+    for b, (s, e) in enumerate(zip(starts.tolist(), ends.tolist())):
+        px, py = x[prev], y[prev]
+        # 삼각형 넓이 ×2 (이전 선택점, 후보, 다음 버킷 평균)
+        area = np.abs((px - avg_x[b]) * (y[s:e] - py) - (px - x[s:e]) * (avg_y[b] - py))
+        prev = s + int(area.argmax())
+        picked[b + 1] = prev
+
+    extrema = [int(y.argmin()), int(y.argmax())]
+    return np.unique(np.concatenate([picked, extrema]))
+
+
+def _plottable(values: np.ndarray) -> np.ndarray:
+    return np.abs(values) < MAX_PLOT_VALUE         # nan 도 False
+
+
+def downsample(x, y, n_out: int, x_range: Optional[Tuple[float, float]] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """유한한 점만, x_range 구간(양쪽 바깥 1점 포함)을 n_out 점 내외로"""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    finite = _plottable(x) & _plottable(y)
+    if not finite.all():
+        x, y = x[finite], y[finite]
+    if x_range is not None and len(x):
+        lo, hi = sorted(x_range)
+        # 보이는 구간 + 양쪽 1점 (선이 축 가장자리까지 이어지도록)
+        i0 = max(int(np.searchsorted(x, lo, side='left')) - 1, 0)
+        i1 = min(int(np.searchsorted(x, hi, side='right')) + 1, len(x))
+        x, y = x[i0:i1], y[i0:i1]
+    keep = lttb(x, y, max(n_out, MIN_POINTS))
+    return x[keep], y[keep]
+
+
+# ============================================================
+# matplotlib 연결
+# ============================================================
+
+class _Series:
+    __slots__ = ('x', 'y', 'line')
+
+    def __init__(self, x: np.ndarray, y: np.ndarray, line):
+        self.x, self.y, self.line = x, y, line
+
+
+class DownsamplingPlotter:
+    """축별 원본 배열 보관 + 보이는 구간만 다운샘플해서 Line2D 갱신"""
+
+    def __init__(self, points_per_pixel: float = POINTS_PER_PIXEL):
+        self.points_per_pixel = points_per_pixel
+        self._series: Dict[object, List[_Series]] = {}
+        self._callbacks: Dict[object, int] = {}
+
+    def _n_out(self, ax) -> int:
+        return int(ax.bbox.width * self.points_per_pixel)
+
+    def plot(self, ax, x, y, *args, **kwargs):
+        """ax.plot 과 같은 인자 (x 는 오름차순) → Line2D"""
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        dx, dy = downsample(x, y, self._n_out(ax))
+        (line,) = ax.plot(dx, dy, *args, **kwargs)
+        self._series.setdefault(ax, []).append(_Series(x, y, line))
+        if ax not in self._callbacks:
+            self._callbacks[ax] = ax.callbacks.connect('xlim_changed', self._on_xlim_changed)
+        return line
+
+    def fill_between(self, ax, x, y1, y2=0, **kwargs):
+        """정적 채우기 (전체 범위 기준 1회 다운샘플)"""
+        x = np.asarray(x, dtype=np.float64)
+        y1 = np.asarray(y1, dtype=np.float64)
+        finite = _plottable(x) & _plottable(y1)
+        x, y1 = x[finite], y1[finite]
+        keep = lttb(x, y1, max(self._n_out(ax), MIN_POINTS))
+        y2 = np.asarray(y2)[finite][keep] if np.ndim(y2) else y2
+        return ax.fill_between(x[keep], y1[keep], y2, **kwargs)
+
+    def _on_xlim_changed(self, ax):
+        self.update(ax)
+
+    def update(self, ax):
+        """ax 의 현재 x 범위와 폭으로 선 데이터 다시 추림"""
+        n_out = self._n_out(ax)
+        x_range = ax.get_xlim()
+        for series in self._series.get(ax, []):
+            series.line.set_data(*downsample(series.x, series.y, n_out, x_range))
+
+    def refresh(self, *_):
+        for ax in list(self._series):
+            self.update(ax)
+
+    def connect(self, canvas):
+        """캔버스 크기 변경 시 다시 추림"""
+        return canvas.mpl_connect('resize_event', self.refresh)
+
+    def clear(self):
+        for ax, cid in self._callbacks.items():
+            ax.callbacks.disconnect(cid)
+        self._series.clear()
+        self._callbacks.clear()
+
+    @property
+    def point_count(self) -> int:
+        """현재 그려진 점 수 (원본 대비 확인용)"""
+        return sum(len(s.line.get_xdata()) for series in self._series.values() for s in series)
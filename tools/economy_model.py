@@ -0,0 +1,223 @@
+"""
+DeskWarrior 경제 모델 (NumPy 벡터화)
+- 스탯 설정을 열 단위 배열로 로드
+- 업그레이드/누적 비용을 전 스탯 × 전 레벨 한 번에 계산
+- 영구 스탯 효과 → 기대 데미지/제한시간/필요 CPS
+
+공식 자체는 stat_formulas_generated.py (Single Source of Truth)와 동일하며,
+이 모듈은 같은 공식을 배열 단위로 평가할 뿐입니다.
+"""
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+import stat_formulas_generated as SF
+
+# 프로젝트 루트 경로
+ROOT = Path(__file__).resolve().parent.parent
+CONFIG_DIR = ROOT / "config"
+
+# 파라미터 키 (StatEditorTab.PARAM_KEYS와 동일 순서)
+PARAM_KEYS = ('base_cost', 'growth_rate', 'multiplier', 'softcap_interval', 'effect_per_level')
+COST_PARAM_KEYS = PARAM_KEYS[:4]
+
+# 파일에 값이 없을 때의 기본값 (대시보드 로더와 동일)
+PARAM_DEFAULTS = {
+    'base_cost': 1,
+    'growth_rate': 0.5,
+    'multiplier': 1.5,
+    'softcap_interval': 10,
+    'effect_per_level': 1,
+}
+
+
+# ============================================================
+# 설정 로드
+# ============================================================
+
+def load_json(filename: str, config_dir: Optional[Path] = None) -> dict:
+    """JSON 설정 파일 로드"""
+    with open(Path(config_dir or CONFIG_DIR) / filename, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+@dataclass
+class StatTable:
+    """스탯 파라미터 테이블 (스탯별 행, 파라미터별 NumPy 열)"""
+    ids: List[str]
+    names: List[str]
+    params: np.ndarray      # (n_stats, 5) - PARAM_KEYS 순서
+    max_level: np.ndarray   # (n_stats,) - 0이면 무제한
+
+    @classmethod
+    def from_config(cls, data: dict) -> 'StatTable':
+        """PermanentStatGrowth.json / InGameStatGrowth.json 구조에서 생성"""
+        ids, names, rows, max_levels = [], [], [], []
+        for stat_id, stat in data.get('stats', {}).items():
+            if stat_id.startswith('_'):  # 주석 스킵
+                continue
+            ids.append(stat_id)
+            names.append(stat.get('name', stat_id))
+            rows.append([float(stat.get(k, PARAM_DEFAULTS[k])) for k in PARAM_KEYS])
+            max_levels.append(int(stat.get('max_level', 0)))
+        return cls(
+            ids=ids,
+            names=names,
+            params=np.array(rows, dtype=np.float64).reshape(len(ids), len(PARAM_KEYS)),
+            max_level=np.array(max_levels, dtype=np.int64),
+        )
+
+    @classmethod
+    def load(cls, filename: str, config_dir: Optional[Path] = None) -> 'StatTable':
+        return cls.from_config(load_json(filename, config_dir))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def index(self, stat_id: str) -> int:
+        return self.ids.index(stat_id)
+
+    def column(self, key: str) -> np.ndarray:
+        return self.params[:, PARAM_KEYS.index(key)]
+
+    def to_values(self) -> Dict[str, Dict[str, float]]:
+        """{stat_id: {param: value}} 형태로 변환"""
+        return {
+            sid: {k: float(v) for k, v in zip(PARAM_KEYS, row)}
+            for sid, row in zip(self.ids, self.params)
+        }
+
+    def cost_table(self, max_level: int) -> np.ndarray:
+        """(n_stats, max_level) 레벨 1..max_level 업그레이드 비용"""
+        return upgrade_costs(self.params[..., :4], np.arange(1, max_level + 1))
+
+    def cumulative_table(self, max_level: int) -> np.ndarray:
+        """(n_stats, max_level) 레벨 1..max_level 누적 비용"""
+        return np.cumsum(self.cost_table(max_level), axis=-1)
+
+
+# ============================================================
+# 비용 계산 (벡터화)
+# ============================================================
+
+def upgrade_costs(cost_params: np.ndarray, levels: np.ndarray, truncate: bool = True) -> np.ndarray:
+    """
+    업그레이드 비용
+    공식: base_cost * (1 + level * growth_rate) * pow(multiplier, level / softcap_interval)
+
+    cost_params: (..., 4) - COST_PARAM_KEYS 순서 (effect_per_level 열이 있어도 무시)
+    levels: (L,)
+    반환: (..., L)
+    """
+    p = np.asarray(cost_params, dtype=np.float64)
+    lv = np.asarray(levels, dtype=np.float64)
+    base = p[..., 0:1]
+    growth = p[..., 1:2]
+    multi = p[..., 2:3]
+    softcap = p[..., 3:4]
+    costs = base * (1 + lv * growth) * np.power(multi, lv / softcap)
+    # SF.calc_upgrade_cost와 동일하게 int() 절삭
+    return np.trunc(costs) if truncate else costs
+
+
+def cumulative_costs(cost_params: np.ndarray, max_level: int, truncate: bool = True) -> np.ndarray:
+    """레벨 1..max_level 누적 비용 합계 (..., )"""
+    return upgrade_costs(cost_params, np.arange(1, max_level + 1), truncate).sum(axis=-1)
+
+
+def total_cost(stat: Dict[str, float], from_lv: int, to_lv: int) -> int:
+    """from_lv ~ to_lv-1 구간 총 비용 (GameFormulas.total_cost와 동일)"""
+    if to_lv <= from_lv:
+        return 0
+    params = np.array([stat.get(k, PARAM_DEFAULTS[k]) for k in COST_PARAM_KEYS], dtype=np.float64)
+    return int(upgrade_costs(params, np.arange(from_lv, to_lv)).sum())
+
+
+# ============================================================
+# 영구 스탯 효과 → 전투력
+# ============================================================
+
+def const(name: str, constants: Optional[Dict[str, float]] = None) -> float:
+    """StatFormulas 상수 (constants: 다른 리비전의 값으로 덮어쓰기 - config_diff)"""
+    if constants and name in constants:
+        return constants[name]
+    return getattr(SF, name)
+
+
+def perm_effects(levels: Dict[str, int], perm_stats: Dict[str, dict]) -> Dict[str, float]:
+    """영구 스탯 레벨 → 효과값 (effect_per_level × level)"""
+    effects = {}
+    for stat_id, level in levels.items():
+        if stat_id in perm_stats:
+            effects[stat_id] = SF.calc_stat_effect(perm_stats[stat_id].get('effect_per_level', 1), level)
+    return effects
+
+
+def expected_damage(base_power, base_attack=0.0, attack_percent=0.0, crit_chance=0.0,
+                    crit_damage=0.0, multi_hit=0.0, combo_stack=0, combo_damage=0.0,
+                    constants: Optional[Dict[str, float]] = None):
+    """
+    타격당 기대 데미지 (스칼라/배열 모두 지원)
+    GameFormulas.calc_damage의 'expected'와 동일한 정의:
+    (power + base_attack) × (1 + atk%) × 크리 기대값 × 멀티히트 기대값 × 콤보 배율
+    """
+    after_percent = (np.asarray(base_power, dtype=np.float64) + base_attack) * (1 + np.asarray(attack_percent) / 100)
+    total_crit_chance = np.minimum(const('BASE_CRIT_CHANCE', constants) + np.asarray(crit_chance) / 100, 1.0)
+    total_crit_multi = const('BASE_CRIT_MULTIPLIER', constants) + np.asarray(crit_damage)
+    crit_expected = 1 + total_crit_chance * (total_crit_multi - 1)
+    multi_expected = 1 + np.asarray(multi_hit) / 100
+    combo_multi = (1 + np.asarray(combo_damage) / 100) * np.power(2.0, combo_stack)
+    return after_percent * crit_expected * multi_expected * combo_multi
+
+
+def damage_from_effects(effects: Dict[str, float], base_power: float, combo_stack=0,
+                        constants: Optional[Dict[str, float]] = None):
+    """영구 스탯 효과 dict → 타격당 기대 데미지"""
+    return expected_damage(
+        base_power,
+        effects.get('base_attack', 0),
+        effects.get('attack_percent', 0),
+        effects.get('crit_chance', 0),
+        effects.get('crit_damage', 0),
+        effects.get('multi_hit', 0),
+        combo_stack,
+        effects.get('start_combo_damage', 0),
+        constants,
+    )
+
+
+def time_limit_from_effects(effects: Dict[str, float], constants: Optional[Dict[str, float]] = None) -> float:
+    """제한시간 = 기본 시간 + time_extend"""
+    return const('BASE_TIME_LIMIT', constants) + effects.get('time_extend', 0)
+
+
+# ============================================================
+# 스테이지 곡선 (벡터화)
+# ============================================================
+
+def stage_hp(stages, constants: Optional[Dict[str, float]] = None) -> np.ndarray:
+    """스테이지별 몬스터 HP (보스 스테이지는 보스 HP) - GameFormulas.monster_hp와 동일"""
+    s = np.asarray(stages, dtype=np.float64)
+    raw = const('BASE_HP', constants) * np.power(const('HP_GROWTH', constants), s)
+    boss = (s > 0) & (np.mod(s, const('BOSS_INTERVAL', constants)) == 0)
+    return np.where(boss, np.trunc(raw * const('BOSS_HP_MULTI', constants)), np.trunc(raw))
+
+
+def is_boss_stage(stages) -> np.ndarray:
+    s = np.asarray(stages)
+    return (s > 0) & (np.mod(s, SF.BOSS_INTERVAL) == 0)
+
+
+def stage_gold(stages, gold_flat=0.0, gold_multi=0.0, constants: Optional[Dict[str, float]] = None) -> np.ndarray:
+    """스테이지별 처치 골드 (GameFormulas.monster_gold와 동일, gold_multi는 %)"""
+    base = np.trunc(np.asarray(stages, dtype=np.float64) * const('BASE_GOLD_MULTI', constants))
+    return np.trunc((base + gold_flat) * (1 + np.asarray(gold_multi) / 100))
+
+
+def required_cps(stages, damage, time_limit) -> np.ndarray:
+    """스테이지별 필요 CPS (SF.calc_required_cps의 배열 버전)"""
+    return stage_hp(stages) / np.maximum(damage, 1e-9) / time_limit
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DeskWarrior 스탯 편집 기록 (실행 취소/다시 실행 + 체크포인트)
+- 상태: {(type, id): {param: value}} 의 읽기 전용 매핑
+  편집 한 번은 바뀐 행 하나만 새로 만들고 나머지 행 객체는 이전 상태와 공유 (구조적 공유)
+- 기록 항목: 이전 항목 대비 셀 변경(CellEdit) 목록 + 상태 참조
+- 체크포인트: 이름 → 항목 (복원도 하나의 기록 항목이라 다시 취소 가능)
+- 곡선 메모: (상태, 보기 키) → 계산된 곡선. 같은 상태를 공유하는 항목(취소/복원)은 재계산 없음
+  배열 크기 합이 MEMO_BYTES 를 넘으면 오래 안 쓴 것부터 버림
+
+Qt 에 의존하지 않음 (balance_dashboard_qt.StatEditorTab 이 사용)
+
+사용 예:
+    history = EditHistory(file_values)
+    history.set(('permanent', 'base_attack'), 'base_cost', 12)
+    history.checkpoint('공격 강화안')
+    history.undo(); history.redo()
+    history.restore('공격 강화안')
+    curves = history.curves(view_key, lambda: compute(history.state))
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from itertools import count
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+Key = Tuple[str, str]
+State = Mapping[Key, Mapping[str, Any]]
+
+MAX_ENTRIES = 5000              # 오래된 기록부터 버림 (체크포인트가 잡은 상태는 유지)
+MEMO_BYTES = 256 * 1024 * 1024  # 곡선 메모 배열 합계 상한
+
+
+@dataclass(frozen=True)
+class CellEdit:
+    key: Key
+    param: str
+    old: Any
+    new: Any
+
+
+class HistoryEntry:
+    __slots__ = ('state', 'edits', 'label', 'token')
+
+    def __init__(self, state: State, edits: Tuple[CellEdit, ...], label: str, token: int):
+        self.state = state
+        self.edits = edits
+        self.label = label
+        self.token = token          # 상태 식별자 (같은 상태 객체를 가리키는 항목끼리 같음)
+
+
+def freeze(values: Mapping[Key, Mapping[str, Any]]) -> State:
+    return MappingProxyType({key: MappingProxyType(dict(row)) for key, row in values.items()})
+
+
+def diff_states(old: State, new: State) -> Tuple[CellEdit, ...]:
+    """두 상태의 셀 차이 (공유된 행은 비교하지 않음)"""
+    edits = []
+    for key in dict.fromkeys(list(old) + list(new)):
+        a, b = old.get(key, {}), new.get(key, {})
+        if a is b:
+            continue
+        for param in dict.fromkeys(list(a) + list(b)):
+            if a.get(param) != b.get(param):
+                edits.append(CellEdit(key, param, a.get(param), b.get(param)))
+    return tuple(edits)
+
+
+def _nbytes(value) -> int:
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sum(_nbytes(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(_nbytes(v) for v in value)
+    return 64
+
+
+class EditHistory:
+    """선형 편집 기록 (취소 후 새 편집은 다시 실행 분기를 버림)"""
+
+    def __init__(self, base: Mapping[Key, Mapping[str, Any]], max_entries: int = MAX_ENTRIES,
+                 memo_bytes: int = MEMO_BYTES):
+        self._tokens = count()
+        self.max_entries = max_entries
+        self.origin = HistoryEntry(freeze(base), (), '원본', next(self._tokens))
+        self.entries: List[HistoryEntry] = [self.origin]
+        self.cursor = 0
+        self.checkpoints: Dict[str, HistoryEntry] = {}
+        self.memo_bytes = memo_bytes
+        self._memo: 'OrderedDict[Tuple[int, Any], Tuple[Any, int]]' = OrderedDict()
+        self._memo_total = 0
+
+    # --- 상태 ---
+
+    @property
+    def entry(self) -> HistoryEntry:
+        return self.entries[self.cursor]
+
+    @property
+    def state(self) -> State:
+        return self.entry.state
+
+    @property
+    def base(self) -> State:
+        """처음 값 (오래된 기록이 정리돼도 유지)"""
+        return self.origin.state
+
+    @property
+    def can_undo(self) -> bool:
+        return self.cursor > 0
+
+    @property
+    def can_redo(self) -> bool:
+        return self.cursor < len(self.entries) - 1
+
+    # --- 편집 ---
+
+    def set(self, key: Key, param: str, value: Any, label: Optional[str] = None) -> bool:
+        """셀 하나 변경 → 새 항목 (값이 같으면 기록하지 않고 False)"""
+        return self.apply([(key, param, value)], label)
+
+    def apply(self, changes: Iterable[Tuple[Key, str, Any]], label: Optional[str] = None) -> bool:
+        """여러 셀을 한 항목으로 변경"""
+        state = self.state
+        rows: Dict[Key, Dict[str, Any]] = {}
+        edits = []
+        for key, param, value in changes:
+            row = rows.get(key)
+            old = row[param] if row is not None and param in row else state.get(key, {}).get(param)
+            if old == value:
+                continue
+            if row is None:
+                row = rows[key] = dict(state.get(key, {}))
+            row[param] = value
+            edits.append(CellEdit(key, param, old, value))
+        if not edits:
+            return False
+
+        new_state = dict(state)                 # 바뀌지 않은 행 객체는 그대로 공유
+        for key, row in rows.items():
+            new_state[key] = MappingProxyType(row)
+        if label is None:
+            e = edits[0]
+            label = f"{e.key[1]}.{e.param}: {e.old} → {e.new}" + (f" 외 {len(edits) - 1}개" if len(edits) > 1 else "")
+        self._push(HistoryEntry(MappingProxyType(new_state), tuple(edits), label, next(self._tokens)))
+        return True
+
+    def reset(self, label: str = '모든 수정 취소') -> bool:
+        """원본 상태로 (원본 항목과 상태·곡선 메모 공유)"""
+        return self._goto(self.origin, label)
+
+    def _goto(self, target: HistoryEntry, label: str) -> bool:
+        edits = diff_states(self.state, target.state)
+        if not edits:
+            return False
+        self._push(HistoryEntry(target.state, edits, label, target.token))
+        return True
+
+    def _push(self, entry: HistoryEntry):
+        del self.entries[self.cursor + 1:]
+        self.entries.append(entry)
+        if len(self.entries) > self.max_entries:
+            # 가장 오래된 편집 항목을 버리고 그 상태를 새 기준(0번)으로
+            dropped = self.entries.pop(1)
+            self.entries[0] = HistoryEntry(dropped.state, (), '원본 (이전 기록 정리됨)', dropped.token)
+        self.cursor = len(self.entries) - 1
+
+    # --- 이동 ---
+
+    def undo(self) -> Optional[HistoryEntry]:
+        """되돌린 항목 반환 (변경 셀 확인용)"""
+        if not self.can_undo:
+            return None
+        undone = self.entry
+        self.cursor -= 1
+        return undone
+
+    def redo(self) -> Optional[HistoryEntry]:
+        if not self.can_redo:
+            return None
+        self.cursor += 1
+        return self.entry
+
+    def jump(self, index: int) -> HistoryEntry:
+        """기록 목록의 임의 위치로 (중간 항목 재계산 없음)"""
+        self.cursor = max(0, min(index, len(self.entries) - 1))
+        return self.entry
+
+    # --- 체크포인트 ---
+
+    def checkpoint(self, name: str):
+        self.checkpoints[name] = self.entry
+
+    def restore(self, name: str) -> bool:
+        return self._goto(self.checkpoints[name], f"체크포인트 복원: {name}")
+
+    # --- 곡선 메모 ---
+
+    def curves(self, view: Any, compute: Callable[[], Any]):
+        """현재 상태 + 보기 키의 계산 결과 (없으면 compute() 후 보관)"""
+        key = (self.entry.token, view)
+        hit = self._memo.get(key)
+        if hit is not None:
+            self._memo.move_to_end(key)
+            return hit[0]
+        value = compute()
+        size = _nbytes(value)
+        self._memo[key] = (value, size)
+        self._memo_total += size
+        while self._memo_total > self.memo_bytes and len(self._memo) > 1:
+            _, (_, dropped) = self._memo.popitem(last=False)
+            self._memo_total -= dropped
+        return value
+
+    @property
+    def memo_count(self) -> int:
+        return len(self._memo)
+
+    def changed_cells(self) -> List[Tuple[Key, str]]:
+        """원본 대비 바뀐 셀"""
+        return [(e.key, e.param) for e in diff_states(self.base, self.state)]
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DeskWarrior 인게임 골드 최적 소비 정책 (동적 계획법)
+- 주어진 영구 빌드/CPS에서 keyboard_power / mouse_power 구매로 도달 가능한 최대 스테이지
+- 상태 = (스테이지, 키보드 레벨, 마우스 레벨)
+  인게임 골드 수입은 파워 레벨과 무관하므로 보유 골드 = 누적 수입 - 누적 구매 비용으로
+  레벨에서 바로 결정됨 (골드 축은 별도 버킷 없이 정확히 압축)
+- 스테이지마다 도달 가능 레벨 격자를 NumPy 불리언 테이블로 전파
+- 결과 계획은 run_simulator의 소비 정책으로 그대로 사용 가능 (휴리스틱 정책의 상한)
+
+사용법:
+    python tools/gold_policy.py --cps 6 --attack 30
+"""
+
+import argparse
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from economy_model import expected_damage, stage_hp
+from run_simulator import MAX_STAGE, POLICIES, RunBatch, RunSimulator, SpendingPolicy, build_effects
+import stat_formulas_generated as SF
+
+POWER_STATS = ('keyboard_power', 'mouse_power')
+
+
+# ============================================================
+# 계획
+# ============================================================
+
+@dataclass
+class GoldPlan:
+    """DP 결과: 스테이지별 목표 파워 레벨"""
+    stat_ids: Tuple[str, str]
+    start_stage: int
+    max_stage: int              # 실패하는 스테이지 (도달 가능한 최대)
+    targets: np.ndarray         # (max_stage - start_stage, 2) 스테이지별 전투 직전 목표 레벨
+    gold: np.ndarray            # (같은 길이,) 스테이지 전투 직전 누적 골드
+
+    def target(self, stage) -> np.ndarray:
+        """스테이지(배열 가능) → (…, 2) 목표 레벨"""
+        if not len(self.targets):
+            return np.zeros(np.shape(stage) + (2,), dtype=np.int64)
+        i = np.clip(np.asarray(stage) - self.start_stage, 0, len(self.targets) - 1)
+        return self.targets[i]
+
+    def policy(self) -> SpendingPolicy:
+        """run_simulator 소비 정책: 현재 스테이지 목표 레벨까지 부족한 스탯 구매"""
+        def plan_policy(batch: RunBatch, next_cost: np.ndarray) -> np.ndarray:
+            choice = np.full(len(batch), -1)
+            deficit_best = np.zeros(len(batch))
+            target = self.target(batch.stage)
+            for j, stat_id in enumerate(self.stat_ids):
+                idx = batch.stat_index(stat_id)
+                if idx < 0:
+                    continue
+                deficit = target[:, j] - batch.levels[:, idx]
+                ok = (deficit > deficit_best) & (next_cost[:, idx] <= batch.gold)
+                choice = np.where(ok, idx, choice)
+                deficit_best = np.where(ok, deficit, deficit_best)
+            return choice
+        plan_policy.__name__ = 'dp_optimal'
+        return plan_policy
+
+
+# ============================================================
+# 솔버
+# ============================================================
+
+class OptimalGoldSolver:
+    """키보드/마우스 파워 구매 DP (빌드별 결과 메모이제이션)"""
+
+    def __init__(self, run_sim: Optional[RunSimulator] = None):
+        self.run_sim = run_sim or RunSimulator()
+        table = self.run_sim.table
+        missing = [sid for sid in POWER_STATS if sid not in table.ids]
+        if missing:
+            raise ValueError(f"InGameStatGrowth.json에 {missing} 스탯이 없습니다")
+        self.index = [table.index(sid) for sid in POWER_STATS]
+        self.effect = table.params[self.index, 4]
+        self._memo: Dict[tuple, GoldPlan] = {}
+
+    def _cumulative_costs(self, start: np.ndarray, discount: float, budget: float) -> List[np.ndarray]:
+        """스탯별 start 레벨부터 레벨 l까지의 누적 비용 (budget 이내만)"""
+        out = []
+        for j, stat_id in enumerate(POWER_STATS):
+            step = self.run_sim.level_costs(stat_id, discount)[int(start[j]) + 1:]
+            cum = np.concatenate([[0.0], np.cumsum(step)])
+            out.append(cum[:int(np.searchsorted(cum, budget, side='right'))])
+        return out
+
+    def solve(self, perm_levels: Optional[Dict[str, int]] = None, cps: float = 5.0,
+              keyboard_ratio: float = 0.5, combo_stack: float = 0.0,
+              max_stage: int = MAX_STAGE) -> GoldPlan:
+        key = (tuple(sorted((perm_levels or {}).items())), float(cps), float(keyboard_ratio),
+               float(combo_stack), int(max_stage))
+        if key not in self._memo:
+            self._memo[key] = self._solve(perm_levels or {}, cps, keyboard_ratio, combo_stack, max_stage)
+        return self._memo[key]
+
+    def _solve(self, perm_levels, cps, ratio, combo_stack, max_stage) -> GoldPlan:
+        eff = {k: float(v) for k, v in build_effects(perm_levels, self.run_sim.perm_config).items()}
+        start_stage = 1 + int(eff.get('start_level', 0))
+        start = np.array([int(eff.get('start_keyboard', 0)), int(eff.get('start_mouse', 0))])
+        time_limit = SF.BASE_TIME_LIMIT + eff.get('time_extend', 0)
+
+        # 스테이지별 전투 직전 누적 골드 (정책과 무관)
+        stages = np.arange(start_stage, max_stage + 1)
+        base_gold = np.trunc(stages * SF.BASE_GOLD_MULTI)
+        kill_gold = np.trunc((base_gold + eff.get('gold_flat_perm', 0)) * (1 + eff.get('gold_multi_perm', 0) / 100))
+        gold_before = np.trunc(eff.get('start_gold', 0)) + np.concatenate([[0.0], np.cumsum(kill_gold)[:-1]])
+
+        # 레벨 격자: 누적 비용 (K, M) 과 기대 데미지
+        cum_kb, cum_ms = self._cumulative_costs(start, eff.get('upgrade_discount', 0), gold_before[-1])
+        spent = cum_kb[:, None] + cum_ms[None, :]
+        lv_kb = start[0] + np.arange(len(cum_kb))
+        lv_ms = start[1] + np.arange(len(cum_ms))
+        power = ratio * (1 + self.effect[0] * lv_kb[:, None]) + (1 - ratio) * (1 + self.effect[1] * lv_ms[None, :])
+        damage = expected_damage(
+            power, eff.get('base_attack', 0), eff.get('attack_percent', 0), eff.get('crit_chance', 0),
+            eff.get('crit_damage', 0), eff.get('multi_hit', 0), combo_stack, eff.get('start_combo_damage', 0),
+        )
+        hp = stage_hp(stages)
+
+        # 전진 전파: reach[s] = 골드 충분 & 처치 가능 & 이전 스테이지 도달 레벨 이상
+        reach_history = []
+        prev = np.zeros_like(spent, dtype=bool)
+        prev[0, 0] = True
+        for t, stage in enumerate(stages):
+            if stage >= max_stage:
+                break
+            dominated = np.logical_or.accumulate(np.logical_or.accumulate(prev, axis=0), axis=1)
+            cur = dominated & (spent <= gold_before[t]) & (np.ceil(hp[t] / np.maximum(damage, 1.0)) / cps <= time_limit)
+            if not cur.any():
+                break
+            reach_history.append(cur)
+            prev = cur
+
+        # 역추적: 마지막 스테이지부터 지출이 가장 적은 도달 레벨 선택
+        targets = np.zeros((len(reach_history), 2), dtype=np.int64)
+        bound = (len(cum_kb) - 1, len(cum_ms) - 1)
+        for t in range(len(reach_history) - 1, -1, -1):
+            cur = reach_history[t][:bound[0] + 1, :bound[1] + 1]
+            cost = np.where(cur, spent[:bound[0] + 1, :bound[1] + 1], np.inf)
+            k, m = np.unravel_index(int(np.argmin(cost)), cost.shape)
+            targets[t] = (lv_kb[k], lv_ms[m])
+            bound = (k, m)
+
+        return GoldPlan(
+            stat_ids=POWER_STATS,
+            start_stage=start_stage,
+            max_stage=start_stage + len(reach_history),
+            targets=targets,
+            gold=gold_before[:len(reach_history)],
+        )
+
+
+# ============================================================
+# 메인
+# ============================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="DeskWarrior 인게임 골드 최적 소비 정책 (DP)")
+    parser.add_argument('--cps', type=float, default=5.0)
+    parser.add_argument('--ratio', type=float, default=0.5, help="키보드 입력 비율")
+    parser.add_argument('--combo', type=float, default=0.0)
+    parser.add_argument('--attack', type=int, default=0, help="영구 base_attack 레벨")
+    parser.add_argument('--start-gold', type=int, default=0, help="영구 start_gold 레벨")
+    args = parser.parse_args()
+
+    perm = {'base_attack': args.attack, 'start_gold': args.start_gold}
+    solver = OptimalGoldSolver()
+    plan = solver.solve(perm, cps=args.cps, keyboard_ratio=args.ratio, combo_stack=args.combo)
+
+    print(f"\n{'='*60}")
+    print(f" DP 최적 정책: 최대 스테이지 {plan.max_stage} (CPS {args.cps}, 키보드 비율 {args.ratio})")
+    print(f"{'='*60}")
+    print(f" {'스테이지':>8} | {'누적 골드':>10} | {'키보드':>6} | {'마우스':>6}")
+    print(f"{'-'*60}")
+    for t in range(0, len(plan.targets), max(1, len(plan.targets) // 20)):
+        kb, ms = plan.targets[t]
+        print(f" {plan.start_stage + t:>8} | {plan.gold[t]:>10,.0f} | {kb:>6} | {ms:>6}")
+
+    print(f"\n 정책 비교 (run_simulator)")
+    policies = dict(POLICIES, dp_optimal=plan.policy())
+    for name, policy in policies.items():
+        result = solver.run_sim.simulate(1, cps=args.cps, perm_levels=perm, policy=policy,
+                                         keyboard_ratio=args.ratio, combo_stack=args.combo)
+        print(f"  {name:<12} 스테이지 {int(result.max_stage[0])}")
+
+
+if __name__ == '__main__':
+    main()
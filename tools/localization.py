@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DeskWarrior 로컬라이제이션 컴파일러 / 조회
+- 원본: config/localization/<locale>.json (평면 키)
+        + Achievements.json / PermanentUpgrades.json 항목별 localization → <locale>
+          (키: achievement.<id>.<필드>, upgrade.<id>.<필드>)
+- 컴파일: 모든 키를 정렬된 키 목록으로 interning (키 → 정수 id, 로케일 공통)
+          로케일별 문자열 표 (id 순서), 자리표시자({0}, {value})는 미리 분해한 템플릿으로 저장
+- 조회: 활성 로케일 표만 읽음, 없는 키는 en-US(필요할 때 로드) → 키 자체 (LocalizationManager 와 동일)
+- 원본 파일 크기/수정 시각이 바뀌면 자동 재컴파일 (.cache/localization)
+
+사용 예:
+    loc = Localizer('ko-KR')
+    loc.get('ui.common.gold')
+    hp = loc.key_id('ui.common.levelFormat')      # 표 셀 반복 렌더링은 id 로
+    loc.format(hp, 12)                             # 'Lv.12'
+    loc.format('upgrade.base_attack.description', value=3)
+
+    python tools/localization.py --check           # 컴파일 + 로케일별 누락 키 보고
+"""
+
+import argparse
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from economy_model import CONFIG_DIR
+from result_cache import DEFAULT_CACHE_DIR
+
+LOCALIZATION_DIR = 'localization'
+FALLBACK_LOCALE = 'en-US'
+COMPILED_VERSION = 1
+
+# (파일, 목록 키, 키 접두사) - 항목별 localization 블록을 가진 config
+EMBEDDED_SOURCES = (
+    ('Achievements.json', 'achievements', 'achievement'),
+    ('PermanentUpgrades.json', 'upgrades', 'upgrade'),
+)
+
+_PLACEHOLDER = re.compile(r'\{(\w+)\}')
+
+Key = Union[str, int]
+
+
+# ============================================================
+# 템플릿
+# ============================================================
+
+class Template:
+    """자리표시자를 미리 분해한 형식 문자열 (literals 는 fields 보다 1개 많음)"""
+    __slots__ = ('text', 'literals', 'fields')
+
+    def __init__(self, text: str, literals: Sequence[str], fields: Sequence[Union[str, int]]):
+        self.text = text
+        self.literals = tuple(literals)
+        self.fields = tuple(fields)
+
+    @classmethod
+    def parse(cls, text: str) -> Union['Template', str]:
+        """자리표시자가 없으면 문자열 그대로 반환"""
+        parts = _PLACEHOLDER.split(text)
+        if len(parts) == 1:
+            return text
+        fields = [int(f) if f.isdigit() else f for f in parts[1::2]]
+        return cls(text, parts[0::2], fields)
+
+    def to_json(self) -> list:
+        out: list = [self.literals[0]]
+        for field, literal in zip(self.fields, self.literals[1:]):
+            out += [field, literal]
+        return out
+
+    @classmethod
+    def from_json(cls, parts: list) -> 'Template':
+        literals, fields = parts[0::2], parts[1::2]
+        text = literals[0] + ''.join(f"{{{f}}}{lit}" for f, lit in zip(fields, literals[1:]))
+        return cls(text, literals, fields)
+
+    def format(self, *args, **kwargs) -> str:
+        """{0} 은 위치 인자, {name} 은 키워드 인자 (없는 값은 자리표시자 그대로)"""
+        out = [self.literals[0]]
+        for field, literal in zip(self.fields, self.literals[1:]):
+            if isinstance(field, int):
+                value = args[field] if field < len(args) else kwargs.get(str(field), f"{{{field}}}")
+            else:
+                value = kwargs.get(field, f"{{{field}}}")
+            out.append(str(value))
+            out.append(literal)
+        return ''.join(out)
+
+    def __str__(self) -> str:
+        return self.text
+
+
+Entry = Union[str, Template, List[str], None]
+
+
+# ============================================================
+# 컴파일
+# ============================================================
+
+def source_files(config_dir: Path) -> List[Path]:
+    loc_dir = config_dir / LOCALIZATION_DIR
+    files = sorted(p for p in loc_dir.glob('*.json') if p.name != 'languages.json')
+    return files + [config_dir / name for name, _, _ in EMBEDDED_SOURCES if (config_dir / name).exists()]
+
+
+def source_signature(config_dir: Path) -> List[list]:
+    """원본 파일 (이름, 크기, 수정 시각) - 내용을 읽지 않고 최신 여부 판단"""
+    out = []
+    for path in source_files(config_dir):
+        st = path.stat()
+        out.append([path.name, st.st_size, st.st_mtime_ns])
+    return out
+
+
+def collect_strings(config_dir: Path) -> Dict[str, Dict[str, Union[str, List[str]]]]:
+    """{로케일: {키: 문자열 | 문자열 목록}}"""
+    locales: Dict[str, Dict[str, Union[str, List[str]]]] = {}
+    for path in sorted((config_dir / LOCALIZATION_DIR).glob('*.json')):
+        if path.name == 'languages.json':
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            locales[path.stem] = _flatten(json.load(f))
+
+    for filename, list_key, prefix in EMBEDDED_SOURCES:
+        path = config_dir / filename
+        if not path.exists():
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            entries = json.load(f).get(list_key, [])
+        for entry in entries:
+            for locale, fields in entry.get('localization', {}).items():
+                table = locales.setdefault(locale, {})
+                for field, text in fields.items():
+                    table[f"{prefix}.{entry['id']}.{field}"] = text
+    return locales
+
+
+def _flatten(data: dict, prefix: str = '') -> Dict[str, Union[str, List[str]]]:
+    """중첩 객체 → 점 키 (LocalizationManager.FlattenJson 과 동일, 문자열/문자열 목록만)"""
+    out: Dict[str, Union[str, List[str]]] = {}
+    for key, value in data.items():
+        full = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            out.update(_flatten(value, full))
+        elif isinstance(value, list):
+            out[full] = [v for v in value if isinstance(v, str)]
+        elif isinstance(value, str):
+            out[full] = value
+    return out
+
+
+def _encode(value: Union[str, List[str], None]):
+    if value is None or isinstance(value, list):
+        return value
+    parsed = Template.parse(value)
+    return {'t': parsed.to_json()} if isinstance(parsed, Template) else parsed
+
+
+def _decode(value) -> Entry:
+    if isinstance(value, dict):
+        return Template.from_json(value['t'])
+    return value
+
+
+def compile_locales(config_dir: Optional[Path] = None, out_dir: Optional[Path] = None) -> Path:
+    """원본 → index.json (키 목록) + <locale>.json (id 순서 문자열 표)"""
+    config_dir = Path(config_dir or CONFIG_DIR)
+    out_dir = Path(out_dir or DEFAULT_CACHE_DIR / 'localization')
+    out_dir.mkdir(parents=True, exist_ok=True)
+    signature = source_signature(config_dir)
+    strings = collect_strings(config_dir)
+    keys = sorted({k for table in strings.values() for k in table})
+
+    for locale, table in strings.items():
+        _write_json(out_dir / f"{locale}.json", {'strings': [_encode(table.get(k)) for k in keys]})
+    # 인덱스는 마지막에 기록 (로케일 표가 모두 준비된 뒤에만 최신으로 보임)
+    _write_json(out_dir / 'index.json', {
+        'version': COMPILED_VERSION, 'config_dir': str(config_dir.resolve()),
+        'sources': signature, 'locales': sorted(strings), 'keys': keys,
+    })
+    return out_dir
+
+
+def _write_json(path: Path, data: dict):
+    tmp = path.with_name(path.name + '.tmp')
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp, path)
+
+
+# ============================================================
+# 조회
+# ============================================================
+
+class Localizer:
+    """활성 로케일 문자열 표 (키 → id 는 dict 1회 조회, id → 항목은 리스트 인덱스)"""
+
+    def __init__(self, locale: str = 'ko-KR', config_dir: Optional[Path] = None,
+                 cache_dir: Optional[Path] = None, fallback: str = FALLBACK_LOCALE):
+        self.config_dir = Path(config_dir or CONFIG_DIR)
+        self.cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR / 'localization')
+        self.fallback = fallback
+        self.keys, self.locales = self._load_index()
+        self.ids: Dict[str, int] = {k: i for i, k in enumerate(self.keys)}
+        self._tables: Dict[str, List[Entry]] = {}
+        self.locale = locale
+        self._table(locale)
+
+    def _load_index(self) -> Tuple[List[str], List[str]]:
+        index_path = self.cache_dir / 'index.json'
+        signature = source_signature(self.config_dir)
+        index = None
+        if index_path.exists():
+            with open(index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        if (index is None or index.get('version') != COMPILED_VERSION or index.get('sources') != signature
+                or index.get('config_dir') != str(self.config_dir.resolve())):
+            compile_locales(self.config_dir, self.cache_dir)
+            with open(index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        return index['keys'], index['locales']
+
+    def _table(self, locale: str) -> List[Entry]:
+        """로케일 표 (처음 요청될 때 로드, 없는 로케일은 빈 표)"""
+        table = self._tables.get(locale)
+        if table is None:
+            path = self.cache_dir / f"{locale}.json"
+            if locale in self.locales and path.exists():
+                with open(path, 'r', encoding='utf-8') as f:
+                    table = [_decode(v) for v in json.load(f)['strings']]
+            else:
+                table = [None] * len(self.keys)
+            self._tables[locale] = table
+        return table
+
+    @property
+    def loaded_locales(self) -> List[str]:
+        return sorted(self._tables)
+
+    def set_locale(self, locale: str):
+        self.locale = locale
+        self._table(locale)
+
+    # --- 키 ---
+
+    def key_id(self, key: str) -> int:
+        """키 → 정수 id (없는 키는 -1)"""
+        return self.ids.get(key, -1)
+
+    def _entry(self, key: Key) -> Entry:
+        i = key if isinstance(key, int) else self.ids.get(key, -1)
+        if i < 0:
+            return None
+        entry = self._table(self.locale)[i]
+        if entry is None and self.fallback != self.locale:
+            entry = self._table(self.fallback)[i]
+        return entry
+
+    def _name(self, key: Key) -> str:
+        return self.keys[key] if isinstance(key, int) and 0 <= key < len(self.keys) else str(key)
+
+    # --- 조회 ---
+
+    def get(self, key: Key) -> str:
+        """문자열 (템플릿은 원문, 없으면 키)"""
+        entry = self._entry(key)
+        if entry is None or isinstance(entry, list):
+            return self._name(key)
+        return str(entry)
+
+    def get_list(self, key: Key) -> List[str]:
+        entry = self._entry(key)
+        return list(entry) if isinstance(entry, list) else [self._name(key)]
+
+    def template(self, key: Key) -> Union[Template, str]:
+        entry = self._entry(key)
+        if entry is None or isinstance(entry, list):
+            return self._name(key)
+        return entry
+
+    def format(self, key: Key, *args, **kwargs) -> str:
+        entry = self.template(key)
+        return entry.format(*args, **kwargs) if isinstance(entry, Template) else entry
+
+    def missing(self, locale: str) -> List[str]:
+        """해당 로케일에 없는 키 (폴백으로 표시되는 키)"""
+        table = self._table(locale)
+        return [k for k, v in zip(self.keys, table) if v is None]
+
+
+# ============================================================
+# 메인
+# ============================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="DeskWarrior 로컬라이제이션 컴파일러")
+    parser.add_argument('--check', action='store_true', help="로케일별 누락 키 출력")
+    parser.add_argument('--locale', default='ko-KR')
+    parser.add_argument('--key', nargs='*', default=[], help="조회할 키")
+    args = parser.parse_args()
+
+    out_dir = compile_locales()
+    loc = Localizer(args.locale)
+    templates = sum(isinstance(e, Template) for e in loc._table(args.locale))
+    print(f"컴파일: {out_dir}  (키 {len(loc.keys)}개, 로케일 {', '.join(loc.locales)}, "
+          f"{args.locale} 템플릿 {templates}개)")
+    for key in args.key:
+        print(f"  {key} = {loc.get(key)}")
+    if args.check:
+        for locale in loc.locales:
+            missing = loc.missing(locale)
+            print(f"  {locale}: 누락 {len(missing)}개" + (f" ({', '.join(missing[:10])}"
+                                                          f"{' ...' if len(missing) > 10 else ''})" if missing else ""))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,5 @@
 
+import argparse
 import json
 import os
 
@@ -37,67 +38,106 @@ EMOJI_MAP = {
     "rat": "🐀"
 }
 
+def default_entry(i, m):
+    # m has Id, Name, Sprite
+
+    # Determine stats based on index (difficulty curve) or defaults
+    # Simple curve: stronger monsters come later in the species list?
+    # Actually structure is Species A-F, next Species.
+    # So we want base stats to increase per Species, and maybe slightly per Variation (Elite?)
+
+    # Parse species from ID: monster_slime_fire -> slime
+    try:
+        parts = m['Id'].split('_')
+        # parts[0] = monster
+        species = parts[1] # slime
+        attr = parts[2] # fire
+    except:
+        species = "unknown"
+        attr = "normal"
+
+    # Determine stats based on index
+
+    monster_entry = {
+        "Id": m['Id'],
+        "Name": m['Name'],
+        "Sprite": m['Sprite'],
+        "BaseHp": DEFAULT_STATS['BaseHp'] + (i * 2),
+        "HpGrowth": DEFAULT_STATS['HpGrowth'],
+        "BaseGold": DEFAULT_STATS['BaseGold'] + int(i * 0.5),
+        "GoldGrowth": DEFAULT_STATS['GoldGrowth'],
+        "Emoji": EMOJI_MAP.get(species, "👾")
+    }
+
+    # Attribute bonuses
+    if attr == 'holy': # Gold bonus
+         monster_entry['BaseGold'] += 20
+    if attr == 'fire': # HP/Attack bonus suggestion
+         monster_entry['BaseHp'] += 10
+    if attr == 'dark':
+         monster_entry['BaseHp'] += 15
+
+    return monster_entry
+
+def merge_monsters(existing, new_monsters, reset_stats=False):
+    """Returns (merged list, changes). Existing records keep their (possibly tuned) stats;
+    only Name/Sprite are refreshed and new Ids get default stats."""
+    by_id = {m['Id']: m for m in existing}
+    changes = {'added': [], 'updated': [], 'removed': []}
+    merged = []
+
+    for i, m in enumerate(new_monsters):
+        old = by_id.get(m['Id'])
+        if old is None or reset_stats:
+            entry = default_entry(i, m)
+            if old is None:
+                changes['added'].append(m['Id'])
+            elif entry != old:
+                changes['updated'].append(m['Id'])
+        else:
+            entry = old
+            if old['Name'] != m['Name'] or old['Sprite'] != m['Sprite']:
+                entry = dict(old, Name=m['Name'], Sprite=m['Sprite'])
+                changes['updated'].append(m['Id'])
+        merged.append(entry)
+
+    new_ids = {m['Id'] for m in new_monsters}
+    changes['removed'] = [m['Id'] for m in existing if m['Id'] not in new_ids]
+    return merged, changes
+
 def main():
+    parser = argparse.ArgumentParser(description='Merge new_character_data.json into CharacterData.json')
+    parser.add_argument('--reset-stats', action='store_true',
+                        help='recompute stats of existing monsters from their index (old behaviour)')
+    args = parser.parse_args()
+
     with open(MAIN_CONFIG, 'r', encoding='utf-8') as f:
         main_data = json.load(f)
-        
+
     with open(NEW_DATA, 'r', encoding='utf-8') as f:
         new_monsters = json.load(f)
 
-    # We will replace the 'Monsters' list entirely with the new expanded list
-    # preserving any existing stats if ID matches (though IDs changed format, so mostly new)
-    
-    final_monster_list = []
-    
-    for i, m in enumerate(new_monsters):
-        # m has Id, Name, Sprite
-        
-        # Determine stats based on index (difficulty curve) or defaults
-        # Simple curve: stronger monsters come later in the species list? 
-        # Actually structure is Species A-F, next Species.
-        # So we want base stats to increase per Species, and maybe slightly per Variation (Elite?)
-        
-        # Parse species from ID: monster_slime_fire -> slime
-        try:
-            parts = m['Id'].split('_')
-            # parts[0] = monster
-            species = parts[1] # slime
-            attr = parts[2] # fire
-        except:
-            species = "unknown"
-            attr = "normal"
-
-        # Determine stats based on index
-        
-        monster_entry = {
-            "Id": m['Id'],
-            "Name": m['Name'],
-            "Sprite": m['Sprite'], 
-            "BaseHp": DEFAULT_STATS['BaseHp'] + (i * 2),
-            "HpGrowth": DEFAULT_STATS['HpGrowth'],
-            "BaseGold": DEFAULT_STATS['BaseGold'] + int(i * 0.5),
-            "GoldGrowth": DEFAULT_STATS['GoldGrowth'],
-            "Emoji": EMOJI_MAP.get(species, "👾")
-        }
-        
-        # Attribute bonuses
-        if attr == 'holy': # Gold bonus
-             monster_entry['BaseGold'] += 20
-        if attr == 'fire': # HP/Attack bonus suggestion
-             monster_entry['BaseHp'] += 10
-        if attr == 'dark': 
-             monster_entry['BaseHp'] += 15
-
-
-             
-        final_monster_list.append(monster_entry)
+    existing = main_data.get('Monsters', [])
+    final_monster_list, changes = merge_monsters(existing, new_monsters, args.reset_stats)
+    reordered = [m['Id'] for m in existing] != [m['Id'] for m in final_monster_list]
+
+    for kind in ('added', 'updated', 'removed'):
+        for monster_id in changes[kind]:
+            print(f"  {kind:<8} {monster_id}")
+
+    if not any(changes.values()) and not reordered:
+        print(f"No changes; {MAIN_CONFIG} left untouched.")
+        return
 
     main_data['Monsters'] = final_monster_list
-    
-    with open(MAIN_CONFIG, 'w', encoding='utf-8') as f:
+
+    tmp = MAIN_CONFIG + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
         json.dump(main_data, f, indent=4, ensure_ascii=False)
-        
-    print(f"Merged {len(final_monster_list)} monsters into {MAIN_CONFIG}")
+    os.replace(tmp, MAIN_CONFIG)
+
+    print(f"Merged {len(final_monster_list)} monsters into {MAIN_CONFIG} "
+          f"(+{len(changes['added'])} ~{len(changes['updated'])} -{len(changes['removed'])})")
 
 if __name__ == "__main__":
     main()
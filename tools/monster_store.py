@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DeskWarrior 몬스터 DB 저장소 (SQLite + JSON 내보내기)
+- species / variations 두 테이블, id·종족·속성·파일명 인덱스
+- 추가/수정은 트랜잭션 단위 upsert (중간에 실패하면 전부 롤백)
+- monster_db.json 은 git 에 남는 내보내기 결과 (generate_monsters.py 가 읽음)
+- JSON 이 손으로 수정되면 (내용 해시가 다르면) 다음 열 때 다시 가져옴
+- 변경이 없으면 JSON 을 다시 쓰지 않음
+
+사용 예:
+    store = MonsterStore()
+    with store.transaction():
+        store.upsert_species(entry)
+    store.export_json()
+
+    python tools/monster_store.py                      # 요약
+    python tools/monster_store.py --attribute Fire     # 속성별 조회
+    python tools/monster_store.py --species monster_bat
+    python tools/monster_store.py --export             # monster_db.json 강제 내보내기
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+from result_cache import DEFAULT_CACHE_DIR
+
+TOOLS_DIR = Path(__file__).resolve().parent
+DB_FILE = TOOLS_DIR / "monster_db.json"
+STORE_FILE = DEFAULT_CACHE_DIR / "monster_db.sqlite"
+
+# 속성 → (접미사, 기본 색상)
+ATTRIBUTES = {
+    "Normal": ("A", None),
+    "Fire": ("B", 358),
+    "Ice": ("C", 210),
+    "Wind": ("D", 60),
+    "Holy": ("E", 50),
+    "Dark": ("F", 270),
+}
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS species (
+    id          TEXT PRIMARY KEY,
+    base_file   TEXT NOT NULL,
+    position    INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS variations (
+    species_id  TEXT NOT NULL REFERENCES species(id) ON DELETE CASCADE,
+    suffix      TEXT NOT NULL,
+    monster_id  TEXT NOT NULL,
+    attribute   TEXT NOT NULL,
+    name        TEXT NOT NULL,
+    hue         INTEGER,
+    filename    TEXT,
+    PRIMARY KEY (species_id, suffix)
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_variations_monster ON variations(monster_id);
+CREATE INDEX IF NOT EXISTS idx_variations_attribute ON variations(attribute);
+CREATE INDEX IF NOT EXISTS idx_variations_filename ON variations(filename);
+CREATE TABLE IF NOT EXISTS meta (
+    key         TEXT PRIMARY KEY,
+    value       TEXT NOT NULL
+);
+"""
+
+_VARIATION_FIELDS = ('suffix', 'attribute', 'name', 'hue', 'filename')
+
+
+def monster_id(species_id: str, attribute: str) -> str:
+    """CharacterData 의 몬스터 Id (monster_slime + Fire → monster_slime_fire)"""
+    return f"{species_id}_{attribute.lower()}"
+
+
+def make_species(species_id: str, names: Dict[str, str], base_file: Optional[str] = None) -> dict:
+    """속성별 이름으로 기본 규칙(접미사/색상/파일명)을 따르는 종족 항목 생성"""
+    variations = []
+    for attribute, (suffix, hue) in ATTRIBUTES.items():
+        variations.append({
+            "suffix": suffix,
+            "attribute": attribute,
+            "name": names[attribute],
+            "hue": hue,
+            "filename": f"{monster_id(species_id, attribute)}.png",
+        })
+    return {
+        "id": species_id,
+        "base_file": base_file or f"{species_id}A.png",
+        "variations": variations,
+    }
+
+
+def _file_hash(path: Path) -> str:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return 'missing'
+
+
+def _dump(entries: List[dict]) -> str:
+    # 기존 스크립트와 같은 형식 (indent=4, 끝 개행 없음)
+    return json.dumps(entries, indent=4, ensure_ascii=False)
+
+
+# ============================================================
+# 저장소
+# ============================================================
+
+class MonsterStore:
+    """monster_db.json 을 인덱스된 SQLite 로 관리"""
+
+    def __init__(self, path: Optional[Path] = None, json_path: Optional[Path] = None):
+        self.path = Path(path) if path else STORE_FILE
+        self.json_path = Path(json_path) if json_path else DB_FILE
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path), timeout=10.0, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(_SCHEMA)
+        self._depth = 0
+        self.sync_from_json()
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # --- 트랜잭션 / 메타 ---
+
+    @contextmanager
+    def transaction(self) -> Iterator['MonsterStore']:
+        """BEGIN IMMEDIATE ~ COMMIT (중첩 시 가장 바깥 블록에서만 커밋)"""
+        if self._depth:
+            self._depth += 1
+            try:
+                yield self
+            finally:
+                self._depth -= 1
+            return
+        self.conn.execute("BEGIN IMMEDIATE")
+        self._depth = 1
+        try:
+            yield self
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        else:
+            self.conn.execute("COMMIT")
+        finally:
+            self._depth = 0
+
+    def get_meta(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def set_meta(self, key: str, value: str):
+        self.conn.execute("INSERT INTO meta (key, value) VALUES (?, ?) "
+                          "ON CONFLICT(key) DO UPDATE SET value = excluded.value", (key, value))
+
+    @property
+    def revision(self) -> int:
+        """upsert 로 실제 내용이 바뀔 때마다 1 씩 증가"""
+        return int(self.get_meta('revision', '0'))
+
+    def _touch(self):
+        self.set_meta('revision', str(self.revision + 1))
+
+    # --- JSON 동기화 ---
+
+    def sync_from_json(self, force: bool = False) -> bool:
+        """JSON 내용이 마지막 가져오기/내보내기와 다르면 전체를 다시 가져옴"""
+        digest = _file_hash(self.json_path)
+        if digest == 'missing':
+            return False
+        if not force and self.get_meta('schema') == str(SCHEMA_VERSION) \
+                and self.get_meta('json_hash') == digest:
+            return False
+        with open(self.json_path, 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+        with self.transaction():
+            self.conn.execute("DELETE FROM variations")
+            self.conn.execute("DELETE FROM species")
+            for entry in entries:
+                self._insert(entry, self._next_position())
+            self.set_meta('schema', str(SCHEMA_VERSION))
+            self.set_meta('json_hash', digest)
+            self.set_meta('exported_revision', str(self.revision))
+        return True
+
+    def export_json(self, path: Optional[Path] = None, force: bool = False) -> bool:
+        """monster_db.json 으로 내보내기 (변경이 없으면 쓰지 않음, 임시 파일 → 교체)"""
+        target = Path(path) if path else self.json_path
+        if not force and target == self.json_path \
+                and self.get_meta('exported_revision') == str(self.revision) \
+                and _file_hash(target) == self.get_meta('json_hash'):
+            return False
+        text = _dump(self.entries())
+        tmp = target.with_name(target.name + '.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp, target)
+        if target == self.json_path:
+            with self.transaction():
+                self.set_meta('json_hash', hashlib.sha256(text.encode('utf-8')).hexdigest())
+                self.set_meta('exported_revision', str(self.revision))
+        return True
+
+    # --- 조회 ---
+
+    def __contains__(self, species_id: str) -> bool:
+        return self.conn.execute("SELECT 1 FROM species WHERE id = ?", (species_id,)).fetchone() is not None
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM species").fetchone()[0]
+
+    def species_ids(self) -> List[str]:
+        return [r[0] for r in self.conn.execute("SELECT id FROM species ORDER BY position")]
+
+    def get_species(self, species_id: str) -> Optional[dict]:
+        """JSON 항목 형태로 한 종족 반환 (없으면 None)"""
+        row = self.conn.execute("SELECT id, base_file FROM species WHERE id = ?",
+                                (species_id,)).fetchone()
+        if row is None:
+            return None
+        return {"id": row['id'], "base_file": row['base_file'],
+                "variations": self._variations(species_id)}
+
+    def entries(self) -> List[dict]:
+        """전체 목록 (monster_db.json 과 같은 순서/형태)"""
+        grouped: Dict[str, List[dict]] = {}
+        for row in self.conn.execute(
+                "SELECT v.* FROM variations v JOIN species s ON s.id = v.species_id "
+                "ORDER BY s.position, v.suffix"):
+            grouped.setdefault(row['species_id'], []).append(self._variation_dict(row))
+        return [{"id": r['id'], "base_file": r['base_file'], "variations": grouped.get(r['id'], [])}
+                for r in self.conn.execute("SELECT id, base_file FROM species ORDER BY position")]
+
+    def monster(self, mob_id: str) -> Optional[dict]:
+        """몬스터 Id (monster_slime_fire) 로 변형 하나 조회"""
+        row = self.conn.execute("SELECT * FROM variations WHERE monster_id = ?", (mob_id,)).fetchone()
+        return dict(row) if row else None
+
+    def find(self, attribute: Optional[str] = None, species_prefix: Optional[str] = None) -> List[dict]:
+        """속성 / 종족 접두사(monster_, boss_)로 변형 검색"""
+        sql = ("SELECT v.* FROM variations v JOIN species s ON s.id = v.species_id WHERE 1=1")
+        params: list = []
+        if attribute:
+            sql += " AND v.attribute = ?"
+            params.append(attribute)
+        if species_prefix:
+            sql += " AND v.species_id LIKE ? ESCAPE '\\'"
+            params.append(species_prefix.replace('_', '\\_') + '%')
+        sql += " ORDER BY s.position, v.suffix"
+        return [dict(r) for r in self.conn.execute(sql, params)]
+
+    def _variations(self, species_id: str) -> List[dict]:
+        rows = self.conn.execute("SELECT * FROM variations WHERE species_id = ? ORDER BY suffix",
+                                 (species_id,))
+        return [self._variation_dict(r) for r in rows]
+
+    @staticmethod
+    def _variation_dict(row) -> dict:
+        return {k: row[k] for k in _VARIATION_FIELDS}
+
+    # --- 쓰기 ---
+
+    def _next_position(self) -> int:
+        return self.conn.execute("SELECT COALESCE(MAX(position), -1) + 1 FROM species").fetchone()[0]
+
+    def _insert(self, entry: dict, position: int):
+        species_id = entry['id']
+        self.conn.execute("INSERT INTO species (id, base_file, position) VALUES (?, ?, ?)",
+                          (species_id, entry['base_file'], position))
+        self.conn.executemany(
+            "INSERT INTO variations (species_id, suffix, monster_id, attribute, name, hue, filename) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [(species_id, v['suffix'], monster_id(species_id, v['attribute']), v['attribute'],
+              v['name'], v.get('hue'), v.get('filename')) for v in entry['variations']])
+
+    def upsert_species(self, entry: dict, overwrite: bool = True) -> str:
+        """종족 하나 추가/교체 → 'added' / 'updated' / 'unchanged' / 'skipped'
+
+        기존 위치(순서)는 유지하고 해당 종족 레코드만 바꾼다.
+        overwrite=False 면 이미 있는 종족은 건드리지 않음 ('skipped').
+        """
+        with self.transaction():
+            current = self.get_species(entry['id'])
+            if current is None:
+                self._insert(entry, self._next_position())
+                self._touch()
+                return 'added'
+            if not overwrite:
+                return 'skipped'
+            normalized = {"id": entry['id'], "base_file": entry['base_file'],
+                          "variations": [{k: v.get(k) for k in _VARIATION_FIELDS}
+                                         for v in sorted(entry['variations'], key=lambda v: v['suffix'])]}
+            if normalized == current:
+                return 'unchanged'
+            position = self.conn.execute("SELECT position FROM species WHERE id = ?",
+                                         (entry['id'],)).fetchone()[0]
+            self.conn.execute("DELETE FROM species WHERE id = ?", (entry['id'],))
+            self._insert(entry, position)
+            self._touch()
+            return 'updated'
+
+    def update_variation(self, species_id: str, suffix: str, **fields) -> bool:
+        """변형 하나의 name / hue / filename 수정 (바뀌었으면 True)"""
+        allowed = {k: v for k, v in fields.items() if k in ('name', 'hue', 'filename')}
+        if not allowed:
+            return False
+        assignments = ", ".join(f"{k} = ?" for k in allowed)
+        mismatch = " OR ".join(f"{k} IS NOT ?" for k in allowed)
+        with self.transaction():
+            cur = self.conn.execute(
+                f"UPDATE variations SET {assignments} WHERE species_id = ? AND suffix = ? AND ({mismatch})",
+                (*allowed.values(), species_id, suffix, *allowed.values()))
+            if cur.rowcount:
+                self._touch()
+            return cur.rowcount > 0
+
+    def rename_files(self, rule: Callable[[str, str, dict], str]) -> int:
+        """rule(species_id, base_file, variation) → 새 파일명 을 전체 변형에 적용 (변경 수 반환)"""
+        changed = 0
+        with self.transaction():
+            species = {r['id']: r['base_file'] for r in self.conn.execute("SELECT id, base_file FROM species")}
+            for row in self.conn.execute("SELECT * FROM variations").fetchall():
+                filename = rule(row['species_id'], species[row['species_id']], dict(row))
+                changed += self.update_variation(row['species_id'], row['suffix'], filename=filename)
+        return changed
+
+    def delete_species(self, species_id: str) -> bool:
+        with self.transaction():
+            cur = self.conn.execute("DELETE FROM species WHERE id = ?", (species_id,))
+            if cur.rowcount:
+                self._touch()
+            return cur.rowcount > 0
+
+
+def add_species(entries: List[dict], overwrite: bool = False) -> Dict[str, str]:
+    """스크립트용: 한 트랜잭션으로 여러 종족 upsert 후 JSON 내보내기 → {id: 결과}"""
+    with MonsterStore() as store:
+        with store.transaction():
+            results = {e['id']: store.upsert_species(e, overwrite=overwrite) for e in entries}
+        store.export_json()
+    return results
+
+
+# ============================================================
+# CLI
+# ============================================================
+
+def main():
+    parser = argparse.ArgumentParser(description='몬스터 DB 저장소')
+    parser.add_argument('--attribute', help='속성으로 조회 (Normal/Fire/Ice/Wind/Holy/Dark)')
+    parser.add_argument('--species', help='종족 id 로 조회 (monster_slime)')
+    parser.add_argument('--prefix', help='종족 접두사로 조회 (monster_ / boss_)')
+    parser.add_argument('--export', action='store_true', help='monster_db.json 강제 내보내기')
+    parser.add_argument('--reimport', action='store_true', help='monster_db.json 에서 다시 가져오기')
+    args = parser.parse_args()
+
+    with MonsterStore() as store:
+        if args.reimport:
+            store.sync_from_json(force=True)
+        if args.species:
+            entry = store.get_species(args.species)
+            print(json.dumps(entry, indent=2, ensure_ascii=False) if entry else f"없음: {args.species}")
+        elif args.attribute or args.prefix:
+            for v in store.find(attribute=args.attribute, species_prefix=args.prefix):
+                print(f"  {v['monster_id']:<36} {v['name']:<16} hue={v['hue']}  {v['filename']}")
+        else:
+            ids = store.species_ids()
+            bosses = sum(1 for i in ids if i.startswith('boss_'))
+            print(f"저장소: {store.path}")
+            print(f"종족 {len(ids)}개 (일반 {len(ids) - bosses}, 보스 {bosses}), revision {store.revision}")
+        if args.export:
+            store.export_json(force=True)
+            print(f"내보냄: {store.json_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DeskWarrior 몬스터 기획서 → 몬스터 DB 증분 가져오기
+- docs/monster_planning.md 를 표(section) 단위로 나눠 내용 해시 계산
+- 마지막으로 가져온 해시와 같은 표는 행을 파싱하지 않고 건너뜀
+- 바뀐 표의 행만 DB 와 비교해 새 종족을 추가 (한 트랜잭션)
+- 행 단위 diff 출력 (added / changed / removed)
+- 기존 종족의 이름 변경(changed)은 보고만 하고, --update-names 일 때만 반영
+  (기존 update_db 흐름처럼 DB 에서 손으로 고친 이름을 기본으로는 덮어쓰지 않음)
+- 기획서에서 사라진 종족은 보고만 하고, --prune 일 때만 삭제
+
+사용법:
+    python tools/planning_importer.py                  # 동기화 (새 종족만 추가)
+    python tools/planning_importer.py --dry-run        # diff 만 출력
+    python tools/planning_importer.py --force          # 모든 표 다시 비교
+    python tools/planning_importer.py --force --update-names   # 기획서 이름으로 전부 맞춤
+"""
+
+import argparse
+import hashlib
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from monster_store import ATTRIBUTES, MonsterStore, make_species
+
+ROOT = Path(__file__).resolve().parent.parent
+PLANNING_FILE = ROOT / "docs" / "monster_planning.md"
+
+_ATTRIBUTE_ORDER = list(ATTRIBUTES)
+
+_STATE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS planning_sections (
+    source      TEXT NOT NULL,
+    key         TEXT NOT NULL,
+    hash        TEXT NOT NULL,
+    species     TEXT NOT NULL,
+    PRIMARY KEY (source, key)
+);
+"""
+
+
+# ============================================================
+# 파싱
+# ============================================================
+
+@dataclass
+class Section:
+    """기획서의 표 하나 (제목 + 표 줄)"""
+    key: str
+    is_boss: bool
+    lines: List[str] = field(default_factory=list)
+
+    @property
+    def digest(self) -> str:
+        payload = f"{self.key}\n{int(self.is_boss)}\n" + "\n".join(self.lines)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+@dataclass
+class PlanningRow:
+    species: str
+    names: Dict[str, str]
+
+
+def split_sections(text: str) -> List[Section]:
+    """표 단위로 나누기 (키 = '### 제목 / **소제목**', 중복 시 #n)"""
+    sections: List[Section] = []
+    heading, label = '', ''
+    is_boss = False
+    current: Optional[Section] = None
+    seen: Dict[str, int] = {}
+
+    for raw in text.split('\n'):
+        line = raw.strip()
+        if line.startswith('|'):
+            if current is None:
+                key = f"{heading} / {label}" if label else heading
+                seen[key] = seen.get(key, 0) + 1
+                if seen[key] > 1:
+                    key = f"{key} #{seen[key]}"
+                current = Section(key, is_boss)
+                sections.append(current)
+            current.lines.append(line)
+            continue
+        current = None
+        if line.startswith('#'):
+            heading = line.lstrip('#').strip().strip('*').strip()
+            label = ''
+            # 보스 구분은 기존 add_full_batch_to_db 규칙 그대로 (### 제목 기준)
+            if line.startswith('###'):
+                if 'Boss' in line or '보스' in line:
+                    is_boss = True
+                elif '일반' in line or 'Standard' in line:
+                    is_boss = False
+        elif line.startswith('**') and line.endswith('**'):
+            label = line.strip('*').strip()
+    return sections
+
+
+def parse_row(line: str) -> Optional[PlanningRow]:
+    """'| No | **한글 (English)** | 무 | 화 | 빙 | 풍 | 성 | 암 |' → PlanningRow"""
+    if '---' in line or 'No.' in line:
+        return None
+    parts = [p.strip() for p in line.split('|')]
+    if len(parts) < 9:
+        return None
+    # 마지막 괄호가 영문 종족명 ('인어(여) (MermaidF)' → MermaidF)
+    match = re.search(r'\(([^()]*)\)[*\s]*$', parts[2])
+    if not match:
+        return None
+    species = re.sub(r'[^a-zA-Z0-9]', '', match.group(1).strip())
+    names = dict(zip(_ATTRIBUTE_ORDER, parts[3:9]))
+    if not species or species.lower() == 'reserved' or all(n in ('', '-') for n in names.values()):
+        return None
+    return PlanningRow(species, names)
+
+
+def species_id_for(species: str, is_boss: bool) -> str:
+    species_lower = species.lower()
+    if species_lower == "mermaidf":
+        species_lower = "female_mermaid"
+    if species_lower == "mermaidm":
+        species_lower = "male_mermaid"
+    prefix = "boss" if is_boss else "monster"
+    return f"{prefix}_{species_lower}"
+
+
+def parse_planning(text: str) -> List[Tuple[Section, PlanningRow]]:
+    """전체 파싱 (증분이 아닌 경로: 호환/검증용)"""
+    return [(s, row) for s in split_sections(text) for row in map(parse_row, s.lines) if row]
+
+
+# ============================================================
+# 증분 동기화
+# ============================================================
+
+@dataclass
+class RowChange:
+    kind: str                    # added / changed / removed
+    species_id: str
+    section: str
+    names: Dict[str, Tuple[Optional[str], Optional[str]]] = field(default_factory=dict)
+
+
+@dataclass
+class SyncReport:
+    sections: int = 0
+    parsed_sections: int = 0
+    parsed_rows: int = 0
+    changes: List[RowChange] = field(default_factory=list)
+    applied: bool = False
+    exported: bool = False
+    kept_names: int = 0          # 반영하지 않은 이름 변경 수 (--update-names 없음)
+
+    def count(self, kind: str) -> int:
+        return sum(1 for c in self.changes if c.kind == kind)
+
+    def format(self) -> str:
+        lines = [f"표 {self.sections}개 중 {self.parsed_sections}개 변경 (행 {self.parsed_rows}개 비교)"]
+        for c in self.changes:
+            mark = {'added': '+', 'changed': '~', 'removed': '-'}[c.kind]
+            lines.append(f"  {mark} {c.species_id:<28} [{c.section}]" if c.section else f"  {mark} {c.species_id}")
+            for attribute, (old, new) in c.names.items():
+                lines.append(f"      {attribute:<7} {old or '':<16} → {new or ''}")
+        lines.append(f"추가 {self.count('added')} / 변경 {self.count('changed')} / "
+                     f"삭제 {self.count('removed')}"
+                     + ("" if self.applied or not self.changes else "  (적용 안 함)"))
+        if self.applied and self.kept_names:
+            lines.append(f"이름 변경 {self.kept_names}건은 DB 이름 유지 (반영하려면 --force --update-names)")
+        return "\n".join(lines)
+
+
+class PlanningImporter:
+    """기획서 표 해시를 MonsterStore 에 기록하고 바뀐 표만 반영"""
+
+    def __init__(self, store: MonsterStore, path: Optional[Path] = None):
+        self.store = store
+        self.path = Path(path) if path else PLANNING_FILE
+        self.source = self.path.name
+        store.conn.executescript(_STATE_SCHEMA)
+
+    def _known(self) -> Dict[str, Tuple[str, List[str]]]:
+        rows = self.store.conn.execute(
+            "SELECT key, hash, species FROM planning_sections WHERE source = ?", (self.source,))
+        return {k: (h, json.loads(s)) for k, h, s in rows}
+
+    def sync(self, dry_run: bool = False, prune: bool = False, force: bool = False,
+             update_names: bool = False) -> SyncReport:
+        """update_names: 기존 종족의 이름도 기획서 값으로 변경 (기본은 새 종족 추가만)"""
+        report = SyncReport()
+        text = self.path.read_text(encoding='utf-8')
+        file_hash = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        meta_key = f"planning_hash:{self.source}"
+        if not force and self.store.get_meta(meta_key) == file_hash:
+            report.sections = len(self._known())
+            return report
+
+        sections = split_sections(text)
+        known = self._known()
+        report.sections = len(sections)
+        changed = [s for s in sections if force or known.get(s.key, ('',))[0] != s.digest]
+        changed_keys = {s.key for s in changed}
+        report.parsed_sections = len(changed)
+
+        # 바뀌지 않은 표의 종족은 기록된 목록 사용 (파싱하지 않음)
+        present = {sid for s in sections if s.key not in changed_keys for sid in known.get(s.key, ('', []))[1]}
+        section_species: Dict[str, List[str]] = {}
+
+        with self.store.transaction():
+            for section in changed:
+                ids = section_species.setdefault(section.key, [])
+                for row in filter(None, map(parse_row, section.lines)):
+                    report.parsed_rows += 1
+                    sid = species_id_for(row.species, section.is_boss)
+                    if sid in present or sid in ids:
+                        continue        # 같은 종족이 이미 앞에서 처리됨
+                    ids.append(sid)
+                    present.add(sid)
+                    change = self._diff_row(sid, row, section.key)
+                    if change:
+                        report.changes.append(change)
+                        if change.kind == 'changed' and not update_names:
+                            report.kept_names += 1
+                        elif not dry_run:
+                            self._apply(change, row)
+
+            current_keys = [s.key for s in sections]
+            previous = {sid for key, (_, ids) in known.items()
+                        if key in changed_keys or key not in current_keys for sid in ids}
+            for sid in sorted(previous - present):
+                if sid in self.store:
+                    report.changes.append(RowChange('removed', sid, '', {}))
+                    if prune and not dry_run:
+                        self.store.delete_species(sid)
+
+            if not dry_run:
+                self.store.conn.execute(
+                    f"DELETE FROM planning_sections WHERE source = ? AND key NOT IN "
+                    f"({','.join('?' * len(current_keys))})", (self.source, *current_keys))
+                self.store.conn.executemany(
+                    "INSERT INTO planning_sections (source, key, hash, species) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT(source, key) DO UPDATE SET hash = excluded.hash, species = excluded.species",
+                    [(self.source, s.key, s.digest, json.dumps(section_species[s.key])) for s in changed])
+                self.store.set_meta(meta_key, file_hash)
+                report.applied = True
+
+        if not dry_run:
+            report.exported = self.store.export_json()
+        return report
+
+    def _diff_row(self, sid: str, row: PlanningRow, section: str) -> Optional[RowChange]:
+        current = self.store.get_species(sid)
+        if current is None:
+            return RowChange('added', sid, section, {a: (None, n) for a, n in row.names.items()})
+        old = {v['attribute']: v['name'] for v in current['variations']}
+        diff = {a: (old.get(a), n) for a, n in row.names.items() if old.get(a) != n}
+        return RowChange('changed', sid, section, diff) if diff else None
+
+    def _apply(self, change: RowChange, row: PlanningRow):
+        if change.kind == 'added':
+            self.store.upsert_species(make_species(change.species_id, row.names))
+            return
+        suffixes = {v['attribute']: v['suffix'] for v in self.store.get_species(change.species_id)['variations']}
+        for attribute, (_, new) in change.names.items():
+            if attribute in suffixes:
+                self.store.update_variation(change.species_id, suffixes[attribute], name=new)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='몬스터 기획서 → DB 증분 가져오기')
+    parser.add_argument('--file', type=Path, default=PLANNING_FILE, help='기획서 경로')
+    parser.add_argument('--dry-run', action='store_true', help='diff 만 출력')
+    parser.add_argument('--force', action='store_true', help='해시와 무관하게 모든 표 비교')
+    parser.add_argument('--prune', action='store_true', help='기획서에서 사라진 종족 삭제')
+    parser.add_argument('--update-names', action='store_true', help='기존 종족 이름도 기획서 값으로 변경')
+    args = parser.parse_args()
+
+    with MonsterStore() as store:
+        report = PlanningImporter(store, args.file).sync(dry_run=args.dry_run, prune=args.prune,
+                                                         force=args.force, update_names=args.update_names)
+    print(report.format())
+    if report.exported:
+        print(f"내보냄: {store.json_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DeskWarrior 플레이어 집단 시뮬레이터
+- CPS 등급(CpsMeasureTab 기준), 영구 업그레이드 전략, 하루 플레이 시간을 표본 추출
+- 진행 모델: prestige_simulator 기대값 궤적 (CPS 격자 × 전략별 1회 계산, 결과 캐시)
+  각 플레이어는 자신의 누적 플레이 시간으로 궤적을 조회
+- 병렬 배치 + 스트리밍 집계 (streaming_stats 스케치, 플레이어별 결과를 저장하지 않음)
+- 출력: 보스별 통과 비율, 첫 영구 업그레이드까지 시간, 크리스탈 수입 백분위
+
+사용법:
+    python tools/population_simulator.py --players 1000000 --days 30 --workers 8
+"""
+
+import argparse
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from prestige_simulator import PERM_POLICIES, PrestigeSimulator
+from result_cache import RESULT_CACHE
+from rng_streams import RandomStreams, categorical, normals
+import stat_formulas_generated as SF
+from streaming_stats import Summary
+
+# CPS 등급 (CpsMeasureTab._show_result와 동일 구간)
+CPS_GRADES = (
+    ('느림', 1.0, 3.0),
+    ('캐주얼', 3.0, 5.0),
+    ('일반', 5.0, 8.0),
+    ('숙련자', 8.0, 12.0),
+    ('프로', 12.0, 15.0),
+    ('초인', 15.0, 18.0),
+)
+DEFAULT_GRADE_WEIGHTS = (0.10, 0.25, 0.35, 0.20, 0.08, 0.02)
+DEFAULT_STRATEGY_WEIGHTS = {'cheapest': 0.6, 'balanced': 0.4}
+
+CPS_STEP = 0.5                          # 궤적 격자 간격
+CPS_GRID = np.arange(CPS_GRADES[0][1], CPS_GRADES[-1][2] + CPS_STEP / 2, CPS_STEP)
+MAX_STAGE_BIN = 2048
+CHECKPOINT_DAYS = (1, 3, 7, 14, 30)
+
+# 궤적에 영향을 주는 config (HP/골드/보스 주기 상수는 StatFormulas.json → stat_formulas_generated,
+# 생성 코드 자체는 ResultCache 코드 지문으로 키에 들어감)
+TRAJECTORY_CONFIGS = ("PermanentStatGrowth.json", "InGameStatGrowth.json", "BossDrops.json", "StatFormulas.json")
+
+
+# ============================================================
+# 설정
+# ============================================================
+
+@dataclass
+class PopulationConfig:
+    players: int = 100000
+    days: float = 30.0
+    grade_weights: Sequence[float] = DEFAULT_GRADE_WEIGHTS
+    strategy_weights: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_STRATEGY_WEIGHTS))
+    minutes_median: float = 30.0        # 하루 플레이 시간 중앙값 (분)
+    minutes_sigma: float = 0.7          # 로그정규 σ
+    max_minutes: float = 240.0
+    start_crystals: float = 0.0
+    runs: int = 20000                   # 궤적 최대 런 수
+    batch: int = 50000
+    seed: int = 0
+
+    def checkpoints(self) -> Tuple[float, ...]:
+        return tuple(d for d in CHECKPOINT_DAYS if d < self.days) + (self.days,)
+
+
+# ============================================================
+# 진행 궤적
+# ============================================================
+
+@dataclass
+class Trajectory:
+    """한 (CPS, 전략)의 누적 플레이 시간 → 진행 상태 (정상 상태 구간 단위)"""
+    t0: np.ndarray          # 구간 시작 누적 초
+    t1: np.ndarray          # 구간 끝 누적 초
+    stage: np.ndarray       # 구간 최대 스테이지
+    c0: np.ndarray          # 구간 시작 누적 크리스탈
+    c1: np.ndarray
+    first_purchase: float   # 첫 영구 업그레이드 구매 시점 (초), 없으면 inf
+
+    def lookup(self, seconds: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """누적 플레이 시간 → (최대 스테이지, 누적 크리스탈)"""
+        i = np.minimum(np.searchsorted(self.t1, seconds, side='left'), len(self.t1) - 1)
+        span = np.maximum(self.t1[i] - self.t0[i], 1e-9)
+        frac = np.clip((seconds - self.t0[i]) / span, 0, 1)
+        return self.stage[i], self.c0[i] + (self.c1[i] - self.c0[i]) * frac
+
+
+@RESULT_CACHE.memoize(*TRAJECTORY_CONFIGS)
+def build_trajectory(cps: float, strategy: str, runs: int, start_crystals: float) -> Trajectory:
+    sim = PrestigeSimulator(cps=cps, perm_policy=strategy)
+    result = sim.simulate(runs, crystals=start_crystals)
+    starts = np.array([s.start_run for s in result.segments])
+    ends = starts + np.array([s.runs for s in result.segments]) - 1
+    seconds = np.concatenate([[0.0], result.play_seconds])
+    crystals = np.concatenate([[0.0], result.crystals_earned])
+    bought = np.flatnonzero(result.purchases > 0)
+    return Trajectory(
+        t0=seconds[starts], t1=seconds[ends + 1],
+        stage=np.array([s.max_stage for s in result.segments]),
+        c0=crystals[starts], c1=crystals[ends + 1],
+        first_purchase=float(seconds[bought[0]]) if len(bought) else np.inf,
+    )
+
+
+def _trajectory_task(args) -> Tuple[int, int, Trajectory]:
+    i, j, cps, strategy, runs, start_crystals = args
+    return i, j, build_trajectory(cps, strategy, runs, start_crystals)
+
+
+# ============================================================
+# 스트리밍 집계
+# ============================================================
+
+@dataclass
+class PopulationStats:
+    """병합 가능한 집계 (스테이지 카운터 + 스트리밍 요약만 보관)"""
+    checkpoints: Tuple[float, ...]
+    stage_counts: np.ndarray            # (checkpoint, stage) 최대 스테이지 분포
+    grade_stage_counts: np.ndarray      # (grade, stage) 마지막 체크포인트 분포
+    first_purchase: Summary = field(default_factory=Summary)   # 기간 내 첫 구매 일수
+    income: Summary = field(default_factory=Summary)           # 일 평균 크리스탈 수입
+    never_purchased: int = 0
+    players: int = 0
+
+    @classmethod
+    def empty(cls, config: PopulationConfig) -> 'PopulationStats':
+        cps = config.checkpoints()
+        return cls(
+            checkpoints=cps,
+            stage_counts=np.zeros((len(cps), MAX_STAGE_BIN), dtype=np.int64),
+            grade_stage_counts=np.zeros((len(CPS_GRADES), MAX_STAGE_BIN), dtype=np.int64),
+        )
+
+    def merge(self, other: 'PopulationStats') -> 'PopulationStats':
+        self.stage_counts += other.stage_counts
+        self.grade_stage_counts += other.grade_stage_counts
+        self.first_purchase.merge(other.first_purchase)
+        self.income.merge(other.income)
+        self.never_purchased += other.never_purchased
+        self.players += other.players
+        return self
+
+    # --- 조회 ---
+
+    def past_boss(self, checkpoint: int = -1) -> Dict[int, float]:
+        """보스 스테이지별 통과 비율 (최대 스테이지 > 보스 스테이지)"""
+        counts = self.stage_counts[checkpoint]
+        beyond = counts[::-1].cumsum()[::-1]    # beyond[s] = 최대 스테이지 ≥ s
+        total = max(self.players, 1)
+        top = int(np.flatnonzero(counts).max()) if counts.any() else 0
+        return {b: float(beyond[b + 1]) / total for b in range(SF.BOSS_INTERVAL, top + SF.BOSS_INTERVAL, SF.BOSS_INTERVAL)
+                if b + 1 < MAX_STAGE_BIN}
+
+    def stage_percentiles(self, percentiles=(10, 50, 90), checkpoint: int = -1) -> Dict[int, int]:
+        cdf = np.cumsum(self.stage_counts[checkpoint]) / max(self.players, 1)
+        return {p: int(np.searchsorted(cdf, p / 100)) for p in percentiles}
+
+    def first_purchase_percentiles(self, percentiles=(10, 50, 90)) -> Dict[int, Optional[float]]:
+        """첫 영구 업그레이드까지 일수 백분위 (기간 내 구매 못한 플레이어 포함, 도달 못하면 None)"""
+        bought = self.first_purchase.count
+        out = {}
+        for p in percentiles:
+            q = p / 100 * self.players / bought if bought else math.inf
+            out[p] = float(self.first_purchase.digest.quantile(q)[0]) if q <= 1 else None
+        return out
+
+    def income_percentiles(self, percentiles=(10, 50, 90)) -> Dict[int, float]:
+        return self.income.percentiles(percentiles)
+
+
+# ============================================================
+# 표본 추출
+# ============================================================
+
+@dataclass
+class PlayerSample:
+    """플레이어 표본 (배열)"""
+    grade: np.ndarray           # CPS 등급 인덱스
+    cps: np.ndarray
+    cps_idx: np.ndarray         # CPS_GRID 인덱스
+    strategy: np.ndarray        # strategy_weights 순서 인덱스
+    per_day: np.ndarray         # 하루 플레이 시간 (초)
+
+    def groups(self, strategies: int):
+        """(CPS 격자, 전략) 궤적별 플레이어 인덱스"""
+        group = self.cps_idx * strategies + self.strategy
+        for g in np.unique(group):
+            yield (int(g // strategies), int(g % strategies)), np.flatnonzero(group == g)
+
+
+def sample_players(config: PopulationConfig, start: int, n: int) -> PlayerSample:
+    """플레이어 start..start+n 표본 추출 (플레이어 번호별 카운터 난수 → 배치 분할과 무관)"""
+    u = RandomStreams(config.seed, 'population').uniforms('players', start, n, width=5)
+    grade = categorical(u[:, 0], config.grade_weights)
+    lo = np.array([g[1] for g in CPS_GRADES])[grade]
+    hi = np.array([g[2] for g in CPS_GRADES])[grade]
+    cps = lo + (hi - lo) * u[:, 1]
+    cps_idx = np.clip(np.rint((cps - CPS_GRID[0]) / CPS_STEP).astype(np.int64), 0, len(CPS_GRID) - 1)
+
+    names = list(config.strategy_weights)
+    strategy = categorical(u[:, 2], [config.strategy_weights[k] for k in names])
+
+    log_minutes = np.log(config.minutes_median) + config.minutes_sigma * normals(u[:, 3], u[:, 4])
+    minutes = np.clip(np.exp(log_minutes), 1, config.max_minutes)
+    return PlayerSample(grade, cps, cps_idx, strategy, minutes * 60)
+
+
+# ============================================================
+# 배치
+# ============================================================
+
+_TRAJECTORIES: Dict[Tuple[int, int], Trajectory] = {}
+
+
+def _init_worker(trajectories):
+    global _TRAJECTORIES
+    _TRAJECTORIES = trajectories
+
+
+def _simulate_batch(args) -> PopulationStats:
+    """플레이어 start..start+n 표본 추출 → 집계만 반환"""
+    start, n, config = args
+    players = sample_players(config, start, n)
+    stats = PopulationStats.empty(config)
+    stats.players = n
+    grade, per_day = players.grade, players.per_day
+
+    checkpoints = config.checkpoints()
+    final_stage = np.zeros(n, dtype=np.int64)
+    final_crystals = np.zeros(n)
+    first_days = np.full(n, np.inf)
+
+    for key, members in players.groups(len(config.strategy_weights)):
+        traj = _TRAJECTORIES[key]
+        for c, day in enumerate(checkpoints):
+            stage, crystals = traj.lookup(per_day[members] * day)
+            stats.stage_counts[c] += np.bincount(np.minimum(stage, MAX_STAGE_BIN - 1), minlength=MAX_STAGE_BIN)
+        final_stage[members] = stage
+        final_crystals[members] = crystals
+        first_days[members] = traj.first_purchase / per_day[members]
+
+    for gi in range(len(CPS_GRADES)):
+        sel = grade == gi
+        stats.grade_stage_counts[gi] += np.bincount(np.minimum(final_stage[sel], MAX_STAGE_BIN - 1),
+                                                    minlength=MAX_STAGE_BIN)
+    within = first_days <= config.days
+    stats.first_purchase.update(first_days[within])
+    stats.never_purchased = int(n - within.sum())
+    stats.income.update(final_crystals / config.days)
+    return stats
+
+
+def simulate_population(config: PopulationConfig, workers: int = 0) -> PopulationStats:
+    """집단 시뮬레이션 (workers: 0 = CPU 수, 1 = 현재 프로세스)"""
+    names = list(config.strategy_weights)
+    for name in names:
+        if name not in PERM_POLICIES:
+            raise ValueError(f"알 수 없는 전략: {name}")
+
+    traj_tasks = [(i, j, float(c), s, config.runs, config.start_crystals)
+                  for i, c in enumerate(CPS_GRID) for j, s in enumerate(names)]
+    batch_tasks = [(k, min(config.batch, config.players - k), config) for k in range(0, config.players, config.batch)]
+
+    stats = PopulationStats.empty(config)
+    if workers == 1:
+        trajectories = {(i, j): t for i, j, t in map(_trajectory_task, traj_tasks)}
+        _init_worker(trajectories)
+        for part in map(_simulate_batch, batch_tasks):
+            stats.merge(part)
+        return stats
+
+    with ProcessPoolExecutor(max_workers=workers or None) as pool:
+        trajectories = {(i, j): t for i, j, t in pool.map(_trajectory_task, traj_tasks)}
+    with ProcessPoolExecutor(max_workers=workers or None, initializer=_init_worker,
+                             initargs=(trajectories,)) as pool:
+        for part in pool.map(_simulate_batch, batch_tasks):
+            stats.merge(part)
+    return stats
+
+
+# ============================================================
+# 메인
+# ============================================================
+
+def print_report(stats: PopulationStats, config: PopulationConfig):
+    print(f"\n{'='*72}")
+    print(f" 플레이어 집단 시뮬레이션 ({stats.players:,}명, {config.days:g}일)")
+    print(f"{'='*72}")
+
+    print(f"\n [보스 통과 비율]")
+    header = " ".join(f"{f'{d:g}일':>8}" for d in stats.checkpoints)
+    print(f" {'보스':>6} | {header}")
+    rows = [stats.past_boss(c) for c in range(len(stats.checkpoints))]
+    for boss in rows[-1]:
+        cells = " ".join(f"{r.get(boss, 0.0) * 100:>7.1f}%" for r in rows)
+        print(f" {boss:>6} | {cells}")
+    if not rows[-1]:
+        print("  (첫 보스를 통과한 플레이어 없음)")
+
+    print(f"\n [등급별 최대 스테이지 중앙값]")
+    for gi, (name, lo, hi) in enumerate(CPS_GRADES):
+        counts = stats.grade_stage_counts[gi]
+        total = counts.sum()
+        median = int(np.searchsorted(np.cumsum(counts), total / 2)) if total else 0
+        print(f"  {name:<6} (CPS {lo:g}~{hi:g}): {median:>5}  ({total:,}명)")
+
+    sp = stats.stage_percentiles()
+    fp = stats.first_purchase_percentiles()
+    ip = stats.income_percentiles()
+    fmt_day = lambda d: f"{d:.2f}일" if d is not None else "기간 내 없음"
+    print(f"\n 최대 스테이지  p10 {sp[10]} / p50 {sp[50]} / p90 {sp[90]}")
+    print(f" 첫 영구 업그레이드  p10 {fmt_day(fp[10])} / p50 {fmt_day(fp[50])} / p90 {fmt_day(fp[90])}")
+    print(f" 크리스탈 수입(일)  p10 {ip[10]:,.1f} / p50 {ip[50]:,.1f} / p90 {ip[90]:,.1f}"
+          f"  (평균 {stats.income.moments.mean:,.1f})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DeskWarrior 플레이어 집단 시뮬레이터")
+    parser.add_argument('--players', type=int, default=100000)
+    parser.add_argument('--days', type=float, default=30.0)
+    parser.add_argument('--minutes', type=float, default=30.0, help="하루 플레이 시간 중앙값 (분)")
+    parser.add_argument('--start-crystals', type=float, default=0.0, help="시작 크리스탈 (복귀 유저 등)")
+    parser.add_argument('--runs', type=int, default=20000, help="궤적 최대 런 수")
+    parser.add_argument('--workers', type=int, default=0)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    config = PopulationConfig(players=args.players, days=args.days, minutes_median=args.minutes,
+                              start_crystals=args.start_crystals, runs=args.runs, seed=args.seed)
+    started = time.perf_counter()
+    stats = simulate_population(config, workers=args.workers)
+    elapsed = time.perf_counter() - started
+    print_report(stats, config)
+    print(f"\n {elapsed:.1f}초 ({stats.players / max(elapsed, 1e-9):,.0f}명/초)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DeskWarrior 프레스티지 루프 시뮬레이터 (장기 메타 진행)
+- 런 반복: 인게임 런(run_simulator) → 보스 크리스탈 드롭 + 골드 변환 → 영구 업그레이드 구매
+- 보스 드롭: BossDrops.json + calc_crystal_drop_chance / calc_crystal_drop_amount, N보스 확정 드롭(피티)
+- 정상 상태 구간(구매 사이 동일한 런)은 피티 마르코프 체인으로 해석적 빨리 감기
+
+영구 업그레이드 구매 순서는 레벨에만 의존하므로 구매 경로를 먼저 만들고,
+경로 위 각 지점의 런 결과를 run_simulator로 한 번에(배열) 계산합니다.
+
+사용법:
+    python tools/prestige_simulator.py --runs 10000 --cps 6 --target 200
+"""
+
+import argparse
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from economy_model import StatTable, is_boss_stage, load_json, upgrade_costs
+from rng_streams import RandomStreams
+from run_simulator import RunSimulator
+import stat_formulas_generated as SF
+
+# 런 시뮬레이터에 반영되는 영구 스탯 (나머지는 대응 인게임 스탯이 없어 효과 없음)
+MODELED_STATS = (
+    'base_attack', 'attack_percent', 'crit_chance', 'crit_damage', 'multi_hit',
+    'gold_flat_perm', 'gold_multi_perm', 'crystal_flat', 'crystal_multi',
+    'time_extend', 'upgrade_discount', 'start_level', 'start_gold',
+    'start_keyboard', 'start_mouse', 'start_combo_damage',
+)
+
+PATH_CHUNK = 256            # 구매 경로를 몇 지점씩 묶어 시뮬레이션할지
+VARIANCE_SAMPLES = 256      # 드롭량 분산 기대값 적분 격자
+STEADY_TOL = 1e-12          # 피티 분포 수렴 판정
+
+
+# 업적 메트릭 → 런 1회 값 (RunResult 필드, 누적형)
+RUN_METRICS = ('kills', 'bosses', 'gold_earned', 'gold_spent', 'keyboard_inputs', 'mouse_inputs',
+               'damage', 'crits')
+
+
+# ============================================================
+# 보스 드롭
+# ============================================================
+
+@dataclass
+class BossDropConfig:
+    """BossDrops.json"""
+    base_drop_chance: float = 0.5
+    drop_chance_per_level: float = 0.005
+    max_drop_chance: float = 0.95
+    base_crystal_amount: int = 5
+    crystal_per_level: int = 1
+    crystal_variance: float = 0.2
+    guaranteed_drop_every_n_bosses: int = 10
+
+    @classmethod
+    def load(cls, filename: str = 'BossDrops.json') -> 'BossDropConfig':
+        data = load_json(filename)
+        return cls(**{k: data[k] for k in cls.__dataclass_fields__ if k in data})
+
+    def drop_chances(self, boss_levels: np.ndarray, crystal_multi: float = 0.0) -> np.ndarray:
+        """보스별 드롭 확률 (calc_crystal_drop_chance)"""
+        base = self.base_drop_chance + np.asarray(boss_levels) * self.drop_chance_per_level
+        return np.minimum(base + crystal_multi / 100, self.max_drop_chance)
+
+    def base_amounts(self, boss_levels: np.ndarray, crystal_flat: float = 0.0) -> np.ndarray:
+        """보스별 분산 적용 전 드롭량 (calc_crystal_drop_amount)"""
+        base = self.base_crystal_amount + np.asarray(boss_levels) * self.crystal_per_level
+        return np.trunc(base + crystal_flat)
+
+    def expected_amounts(self, boss_levels: np.ndarray, crystal_flat: float = 0.0) -> np.ndarray:
+        """분산(±variance, int 절삭, 최소 1) 적용 기대 드롭량"""
+        base = self.base_amounts(boss_levels, crystal_flat)
+        u = (np.arange(VARIANCE_SAMPLES) + 0.5) / VARIANCE_SAMPLES
+        factor = 1 + (u * 2 - 1) * self.crystal_variance
+        return np.maximum(1, np.trunc(base[:, None] * factor[None, :])).mean(axis=1)
+
+    def sample_amount(self, base: float, rng: np.random.Generator) -> int:
+        variance = 1 + (rng.random() * 2 - 1) * self.crystal_variance
+        return max(1, int(base * variance))
+
+
+def pity_chain(chances: np.ndarray, amounts: np.ndarray, pity: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    런 1회의 피티 카운터 전이행렬과 기대 드롭 크리스탈
+
+    상태 = 런 시작 시 BossKillCounter (0..pity-1)
+    반환: P (pity, pity) 상태 전이, r (pity,) 시작 상태별 기대 크리스탈
+    """
+    dist = np.eye(pity)
+    reward = np.zeros(pity)
+    for p, a in zip(chances, amounts):
+        # 처치 시 카운터 +1, pity 도달이면 확정 드롭
+        hit = np.full(pity, p)
+        hit[pity - 1] = 1.0
+        drop = dist @ hit
+        reward += drop * a
+        miss = dist * (1 - hit)
+        dist = np.zeros_like(dist)
+        dist[:, 0] = drop
+        dist[:, 1:] = miss[:, :-1]
+    return dist, reward
+
+
+# ============================================================
+# 영구 업그레이드 경로
+# ============================================================
+
+# 정책: (levels (S,), next_cost (S,), allowed (S,) bool) -> 다음 구매 스탯 인덱스 (-1 = 없음)
+PermPolicy = Callable[[np.ndarray, np.ndarray, np.ndarray], int]
+
+
+def cheapest(levels: np.ndarray, next_cost: np.ndarray, allowed: np.ndarray) -> int:
+    """가장 싼 영구 업그레이드"""
+    cost = np.where(allowed, next_cost, np.inf)
+    i = int(np.argmin(cost))
+    return i if np.isfinite(cost[i]) else -1
+
+
+def lowest_level(levels: np.ndarray, next_cost: np.ndarray, allowed: np.ndarray) -> int:
+    """레벨이 가장 낮은 스탯 (동률이면 싼 것)"""
+    key = np.where(allowed & np.isfinite(next_cost), levels + next_cost / (next_cost.max() + 1), np.inf)
+    i = int(np.argmin(key))
+    return i if np.isfinite(key[i]) else -1
+
+
+PERM_POLICIES: Dict[str, PermPolicy] = {
+    'cheapest': cheapest,
+    'balanced': lowest_level,
+}
+
+
+@dataclass
+class PurchasePath:
+    """구매 경로: k번째 지점 = k회 구매 후 레벨"""
+    levels: List[np.ndarray] = field(default_factory=list)   # 지점별 (S,)
+    costs: List[float] = field(default_factory=list)         # k → k+1 구매 비용
+    stats: List[int] = field(default_factory=list)           # k → k+1 구매 스탯
+
+    def __len__(self) -> int:
+        return len(self.levels)
+
+
+# ============================================================
+# 결과
+# ============================================================
+
+@dataclass
+class Segment:
+    """동일한 런이 반복된 구간"""
+    start_run: int
+    runs: int
+    path_index: int
+    max_stage: int
+    crystals_per_run: float
+    metrics: Dict[str, float] = field(default_factory=dict)    # 런 1회 업적 메트릭 (RUN_METRICS + max_hit)
+
+
+@dataclass
+class PrestigeResult:
+    """런별 결과 배열 (구간 단위로 채워짐)"""
+    max_stage: np.ndarray          # (runs,)
+    play_seconds: np.ndarray       # (runs,) 누적 플레이 시간
+    crystals_earned: np.ndarray    # (runs,) 누적 획득 크리스탈
+    purchases: np.ndarray          # (runs,) 런 시작 시 누적 구매 횟수
+    segments: List[Segment]
+    final_levels: Dict[str, int]
+
+    def runs_to_stage(self, stage: int) -> Optional[int]:
+        """처음으로 stage에 도달한 런 번호 (1부터), 미도달 시 None"""
+        hit = np.flatnonzero(self.max_stage >= stage)
+        return int(hit[0]) + 1 if len(hit) else None
+
+    def days_to_stage(self, stage: int, minutes_per_day: float = 60.0) -> Optional[float]:
+        """stage 도달까지 필요한 플레이 일수"""
+        run = self.runs_to_stage(stage)
+        if run is None:
+            return None
+        return float(self.play_seconds[run - 1]) / (minutes_per_day * 60)
+
+
+# ============================================================
+# 시뮬레이터
+# ============================================================
+
+class PrestigeSimulator:
+    """런 반복 + 영구 업그레이드 메타 진행"""
+
+    def __init__(self, run_sim: Optional[RunSimulator] = None, drops: Optional[BossDropConfig] = None,
+                 cps: float = 5.0, run_policy: str = 'efficient', perm_policy: str = 'cheapest',
+                 stats: Sequence[str] = MODELED_STATS, combo_stack: float = 0.0):
+        self.run_sim = run_sim or RunSimulator()
+        self.drops = drops or BossDropConfig.load()
+        self.table = StatTable.from_config(self.run_sim.perm_config)
+        self.cps = cps
+        self.run_policy = run_policy
+        self.perm_policy = PERM_POLICIES[perm_policy] if isinstance(perm_policy, str) else perm_policy
+        self.combo_stack = combo_stack
+        self.allowed = np.array([sid in stats for sid in self.table.ids])
+        self.effect = dict(zip(self.table.ids, self.table.column('effect_per_level')))
+
+    # --- 구매 경로 ---
+
+    def _next_cost(self, levels: np.ndarray) -> np.ndarray:
+        cost = upgrade_costs(self.table.params, levels + 1)
+        cost = np.diagonal(cost).copy()
+        capped = (self.table.max_level > 0) & (levels >= self.table.max_level)
+        cost[capped] = np.inf
+        return cost
+
+    def _extend_path(self, path: PurchasePath, count: int):
+        levels = path.levels[-1].copy()
+        for _ in range(count):
+            cost = self._next_cost(levels)
+            i = self.perm_policy(levels, cost, self.allowed)
+            if i < 0:
+                path.costs.append(math.inf)
+                path.stats.append(-1)
+                return
+            path.costs.append(float(cost[i]))
+            path.stats.append(i)
+            levels = levels.copy()
+            levels[i] += 1
+            path.levels.append(levels)
+
+    # --- 경로 지점별 런 결과 (배열 시뮬레이션) ---
+
+    def _simulate_points(self, levels: np.ndarray) -> dict:
+        perm = {sid: levels[:, i] for i, sid in enumerate(self.table.ids)}
+        result = self.run_sim.simulate(len(levels), cps=self.cps, perm_levels=perm,
+                                       policy=self.run_policy, combo_stack=self.combo_stack)
+        time_extend = levels[:, self.table.index('time_extend')] * self.effect.get('time_extend', 0)
+        return {
+            'max_stage': result.max_stage,
+            'start_stage': result.start_stage,
+            # 마지막 몬스터는 제한시간을 모두 쓰고 실패
+            'play_seconds': result.elapsed + SF.BASE_TIME_LIMIT + time_extend,
+            'gold_crystals': np.floor(result.gold_earned / SF.GOLD_TO_CRYSTAL_RATE),
+            'metrics': {key: getattr(result, key) for key in RUN_METRICS + ('max_hit',)},
+        }
+
+    def _outcome(self, k: int, levels: np.ndarray, points: dict):
+        """k번째 지점의 (최대 스테이지, 플레이 시간, 골드 크리스탈, 보스 레벨, 드롭 확률, 기대 드롭량,
+        분산 전 드롭량, 런 메트릭)"""
+        start, end = int(points['start_stage'][k]), int(points['max_stage'][k])
+        stages = np.arange(start, end)
+        bosses = stages[is_boss_stage(stages)]
+        crystal_multi = levels[self.table.index('crystal_multi')] * self.effect.get('crystal_multi', 0)
+        crystal_flat = levels[self.table.index('crystal_flat')] * self.effect.get('crystal_flat', 0)
+        chances = self.drops.drop_chances(bosses, crystal_multi)
+        return (
+            end, float(points['play_seconds'][k]), float(points['gold_crystals'][k]),
+            bosses, chances,
+            self.drops.expected_amounts(bosses, crystal_flat),
+            self.drops.base_amounts(bosses, crystal_flat),
+            {key: float(values[k]) for key, values in points['metrics'].items()},
+        )
+
+    # --- 메인 루프 ---
+
+    def simulate(self, runs: int = 10000, start_levels: Optional[Dict[str, int]] = None,
+                 crystals: float = 0.0, mode: str = 'expected', seed: int = 0) -> PrestigeResult:
+        """
+        runs회 반복 시뮬레이션
+
+        mode='expected': 드롭을 기대값으로 처리, 정상 상태 구간은 해석적으로 빨리 감기
+        mode='monte_carlo': 런마다 드롭을 추첨 (BossKillCounter 피티 포함)
+        """
+        levels0 = np.array([int((start_levels or {}).get(sid, 0)) for sid in self.table.ids], dtype=np.int64)
+        path = PurchasePath(levels=[levels0])
+        points = {}
+        rng = RandomStreams(seed, 'prestige').generator('drops')
+        pity = int(self.drops.guaranteed_drop_every_n_bosses)
+
+        def outcome(k):
+            # 경로와 런 결과를 청크 단위로 확장
+            while k >= len(path) - 1 and (not path.costs or math.isfinite(path.costs[-1])):
+                self._extend_path(path, PATH_CHUNK)
+            if k not in points:
+                chunk = range(k, min(k + PATH_CHUNK, len(path)))
+                sim = self._simulate_points(np.array([path.levels[j] for j in chunk]))
+                for j_local, j in enumerate(chunk):
+                    points[j] = self._outcome(j_local, path.levels[j], sim)
+            return points[k]
+
+        max_stage = np.zeros(runs, dtype=np.int64)
+        seconds = np.zeros(runs)
+        earned = np.zeros(runs)
+        bought = np.zeros(runs, dtype=np.int64)
+        segments: List[Segment] = []
+
+        run, k = 0, 0
+        total_seconds = total_earned = 0.0
+        dist = np.zeros(pity)
+        dist[0] = 1.0
+        counter = 0
+        chain_cache = {}
+
+        while run < runs:
+            outcome(k)
+            while k < len(path.costs) and crystals >= path.costs[k]:
+                crystals -= path.costs[k]
+                k += 1
+                outcome(k)
+            stage, play, gold_cr, bosses, chances, exp_amounts, base_amounts, metrics = outcome(k)
+            need = path.costs[k] - crystals if k < len(path.costs) else math.inf
+            limit = runs - run
+
+            if mode == 'expected':
+                if k not in chain_cache:
+                    chain_cache[k] = pity_chain(chances, exp_amounts, pity)
+                P, r = chain_cache[k]
+                n, gained, dist = _fast_forward(dist, P, r, gold_cr, need, limit)
+            else:
+                gained = 0.0
+                for p, base in zip(chances, base_amounts):
+                    counter += 1
+                    if counter >= pity or rng.random() < p:
+                        gained += self.drops.sample_amount(base, rng)
+                        counter = 0
+                gained += gold_cr
+                n = 1
+
+            sl = slice(run, run + n)
+            max_stage[sl] = stage
+            seconds[sl] = total_seconds + play * np.arange(1, n + 1)
+            earned[sl] = total_earned + gained * np.arange(1, n + 1) / n
+            bought[sl] = k
+            if segments and segments[-1].path_index == k:
+                seg = segments[-1]
+                seg.crystals_per_run = (seg.crystals_per_run * seg.runs + gained) / (seg.runs + n)
+                seg.runs += n
+            else:
+                segments.append(Segment(run, n, k, stage, gained / n, metrics))
+            total_seconds += play * n
+            total_earned += gained
+            crystals += gained
+            run += n
+
+        final = path.levels[k]
+        return PrestigeResult(
+            max_stage=max_stage,
+            play_seconds=seconds,
+            crystals_earned=earned,
+            purchases=bought,
+            segments=segments,
+            final_levels={sid: int(final[i]) for i, sid in enumerate(self.table.ids)},
+        )
+
+
+def _fast_forward(dist: np.ndarray, P: np.ndarray, r: np.ndarray, gold_crystals: float,
+                  need: float, limit: int) -> Tuple[int, float, np.ndarray]:
+    """
+    동일한 런을 need 크리스탈이 모일 때까지 반복 (최대 limit회)
+    피티 분포가 정상 상태에 도달하면 남은 런 수를 나눗셈으로 계산
+    반환: (런 수, 획득 크리스탈 기대값, 피티 분포)
+    """
+    n, total = 0, 0.0
+    while n < limit:
+        total += dist @ r + gold_crystals
+        n += 1
+        new = dist @ P
+        converged = np.abs(new - dist).max() < STEADY_TOL
+        dist = new
+        if total >= need - 1e-9:
+            break
+        if converged:
+            per_run = dist @ r + gold_crystals
+            remaining = limit - n
+            if per_run > 0 and math.isfinite(need):
+                remaining = min(remaining, math.ceil((need - total) / per_run - 1e-9))
+            total += per_run * remaining
+            n += remaining
+            break
+    return n, total, dist
+
+
+# ============================================================
+# 메인
+# ============================================================
+
+def print_report(result: PrestigeResult, target: int, minutes_per_day: float, table: StatTable):
+    print(f"\n{'='*72}")
+    print(f" 프레스티지 루프 ({len(result.max_stage):,}런, 구간 {len(result.segments):,}개)")
+    print(f"{'='*72}")
+    print(f" {'런':>8} | {'최대 스테이지':>12} | {'누적 시간(h)':>12} | {'누적 크리스탈':>14} | {'구매':>6}")
+    print(f"{'-'*72}")
+    n = len(result.max_stage)
+    for run in sorted({0, n // 100, n // 20, n // 10, n // 4, n // 2, n - 1}):
+        print(f" {run + 1:>8,} | {result.max_stage[run]:>12} | {result.play_seconds[run] / 3600:>12,.1f} | "
+              f"{result.crystals_earned[run]:>14,.0f} | {result.purchases[run]:>6,}")
+
+    run = result.runs_to_stage(target)
+    print(f"\n 스테이지 {target} 도달: ", end="")
+    if run is None:
+        print(f"{n:,}런 안에 도달하지 못함 (최고 {result.max_stage.max()})")
+    else:
+        days = result.days_to_stage(target, minutes_per_day)
+        print(f"{run:,}번째 런, 하루 {minutes_per_day:g}분 기준 {days:,.1f}일")
+
+    top = sorted(result.final_levels.items(), key=lambda kv: -kv[1])
+    print(" 최종 레벨: " + ", ".join(f"{sid}={lv}" for sid, lv in top if lv > 0))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DeskWarrior 프레스티지 루프 시뮬레이터")
+    parser.add_argument('--runs', type=int, default=10000)
+    parser.add_argument('--cps', type=float, default=5.0)
+    parser.add_argument('--target', type=int, default=200, help="목표 스테이지")
+    parser.add_argument('--minutes-per-day', type=float, default=60.0)
+    parser.add_argument('--run-policy', default='efficient', help="인게임 소비 정책 (run_simulator.POLICIES)")
+    parser.add_argument('--perm-policy', choices=sorted(PERM_POLICIES), default='cheapest')
+    parser.add_argument('--mode', choices=['expected', 'monte_carlo'], default='expected')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    sim = PrestigeSimulator(cps=args.cps, run_policy=args.run_policy, perm_policy=args.perm_policy)
+    started = time.perf_counter()
+    result = sim.simulate(args.runs, mode=args.mode, seed=args.seed)
+    elapsed = time.perf_counter() - started
+
+    print_report(result, args.target, args.minutes_per_day, sim.table)
+    print(f"\n {elapsed:.2f}초")
+
+
+if __name__ == '__main__':
+    main()
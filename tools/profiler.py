@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DeskWarrior 대시보드 구간 계측 / cProfile 캡처
+- Profiler.instrument(): 탭 메서드(_simulate, _update_graph, _populate_table ...)를 감싸는 데코레이터
+  단계별 소요 시간을 고정 크기 링 버퍼에 기록 → p50/p95 조회
+- Profiler.measure(name): 같은 기록을 하는 컨텍스트 매니저
+- arm_capture(): 다음 동작(처음 진입하는 최상위 구간부터) 하나를 cProfile 로 기록
+  → .prof (pstats/snakeviz) + .collapsed (flamegraph.pl / speedscope 의 collapsed stack 형식)
+
+Qt 에 의존하지 않음 (balance_dashboard_qt.ProfilerPanel 이 표시)
+
+사용 예:
+    PROFILER = Profiler()
+
+    class StageSimulatorTab(QWidget):
+        @PROFILER.instrument()
+        def _simulate(self): ...
+
+    with PROFILER.measure('export'):
+        ...
+    PROFILER.rows()                         # [PhaseStats(name, count, last, p50, p95, max), ...]
+    PROFILER.arm_capture('.cache/profiles/next')
+"""
+
+import cProfile
+import functools
+import inspect
+import os
+import pstats
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+
+RING_SIZE = 256                 # 단계별 보관 표본 수
+MAX_STACK_DEPTH = 64
+
+Func = Tuple[str, int, str]     # pstats 함수 키 (파일, 줄, 이름)
+
+
+@dataclass
+class PhaseStats:
+    """단계 하나의 최근 표본 요약 (ms)"""
+    name: str
+    count: int
+    last: float
+    p50: float
+    p95: float
+    max: float
+
+
+# ============================================================
+# 구간 계측
+# ============================================================
+
+class Profiler:
+    """단계별 소요 시간 링 버퍼 + 다음 동작 cProfile 캡처"""
+
+    def __init__(self, ring_size: int = RING_SIZE, clock: Callable[[], float] = time.perf_counter):
+        self.ring_size = ring_size
+        self.clock = clock
+        self.enabled = True
+        self.samples: Dict[str, Deque[float]] = {}
+        self.counts: Dict[str, int] = {}
+        self._depth = 0
+        self._armed: Optional[Path] = None
+        self._profile: Optional[cProfile.Profile] = None
+        self._capture_path: Optional[Path] = None
+        # 캡처 시작 시 호출 (종료 콜백을 받아 이벤트 루프가 한가해질 때 부르도록 예약)
+        # None 이면 최상위 구간이 끝날 때 종료
+        self.defer_finish: Optional[Callable[[Callable[[], None]], None]] = None
+        # collapsed 파일 (.prof 는 항상 즉시) 을 별도 스레드에서 작성 - on_capture 도 그 스레드에서 호출됨
+        self.background_export = False
+        self.on_capture: Optional[Callable[[Path], None]] = None
+
+    # --- 기록 ---
+
+    def record(self, name: str, seconds: float):
+        ring = self.samples.get(name)
+        if ring is None:
+            ring = self.samples[name] = deque(maxlen=self.ring_size)
+        ring.append(seconds)
+        self.counts[name] = self.counts.get(name, 0) + 1
+
+    @contextmanager
+    def measure(self, name: str):
+        if not self.enabled:
+            yield
+            return
+        self._enter()
+        start = self.clock()
+        try:
+            yield
+        finally:
+            self.record(name, self.clock() - start)
+            self._exit()
+
+    def instrument(self, name: Optional[str] = None):
+        """
+        메서드 데코레이터 (이름 기본값: Class.method)
+
+        Qt 시그널이 넘기는 여분 위치 인자(clicked 의 checked, valueChanged 의 값)는
+        원래 함수가 받는 개수만큼만 전달 - 감싸기 전과 같은 슬롯 동작
+        """
+        def decorate(func):
+            phase = name or func.__qualname__.rsplit('<locals>.', 1)[-1]
+            code = inspect.unwrap(func).__code__       # 다른 데코레이터(functools.wraps) 안쪽의 원래 함수
+            n_args = None if code.co_flags & 0x04 else code.co_argcount    # CO_VARARGS
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if n_args is not None:
+                    args = args[:n_args]
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with self.measure(phase):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    def reset(self):
+        self.samples.clear()
+        self.counts.clear()
+
+    # --- 조회 ---
+
+    def stats(self, name: str) -> Optional[PhaseStats]:
+        ring = self.samples.get(name)
+        if not ring:
+            return None
+        ms = np.fromiter(ring, dtype=np.float64, count=len(ring)) * 1000.0
+        p50, p95 = np.percentile(ms, (50, 95))
+        return PhaseStats(name, self.counts[name], float(ms[-1]), float(p50), float(p95), float(ms.max()))
+
+    def rows(self) -> List[PhaseStats]:
+        """p95 큰 순서"""
+        rows = [self.stats(name) for name in self.samples]
+        return sorted((r for r in rows if r), key=lambda r: r.p95, reverse=True)
+
+    # --- cProfile 캡처 ---
+
+    @property
+    def capturing(self) -> bool:
+        return self._armed is not None or self._profile is not None
+
+    def arm_capture(self, path):
+        """다음 최상위 구간부터 기록 (path 에 확장자 .prof / .collapsed 를 붙여 저장)"""
+        self._armed = Path(path)
+
+    def cancel_capture(self):
+        self._armed = None
+        if self._profile is not None:
+            self._profile.disable()
+            self._profile = None
+
+    def _enter(self):
+        if self._depth == 0 and self._armed is not None and self._profile is None:
+            self._capture_path, self._armed = self._armed, None
+            self._profile = cProfile.Profile()
+            if self.defer_finish is not None:
+                self.defer_finish(self.finish_capture)
+            self._profile.enable()
+        self._depth += 1
+
+    def _exit(self):
+        self._depth -= 1
+        if self._depth == 0 and self._profile is not None and self.defer_finish is None:
+            self.finish_capture()
+
+    def finish_capture(self) -> Optional[Path]:
+        """기록 종료 + 파일 저장 → collapsed 파일 경로 (background_export 면 작성 전에 반환)"""
+        profile, self._profile = self._profile, None
+        if profile is None:
+            return None
+        profile.disable()
+        base = self._capture_path
+        base.parent.mkdir(parents=True, exist_ok=True)
+        stats = pstats.Stats(profile)
+        stats.dump_stats(str(base.with_suffix('.prof')))
+        out = base.with_suffix('.collapsed')
+        if self.background_export:
+            threading.Thread(target=self._export, args=(stats, out), name='profile-export', daemon=True).start()
+        else:
+            self._export(stats, out)
+        return out
+
+    def _export(self, stats: pstats.Stats, out: Path):
+        write_collapsed(stats, out)
+        if self.on_capture is not None:
+            self.on_capture(out)
+
+
+# ============================================================
+# flamegraph 내보내기
+# ============================================================
+
+def _label(func: Func) -> str:
+    filename, line, name = func
+    if filename == '~':                                      # 내장 함수
+        label = name
+    else:
+        label = f"{name} ({os.path.basename(filename)}:{line})"
+    return label.replace(';', ',')
+
+
+def collapsed_stacks(stats: pstats.Stats) -> Dict[str, int]:
+    """
+    pstats → {"root;caller;func": 자기 시간(µs)}
+
+    cProfile 은 호출자-피호출자 간선만 기록하므로 스택을 한 번에 근사 (간선 수에 비례, 지수 폭발 없음)
+    - 함수마다 누적 시간이 가장 큰 호출자를 대표 부모로 → 대표 경로는 함수당 한 번만 계산 (재귀/순환은 끊음)
+    - 자기 시간은 호출자별 간선 누적 시간 비율로 나눠 "호출자의 대표 경로;함수" 에 기록
+    """
+    entries = stats.stats
+    parent: Dict[Func, Optional[Func]] = {}
+    for func, (_, _, _, _, callers) in entries.items():
+        known = [(edge[3], c) for c, edge in callers.items() if c in entries and c != func]
+        parent[func] = max(known, key=lambda item: item[0])[1] if known else None
+
+    paths: Dict[Func, Tuple[str, ...]] = {}
+
+    def path_of(func: Func) -> Tuple[str, ...]:
+        # 대표 부모를 따라 올라가며 아직 모르는 함수들을 모은 뒤 위에서부터 채움
+        chain, seen = [], set()
+        node = func
+        while node is not None and node not in paths and node not in seen:
+            seen.add(node)
+            chain.append(node)
+            node = parent[node]
+        prefix = paths.get(node, ()) if node is not None else ()
+        for item in reversed(chain):
+            prefix = paths[item] = (prefix + (_label(item),))[-MAX_STACK_DEPTH:]
+        return paths[func]
+
+    out: Dict[str, int] = {}
+
+    def add(stack: Tuple[str, ...], seconds: float):
+        us = int(round(seconds * 1e6))
+        if us > 0:
+            key = ';'.join(stack)
+            out[key] = out.get(key, 0) + us
+
+    for func, (_, _, tt, ct, callers) in entries.items():
+        label = _label(func)
+        edges = [(c, edge[3]) for c, edge in callers.items() if c in entries and c != func and edge[3] > 0]
+        total = sum(edge_ct for _, edge_ct in edges)
+        if not edges or total <= 0:
+            add(path_of(func), tt)
+            continue
+        for caller, edge_ct in edges:
+            add((path_of(caller) + (label,))[-MAX_STACK_DEPTH:], tt * edge_ct / total)
+    return out
+
+
+def write_collapsed(stats: pstats.Stats, path) -> Path:
+    path = Path(path)
+    lines = [f"{stack} {value}" for stack, value in sorted(collapsed_stacks(stats).items())]
+    path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+    return path
@@ -1,30 +1,16 @@
 
-import json
-import os
+from monster_store import MonsterStore, monster_id
 
-DB_FILE = os.path.join(os.path.dirname(__file__), "monster_db.json")
+def attribute_filename(species_id, base_file, var):
+    # New Filename: monster_slime_fire.png
+    return f"{monster_id(species_id, var['attribute'])}.png"
 
 def main():
-    with open(DB_FILE, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    with MonsterStore() as store:
+        changed = store.rename_files(attribute_filename)
+        store.export_json()
 
-    for entry in data:
-        # entry['id'] is like "monster_slime"
-        # We want filenames like "monster_slime_fire.png"
-        
-        species_id = entry['id'] # monster_slime
-        
-        for var in entry['variations']:
-            attr = var['attribute'].lower() # Fire -> fire
-            
-            # New Filename: monster_slime_fire.png
-            new_filename = f"{species_id}_{attr}.png"
-            var['filename'] = new_filename
-            
-    with open(DB_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
-    
-    print(f"Refactored filenames in {DB_FILE}")
+    print(f"Refactored {changed} filenames in {store.json_path}")
 
 if __name__ == "__main__":
     main()
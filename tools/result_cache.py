@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DeskWarrior 시뮬레이션 결과 디스크 캐시 (SQLite)
+- 키 = (관련 config 파일 내용 해시, 코드 지문, 함수 이름, 인자)
+  코드 지문: 함수가 정의된 모듈 + 그 모듈이 (전이적으로) 참조하는 프로젝트 모듈 소스의 해시
+  → 시뮬레이터/생성 공식(stat_formulas_generated) 코드를 고치면 자동 무효화
+- 크기 상한 초과 시 마지막 접근 순 LRU 제거
+- WAL 모드: 여러 프로세스가 동시에 읽어도 안전
+- 적중/미스 카운터 (인스턴스 단위 + 엔트리별 누적 적중 수)
+
+사용 예:
+    CACHE = ResultCache()
+
+    @CACHE.memoize('PermanentStatGrowth.json', 'InGameStatGrowth.json')
+    def progression_table(max_stage):
+        ...
+
+    python tools/result_cache.py            # 통계 출력
+    python tools/result_cache.py --clear    # 전체 삭제
+"""
+
+import argparse
+import functools
+import hashlib
+import inspect
+import json
+import marshal
+import os
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# 프로젝트 루트 경로
+ROOT = Path(__file__).resolve().parent.parent
+CONFIG_DIR = ROOT / "config"
+DEFAULT_CACHE_DIR = Path(os.environ.get('DESKWARRIOR_CACHE_DIR', ROOT / ".cache"))
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# 스키마 버전 (값 직렬화 방식/키 구성이 바뀌면 올림)
+SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key         TEXT PRIMARY KEY,
+    func        TEXT NOT NULL,
+    value       BLOB NOT NULL,
+    size        INTEGER NOT NULL,
+    created     REAL NOT NULL,
+    accessed    REAL NOT NULL,
+    hits        INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_results_accessed ON results(accessed);
+"""
+
+
+# ============================================================
+# 해시
+# ============================================================
+
+def _canonical(obj: Any) -> Any:
+    """해시용 정규화 (dict 키 정렬, NumPy 배열 → bytes)"""
+    if isinstance(obj, dict):
+        return {str(k): _canonical(v) for k, v in sorted(obj.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(obj, (list, tuple)):
+        return [_canonical(v) for v in obj]
+    if hasattr(obj, 'tobytes') and hasattr(obj, 'dtype'):
+        return {'__ndarray__': hashlib.sha256(obj.tobytes()).hexdigest(), 'dtype': str(obj.dtype),
+                'shape': list(getattr(obj, 'shape', ()))}
+    if hasattr(obj, 'item') and callable(obj.item):   # NumPy 스칼라
+        return obj.item()
+    if isinstance(obj, (str, int, float, bool)) or obj is None:
+        return obj
+    return repr(obj)
+
+
+def content_hash(obj: Any) -> str:
+    """임의 값(dict/list/배열)의 내용 해시"""
+    payload = json.dumps(_canonical(obj), sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class _FileHasher:
+    """config 파일 내용 해시 (mtime/size 가 같으면 재계산하지 않음)"""
+
+    def __init__(self):
+        self._memo: Dict[str, Tuple[int, int, str]] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, path: Path) -> str:
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return 'missing'
+        key = str(path)
+        with self._lock:
+            memo = self._memo.get(key)
+            if memo and memo[0] == st.st_mtime_ns and memo[1] == st.st_size:
+                return memo[2]
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        with self._lock:
+            self._memo[key] = (st.st_mtime_ns, st.st_size, digest)
+        return digest
+
+
+def _is_local(module: ModuleType, root: Path) -> bool:
+    path = getattr(module, '__file__', None)
+    if not path:
+        return False
+    path = Path(path).resolve()
+    return root in path.parents and 'site-packages' not in path.parts
+
+
+def local_modules(module: ModuleType, root: Path = ROOT) -> List[ModuleType]:
+    """module 과 그 전역이 (전이적으로) 참조하는 root 아래 모듈 (import 한 모듈, from-import 한 함수/클래스)"""
+    found: Dict[str, ModuleType] = {}
+    stack = [module]
+    while stack:
+        mod = stack.pop()
+        if mod.__name__ in found:
+            continue
+        found[mod.__name__] = mod
+        for value in list(vars(mod).values()):
+            if isinstance(value, ModuleType):
+                dep = value
+            else:
+                name = getattr(value, '__module__', None)
+                dep = sys.modules.get(name) if isinstance(name, str) else None
+            if dep is not None and dep.__name__ not in found and _is_local(dep, root):
+                stack.append(dep)
+    return list(found.values())
+
+
+def code_fingerprint(func: Callable, root: Path = ROOT) -> str:
+    """func 결과에 영향을 주는 프로젝트 코드의 해시 (모듈 파일 내용, 이름 대신 경로 - __main__ 실행과 같은 값)"""
+    module = sys.modules.get(func.__module__)
+    modules = local_modules(module, root) if module is not None and _is_local(module, root) else []
+    files = []
+    for mod in modules:
+        path = Path(mod.__file__).resolve()
+        try:
+            files.append((path.relative_to(root).as_posix(), hashlib.sha256(path.read_bytes()).hexdigest()))
+        except OSError:
+            modules = []            # 소스 없음 (패키징된 exe) → 함수 바이트코드만
+            break
+    if not modules:
+        code = inspect.unwrap(func).__code__
+        return hashlib.sha256(marshal.dumps(code)).hexdigest()
+    return content_hash(sorted(files))
+
+
+# ============================================================
+# 캐시
+# ============================================================
+
+class ResultCache:
+    """SQLite 결과 캐시 (스레드별 연결, 프로세스 간 WAL 공유)"""
+
+    def __init__(self, path: Optional[Path] = None, max_bytes: int = DEFAULT_MAX_BYTES,
+                 config_dir: Optional[Path] = None, enabled: bool = True, code_root: Optional[Path] = None):
+        self.path = Path(path) if path else DEFAULT_CACHE_DIR / "sim_results.sqlite"
+        self.max_bytes = max_bytes
+        self.config_dir = Path(config_dir or CONFIG_DIR)
+        self.code_root = Path(code_root or ROOT).resolve()     # 코드 지문에 넣을 모듈 범위
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()
+        self._file_hash = _FileHasher()
+        self._stat_lock = threading.Lock()
+
+    # --- 연결 ---
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=10.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._local.conn = conn
+        return conn
+
+    def close(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # --- 키 ---
+
+    def config_hash(self, config_files: Sequence[str]) -> str:
+        """관련 config 파일들의 내용 해시"""
+        digest = hashlib.sha256()
+        for name in sorted(config_files):
+            digest.update(name.encode('utf-8'))
+            digest.update(self._file_hash(self.config_dir / name).encode('ascii'))
+        return digest.hexdigest()
+
+    def make_key(self, func_name: str, args: Any = (), config_files: Sequence[str] = (), code: str = '') -> str:
+        """code: 코드 지문 (code_fingerprint) - 계산 코드가 바뀌면 다른 키"""
+        return content_hash([SCHEMA_VERSION, func_name, self.config_hash(config_files), code, args])
+
+    # --- 조회/저장 ---
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """(적중 여부, 값)"""
+        if not self.enabled:
+            return False, None
+        try:
+            row = self._conn().execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+        except sqlite3.DatabaseError:
+            row = None
+        if row is None:
+            self._count(hit=False)
+            return False, None
+        try:
+            value = pickle.loads(row[0])
+        except Exception:
+            self._count(hit=False)
+            return False, None
+        self._count(hit=True)
+        try:
+            self._conn().execute("UPDATE results SET accessed = ?, hits = hits + 1 WHERE key = ?",
+                                 (time.time(), key))
+        except sqlite3.OperationalError:
+            pass  # 다른 프로세스가 쓰는 중이면 접근 시각 갱신만 건너뜀
+        return True, value
+
+    def put(self, key: str, func_name: str, value: Any):
+        if not self.enabled:
+            return
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(blob) > self.max_bytes:
+            return
+        now = time.time()
+        try:
+            conn = self._conn()
+            conn.execute(
+                "INSERT OR REPLACE INTO results (key, func, value, size, created, accessed, hits) "
+                "VALUES (?, ?, ?, ?, ?, ?, 0)",
+                (key, func_name, blob, len(blob), now, now),
+            )
+            self._evict(conn)
+        except sqlite3.OperationalError:
+            pass  # 잠금 타임아웃 - 캐시는 최선 노력
+
+    def _evict(self, conn: sqlite3.Connection):
+        """크기 상한 초과분을 오래된 접근 순으로 제거"""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            excess = total - self.max_bytes
+            freed = 0
+            victims = []
+            for key, size in conn.execute("SELECT key, size FROM results ORDER BY accessed ASC"):
+                victims.append((key,))
+                freed += size
+                if freed >= excess:
+                    break
+            conn.executemany("DELETE FROM results WHERE key = ?", victims)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def get_or_compute(self, func_name: str, compute: Callable[[], Any], args: Any = (),
+                       config_files: Sequence[str] = (), code: str = '') -> Any:
+        key = self.make_key(func_name, args, config_files, code)
+        hit, value = self.get(key)
+        if hit:
+            return value
+        value = compute()
+        self.put(key, func_name, value)
+        return value
+
+    def memoize(self, *config_files: str, skip_self: Optional[bool] = None):
+        """
+        함수 결과 캐시 데코레이터
+        config_files: 결과에 영향을 주는 config 파일 (내용이 바뀌면 자동 무효화)
+        skip_self: 메서드의 self 인자를 키에서 제외 (기본: 첫 인자 이름이 self면 제외)
+        코드 지문은 첫 호출 때 한 번 계산 (모든 import 가 끝난 뒤, 실제로 실행 중인 코드 기준)
+        """
+        def decorator(func):
+            params = list(inspect.signature(func).parameters)
+            skip = skip_self if skip_self is not None else (params[:1] == ['self'])
+            # 스크립트 실행(__main__)과 import가 같은 키를 쓰도록 파일 이름 사용
+            name = f"{Path(inspect.getfile(func)).stem}.{func.__qualname__}"
+            fingerprint = []
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not fingerprint:
+                    fingerprint.append(code_fingerprint(func, self.code_root))
+                key_args = [list(args[1:] if skip else args), kwargs]
+                return self.get_or_compute(name, lambda: func(*args, **kwargs), key_args, config_files,
+                                           fingerprint[0])
+            wrapper.cache = self
+            return wrapper
+        return decorator
+
+    # --- 통계/관리 ---
+
+    def _count(self, hit: bool):
+        with self._stat_lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def stats(self) -> dict:
+        """적중/미스 카운터 + 저장소 현황"""
+        entries, size, total_hits = 0, 0, 0
+        if self.enabled:
+            try:
+                entries, size, total_hits = self._conn().execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(hits), 0) FROM results"
+                ).fetchone()
+            except sqlite3.DatabaseError:
+                pass
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': entries,
+            'bytes': size,
+            'lifetime_hits': total_hits,
+        }
+
+    def clear(self):
+        self._conn().execute("DELETE FROM results")
+        self.hits = self.misses = 0
+
+
+# 기본 공용 캐시
+RESULT_CACHE = ResultCache()
+
+
+# ============================================================
+# 메인
+# ============================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="DeskWarrior 시뮬레이션 결과 캐시 관리")
+    parser.add_argument('--path', type=Path, default=None)
+    parser.add_argument('--clear', action='store_true', help="캐시 전체 삭제")
+    args = parser.parse_args()
+
+    cache = ResultCache(args.path)
+    if args.clear:
+        cache.clear()
+        print(f" 캐시 삭제: {cache.path}")
+        return
+
+    stats = cache.stats()
+    print(f" 캐시 파일: {cache.path}")
+    print(f" 엔트리: {stats['entries']:,}개, {stats['bytes'] / 1024:,.1f} KB, 누적 적중 {stats['lifetime_hits']:,}회")
+    rows = cache._conn().execute(
+        "SELECT func, COUNT(*), SUM(size), SUM(hits) FROM results GROUP BY func ORDER BY SUM(size) DESC"
+    ).fetchall()
+    for func, count, size, hits in rows:
+        print(f"  {func:<60} {count:>5}개 {size / 1024:>9,.1f} KB  적중 {hits:,}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DeskWarrior 재현 가능한 병렬 난수 스트림
+- 루트 시드 + 이름공간 → 키별 독립 스트림 (SeedSequence spawn_key 기반)
+- 스트림은 워커/청크가 아니라 항목 키(세션 번호, 기록 번호 등)로 결정
+  → 워커 수와 청크 크기에 관계없이 같은 결과
+- 대량 항목은 Philox 카운터 직접 지정(uniforms)으로 항목 i의 난수를 바로 계산
+- 표준 라이브러리 random이 필요한 스크립트용 python_random()
+
+사용 예:
+    streams = RandomStreams(seed, 'population')
+    rng = streams.generator('session', 17)          # 세션 17 전용 Generator
+    u = streams.uniforms('players', start, count, 8)  # 항목 start..start+count 의 균등난수 (count, 8)
+
+    python tools/rng_streams.py --seed 42 --namespace population   # 스트림 키 확인
+"""
+
+import argparse
+import hashlib
+import random
+from typing import List, Sequence, Union
+
+import numpy as np
+
+KeyPart = Union[int, str]
+
+_WORDS_PER_BLOCK = 4                    # Philox 카운터 1칸 = uint64 4개
+_DOUBLE_SCALE = 1.0 / (1 << 53)
+
+
+def _key_int(part: KeyPart) -> int:
+    """키 조각 → 32비트 정수 (문자열은 안정 해시)"""
+    if isinstance(part, (int, np.integer)):
+        if part < 0:
+            raise ValueError(f"음수 키는 사용할 수 없습니다: {part}")
+        return int(part)
+    digest = hashlib.sha256(str(part).encode('utf-8')).digest()
+    return int.from_bytes(digest[:4], 'little')
+
+
+class RandomStreams:
+    """시드/이름공간에서 키별 독립 난수 스트림을 만드는 팩토리"""
+
+    def __init__(self, seed: int = 0, namespace: str = ''):
+        self.seed = int(seed)
+        self.namespace = namespace
+        self._prefix = (_key_int(namespace),) if namespace else ()
+
+    def __repr__(self) -> str:
+        return f"RandomStreams(seed={self.seed}, namespace={self.namespace!r})"
+
+    # --- SeedSequence / Generator ---
+
+    def seed_sequence(self, *key: KeyPart) -> np.random.SeedSequence:
+        return np.random.SeedSequence(self.seed, spawn_key=self._prefix + tuple(_key_int(k) for k in key))
+
+    def generator(self, *key: KeyPart) -> np.random.Generator:
+        """키 전용 Generator (Philox)"""
+        return np.random.Generator(np.random.Philox(self.seed_sequence(*key)))
+
+    def spawn(self, count: int, *key: KeyPart, start: int = 0) -> List[np.random.SeedSequence]:
+        """항목 start..start+count 의 SeedSequence (항목 i = seed_sequence(*key, i))"""
+        return [self.seed_sequence(*key, i) for i in range(start, start + count)]
+
+    def python_random(self, *key: KeyPart) -> random.Random:
+        """표준 라이브러리 random.Random (스크립트용)"""
+        return random.Random(int(self.seed_sequence(*key).generate_state(1, np.uint64)[0]))
+
+    # --- 카운터 기반 대량 난수 ---
+
+    def uniforms(self, stream: KeyPart, start: int, count: int, width: int = 1) -> np.ndarray:
+        """
+        항목 start..start+count 의 [0, 1) 균등난수 (count, width)
+        항목 i는 Philox 카운터 i·blocks 부터 사용 → 어떤 구간으로 나눠 요청해도 같은 값
+        """
+        blocks = -(-width // _WORDS_PER_BLOCK)
+        key = self.seed_sequence(stream).generate_state(2, np.uint64)
+        bitgen = np.random.Philox(key=key, counter=int(start) * blocks)
+        raw = bitgen.random_raw(count * blocks * _WORDS_PER_BLOCK).reshape(count, -1)[:, :width]
+        return (raw >> np.uint64(11)).astype(np.float64) * _DOUBLE_SCALE
+
+
+# ============================================================
+# 균등난수 변환 (uniforms 결과용)
+# ============================================================
+
+def categorical(u: np.ndarray, weights: Sequence[float]) -> np.ndarray:
+    """균등난수 → 가중치 인덱스"""
+    cum = np.cumsum(np.asarray(weights, dtype=np.float64))
+    return np.minimum(np.searchsorted(cum / cum[-1], u, side='right'), len(cum) - 1)
+
+
+def normals(u1: np.ndarray, u2: np.ndarray) -> np.ndarray:
+    """Box-Muller 표준정규"""
+    return np.sqrt(-2.0 * np.log1p(-u1)) * np.cos(2 * np.pi * u2)
+
+
+# ============================================================
+# 메인
+# ============================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="DeskWarrior 난수 스트림 확인")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--namespace', default='')
+    parser.add_argument('key', nargs='*', help="스트림 키 (정수 또는 문자열)")
+    args = parser.parse_args()
+
+    streams = RandomStreams(args.seed, args.namespace)
+    key = [int(k) if k.isdigit() else k for k in args.key]
+    ss = streams.seed_sequence(*key)
+    print(f" {streams!r} key={key}")
+    print(f" spawn_key={ss.spawn_key}")
+    print(f" 처음 5개: {np.round(streams.generator(*key).random(5), 6).tolist()}")
+
+
+if __name__ == '__main__':
+    main()
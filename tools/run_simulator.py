@@ -0,0 +1,470 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DeskWarrior 인게임 런 시뮬레이터 (이벤트 기반)
+- 몬스터 단위 진행: calc_monster_hp / calc_boss_hp / calc_gold_earned
+- 처치 이벤트마다 InGameStatGrowth.json 골드 업그레이드 (교체 가능한 소비 정책)
+- 제한시간 = 기본 시간 + time_extend, 처치 보너스는 calc_time_thief로 상한 적용
+- 업적 메트릭 카운터: 입력 수(키보드/마우스), 누적 데미지, 크리티컬 수, 최대 단일 타격
+- N개 세션을 NumPy 배열로 동시에 진행 (세션별 CPS/영구 스탯 지원)
+
+사용법:
+    python tools/run_simulator.py --sessions 100000 --cps 6 --policy efficient
+"""
+
+import argparse
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Union
+
+import numpy as np
+
+from economy_model import StatTable, expected_damage, is_boss_stage, load_json, stage_hp
+from rng_streams import RandomStreams
+import stat_formulas_generated as SF
+
+ArrayLike = Union[float, np.ndarray]
+
+# 안전 상한
+MAX_STAGE = 2000                 # HP 1.2^stage 오버플로 방지
+LEVEL_CAP = 2000                 # 인게임 스탯 비용 테이블 크기
+MAX_PURCHASES_PER_KILL = 64      # 처치 1회당 최대 구매 횟수
+
+# 인게임 스탯 → 런 효과 매핑 (config에 없는 스탯은 0)
+POWER_STATS = ('keyboard_power', 'mouse_power')
+
+
+# ============================================================
+# 영구 스탯 빌드
+# ============================================================
+
+def build_effects(perm_levels: Dict[str, ArrayLike], perm_config: Optional[dict] = None) -> Dict[str, ArrayLike]:
+    """
+    영구 스탯 레벨 → 효과값 dict
+    레벨은 스칼라 또는 세션별 (N,) 배열
+    """
+    if perm_config is None:
+        perm_config = load_json('PermanentStatGrowth.json')
+    stats = perm_config.get('stats', {})
+    effects = {}
+    for stat_id, level in perm_levels.items():
+        if stat_id in stats:
+            effects[stat_id] = stats[stat_id].get('effect_per_level', 1) * np.asarray(level, dtype=np.float64)
+    return effects
+
+
+# ============================================================
+# 배치 상태
+# ============================================================
+
+@dataclass
+class RunBatch:
+    """N개 세션의 현재 상태 (소비 정책이 읽는 값)"""
+    stat_ids: List[str]
+    effect_per_level: np.ndarray     # (S,)
+    keyboard_ratio: np.ndarray       # (N,)
+    stage: np.ndarray                # (N,) int
+    gold: np.ndarray                 # (N,) float (정수값)
+    levels: np.ndarray               # (N, S) int
+    alive: np.ndarray                # (N,) bool
+    elapsed: np.ndarray              # (N,) 누적 전투 시간 (초)
+    kills: np.ndarray                # (N,) int
+    bosses: np.ndarray               # (N,) int
+    gold_earned: np.ndarray          # (N,) float
+    gold_spent: np.ndarray           # (N,) float
+
+    def __len__(self) -> int:
+        return len(self.stage)
+
+    def stat_index(self, stat_id: str) -> int:
+        return self.stat_ids.index(stat_id) if stat_id in self.stat_ids else -1
+
+    def damage_gain(self) -> np.ndarray:
+        """(N, S) 스탯 1레벨당 평균 입력 파워 증가량 (파워 스탯 외 0)"""
+        gain = np.zeros((len(self), len(self.stat_ids)))
+        kb, ms = self.stat_index('keyboard_power'), self.stat_index('mouse_power')
+        if kb >= 0:
+            gain[:, kb] = self.effect_per_level[kb] * self.keyboard_ratio
+        if ms >= 0:
+            gain[:, ms] = self.effect_per_level[ms] * (1 - self.keyboard_ratio)
+        return gain
+
+
+# ============================================================
+# 소비 정책
+# ============================================================
+
+# 정책: (batch, next_cost (N,S)) -> 구매할 스탯 인덱스 (N,), -1 = 구매 안 함
+SpendingPolicy = Callable[[RunBatch, np.ndarray], np.ndarray]
+
+
+def _pick(score: np.ndarray, next_cost: np.ndarray, gold: np.ndarray) -> np.ndarray:
+    """구매 가능한 스탯 중 score 최대값 선택"""
+    affordable = next_cost <= gold[:, None]
+    masked = np.where(affordable, score, -np.inf)
+    choice = np.argmax(masked, axis=1)
+    return np.where(np.isfinite(masked[np.arange(len(choice)), choice]), choice, -1)
+
+
+def no_spending(batch: RunBatch, next_cost: np.ndarray) -> np.ndarray:
+    """업그레이드 안 함 (기존 도구들의 고정 파워 가정)"""
+    return np.full(len(batch), -1)
+
+
+def greedy_cheapest(batch: RunBatch, next_cost: np.ndarray) -> np.ndarray:
+    """가장 싼 업그레이드부터 구매"""
+    return _pick(-next_cost, next_cost, batch.gold)
+
+
+def efficient(batch: RunBatch, next_cost: np.ndarray) -> np.ndarray:
+    """골드당 파워 증가량이 가장 큰 업그레이드 구매"""
+    gain = batch.damage_gain()
+    score = np.where(gain > 0, gain / np.maximum(next_cost, 1), -np.inf)
+    return _pick(score, next_cost, batch.gold)
+
+
+def balanced(batch: RunBatch, next_cost: np.ndarray) -> np.ndarray:
+    """레벨이 가장 낮은 스탯부터 구매 (스탯 레벨 균등 유지)"""
+    return _pick(-batch.levels.astype(np.float64), next_cost, batch.gold)
+
+
+def focus(stat_id: str) -> SpendingPolicy:
+    """지정 스탯만 구매"""
+    def policy(batch: RunBatch, next_cost: np.ndarray) -> np.ndarray:
+        idx = batch.stat_index(stat_id)
+        if idx < 0:
+            return np.full(len(batch), -1)
+        return np.where(next_cost[:, idx] <= batch.gold, idx, -1)
+    policy.__name__ = f"focus_{stat_id}"
+    return policy
+
+
+POLICIES: Dict[str, SpendingPolicy] = {
+    'none': no_spending,
+    'cheapest': greedy_cheapest,
+    'efficient': efficient,
+    'balanced': balanced,
+    'keyboard': focus('keyboard_power'),
+    'mouse': focus('mouse_power'),
+}
+
+
+# ============================================================
+# 결과
+# ============================================================
+
+@dataclass
+class RunResult:
+    """세션별 결과 배열"""
+    max_stage: np.ndarray       # 실패(시간 초과)한 스테이지
+    start_stage: np.ndarray
+    elapsed: np.ndarray         # 전투 시간 합계 (초)
+    kills: np.ndarray
+    bosses: np.ndarray
+    gold_earned: np.ndarray
+    gold_spent: np.ndarray
+    keyboard_inputs: np.ndarray  # 입력 수 기대값 (실패한 몬스터의 제한시간 포함)
+    mouse_inputs: np.ndarray
+    damage: np.ndarray          # 누적 데미지 기대값 (타격 수 × 타격당 데미지)
+    crits: np.ndarray           # 크리티컬 수 기대값
+    max_hit: np.ndarray         # 최대 단일 타격 (크리티컬 1회 기대 데미지)
+    levels: Dict[str, np.ndarray]
+    trace: List[dict] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.max_stage)
+
+    def summary(self, percentiles=(10, 50, 90)) -> dict:
+        """주요 지표 백분위 요약"""
+        out = {}
+        for key in ('max_stage', 'elapsed', 'kills', 'bosses', 'gold_earned'):
+            values = getattr(self, key)
+            out[key] = {f"p{p}": float(np.percentile(values, p)) for p in percentiles}
+            out[key]['mean'] = float(np.mean(values))
+        for stat_id, lv in self.levels.items():
+            out[f"lv_{stat_id}"] = {f"p{p}": float(np.percentile(lv, p)) for p in percentiles}
+        return out
+
+
+# ============================================================
+# 시뮬레이터
+# ============================================================
+
+class RunSimulator:
+    """인게임 런 시뮬레이터 (설정은 생성 시 1회 로드)"""
+
+    def __init__(self, ingame_config: Optional[dict] = None, perm_config: Optional[dict] = None,
+                 level_cap: int = LEVEL_CAP):
+        self.ingame_config = ingame_config or load_json('InGameStatGrowth.json')
+        self.perm_config = perm_config or load_json('PermanentStatGrowth.json')
+        self.table = StatTable.from_config(self.ingame_config)
+        self.level_cap = level_cap
+
+        # (S, level_cap + 2) 레벨 l로 올리는 비용, 최대 레벨 초과는 inf
+        costs = np.full((len(self.table), level_cap + 2), np.inf)
+        costs[:, 1:] = self.table.cost_table(level_cap + 1)
+        for i, max_lv in enumerate(self.table.max_level):
+            if max_lv > 0:
+                costs[i, max_lv + 1:] = np.inf
+        self._raw_costs = costs
+
+    def _effect(self, effects: Dict[str, ArrayLike], stat_id: str, n: int) -> np.ndarray:
+        return np.broadcast_to(np.asarray(effects.get(stat_id, 0.0), dtype=np.float64), (n,))
+
+    def ingame_effect(self, levels: np.ndarray, stat_id: str) -> np.ndarray:
+        if stat_id not in self.table.ids:
+            return np.zeros(len(levels))
+        i = self.table.index(stat_id)
+        return self.table.params[i, 4] * levels[:, i]
+
+    def simulate(self, sessions: int, cps: ArrayLike = 5.0,
+                 perm_levels: Optional[Dict[str, ArrayLike]] = None,
+                 policy: Union[str, SpendingPolicy] = 'efficient',
+                 keyboard_ratio: ArrayLike = 0.5, combo_stack: ArrayLike = 0.0,
+                 max_stage: int = MAX_STAGE, trace: bool = False) -> RunResult:
+        """
+        N개 세션을 시뮬레이션
+
+        cps, keyboard_ratio, combo_stack, perm_levels 값은 스칼라 또는 (N,) 배열
+        combo_stack: 평균 콤보 스택 (0~3, 소수 가능 - 2^stack 배율)
+        trace: True면 0번 세션의 몬스터별 이벤트를 기록
+        """
+        n = sessions
+        if isinstance(policy, str):
+            policy = POLICIES[policy]
+        effects = build_effects(perm_levels or {}, self.perm_config)
+        eff = lambda sid: self._effect(effects, sid, n)
+
+        cps = np.broadcast_to(np.asarray(cps, dtype=np.float64), (n,))
+        ratio = np.broadcast_to(np.asarray(keyboard_ratio, dtype=np.float64), (n,))
+        combo = np.broadcast_to(np.asarray(combo_stack, dtype=np.float64), (n,))
+
+        # 업그레이드 할인 (calc_discounted_cost) - 세션별 할인율이 같으면 테이블 1개
+        discount = eff('upgrade_discount')
+        n_stats = len(self.table)
+
+        # 시작 상태 (GameManager.StartGame과 동일)
+        start_stage = (1 + eff('start_level')).astype(np.int64)
+        levels = np.zeros((n, n_stats), dtype=np.int64)
+        for stat_id, perm_id in (('keyboard_power', 'start_keyboard'), ('mouse_power', 'start_mouse')):
+            if stat_id in self.table.ids:
+                levels[:, self.table.index(stat_id)] = eff(perm_id).astype(np.int64)
+        levels = np.minimum(levels, self.level_cap)
+
+        batch = RunBatch(
+            stat_ids=list(self.table.ids),
+            effect_per_level=self.table.params[:, 4].copy(),
+            keyboard_ratio=ratio,
+            stage=start_stage.copy(),
+            gold=np.trunc(eff('start_gold')).astype(np.float64),
+            levels=levels,
+            alive=np.ones(n, dtype=bool),
+            elapsed=np.zeros(n),
+            kills=np.zeros(n, dtype=np.int64),
+            bosses=np.zeros(n, dtype=np.int64),
+            gold_earned=np.zeros(n),
+            gold_spent=np.zeros(n),
+        )
+
+        base_time = SF.BASE_TIME_LIMIT + eff('time_extend')
+        timer = base_time.copy()
+        max_reached = np.zeros(n, dtype=np.int64)
+        inputs = np.zeros(n)
+        dealt = np.zeros(n)
+        max_hit = np.zeros(n)
+        crit_chance = np.minimum(SF.BASE_CRIT_CHANCE + eff('crit_chance') / 100, 1.0)
+        crit_multi = SF.BASE_CRIT_MULTIPLIER + eff('crit_damage')
+        crit_hit = crit_multi / (1 + crit_chance * (crit_multi - 1))    # 기대 데미지 → 크리티컬 1회
+        gold_flat_perm = eff('gold_flat_perm')
+        gold_multi_perm = eff('gold_multi_perm') / 100
+        events = []
+        rows = np.arange(n)
+
+        while batch.alive.any():
+            idx = np.flatnonzero(batch.alive)
+            stage = batch.stage[idx]
+            lv = batch.levels[idx]
+
+            # --- 전투: 몬스터 1마리 ---
+            kb_power = 1 + self.ingame_effect(lv, 'keyboard_power')
+            ms_power = 1 + self.ingame_effect(lv, 'mouse_power')
+            power = ratio[idx] * kb_power + (1 - ratio[idx]) * ms_power
+            damage = expected_damage(
+                power, eff('base_attack')[idx], eff('attack_percent')[idx],
+                eff('crit_chance')[idx], eff('crit_damage')[idx], eff('multi_hit')[idx],
+                combo[idx], eff('start_combo_damage')[idx] + self.ingame_effect(lv, 'combo_damage'),
+            )
+            hp = stage_hp(stage)
+            ttk = np.ceil(hp / np.maximum(damage, 1.0)) / cps[idx]
+            cleared = (ttk <= timer[idx]) & (stage < max_stage)
+
+            # 처치: 필요한 타격 수, 실패: 제한시간 동안의 입력
+            hits = np.where(cleared, np.ceil(hp / np.maximum(damage, 1.0)),
+                            np.floor(timer[idx] * cps[idx]))
+            inputs[idx] += hits
+            dealt[idx] += hits * damage
+            max_hit[idx] = np.maximum(max_hit[idx], damage * crit_hit[idx])
+
+            failed = idx[~cleared]
+            batch.alive[failed] = False
+            max_reached[failed] = batch.stage[failed]
+
+            won = idx[cleared]
+            if trace and len(idx) and idx[0] == 0:
+                events.append({
+                    'stage': int(stage[0]), 'hp': float(hp[0]), 'damage': float(damage[0]),
+                    'ttk': float(ttk[0]), 'timer': float(timer[0]), 'gold': float(batch.gold[0]),
+                    'levels': {sid: int(lv[0, i]) for i, sid in enumerate(batch.stat_ids)},
+                    'event': 'kill' if cleared[0] else 'timeout',
+                })
+            if not len(won):
+                continue
+
+            # --- 처치: 골드/카운터 ---
+            won_stage = batch.stage[won]
+            won_lv = batch.levels[won]
+            base_gold = np.trunc(won_stage * SF.BASE_GOLD_MULTI)
+            gold = np.trunc(
+                (base_gold + self.ingame_effect(won_lv, 'gold_flat') + gold_flat_perm[won])
+                * (1 + self.ingame_effect(won_lv, 'gold_multi') / 100 + gold_multi_perm[won])
+            )
+            batch.gold[won] += gold
+            batch.gold_earned[won] += gold
+            batch.elapsed[won] += ttk[cleared]
+            batch.kills[won] += 1
+            batch.bosses[won] += is_boss_stage(won_stage)
+            batch.stage[won] += 1
+
+            # 다음 몬스터 타이머 (시간 도둑: 최대 기본시간의 2배)
+            thief = self.ingame_effect(won_lv, 'time_thief')
+            timer[won] = np.minimum(base_time[won] + thief, base_time[won] * 2)
+
+            # --- 업그레이드 구매 ---
+            self.spend(batch, won, policy, discount)
+
+        levels_out = {sid: batch.levels[:, i].copy() for i, sid in enumerate(batch.stat_ids)}
+        return RunResult(
+            max_stage=max_reached,
+            start_stage=start_stage,
+            elapsed=batch.elapsed,
+            kills=batch.kills,
+            bosses=batch.bosses,
+            gold_earned=batch.gold_earned,
+            gold_spent=batch.gold_spent,
+            keyboard_inputs=inputs * ratio,
+            mouse_inputs=inputs * (1 - ratio),
+            damage=dealt,
+            crits=inputs * crit_chance,
+            max_hit=max_hit,
+            levels=levels_out,
+            trace=events,
+        )
+
+    def level_costs(self, stat_id: str, discount: float = 0.0) -> np.ndarray:
+        """스탯 1개의 레벨 l로 올리는 비용 (l = 0..level_cap + 1, calc_discounted_cost 적용, 구매 불가는 inf)"""
+        raw = self._raw_costs[self.table.index(stat_id)]
+        return np.where(np.isfinite(raw), np.trunc(raw * (1 - discount / 100)), np.inf)
+
+    def next_costs(self, levels: np.ndarray, discount: np.ndarray) -> np.ndarray:
+        """(M, S) 다음 레벨 비용 (calc_discounted_cost 적용)"""
+        nxt = np.minimum(levels + 1, self.level_cap + 1)
+        raw = self._raw_costs[np.arange(levels.shape[1])[None, :], nxt]
+        return np.where(np.isfinite(raw), np.trunc(raw * (1 - discount[:, None] / 100)), np.inf)
+
+    def spend(self, batch: RunBatch, idx: np.ndarray, policy: SpendingPolicy, discount: np.ndarray):
+        """처치 직후 정책에 따라 구매 반복 (구매할 것이 없을 때까지)"""
+        active = idx
+        for _ in range(MAX_PURCHASES_PER_KILL):
+            if not len(active):
+                return
+            sub = _subset(batch, active)
+            next_cost = self.next_costs(sub.levels, discount[active])
+            choice = np.asarray(policy(sub, next_cost))
+            buy = choice >= 0
+            price = np.where(buy, next_cost[np.arange(len(active)), np.maximum(choice, 0)], np.inf)
+            buy &= price <= sub.gold
+            if not buy.any():
+                return
+            who = active[buy]
+            batch.gold[who] -= price[buy]
+            batch.gold_spent[who] += price[buy]
+            batch.levels[who, choice[buy]] += 1
+            active = who
+
+
+def _subset(batch: RunBatch, idx: np.ndarray) -> RunBatch:
+    """정책에 넘길 부분 배치 (복사본)"""
+    return RunBatch(
+        stat_ids=batch.stat_ids,
+        effect_per_level=batch.effect_per_level,
+        keyboard_ratio=batch.keyboard_ratio[idx],
+        stage=batch.stage[idx],
+        gold=batch.gold[idx],
+        levels=batch.levels[idx],
+        alive=batch.alive[idx],
+        elapsed=batch.elapsed[idx],
+        kills=batch.kills[idx],
+        bosses=batch.bosses[idx],
+        gold_earned=batch.gold_earned[idx],
+        gold_spent=batch.gold_spent[idx],
+    )
+
+
+# ============================================================
+# 메인
+# ============================================================
+
+def print_summary(result: RunResult):
+    summary = result.summary()
+    print(f"\n{'='*70}")
+    print(f" 런 시뮬레이션 결과 ({len(result):,} 세션)")
+    print(f"{'='*70}")
+    print(f" {'지표':<18} | {'p10':>12} | {'p50':>12} | {'p90':>12} | {'평균':>12}")
+    print(f"{'-'*70}")
+    for key, row in summary.items():
+        mean = row.get('mean')
+        mean_str = f"{mean:>12,.1f}" if mean is not None else f"{'':>12}"
+        print(f" {key:<18} | {row['p10']:>12,.1f} | {row['p50']:>12,.1f} | {row['p90']:>12,.1f} | {mean_str}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DeskWarrior 인게임 런 시뮬레이터")
+    parser.add_argument('--sessions', type=int, default=100000)
+    parser.add_argument('--cps', type=float, default=5.0, help="평균 CPS")
+    parser.add_argument('--cps-spread', type=float, default=0.0, help="세션별 CPS 표준편차 (0=고정)")
+    parser.add_argument('--policy', choices=sorted(POLICIES), default='efficient')
+    parser.add_argument('--combo', type=float, default=0.0, help="평균 콤보 스택 (0~3)")
+    parser.add_argument('--levels', choices=['none', 'player'], default='player',
+                        help="영구 스탯: none=전부 0, player=PlayerLevels.json")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--trace', action='store_true', help="0번 세션 몬스터별 기록 출력")
+    args = parser.parse_args()
+
+    perm_levels = {}
+    if args.levels == 'player':
+        perm_levels = load_json('PlayerLevels.json').get('permanent_levels', {})
+
+    cps = args.cps
+    if args.cps_spread > 0:
+        rng = RandomStreams(args.seed, 'run_simulator').generator('cps')
+        cps = np.clip(rng.normal(args.cps, args.cps_spread, args.sessions), 0.5, None)
+
+    sim = RunSimulator()
+    started = time.perf_counter()
+    result = sim.simulate(args.sessions, cps=cps, perm_levels=perm_levels, policy=args.policy,
+                          combo_stack=args.combo, trace=args.trace)
+    elapsed = time.perf_counter() - started
+
+    print_summary(result)
+    rate = args.sessions / elapsed * 60 if elapsed > 0 else float('inf')
+    print(f"\n {elapsed:.2f}초 ({rate:,.0f} 세션/분)")
+
+    if args.trace:
+        print(f"\n{'스테이지':>8} | {'HP':>14} | {'데미지':>10} | {'TTK':>7} | {'타이머':>6} | {'골드':>10} | 이벤트")
+        for e in result.trace:
+            print(f"{e['stage']:>8} | {e['hp']:>14,.0f} | {e['damage']:>10,.1f} | {e['ttk']:>7.2f} | "
+                  f"{e['timer']:>6.0f} | {e['gold']:>10,.0f} | {e['event']} {e['levels']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DeskWarrior 전역 민감도 분석
+- 누적 비용 탄력성: 공식에서 해석적으로 계산 (∂lnC/∂lnp)
+- 전 스탯 × 전 파라미터 Sobol 지수 (Saltelli/Jansen 추정량)
+- 준난수(quasi-random) 샘플링, NumPy 배치 평가, 프로세스 분산
+
+사용법:
+    python tools/sensitivity_analysis.py
+    python tools/sensitivity_analysis.py --samples 2048 --workers 8 --output required_cps
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from economy_model import (
+    PARAM_KEYS,
+    StatTable,
+    cumulative_costs,
+    expected_damage,
+    stage_hp,
+)
+import stat_formulas_generated as SF
+
+# 기본 분석 조건
+DEFAULT_MAX_LEVEL = 30
+DEFAULT_STAGE = 50
+DEFAULT_BASE_POWER = 10
+DEFAULT_VARIATION = 0.3  # ±30%
+
+# 모델 출력 (모두 log10 스케일로 평가 - 배수형 파라미터끼리 비교 가능하도록)
+OUTPUT_KEYS = ('perm_cost', 'ingame_cost', 'required_cps')
+
+
+# ============================================================
+# 해석적 탄력성
+# ============================================================
+
+def cost_elasticities(params: np.ndarray, max_level: int) -> np.ndarray:
+    """
+    누적 비용 C(L) = Σ b(1 + l·g)·m^(l/s) 의 파라미터 탄력성 (∂lnC/∂lnp)
+
+    params: (n, 5) PARAM_KEYS 순서
+    반환: (n, 5) - effect_per_level 열은 비용과 무관하므로 0
+    """
+    p = np.asarray(params, dtype=np.float64)
+    b, g, m, s = (p[:, i:i + 1] for i in range(4))
+    lv = np.arange(1, max_level + 1, dtype=np.float64)
+
+    linear = 1 + lv * g
+    expo = np.power(m, lv / s)
+    terms = b * linear * expo                      # (n, L)
+    total = terms.sum(axis=1)
+    safe_total = np.where(total > 0, total, 1.0)
+
+    out = np.zeros_like(p)
+    out[:, 0] = 1.0                                                  # C ∝ b
+    out[:, 1] = (b * lv * g * expo).sum(axis=1) / safe_total         # g·∂C/∂g
+    out[:, 2] = (terms * lv / s).sum(axis=1) / safe_total            # m·∂C/∂m
+    out[:, 3] = -(terms * np.log(m) * lv / s).sum(axis=1) / safe_total  # s·∂C/∂s
+    out[total <= 0] = 0.0
+    return out
+
+
+# ============================================================
+# 경제 모델 (배치 평가)
+# ============================================================
+
+@dataclass
+class EconomySpace:
+    """민감도 분석 대상 파라미터 공간"""
+    perm: StatTable
+    ingame: StatTable
+    max_level: int = DEFAULT_MAX_LEVEL
+    stage: int = DEFAULT_STAGE
+    base_power: float = DEFAULT_BASE_POWER
+    variation: float = DEFAULT_VARIATION
+
+    @property
+    def n_perm(self) -> int:
+        return len(self.perm)
+
+    @property
+    def dim(self) -> int:
+        return (len(self.perm) + len(self.ingame)) * len(PARAM_KEYS)
+
+    def labels(self) -> List[tuple]:
+        """[(stat_type, stat_id, param), ...] - 차원 순서"""
+        out = []
+        for stype, table in (('permanent', self.perm), ('ingame', self.ingame)):
+            for sid in table.ids:
+                for param in PARAM_KEYS:
+                    out.append((stype, sid, param))
+        return out
+
+    def nominal(self) -> np.ndarray:
+        """(dim,) 현재 설정값"""
+        return np.concatenate([self.perm.params.ravel(), self.ingame.params.ravel()])
+
+    def scale(self, unit: np.ndarray) -> np.ndarray:
+        """[0,1) 단위 샘플 → 설정값 × (1 ± variation)"""
+        nominal = self.nominal()
+        return nominal * (1 + self.variation * (2 * unit - 1))
+
+    def evaluate(self, x: np.ndarray) -> Dict[str, np.ndarray]:
+        """(N, dim) 파라미터 행렬 → 출력별 (N,) 배열 (log10)"""
+        n_perm_flat = self.n_perm * len(PARAM_KEYS)
+        perm = x[:, :n_perm_flat].reshape(len(x), self.n_perm, len(PARAM_KEYS))
+        ingame = x[:, n_perm_flat:].reshape(len(x), len(self.ingame), len(PARAM_KEYS))
+
+        perm_cost = cumulative_costs(perm, self.max_level, truncate=False).sum(axis=1)
+        ingame_cost = cumulative_costs(ingame, self.max_level, truncate=False).sum(axis=1)
+
+        # 모든 영구 스탯이 max_level일 때의 필요 CPS
+        effect = perm[:, :, PARAM_KEYS.index('effect_per_level')] * self.max_level
+
+        def eff(stat_id):
+            return effect[:, self.perm.index(stat_id)] if stat_id in self.perm.ids else 0.0
+
+        power = self.base_power + (eff('start_keyboard') + eff('start_mouse')) / 2
+        damage = expected_damage(
+            power, eff('base_attack'), eff('attack_percent'), eff('crit_chance'),
+            eff('crit_damage'), eff('multi_hit'), 0, eff('start_combo_damage'),
+        )
+        time_limit = SF.BASE_TIME_LIMIT + eff('time_extend')
+        cps = stage_hp(self.stage) / np.maximum(damage, 1e-9) / time_limit
+
+        return {
+            'perm_cost': np.log10(np.maximum(perm_cost, 1e-12)),
+            'ingame_cost': np.log10(np.maximum(ingame_cost, 1e-12)),
+            'required_cps': np.log10(np.maximum(cps, 1e-12)),
+        }
+
+
+# ============================================================
+# 준난수 샘플링
+# ============================================================
+
+def kronecker(n: int, dim: int, seed: Optional[int] = None) -> np.ndarray:
+    """
+    무작위 시프트 R2(Kronecker) 수열 (n, dim)
+    x_k = frac(shift + k·α), α_j = φ_d^-(j+1) (φ_d: x^(d+1) = x + 1 의 해)
+    Halton과 달리 고차원(수백 차원)에서도 차원 간 상관이 작음
+    """
+    phi = 2.0
+    for _ in range(64):
+        phi = (1 + phi) ** (1 / (dim + 1))
+    alpha = np.mod(1 / np.power(phi, np.arange(1, dim + 1)), 1.0)
+    shift = np.random.default_rng(seed).random(dim)
+    return np.mod(shift + np.outer(np.arange(1, n + 1), alpha), 1.0)
+
+
+def quasi_random(n: int, dim: int, seed: Optional[int] = None) -> np.ndarray:
+    """Sobol 수열 (scipy 사용 가능 시) 또는 R2 수열"""
+    try:
+        from scipy.stats import qmc
+    except ImportError:
+        return kronecker(n, dim, seed)
+    return qmc.Sobol(d=dim, scramble=True, seed=seed).random(n)
+
+
+# ============================================================
+# Sobol 지수 (Saltelli 2010 / Jansen 1999)
+# ============================================================
+
+def _evaluate_columns(space: EconomySpace, a: np.ndarray, b: np.ndarray,
+                      columns: Sequence[int]) -> Dict[int, Dict[str, np.ndarray]]:
+    """A 행렬의 i번째 열을 B로 교체한 AB_i 들을 평가 (워커 단위 작업)"""
+    results = {}
+    for i in columns:
+        ab = a.copy()
+        ab[:, i] = b[:, i]
+        results[i] = space.evaluate(ab)
+    return results
+
+
+def sobol_indices(space: EconomySpace, samples: int = 1024, workers: int = 0,
+                  seed: Optional[int] = 0) -> Dict[str, Dict[str, np.ndarray]]:
+    """
+    1차(S1)/전체(ST) Sobol 지수
+
+    평가 횟수: samples × (dim + 2)
+    workers: 0이면 CPU 수, 1이면 단일 프로세스
+    반환: {output: {'S1': (dim,), 'ST': (dim,)}}
+    """
+    dim = space.dim
+    unit = quasi_random(samples, 2 * dim, seed)
+    a = space.scale(unit[:, :dim])
+    b = space.scale(unit[:, dim:])
+
+    f_a = space.evaluate(a)
+    f_b = space.evaluate(b)
+
+    workers = workers or os.cpu_count() or 1
+    chunks = [list(range(dim))[i::workers] for i in range(workers)]
+    f_ab = {}
+    if workers == 1:
+        f_ab = _evaluate_columns(space, a, b, chunks[0])
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_evaluate_columns, space, a, b, c) for c in chunks if c]
+            for fut in futures:
+                f_ab.update(fut.result())
+
+    indices = {}
+    for key in OUTPUT_KEYS:
+        # 평균을 빼서 S1 추정량의 분산을 줄임
+        mean = np.mean(np.concatenate([f_a[key], f_b[key]]))
+        ya, yb = f_a[key] - mean, f_b[key] - mean
+        var = np.var(np.concatenate([ya, yb]))
+        s1 = np.zeros(dim)
+        st = np.zeros(dim)
+        if var > 0:
+            for i in range(dim):
+                yab = f_ab[i][key] - mean
+                s1[i] = np.mean(yb * (yab - ya)) / var
+                st[i] = 0.5 * np.mean((ya - yab) ** 2) / var
+        indices[key] = {'S1': s1, 'ST': st}
+    return indices
+
+
+# ============================================================
+# 랭킹 테이블
+# ============================================================
+
+def ranked_table(space: EconomySpace, indices: Dict[str, Dict[str, np.ndarray]],
+                 output: str = 'required_cps', top: int = 0) -> List[dict]:
+    """ST 기준 '어떤 노브가 가장 중요한가' 테이블"""
+    labels = space.labels()
+    perm_el = cost_elasticities(space.perm.params, space.max_level)
+    ingame_el = cost_elasticities(space.ingame.params, space.max_level)
+    elasticity = np.concatenate([perm_el.ravel(), ingame_el.ravel()])
+
+    rows = []
+    for i, (stype, sid, param) in enumerate(labels):
+        rows.append({
+            'type': stype,
+            'stat': sid,
+            'param': param,
+            'S1': float(indices[output]['S1'][i]),
+            'ST': float(indices[output]['ST'][i]),
+            'cost_elasticity': float(elasticity[i]),
+        })
+    rows.sort(key=lambda r: r['ST'], reverse=True)
+    return rows[:top] if top else rows
+
+
+def print_ranked_table(rows: List[dict], output: str):
+    print(f"\n{'='*86}")
+    print(f" 전역 민감도 랭킹 (출력: log10 {output})")
+    print(f"{'='*86}")
+    print(f" {'순위':>4} | {'스탯':<20} | {'파라미터':<16} | {'S1':>7} | {'ST':>7} | {'비용 탄력성':>10}")
+    print(f"{'-'*86}")
+    for rank, r in enumerate(rows, 1):
+        print(f" {rank:>4} | {r['stat']:<20} | {r['param']:<16} | "
+              f"{r['S1']:>7.3f} | {r['ST']:>7.3f} | {r['cost_elasticity']:>10.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DeskWarrior 전역 민감도 분석")
+    parser.add_argument('--samples', type=int, default=1024, help="기본 샘플 수 N (평가 N×(D+2)회)")
+    parser.add_argument('--workers', type=int, default=0, help="프로세스 수 (0=CPU 수)")
+    parser.add_argument('--level', type=int, default=DEFAULT_MAX_LEVEL, help="누적 비용/효과 기준 레벨")
+    parser.add_argument('--stage', type=int, default=DEFAULT_STAGE, help="필요 CPS 기준 스테이지")
+    parser.add_argument('--variation', type=float, default=DEFAULT_VARIATION, help="파라미터 변동폭 (0.3=±30%%)")
+    parser.add_argument('--output', choices=OUTPUT_KEYS, default='required_cps', help="랭킹 기준 출력")
+    parser.add_argument('--top', type=int, default=25, help="출력할 상위 항목 수 (0=전체)")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    space = EconomySpace(
+        perm=StatTable.load('PermanentStatGrowth.json'),
+        ingame=StatTable.load('InGameStatGrowth.json'),
+        max_level=args.level,
+        stage=args.stage,
+        variation=args.variation,
+    )
+
+    started = time.perf_counter()
+    indices = sobol_indices(space, args.samples, args.workers, args.seed)
+    elapsed = time.perf_counter() - started
+
+    evaluations = args.samples * (space.dim + 2)
+    print(f"\n 파라미터 {space.dim}개, 평가 {evaluations:,}회, {elapsed:.2f}초")
+    print_ranked_table(ranked_table(space, indices, args.output, args.top), args.output)
+
+    dead = [r for r in ranked_table(space, indices, args.output) if r['ST'] < 1e-4]
+    if dead:
+        examples = ', '.join(f"{r['stat']}.{r['param']}" for r in dead[:5])
+        print(f"\n[INFO] {args.output}에 영향 없는 파라미터 {len(dead)}개 (예: {examples})")
+
+
+if __name__ == '__main__':
+    main()
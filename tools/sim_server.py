@@ -0,0 +1,601 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DeskWarrior 로컬 시뮬레이션 서버 (웹 대시보드용 JSON-RPC)
+- asyncio HTTP 서버: POST /rpc (JSON-RPC 2.0), GET /jobs/<id>/events (SSE 진행률),
+  POST /curves/<kind> (곡선 배열 바이너리, curve_transport 형식)
+- 시뮬레이션(스테이지 도달, 프리셋 비교, 스탯 스윕)은 프로세스 풀에서 실행
+  요청을 점(CPS/프리셋/레벨) 단위 작업으로 나눠 완료된 작업 수를 진행률로 보고
+- 같은 요청(메서드 + 파라미터)이 진행 중이면 새로 계산하지 않고 같은 작업을 공유
+- 취소: rpc cancel / DELETE /jobs/<id>, 직접 호출은 기다리던 연결이 모두 끊기면 취소
+- pywebview(dashboard_app 이 백그라운드 스레드로 실행)와 브라우저 fetch 모두 접근 가능
+  CORS 는 로컬 출처(localhost / 127.0.0.1 / file:// 의 'null')만 허용, 다른 출처의 브라우저 요청은 403
+
+사용법:
+    python tools/sim_server.py --port 8765 --workers 4
+
+    curl -X POST http://127.0.0.1:8765/rpc \\
+         -d '{"jsonrpc": "2.0", "id": 1, "method": "stage_reach", "params": {"cps": [3, 6, 9]}}'
+"""
+
+import argparse
+import asyncio
+import contextvars
+import hashlib
+import itertools
+import json
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from curve_transport import CURVES, build_curves
+from economy_model import load_json
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+MAX_SESSIONS = 200000           # 작업 1개의 세션 수 상한 (점 수 × 세션)
+MAX_TASKS = 512                 # 요청 1개의 작업 수 상한
+KEEP_FINISHED = 64              # 상태/SSE 조회용으로 보관할 끝난 작업 수
+MAX_BODY = 1 << 20
+# 허용 출처: 로컬 http(s) (포트 무관) + file:// 페이지(pywebview)가 보내는 'null'
+LOCAL_ORIGIN = re.compile(r'^(https?://(localhost|127\.0\.0\.1|\[::1\])(:\d+)?|null)$')
+_ORIGIN: contextvars.ContextVar = contextvars.ContextVar('origin', default=None)   # 연결(태스크)별
+
+# JSON-RPC 오류 코드
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+JOB_FAILED = -32000
+JOB_CANCELLED = -32001
+
+
+class RpcError(Exception):
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+
+
+# ============================================================
+# 워커 (프로세스 풀에서 실행)
+# ============================================================
+
+SIM_CONFIGS = ('InGameStatGrowth.json', 'PermanentStatGrowth.json')   # RunSimulator 가 읽는 config
+
+_RUN_SIM: Optional[Tuple[str, Any]] = None     # (config 내용 해시, RunSimulator)
+
+
+def _run_simulator():
+    """워커의 RunSimulator (대시보드가 config 를 저장하면 내용 해시가 바뀌어 다시 생성)"""
+    global _RUN_SIM
+    from result_cache import RESULT_CACHE
+    from run_simulator import RunSimulator
+    config_hash = RESULT_CACHE.config_hash(SIM_CONFIGS)
+    if _RUN_SIM is None or _RUN_SIM[0] != config_hash:
+        _RUN_SIM = (config_hash, RunSimulator())
+    return _RUN_SIM[1]
+
+
+def _simulate(levels: Dict[str, int], cps: List[float], sessions: int, policy: str,
+              keyboard_ratio: float, combo: float) -> List[dict]:
+    """영구 레벨 1세트 × CPS 목록 → CPS별 최대 스테이지 요약 (한 번의 배열 시뮬레이션)"""
+    cps_all = np.repeat(np.asarray(cps, dtype=np.float64), sessions)
+    result = _run_simulator().simulate(len(cps_all), cps=cps_all, perm_levels=levels, policy=policy,
+                                       keyboard_ratio=keyboard_ratio, combo_stack=combo)
+    rows = []
+    for i, c in enumerate(cps):
+        sl = slice(i * sessions, (i + 1) * sessions)
+        stages = result.max_stage[sl]
+        p10, p50, p90 = np.percentile(stages, (10, 50, 90))
+        rows.append({
+            'cps': float(c), 'mean': float(stages.mean()), 'p10': float(p10), 'p50': float(p50),
+            'p90': float(p90), 'kills': float(result.kills[sl].mean()),
+            'gold_earned': float(result.gold_earned[sl].mean()),
+        })
+    return rows
+
+
+# ============================================================
+# 메서드 (파라미터 → 작업 목록 + 결과 조립)
+# ============================================================
+
+Task = Tuple[Dict[str, int], List[float], int, str, float, float]
+Plan = Tuple[List[Task], Callable[[List[Any]], Any]]
+
+
+def _common(params: dict) -> Tuple[List[float], int, str, float, float]:
+    from run_simulator import POLICIES
+    cps = params.get('cps', [5.0])
+    cps = [float(c) for c in (cps if isinstance(cps, list) else [cps])]
+    sessions = int(params.get('sessions', 1))
+    policy = params.get('policy', 'efficient')
+    if not cps or any(c <= 0 for c in cps):
+        raise RpcError(INVALID_PARAMS, "cps 는 양수여야 합니다")
+    if sessions < 1 or sessions * len(cps) > MAX_SESSIONS:
+        raise RpcError(INVALID_PARAMS, f"sessions × cps 수는 1~{MAX_SESSIONS} 이어야 합니다")
+    if policy not in POLICIES:
+        raise RpcError(INVALID_PARAMS, f"알 수 없는 정책: {policy}")
+    return cps, sessions, policy, float(params.get('keyboard_ratio', 0.5)), float(params.get('combo', 0.0))
+
+
+def _levels(value: Any) -> Dict[str, int]:
+    if not isinstance(value, dict):
+        raise RpcError(INVALID_PARAMS, "levels 는 {스탯: 레벨} 객체여야 합니다")
+    return {str(k): int(v) for k, v in value.items()}
+
+
+def plan_stage_reach(params: dict) -> Plan:
+    """{levels, cps[], sessions, policy} → CPS별 최대 스테이지 (CPS 하나가 작업 하나)"""
+    cps, sessions, policy, ratio, combo = _common(params)
+    levels = _levels(params.get('levels', {}))
+    tasks = [(levels, [c], sessions, policy, ratio, combo) for c in cps]
+    return tasks, lambda parts: {'rows': [row for part in parts for row in part]}
+
+
+def plan_compare_presets(params: dict) -> Plan:
+    """{presets: [id] | {id: levels}, cps[], ...} → 프리셋별 CPS 행 (프리셋 하나가 작업 하나)"""
+    cps, sessions, policy, ratio, combo = _common(params)
+    presets = params.get('presets')
+    if presets is None or isinstance(presets, list):
+        stored = load_json('BalancePresets.json').get('presets', {})
+        ids = presets if presets is not None else list(stored)
+        missing = [pid for pid in ids if pid not in stored]
+        if missing:
+            raise RpcError(INVALID_PARAMS, f"없는 프리셋: {', '.join(missing)}")
+        presets = {pid: stored[pid].get('levels', {}) for pid in ids}
+    ids = list(presets)
+    tasks = [(_levels(presets[pid]), cps, sessions, policy, ratio, combo) for pid in ids]
+    return tasks, lambda parts: {'presets': dict(zip(ids, parts))}
+
+
+def plan_sweep(params: dict) -> Plan:
+    """{stat, values[] | {start, stop, step}, levels, cps[], ...} → 레벨별 CPS 행"""
+    cps, sessions, policy, ratio, combo = _common(params)
+    stat = params.get('stat')
+    if not isinstance(stat, str):
+        raise RpcError(INVALID_PARAMS, "stat 이 필요합니다")
+    values = params.get('values')
+    if isinstance(values, dict):
+        values = list(range(int(values.get('start', 0)), int(values['stop']) + 1, int(values.get('step', 1))))
+    if not isinstance(values, list) or not values:
+        raise RpcError(INVALID_PARAMS, "values 는 레벨 목록 또는 {start, stop, step} 이어야 합니다")
+    base = _levels(params.get('levels', {}))
+    tasks = [(dict(base, **{stat: int(v)}), cps, sessions, policy, ratio, combo) for v in values]
+    return tasks, lambda parts: {'stat': stat, 'values': [int(v) for v in values], 'rows': parts}
+
+
+METHODS: Dict[str, Callable[[dict], Plan]] = {
+    'stage_reach': plan_stage_reach,
+    'compare_presets': plan_compare_presets,
+    'sweep': plan_sweep,
+}
+
+
+def request_key(method: str, params: dict) -> str:
+    """중복 판정 키 (키 순서와 무관한 JSON 해시)"""
+    payload = json.dumps([method, params], sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+# ============================================================
+# 작업
+# ============================================================
+
+@dataclass
+class Job:
+    """진행 중/끝난 요청 하나 (같은 키의 요청이 공유)"""
+    id: str
+    key: str
+    method: str
+    tasks: List[Task]
+    assemble: Callable[[List[Any]], Any]
+    pinned: bool = False                # submit 으로 만든 작업: 연결이 끊겨도 계속
+    state: str = 'pending'              # pending / running / done / error / cancelled
+    done: int = 0
+    result: Any = None
+    error: Optional[str] = None
+    holders: int = 0
+    runner: Optional[asyncio.Task] = None
+    listeners: List[asyncio.Queue] = field(default_factory=list)
+
+    @property
+    def finished(self) -> bool:
+        return self.state in ('done', 'error', 'cancelled')
+
+    def snapshot(self) -> dict:
+        out = {'job': self.id, 'method': self.method, 'state': self.state,
+               'done': self.done, 'total': len(self.tasks)}
+        if self.state == 'done':
+            out['result'] = self.result
+        if self.error:
+            out['error'] = self.error
+        return out
+
+    def _publish(self, event: str, data: dict):
+        for queue in self.listeners:
+            queue.put_nowait((event, data))
+
+    async def run(self, executor: Executor):
+        loop = asyncio.get_running_loop()
+        self.state = 'running'
+        futures = {loop.run_in_executor(executor, _simulate, *task): i for i, task in enumerate(self.tasks)}
+        parts: List[Any] = [None] * len(self.tasks)
+        try:
+            pending = set(futures)
+            while pending:
+                finished, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for fut in finished:
+                    parts[futures[fut]] = fut.result()
+                    self.done += 1
+                self._publish('progress', {'done': self.done, 'total': len(self.tasks)})
+            self.result = self.assemble(parts)
+            self.state = 'done'
+            self._publish('result', self.snapshot())
+        except asyncio.CancelledError:
+            for fut in futures:
+                fut.cancel()        # 아직 시작 안 한 작업은 풀에서 빠짐
+            self.state = 'cancelled'
+            self._publish('cancelled', self.snapshot())
+        except Exception as e:
+            for fut in futures:
+                fut.cancel()
+            self.state, self.error = 'error', f"{type(e).__name__}: {e}"
+            self._publish('error', self.snapshot())
+
+    def cancel(self):
+        if self.runner is not None and not self.finished:
+            self.runner.cancel()
+
+    def release(self):
+        """직접 호출한 연결 하나가 떠남 → 아무도 안 기다리면 취소"""
+        self.holders -= 1
+        if self.holders <= 0 and not self.pinned and not self.listeners:
+            self.cancel()
+
+
+# ============================================================
+# 서버
+# ============================================================
+
+class SimServer:
+    """JSON-RPC + SSE 서버 (이벤트 루프 1개 + 프로세스 풀)"""
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, workers: int = 0,
+                 executor: Optional[Executor] = None):
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ids = itertools.count(1)
+        self.jobs: 'OrderedDict[str, Job]' = OrderedDict()
+        self.inflight: Dict[str, Job] = {}
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers or None)
+        return self._executor
+
+    # --- 수명 ---
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        for job in list(self.inflight.values()):
+            job.cancel()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def start_in_thread(self) -> str:
+        """백그라운드 스레드에서 실행 (pywebview 등 다른 메인 루프용) → URL"""
+        ready = threading.Event()
+        failure: List[BaseException] = []
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            try:
+                self._loop.run_until_complete(self.start())
+            except BaseException as e:
+                failure.append(e)
+                ready.set()
+                return
+            ready.set()
+            self._loop.run_forever()
+            self._loop.run_until_complete(self.close())
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, name='sim-server', daemon=True)
+        self._thread.start()
+        ready.wait()
+        if failure:
+            raise failure[0]
+        return self.url
+
+    def stop(self):
+        if self._loop is not None and self._thread is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    # --- 작업 관리 ---
+
+    def submit(self, method: str, params: dict, pinned: bool = False) -> Tuple[Job, bool]:
+        """작업 시작 (같은 요청이 진행 중이면 그 작업) → (작업, 중복 여부)"""
+        if method not in METHODS:
+            raise RpcError(METHOD_NOT_FOUND, f"알 수 없는 메서드: {method}")
+        if not isinstance(params, dict):
+            raise RpcError(INVALID_PARAMS, "params 는 객체여야 합니다")
+        key = request_key(method, params)
+        job = self.inflight.get(key)
+        if job is not None and not job.finished:
+            job.pinned = job.pinned or pinned
+            return job, True
+
+        try:
+            tasks, assemble = METHODS[method](params)
+        except RpcError:
+            raise
+        except (KeyError, TypeError, ValueError) as e:
+            raise RpcError(INVALID_PARAMS, f"{type(e).__name__}: {e}")
+        if len(tasks) > MAX_TASKS:
+            raise RpcError(INVALID_PARAMS, f"작업이 너무 많습니다 ({len(tasks)} > {MAX_TASKS})")
+
+        job = Job(str(next(self._ids)), key, method, tasks, assemble, pinned=pinned)
+        self.jobs[job.id] = job
+        self.inflight[key] = job
+        job.runner = asyncio.get_running_loop().create_task(self._run(job))
+        while len(self.jobs) > KEEP_FINISHED:
+            oldest = next((j for j in self.jobs.values() if j.finished), None)
+            if oldest is None:
+                break
+            del self.jobs[oldest.id]
+        return job, False
+
+    async def _run(self, job: Job):
+        try:
+            await job.run(self.executor)
+        finally:
+            if self.inflight.get(job.key) is job:
+                del self.inflight[job.key]
+
+    def _job(self, params: Any) -> Job:
+        job_id = str(params.get('job') if isinstance(params, dict) else params)
+        if job_id not in self.jobs:
+            raise RpcError(INVALID_PARAMS, f"없는 작업: {job_id}")
+        return self.jobs[job_id]
+
+    # --- JSON-RPC ---
+
+    async def dispatch(self, method: str, params: Any, disconnected: asyncio.Future) -> Any:
+        if method == 'ping':
+            return {'ok': True, 'methods': sorted(METHODS), 'curves': sorted(CURVES)}
+        if method == 'submit':
+            if not isinstance(params, dict) or 'method' not in params:
+                raise RpcError(INVALID_PARAMS, "submit 은 {method, params} 가 필요합니다")
+            job, dedup = self.submit(params['method'], params.get('params', {}), pinned=True)
+            return dict(job.snapshot(), deduplicated=dedup)
+        if method == 'status':
+            return self._job(params).snapshot()
+        if method == 'cancel':
+            job = self._job(params)
+            job.cancel()
+            if job.runner is not None:
+                await asyncio.wait({job.runner})
+            return job.snapshot()
+
+        job, _ = self.submit(method, params if params is not None else {})
+        job.holders += 1
+        try:
+            await asyncio.wait({job.runner, disconnected}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            job.release()
+        if job.state == 'done':
+            return job.result
+        if job.state == 'error':
+            raise RpcError(JOB_FAILED, job.error or '작업 실패')
+        raise RpcError(JOB_CANCELLED, '작업이 취소되었습니다')
+
+    async def _rpc(self, body: bytes, disconnected: asyncio.Future) -> dict:
+        try:
+            request = json.loads(body.decode('utf-8'))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            return {'jsonrpc': '2.0', 'id': None, 'error': {'code': PARSE_ERROR, 'message': str(e)}}
+        rid = request.get('id') if isinstance(request, dict) else None
+        if not isinstance(request, dict) or not isinstance(request.get('method'), str):
+            return {'jsonrpc': '2.0', 'id': rid, 'error': {'code': INVALID_REQUEST, 'message': 'method 가 필요합니다'}}
+        try:
+            result = await self.dispatch(request['method'], request.get('params'), disconnected)
+        except RpcError as e:
+            return {'jsonrpc': '2.0', 'id': rid, 'error': {'code': e.code, 'message': str(e)}}
+        return {'jsonrpc': '2.0', 'id': rid, 'result': result}
+
+    # --- HTTP ---
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            head = await reader.readuntil(b'\r\n\r\n')
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            writer.close()
+            return
+        lines = head.decode('latin-1').split('\r\n')
+        try:
+            method, path, _ = lines[0].split(' ', 2)
+        except ValueError:
+            writer.close()
+            return
+        headers = {k.strip().lower(): v.strip() for k, _, v in (h.partition(':') for h in lines[1:] if h)}
+        origin = headers.get('origin')
+        _ORIGIN.set(origin)
+
+        try:
+            if origin is not None and not LOCAL_ORIGIN.match(origin):
+                await self._respond_json(writer, 403, {'error': 'origin not allowed'})
+            elif method == 'OPTIONS':
+                await self._respond(writer, 204, b'')
+            elif method == 'GET' and path in ('/', '/health'):
+                await self._respond_json(writer, 200, {'ok': True, 'methods': sorted(METHODS),
+                                                       'curves': sorted(CURVES)})
+            elif method == 'POST' and path == '/rpc':
+                length = _content_length(headers)
+                if length is None:
+                    await self._respond_json(writer, 400, {'jsonrpc': '2.0', 'id': None, 'error': {
+                        'code': INVALID_REQUEST, 'message': f'Content-Length 는 0~{MAX_BODY} 이어야 합니다'}})
+                    return
+                body = await reader.readexactly(length)
+                # 응답 전에 연결이 끊기면 (EOF) 기다리던 작업을 놓음
+                disconnected = asyncio.ensure_future(reader.read(1))
+                try:
+                    response = await self._rpc(body, disconnected)
+                finally:
+                    disconnected.cancel()
+                await self._respond_json(writer, 200, response)
+            elif method == 'POST' and path.startswith('/curves/'):
+                await self._curves(path[len('/curves/'):], headers, reader, writer)
+            elif path.startswith('/jobs/'):
+                parts = path.strip('/').split('/')
+                job = self.jobs.get(parts[1]) if len(parts) > 1 else None
+                if job is None:
+                    await self._respond_json(writer, 404, {'error': 'no such job'})
+                elif method == 'DELETE' and len(parts) == 2:
+                    job.cancel()
+                    await self._respond_json(writer, 200, job.snapshot())
+                elif method == 'GET' and len(parts) == 3 and parts[2] == 'events':
+                    await self._stream(job, reader, writer)
+                else:
+                    await self._respond_json(writer, 404, {'error': 'not found'})
+            else:
+                await self._respond_json(writer, 404, {'error': 'not found'})
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _curves(self, kind: str, headers: dict, reader: asyncio.StreamReader,
+                      writer: asyncio.StreamWriter):
+        """곡선 배열 → 원시 바이너리 (계산은 기본 스레드 풀에서)"""
+        length = _content_length(headers)
+        if length is None:
+            await self._respond_json(writer, 400, {'error': f'Content-Length 는 0~{MAX_BODY} 이어야 합니다'})
+            return
+        body = await reader.readexactly(length) if length else b'{}'
+        try:
+            params = json.loads(body.decode('utf-8'))
+            if kind not in CURVES:
+                raise ValueError(f"알 수 없는 곡선: {kind}")
+            payload = await asyncio.get_running_loop().run_in_executor(None, build_curves, kind, params)
+        except (UnicodeDecodeError, json.JSONDecodeError, TypeError, ValueError) as e:
+            await self._respond_json(writer, 400, {'error': str(e)})
+            return
+        await self._respond(writer, 200, payload, 'application/octet-stream')
+
+    async def _stream(self, job: Job, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """SSE: 현재 상태 → progress* → result / error / cancelled"""
+        writer.write(b'HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nCache-Control: no-cache\r\n'
+                     b'Connection: close\r\n' + self._cors() + b'\r\n')
+        queue: asyncio.Queue = asyncio.Queue()
+        job.listeners.append(queue)
+        disconnected = asyncio.ensure_future(reader.read(1))
+        try:
+            event = {'done': 'result', 'error': 'error', 'cancelled': 'cancelled'}.get(job.state, 'progress')
+            writer.write(_sse(event, job.snapshot()))
+            await writer.drain()
+            while not job.finished or not queue.empty():
+                getter = asyncio.ensure_future(queue.get())
+                await asyncio.wait({getter, disconnected}, return_when=asyncio.FIRST_COMPLETED)
+                if not getter.done():
+                    getter.cancel()
+                    break
+                event, data = getter.result()
+                writer.write(_sse(event, data))
+                await writer.drain()
+        finally:
+            disconnected.cancel()
+            job.listeners.remove(queue)
+            if not job.pinned and not job.listeners and job.holders <= 0:
+                job.cancel()
+
+    @staticmethod
+    def _cors() -> bytes:
+        """허용된 로컬 출처만 그대로 되돌려줌 (Origin 없는 요청 = 브라우저 밖 클라이언트)"""
+        origin = _ORIGIN.get()
+        if origin is None or not LOCAL_ORIGIN.match(origin):
+            return b''
+        return (f'Access-Control-Allow-Origin: {origin}\r\nVary: Origin\r\n'.encode('latin-1')
+                + b'Access-Control-Allow-Methods: GET, POST, DELETE, OPTIONS\r\n'
+                b'Access-Control-Allow-Headers: Content-Type\r\n')
+
+    async def _respond(self, writer: asyncio.StreamWriter, status: int, body: bytes,
+                       content_type: str = 'application/json'):
+        reason = {200: 'OK', 204: 'No Content', 400: 'Bad Request', 403: 'Forbidden',
+                  404: 'Not Found'}.get(status, '')
+        writer.write(f"HTTP/1.1 {status} {reason}\r\nContent-Type: {content_type}\r\n"
+                     f"Content-Length: {len(body)}\r\nConnection: close\r\n".encode('latin-1')
+                     + self._cors() + b'\r\n' + body)
+        await writer.drain()
+
+    async def _respond_json(self, writer: asyncio.StreamWriter, status: int, data: Any):
+        body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        await self._respond(writer, status, body, 'application/json; charset=utf-8')
+
+
+def _content_length(headers: dict) -> Optional[int]:
+    """Content-Length (없으면 0, 숫자가 아니거나 0~MAX_BODY 밖이면 None)"""
+    try:
+        length = int(headers.get('content-length', 0))
+    except ValueError:
+        return None
+    return length if 0 <= length <= MAX_BODY else None
+
+
+def _sse(event: str, data: Any) -> bytes:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n".encode('utf-8')
+
+
+# ============================================================
+# 메인
+# ============================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="DeskWarrior 로컬 시뮬레이션 서버")
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--workers', type=int, default=0, help="프로세스 수 (0 = CPU 수)")
+    args = parser.parse_args()
+
+    server = SimServer(args.host, args.port, args.workers)
+
+    async def serve():
+        await server.start()
+        print(f"시뮬레이션 서버: {server.url}  (메서드: {', '.join(sorted(METHODS))})")
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
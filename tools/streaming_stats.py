@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DeskWarrior 스트리밍 통계 (병합 가능한 요약)
+- Moments: Welford/Chan 방식 평균·분산 (배치 단위 갱신)
+- Histogram: 고정 구간 히스토그램 (구간 내 선형 보간 분위수)
+- TDigest: 병합형 t-digest 분위수 스케치 (NumPy 벡터 압축, 꼬리 정밀)
+- Summary: Moments + TDigest 묶음 (p10/p50/p90 등 보고용)
+
+모든 객체는 pickle 가능하고 merge()로 합칠 수 있음
+→ 워커 프로세스가 로컬로 집계하고 부모가 병합 (원본 표본을 보관하지 않음)
+
+사용 예:
+    s = Summary()
+    s.update(stage_array)
+    s.merge(other_worker_summary)
+    s.percentiles((10, 50, 90))
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+DEFAULT_COMPRESSION = 400.0    # 중심점 약 δ/2개
+DEFAULT_PERCENTILES = (10, 50, 90)
+
+
+def _as_array(values) -> np.ndarray:
+    arr = np.asarray(values, dtype=np.float64).ravel()
+    return arr[np.isfinite(arr)]
+
+
+# ============================================================
+# 모멘트
+# ============================================================
+
+@dataclass
+class Moments:
+    """평균/분산/최소/최대 (Chan 병렬 결합식)"""
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    min: float = math.inf
+    max: float = -math.inf
+
+    def update(self, values) -> 'Moments':
+        arr = _as_array(values)
+        if len(arr):
+            batch_mean = float(arr.mean())
+            self._combine(len(arr), batch_mean, float(((arr - batch_mean) ** 2).sum()),
+                          float(arr.min()), float(arr.max()))
+        return self
+
+    def merge(self, other: 'Moments') -> 'Moments':
+        if other.count:
+            self._combine(other.count, other.mean, other.m2, other.min, other.max)
+        return self
+
+    def _combine(self, n: int, mean: float, m2: float, lo: float, hi: float):
+        total = self.count + n
+        delta = mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += m2 + delta * delta * self.count * n / total
+        self.count = total
+        self.min = min(self.min, lo)
+        self.max = max(self.max, hi)
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+
+# ============================================================
+# 고정 구간 히스토그램
+# ============================================================
+
+@dataclass
+class Histogram:
+    """고정 구간 히스토그램 (범위 밖 값은 양 끝 넘침 칸)"""
+    edges: np.ndarray
+    counts: Optional[np.ndarray] = None     # (len(edges) + 1,) [아래 넘침, 구간..., 위 넘침]
+
+    def __post_init__(self):
+        self.edges = np.asarray(self.edges, dtype=np.float64)
+        if self.counts is None:
+            self.counts = np.zeros(len(self.edges) + 1, dtype=np.int64)
+
+    @classmethod
+    def linear(cls, lo: float, hi: float, bins: int) -> 'Histogram':
+        return cls(np.linspace(lo, hi, bins + 1))
+
+    @classmethod
+    def log(cls, lo: float, hi: float, bins: int) -> 'Histogram':
+        return cls(np.logspace(math.log10(lo), math.log10(hi), bins + 1))
+
+    @property
+    def count(self) -> int:
+        return int(self.counts.sum())
+
+    def update(self, values) -> 'Histogram':
+        arr = _as_array(values)
+        idx = np.searchsorted(self.edges, arr, side='right')
+        self.counts += np.bincount(idx, minlength=len(self.counts))
+        return self
+
+    def merge(self, other: 'Histogram') -> 'Histogram':
+        if len(other.edges) != len(self.edges) or not np.array_equal(other.edges, self.edges):
+            raise ValueError("구간이 다른 히스토그램은 병합할 수 없습니다")
+        self.counts += other.counts
+        return self
+
+    def quantile(self, q):
+        """분위수 (구간 내 균등 분포 가정, 넘침 칸은 경계값)"""
+        q = np.atleast_1d(np.asarray(q, dtype=np.float64))
+        total = self.count
+        if not total:
+            return np.full(q.shape, np.nan)
+        cum = np.cumsum(self.counts)
+        target = q * total
+        i = np.minimum(np.searchsorted(cum, target, side='left'), len(cum) - 1)
+        lo = self.edges[np.clip(i - 1, 0, len(self.edges) - 1)]
+        hi = self.edges[np.clip(i, 0, len(self.edges) - 1)]
+        before = np.where(i > 0, cum[np.maximum(i - 1, 0)], 0)
+        frac = np.clip((target - before) / np.maximum(self.counts[i], 1), 0, 1)
+        return lo + (hi - lo) * frac
+
+
+# ============================================================
+# t-digest
+# ============================================================
+
+@dataclass
+class TDigest:
+    """
+    병합형 t-digest (Dunning & Ertl)
+    - 중심점은 평균 순 정렬, 크기 한도는 k1 스케일 함수 k(q) = δ/2π·asin(2q-1)
+    - 압축은 같은 k 정수 구간의 중심점을 한 번에 합침 (순차 병합의 벡터 근사)
+    """
+    compression: float = DEFAULT_COMPRESSION
+    means: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    weights: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    min: float = math.inf
+    max: float = -math.inf
+
+    @property
+    def count(self) -> float:
+        return float(self.weights.sum())
+
+    def update(self, values, weights=None) -> 'TDigest':
+        arr = np.asarray(values, dtype=np.float64).ravel()
+        w = np.ones(len(arr)) if weights is None else np.broadcast_to(np.asarray(weights, dtype=np.float64), arr.shape)
+        ok = np.isfinite(arr) & (w > 0)
+        if ok.any():
+            arr, w = arr[ok], w[ok]
+            self.min = min(self.min, float(arr.min()))
+            self.max = max(self.max, float(arr.max()))
+            self._compress(np.concatenate([self.means, arr]), np.concatenate([self.weights, w]))
+        return self
+
+    def merge(self, other: 'TDigest') -> 'TDigest':
+        if len(other.means):
+            self.min = min(self.min, other.min)
+            self.max = max(self.max, other.max)
+            self._compress(np.concatenate([self.means, other.means]),
+                           np.concatenate([self.weights, other.weights]))
+        return self
+
+    def _compress(self, means: np.ndarray, weights: np.ndarray):
+        order = np.argsort(means, kind='stable')
+        means, weights = means[order], weights[order]
+        if len(means) <= self.compression / 2:
+            self.means, self.weights = means, weights
+            return
+        cum = np.cumsum(weights)
+        q_mid = (cum - weights / 2) / cum[-1]
+        k = self.compression / (2 * math.pi) * np.arcsin(2 * q_mid - 1)
+        group = np.floor(k).astype(np.int64)
+        starts = np.concatenate([[0], np.flatnonzero(np.diff(group)) + 1])
+        w = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / w
+        self.weights = w
+
+    def quantile(self, q):
+        """분위수 (중심점 누적 중간 위치 사이 선형 보간, 양 끝은 최소/최대)"""
+        q = np.atleast_1d(np.asarray(q, dtype=np.float64))
+        if not len(self.means):
+            return np.full(q.shape, np.nan)
+        cum = np.cumsum(self.weights)
+        total = cum[-1]
+        pos = np.concatenate([[0.0], cum - self.weights / 2, [total]])
+        val = np.concatenate([[self.min], self.means, [self.max]])
+        return np.interp(np.clip(q, 0, 1) * total, pos, val)
+
+    def cdf(self, x):
+        x = np.atleast_1d(np.asarray(x, dtype=np.float64))
+        if not len(self.means):
+            return np.full(x.shape, np.nan)
+        cum = np.cumsum(self.weights)
+        total = cum[-1]
+        pos = np.concatenate([[0.0], cum - self.weights / 2, [total]])
+        val = np.concatenate([[self.min], self.means, [self.max]])
+        return np.interp(x, val, pos) / total
+
+
+# ============================================================
+# 요약
+# ============================================================
+
+@dataclass
+class Summary:
+    """모멘트 + 분위수 스케치 (리포트/대시보드용)"""
+    moments: Moments = field(default_factory=Moments)
+    digest: TDigest = field(default_factory=TDigest)
+
+    @property
+    def count(self) -> int:
+        return self.moments.count
+
+    def update(self, values) -> 'Summary':
+        self.moments.update(values)
+        self.digest.update(values)
+        return self
+
+    def merge(self, other: 'Summary') -> 'Summary':
+        self.moments.merge(other.moments)
+        self.digest.merge(other.digest)
+        return self
+
+    def percentiles(self, percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> Dict[float, float]:
+        values = self.digest.quantile(np.asarray(percentiles, dtype=np.float64) / 100)
+        return {p: float(v) for p, v in zip(percentiles, values)}
+
+    def to_dict(self, percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> dict:
+        out = {
+            'count': self.moments.count,
+            'mean': self.moments.mean,
+            'std': self.moments.std,
+            'min': self.moments.min,
+            'max': self.moments.max,
+        }
+        out.update({f'p{p:g}': v for p, v in self.percentiles(percentiles).items()})
+        return out
+
+
+def merge_all(parts):
+    """같은 종류의 요약 목록을 하나로 병합"""
+    parts = list(parts)
+    if not parts:
+        return None
+    head = parts[0]
+    for part in parts[1:]:
+        head.merge(part)
+    return head
@@ -0,0 +1,59 @@
+"""
+업적 해금 시점 예측 검증 테스트
+"""
+
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from achievement_projector import (Achievement, AchievementIndex, MetricCurve, ProjectionConfig,
+                                   project_achievements)
+from result_cache import RESULT_CACHE
+
+
+@pytest.fixture(autouse=True)
+def _temp_result_cache(tmp_path, monkeypatch):
+    """개발자의 .cache 대신 임시 캐시 (워커 프로세스는 환경 변수로 같은 곳)"""
+    monkeypatch.setenv('DESKWARRIOR_CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(RESULT_CACHE, 'path', tmp_path / 'sim_results.sqlite')
+    RESULT_CACHE.close()
+    yield
+    RESULT_CACHE.close()
+
+
+def test_crossing_matches_linear_scan():
+    """이진 탐색 해금 시점 = 구간을 순서대로 훑은 결과"""
+    curve = MetricCurve(
+        t1=np.array([100.0, 400.0, 1000.0]),
+        first_run=np.array([10.0, 130.0, 460.0]),
+        stage=np.array([5, 8, 12]),
+        totals={'kills': np.array([40.0, 40.0, 160.0])},
+        peaks={'max_stage': np.array([5.0, 8.0, 12.0])},
+    )
+    index = AchievementIndex([Achievement(f"k{t}", 'monster_kills', t) for t in (200, 10, 40, 100)]
+                             + [Achievement('lv8', 'max_level', 8)])
+    targets, positions = index.metrics['monster_kills']
+    assert list(targets) == [10, 40, 100, 200] and [index.achievements[p].id for p in positions][0] == 'k10'
+
+    seconds = curve.crossing_seconds('monster_kills', targets)
+    assert np.allclose(seconds[:3], [25.0, 100.0, 700.0]) and np.isinf(seconds[3])
+    assert curve.crossing_seconds('max_level', np.array([8.0, 13.0]))[0] == 130.0
+    assert np.isinf(curve.crossing_seconds('max_level', np.array([13.0]))[0])
+
+
+def test_projection_independent_of_workers_and_ordered():
+    """워커 수/배치와 무관, 같은 메트릭은 목표가 클수록 해금 비율이 줄지 않음"""
+    config = ProjectionConfig(players=3000, days=7, batch=1000, runs=2000, start_crystals=300, seed=4)
+    index = AchievementIndex.load()
+    a = project_achievements(config, index, workers=1)
+    b = project_achievements(replace(config, batch=700), index, workers=2)
+    assert a.players == b.players == 3000
+    assert np.array_equal(a.unlocked, b.unlocked)
+
+    for metric, (targets, positions) in index.metrics.items():
+        rates = a.unlocked[positions]
+        assert np.all(np.diff(rates) <= 0), metric
+    for achievement in index.unsupported():
+        assert a.unlocked[index.ids.index(achievement.id)] == 0
+    assert a.unlocked[index.ids.index('first_blood')] > 0
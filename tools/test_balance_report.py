@@ -0,0 +1,55 @@
+"""
+헤드리스 밸런스 리포트 검증 테스트
+"""
+
+import json
+import shutil
+
+import numpy as np
+
+import balance_report as BR
+import stat_formulas_generated as SF
+from economy_model import CONFIG_DIR, damage_from_effects, perm_effects, stage_hp
+
+
+def test_stat_curves_match_scalar_formulas():
+    vals = {'base_cost': 3, 'growth_rate': 0.4, 'multiplier': 1.6, 'softcap_interval': 8, 'effect_per_level': 2}
+    cfg = BR.ReportConfig(max_level=25, max_stage=40)
+    curves = BR.stat_curves('base_attack', vals, cfg)
+
+    costs = [SF.calc_upgrade_cost(3, 0.4, 1.6, 8, lv) for lv in range(1, 26)]
+    assert curves['cost'].tolist() == costs
+    assert curves['cumulative'][-1] == sum(costs)
+    hp = SF.calc_boss_hp(40)                        # 40 스테이지는 보스
+    assert np.isclose(curves['cps_level'][-1], hp / (cfg.base_power + 2 * 25) / SF.BASE_TIME_LIMIT)
+    assert len(curves['stages']) == 40
+
+
+def test_report_renders_every_stat_and_comparison(tmp_path):
+    config = tmp_path / 'config'
+    shutil.copytree(CONFIG_DIR, config, ignore=shutil.ignore_patterns('localization', '*.backup'))
+    data = json.loads((config / 'PermanentStatGrowth.json').read_text(encoding='utf-8'))
+    data['stats'] = {k: data['stats'][k] for k in ('base_attack', 'time_extend')}
+    (config / 'PermanentStatGrowth.json').write_text(json.dumps(data), encoding='utf-8')
+
+    cfg = BR.ReportConfig(config_dir=config, baseline_dir=CONFIG_DIR, max_level=10, dpi=40)
+    figures = BR.render_report(cfg, workers=1)
+    assert [f.key for f in figures] == ['permanent.base_attack', 'permanent.time_extend',
+                                        'ingame.keyboard_power', 'ingame.mouse_power', 'comparison']
+    assert all(f.png.startswith(b'\x89PNG') for f in figures)
+    assert '→' in figures[0].summary['Lv10 총비용']
+
+    out = BR.write_report(figures, cfg, tmp_path / 'report.html')
+    text = out.read_text(encoding='utf-8')
+    assert text.count('data:image/png;base64,') == 5 and 'id="comparison"' in text
+    assert BR.write_report(figures, cfg, tmp_path / 'report.pdf').read_bytes().startswith(b'%PDF')
+
+
+def test_preset_curves_keep_fractional_power():
+    """평균 파워는 비교 분석 탭 _calc_dps 처럼 소수 유지 (키보드 11 + 마우스 10 → 10.5)"""
+    perm = json.loads((CONFIG_DIR / 'PermanentStatGrowth.json').read_text(encoding='utf-8'))['stats']
+    stages = np.array([10, 40])
+    curves = BR.preset_curves({'start_keyboard': 1}, perm, stages)
+    effects = perm_effects({'start_keyboard': 1}, perm)
+    damage = damage_from_effects(effects, 10.5, combo_stack=1.5)
+    assert np.allclose(curves['clicks'], stage_hp(stages) / damage)
@@ -0,0 +1,63 @@
+"""
+빌드 파레토 탐색기 검증 테스트
+"""
+
+import json
+import shutil
+
+import numpy as np
+
+from build_explorer import OBJECTIVES, BuildExplorer, export_presets, non_dominated
+from economy_model import CONFIG_DIR
+
+
+def test_non_dominated_matches_brute_force():
+    pts = np.random.default_rng(0).integers(0, 6, (300, 3)).astype(float)
+    mask = non_dominated(pts, block=64)
+    for i, p in enumerate(pts):
+        dominated = any((q >= p).all() and (q > p).any() for q in pts)
+        assert mask[i] == (not dominated)
+
+
+def test_front_respects_budget_and_is_non_dominated():
+    explorer = BuildExplorer(800)
+    front = explorer.explore(generations=5, population=128, archive_size=64, seed=1)
+    assert len(front) > 0
+    assert np.all(front.costs <= 800)
+    assert non_dominated(front.scores).all()
+    # 같은 시드 = 같은 결과
+    again = explorer.explore(generations=5, population=128, archive_size=64, seed=1)
+    assert np.array_equal(front.levels, again.levels)
+
+
+def test_start_and_discount_stats_are_scored():
+    """시작 레벨/할인/시작 골드+* 도 골드/크리스탈 목적에 반영 → 탐색 대상, 죽은 스탯 판정 대상"""
+    explorer = BuildExplorer(800)
+    ids = explorer.table.ids
+    base = explorer.scorer.score(np.zeros((1, len(ids)), dtype=np.int64))[0]
+    gold, crystals = OBJECTIVES.index('gold'), OBJECTIVES.index('crystals')
+    for sid in ('start_level', 'upgrade_discount', 'start_gold_flat', 'start_gold_multi'):
+        levels = np.zeros((1, len(ids)), dtype=np.int64)
+        levels[0, ids.index(sid)] = 5
+        scores = explorer.scorer.score(levels)[0]
+        assert scores[gold] > base[gold], sid
+        if sid != 'upgrade_discount':
+            assert scores[crystals] > base[crystals], sid
+        assert explorer.allowed[ids.index(sid)]
+
+    front = explorer.explore(generations=5, population=128, archive_size=64, seed=1)
+    used = {sid for sid, u in front.usage().items() if u > 0}
+    assert used & {'start_level', 'start_gold_flat', 'start_gold_multi'}
+    assert not used & set(front.dead_stats())
+
+
+def test_export_presets_replaces_previous_run(tmp_path):
+    shutil.copy(CONFIG_DIR / 'BalancePresets.json', tmp_path / 'BalancePresets.json')
+    front = BuildExplorer(500).explore(generations=3, population=64, archive_size=32)
+    export_presets(front, 5, config_dir=tmp_path)
+    added = export_presets(front, 3, config_dir=tmp_path)
+    data = json.loads((tmp_path / 'BalancePresets.json').read_text(encoding='utf-8'))
+    pareto = [pid for pid in data['presets'] if pid.startswith('pareto_')]
+    assert sorted(pareto) == sorted(added) and len(added) == 3
+    assert 'live' in data['presets']
+    assert set(data['presets'][added[0]]['levels']) == set(front.stat_ids)
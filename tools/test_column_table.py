@@ -0,0 +1,35 @@
+"""
+열 배열 표 데이터 검증 테스트
+"""
+
+import numpy as np
+
+from column_table import Column, ColumnTable, format_number
+
+
+def test_sort_is_stable_and_keeps_source_rows():
+    table = ColumnTable([
+        Column('stage', '스테이지', [1, 2, 3, 4, 5]),
+        Column('boss', '보스', [False, True, False, True, False], fmt=lambda b: "BOSS" if b else ""),
+    ])
+    table.sort('boss', descending=True)
+    assert [table.value(r, 0) for r in range(5)] == [2, 4, 1, 3, 5]
+    assert table.text(0, 1) == "BOSS" and table.source_row(0) == 1 and table.view_row(1) == 0
+
+    # 같은 열 키로 다시 채우면 정렬이 유지되고, 모양이 같으면 전체 범위 반환
+    rng = table.set_columns([Column('stage', '스테이지', [5, 4, 3, 2, 1]), Column('boss', '보스', [True] + [False] * 4)])
+    assert rng == (0, 4)
+    assert table.value(0, 0) == 5
+    assert table.set_columns([Column('stage', '스테이지', [1])]) is None and table.sort_key is None
+
+
+def test_large_stage_columns_format_on_demand():
+    hps = [int(100 * 1.2 ** s) for s in range(1, 3000)] + [float('inf')]
+    table = ColumnTable([Column('hp', 'HP', hps, fmt=format_number), Column('gold', '골드', np.arange(3000))])
+    assert table.column('hp').values.dtype == object
+    assert table.text(0, 0) == "120" and table.text(2999, 0) == "∞"
+    assert "e+" in table.text(2998, 0)
+    table.sort('hp', descending=True)
+    assert table.text(0, 0) == "∞" and table.value(0, 1) == 2999
+    table.set_value(0, 1, 10 ** 30)         # int64 범위 초과 → object 로 승격
+    assert table.value(0, 1) == 10 ** 30
@@ -0,0 +1,84 @@
+"""
+config 리비전 비교 / 회귀 검사 테스트
+"""
+
+import json
+import shutil
+import subprocess
+
+import numpy as np
+
+from config_diff import REVISION_FILES, WORKTREE, ModelParams, RevisionSource, bisect, diff_revisions, run_models
+from economy_model import CONFIG_DIR, load_json
+from result_cache import ResultCache
+
+
+def _git(repo, *args):
+    subprocess.run(['git', '-c', 'user.name=t', '-c', 'user.email=t@t', *args], cwd=repo,
+                   check=True, capture_output=True)
+
+
+def _edit(repo, name, change):
+    path = repo / 'config' / name
+    data = json.loads(path.read_text(encoding='utf-8'))
+    change(data)
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding='utf-8')
+
+
+def _repo(tmp_path):
+    repo = tmp_path / 'repo'
+    (repo / 'config').mkdir(parents=True)
+    for name in REVISION_FILES:
+        shutil.copy(CONFIG_DIR / name, repo / 'config' / name)
+    _git(repo, 'init', '-q')
+    _git(repo, 'add', '.')
+    _git(repo, 'commit', '-q', '-m', 'base')
+    return repo
+
+
+def test_diff_flags_cost_and_cps_regressions(tmp_path):
+    repo = _repo(tmp_path)
+    cache = ResultCache(tmp_path / 'c.sqlite')
+    source = RevisionSource(repo)
+
+    _edit(repo, 'PermanentStatGrowth.json', lambda d: d['stats']['base_attack'].update(base_cost=1000))
+    _edit(repo, 'StatFormulas.json', lambda d: d['constants'].update(HP_GROWTH=1.3))
+    report = diff_revisions(source, 'HEAD', WORKTREE, ModelParams(max_stage=50), cache=cache)
+    areas = {(r.area, r.subject) for r in report.regressions}
+    assert ('cost', 'permanent.base_attack') in areas
+    assert any(area == 'cps' for area, _ in areas) and any(area == 'wall' for area, _ in areas)
+    assert [row[0] for row in report.stat_rows] == ['permanent.base_attack']
+    assert report.stage_rows[0][:3] == (1, 120.0, 130.0)
+
+    # 방향이 반대면 회귀 아님 (개선)
+    assert not diff_revisions(source, WORKTREE, 'HEAD', ModelParams(max_stage=50), cache=cache).regressions
+
+
+def test_bisect_reuses_cached_results_for_unchanged_config(tmp_path):
+    repo = _repo(tmp_path)
+    for i in range(6):
+        if i == 4:
+            _edit(repo, 'PermanentStatGrowth.json', lambda d: d['stats']['crit_chance'].update(effect_per_level=0.1))
+        (repo / 'notes.txt').write_text(str(i))                 # config 와 무관한 커밋
+        _git(repo, 'add', '.')
+        _git(repo, 'commit', '-q', '-m', f'c{i}')
+
+    cache = ResultCache(tmp_path / 'c.sqlite')
+    source = RevisionSource(repo)
+    found, tested = bisect(source, 'HEAD~6', 'HEAD', cache=cache)
+    expected = subprocess.run(['git', 'rev-parse', 'HEAD~1'], cwd=repo, capture_output=True, text=True).stdout.strip()
+    assert found == expected and tested <= 4
+    assert cache.misses == 2                                     # 서로 다른 config 내용은 2가지뿐
+
+    hits = cache.hits
+    diff_revisions(source, 'HEAD~6', 'HEAD', cache=cache)
+    assert cache.misses == 2 and cache.hits == hits + 2
+
+
+def test_preset_power_is_not_truncated():
+    """평균 파워는 _calc_dps 처럼 소수 유지 (기본 20 + 키보드 1 → 10.5)"""
+    configs = {name: load_json(name) for name in REVISION_FILES}
+    configs['BalancePresets.json'] = {'presets': {'base': {'levels': {}}, 'odd': {'levels': {'start_keyboard': 1}}}}
+    configs.pop('PlayerLevels.json', None)
+    cps = run_models(configs, ModelParams(max_stage=20))['cps']
+    assert np.allclose(cps['odd'] / cps['base'], 10 / 10.5)
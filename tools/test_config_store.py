@@ -0,0 +1,57 @@
+"""
+config 묶음 읽기/쓰기 검증 테스트
+"""
+
+import os
+
+import pytest
+
+from config_store import ConfigConflict, ConfigStore, serialize
+
+
+def _store(tmp_path):
+    (tmp_path / "A.json").write_bytes(serialize({"a": 1}))
+    (tmp_path / "B.json").write_bytes(serialize({"b": 1}))
+    return ConfigStore(tmp_path)
+
+
+def test_conditional_batch_load(tmp_path):
+    store = _store(tmp_path)
+    first = store.load_many(["A.json", "B.json", "Missing.json"])
+    assert first["A.json"]["data"] == {"a": 1} and not first["Missing.json"]["success"]
+
+    again = store.load_many(["A.json", "B.json"], known={n: first[n]["hash"] for n in ("A.json", "B.json")})
+    assert again["A.json"]["unchanged"] and "data" not in again["B.json"]
+    with pytest.raises(ValueError):
+        store.path("../secret.json")
+
+
+def test_multi_file_save_is_all_or_nothing(tmp_path, monkeypatch):
+    store = _store(tmp_path)
+    hashes = {n: store.current_hash(n) for n in ("A.json", "B.json")}
+
+    saved = store.save_many({"A.json": {"a": 2}, "B.json": {"b": 1}}, base=hashes)
+    assert saved["A.json"]["changed"] and not saved["B.json"]["changed"]
+    assert not (tmp_path / "B.json.backup").exists()        # 안 바뀐 파일은 백업/쓰기 없음
+    assert (tmp_path / "A.json.backup").read_bytes() == serialize({"a": 1})
+
+    with pytest.raises(ConfigConflict) as conflict:
+        store.save_many({"A.json": {"a": 3}}, base=hashes)   # 편집 기준 해시가 오래됨
+    assert list(conflict.value.conflicts) == ["A.json"]
+
+    # 두 번째 파일 교체가 실패하면 첫 번째 파일도 원래대로
+    real_replace = os.replace
+    calls = []
+
+    def flaky_replace(src, dst):
+        calls.append(dst)
+        if len(calls) == 2:
+            raise OSError("disk full")
+        real_replace(src, dst)
+
+    monkeypatch.setattr(os, "replace", flaky_replace)
+    with pytest.raises(OSError):
+        store.save_many({"A.json": {"a": 9}, "B.json": {"b": 9}})
+    assert store.load_one("A.json")["data"] == {"a": 2}
+    assert store.load_one("B.json")["data"] == {"b": 1}
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["A.json", "A.json.backup", "B.json", "B.json.backup"]
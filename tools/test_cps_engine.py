@@ -0,0 +1,62 @@
+"""
+CPS 측정 엔진 검증 테스트
+"""
+
+import numpy as np
+
+from cps_engine import ClickRecorder, ClickTrace, analyze, combo_stacks
+
+
+def _combo_tracker(intervals, tolerance):
+    """ComboTracker.ProcessInput 직역 (두 번째 입력부터의 스택)"""
+    stack, last_interval, out = 0, 0.0, []
+    for d in intervals:
+        if d > 3.0:
+            stack, last_interval = 0, 0.0
+            out.append(0)
+            continue
+        if last_interval > 0:
+            if abs(d - last_interval) <= tolerance:
+                stack = min(stack + 1, 3)
+            else:
+                stack, last_interval = 0, 0.0
+        else:
+            stack = 1
+        last_interval = d
+        out.append(stack)
+    return out
+
+
+def test_combo_stacks_match_combo_tracker():
+    """벡터화 콤보 스택 = ComboTracker 규칙"""
+    rng = np.random.default_rng(3)
+    # 리듬 일치가 자주 나오도록 10ms 단위로 양자화 + 가끔 3초 초과 공백
+    intervals = rng.choice([0.12, 0.13, 0.14, 0.15, 3.5], size=5000, p=[0.3, 0.3, 0.2, 0.15, 0.05])
+    for tolerance in (0.0, 0.01, 0.015, 0.03):
+        assert combo_stacks(intervals, tolerance).tolist() == _combo_tracker(intervals, tolerance)
+
+
+def test_trace_binary_roundtrip():
+    """바이너리 저장/로드 (µs 정밀도) + 링 버퍼 순서"""
+    rec = ClickRecorder(capacity=8)
+    for i in range(13):
+        rec.record(i % 2, t_ns=1_000_000_000 + i * 123_456_000)
+    trace = rec.trace()
+    assert len(trace) == 8
+    assert np.all(np.diff(trace.timestamps_ns) > 0)
+
+    restored = ClickTrace.from_bytes(trace.to_bytes())
+    assert np.array_equal(restored.timestamps_ns, trace.timestamps_ns)
+    assert np.array_equal(restored.sources, trace.sources)
+    assert len(trace.to_bytes()) < 24 + 8 * 5
+
+
+def test_analyze_steady_rhythm():
+    """일정한 리듬 → 콤보 유지 가능, 피로 없음"""
+    trace = ClickTrace.from_intervals(np.full(100, 0.125))
+    report = analyze(trace)
+    assert abs(report.mean_cps - 8.0) < 1e-6
+    assert report.burst_cps == 8.0
+    assert report.combo['max_stack'] == 3
+    assert report.combo['sustainable']
+    assert abs(report.fatigue_pct) < 1e-9
@@ -0,0 +1,53 @@
+"""
+곡선 자동 맞춤 검증 테스트
+"""
+
+from pathlib import Path
+
+import numpy as np
+
+from curve_fitter import (LEVEL_CAP, MAX_DOUBLING_LEVELS, CurveFitter, CurveTargets, config_diff,
+                          nelder_mead_batch)
+from economy_model import upgrade_costs
+
+
+def test_nelder_mead_batch_finds_minimum():
+    target = np.array([0.3, 0.7, 0.2, 0.6])
+    func = lambda x: ((x - target) ** 2).sum(axis=1)
+    points, values = nelder_mead_batch(func, np.random.default_rng(0).random((3, 4)), iterations=300)
+    assert np.all(values < 1e-6)
+    assert np.allclose(points, target, atol=1e-3)
+
+
+def test_fit_hits_cumulative_cost_target():
+    """단일 스탯 누적 비용 목표 → 제안 설정이 목표에 근접, 다른 스탯/키는 그대로"""
+    targets = CurveTargets.from_dict({
+        'stats': {'base_attack': {'cumulative': {'50': 3000}}},
+        'progression': None,
+        'anchor_weight': 0.0,
+        'free_stats': ['base_attack'],
+    })
+    fitter = CurveFitter(targets)
+    result = fitter.fit(rounds=2, workers=1)
+    i = fitter.table.index('base_attack')
+    total = upgrade_costs(result.params[i], np.arange(1, 51)).sum()
+    assert abs(np.log(total / 3000)) < 0.05
+    assert result.changed == ['base_attack']
+
+    diff = config_diff(fitter.config, fitter.proposed_config(result))
+    changed = [line for line in diff.splitlines() if line[:1] in '+-' and not line.startswith(('+++', '---'))]
+    assert changed and all(any(k in line for k in ('base_cost', 'growth_rate', 'multiplier', 'softcap_interval'))
+                           for line in changed)
+
+
+def test_example_targets_keep_costs_growing():
+    """예시 목표 (도달 불가능한 필요 CPS) 에서도 최대 레벨 없는 스탯을 평평한 비용으로 만들지 않음"""
+    fitter = CurveFitter(CurveTargets.load(Path(__file__).with_name('curve_targets_example.json')))
+    result = fitter.fit(rounds=2, iterations=40, workers=1)
+    obj = fitter.objective
+    for i in np.flatnonzero(obj.truncated):
+        sid = fitter.table.ids[i]
+        costs = upgrade_costs(result.params[i], np.arange(1, LEVEL_CAP + 1), truncate=False)
+        assert np.all(np.diff(costs) > 0), sid
+        assert costs[MAX_DOUBLING_LEVELS] >= 1.8 * costs[0], sid
+    assert obj.levels_at_budget(result.params[None]).max() < LEVEL_CAP
@@ -0,0 +1,49 @@
+"""
+곡선 바이너리 전송 검증 테스트
+"""
+
+import struct
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from curve_transport import build_curves, pack_arrays, unpack_arrays
+from economy_model import stage_hp
+from sim_server import SimServer
+
+
+def test_pack_roundtrip_is_aligned_views():
+    arrays = {'x': np.arange(5), 'y': np.array([0.5, np.inf, -1.0]), 'flag': np.array([True, False, True])}
+    payload = pack_arrays(arrays, meta={'note': '곡선'})
+    (header,) = struct.unpack_from('<I', payload, 4)
+    assert (8 + header) % 8 == 0
+
+    out, meta = unpack_arrays(payload)
+    assert meta == {'note': '곡선'}
+    assert out['x'].dtype == np.dtype('<i8') and out['flag'].tolist() == [1, 0, 1]
+    assert np.array_equal(out['y'], arrays['y'])
+    assert out['y'].base is not None            # 복사 없이 버퍼 뷰
+
+
+def test_server_serves_raw_curves():
+    server = SimServer(port=0, executor=ThreadPoolExecutor(1))
+    url = server.start_in_thread()
+    try:
+        request = urllib.request.Request(url + '/curves/stage', b'{"max_stage": 20000}')
+        with urllib.request.urlopen(request, timeout=60) as response:
+            assert response.headers['Content-Type'] == 'application/octet-stream'
+            payload = response.read()
+        assert payload == build_curves('stage', {'max_stage': 20000})
+        arrays, meta = unpack_arrays(payload)
+        assert meta['kind'] == 'stage' and len(arrays['hp']) == 20000
+        assert arrays['hp'][49] == stage_hp(50) and np.isinf(arrays['hp'][-1])
+    finally:
+        server.stop()
+
+
+def test_upgrade_costs_use_unsaved_overrides():
+    base, _ = unpack_arrays(build_curves('upgrade_costs', {'stat': 'base_attack', 'max_level': 10}))
+    edited, _ = unpack_arrays(build_curves('upgrade_costs', {'stat': 'base_attack', 'max_level': 10,
+                                                             'overrides': {'base_cost': 1000, 'growth_rate': None}}))
+    assert edited['cost'][0] > base['cost'][0]
@@ -0,0 +1,45 @@
+"""
+그래프 다운샘플링 검증 테스트
+"""
+
+import numpy as np
+from matplotlib.figure import Figure
+
+from downsample import MAX_PLOT_VALUE, DownsamplingPlotter, downsample, lttb
+from economy_model import stage_hp
+
+
+def test_lttb_keeps_shape_endpoints_and_extrema():
+    x = np.arange(100_000, dtype=float)
+    y = np.sin(x / 3000.0)
+    y[54_321] = 9.0                                  # 보스처럼 튀는 한 점
+    y[77_777] = -9.0
+
+    keep = lttb(x, y, 500)
+    assert keep[0] == 0 and keep[-1] == len(x) - 1
+    assert np.all(np.diff(keep) > 0) and len(keep) <= 502
+    assert 54_321 in keep and 77_777 in keep
+    assert lttb(x[:100], y[:100], 500).tolist() == list(range(100))   # 충분히 짧으면 그대로
+
+    with np.errstate(over='ignore'):
+        hp = stage_hp(np.arange(1, 100_001))       # 뒤쪽은 inf
+    dx, dy = downsample(np.arange(1, 100_001), hp, 400)
+    assert np.isfinite(dy).all() and dy.max() == hp[hp < MAX_PLOT_VALUE].max()
+
+
+def test_plotter_recomputes_visible_window_on_zoom():
+    fig = Figure(figsize=(4, 3), dpi=100)
+    ax = fig.add_subplot()
+    plotter = DownsamplingPlotter()
+    x = np.arange(1, 100_001)
+    line = plotter.plot(ax, x, np.sqrt(x))
+    width = int(ax.bbox.width)
+    assert len(line.get_xdata()) <= width + 2
+
+    ax.set_xlim(1_000, 1_100)                        # 확대 → 보이는 구간만 원본 해상도로
+    xs = line.get_xdata()
+    assert xs[0] == 999 and xs[-1] == 1_101 and len(xs) == 103
+
+    plotter.clear()
+    ax.set_xlim(0, 100_000)                          # 연결 해제 후에는 갱신 안 함
+    assert len(line.get_xdata()) == 103 and plotter.point_count == 0
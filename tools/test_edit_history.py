@@ -0,0 +1,64 @@
+"""
+스탯 편집 기록 (실행 취소/체크포인트/곡선 메모) 검증 테스트
+"""
+
+import numpy as np
+
+from edit_history import EditHistory
+
+
+def _base():
+    return {('permanent', f's{i}'): {'base_cost': 10, 'growth_rate': 0.5} for i in range(50)}
+
+
+def test_edits_share_rows_and_undo_redo_checkpoint():
+    history = EditHistory(_base())
+    base = history.state
+    a, b = ('permanent', 's1'), ('permanent', 's2')
+
+    assert history.set(a, 'base_cost', 12)
+    assert not history.set(a, 'base_cost', 12)          # 같은 값은 기록 안 함
+    edited = history.state
+    assert edited[a]['base_cost'] == 12 and base[a]['base_cost'] == 10
+    assert edited[b] is base[b]                          # 바뀌지 않은 행은 공유
+    history.checkpoint('A')
+
+    for value in range(13, 1013):                        # 1,000번 편집
+        history.set(b, 'growth_rate', value)
+    assert history.state[b]['growth_rate'] == 1012
+    assert history.state[a] is edited[a]
+
+    entry = history.undo()
+    assert entry.edits[0].key == b and history.state[b]['growth_rate'] == 1011
+    history.redo()
+    assert history.restore('A') and history.state is edited
+    assert history.undo() and history.state[b]['growth_rate'] == 1012
+
+    history.jump(1)
+    history.set(b, 'base_cost', 99)                      # 새 편집은 다시 실행 분기를 버림
+    assert not history.can_redo and len(history.entries) == 3
+    assert history.reset() and history.state is base and history.changed_cells() == []
+
+
+def test_curve_memo_hits_shared_states_and_respects_budget():
+    history = EditHistory(_base(), memo_bytes=3 * 8000)
+    calls = []
+
+    def compute():
+        calls.append(history.entry.token)
+        return {'costs': np.full(1000, float(history.state[('permanent', 's0')]['base_cost']))}
+
+    history.curves('view', compute)
+    history.set(('permanent', 's0'), 'base_cost', 20)
+    assert history.curves('view', compute)['costs'][0] == 20
+    history.undo()
+    assert history.curves('view', compute)['costs'][0] == 10
+    history.reset()
+    history.redo()
+    history.curves('view', compute)
+    assert len(calls) == 2                               # 취소/다시 실행은 재계산 없음
+
+    for value in range(30, 34):
+        history.set(('permanent', 's0'), 'base_cost', value)
+        history.curves('view', compute)
+    assert history.memo_count == 3                       # 오래 안 쓴 것부터 버림
@@ -0,0 +1,31 @@
+"""
+인게임 골드 최적 소비 정책 (DP) 검증 테스트
+"""
+
+import numpy as np
+
+from gold_policy import OptimalGoldSolver
+from run_simulator import POLICIES, RunSimulator
+
+
+def test_dp_policy_bounds_heuristics():
+    """DP 최적 정책 ≥ 모든 휴리스틱 정책, 시뮬레이터에서 예측 스테이지 재현"""
+    solver = OptimalGoldSolver()
+    perm = {'base_attack': 40, 'start_gold': 30, 'gold_multi_perm': 20}
+    for cps, ratio in ((4.0, 0.5), (9.0, 0.8)):
+        plan = solver.solve(perm, cps=cps, keyboard_ratio=ratio)
+        dp = solver.run_sim.simulate(1, cps=cps, perm_levels=perm, policy=plan.policy(), keyboard_ratio=ratio)
+        assert dp.max_stage[0] == plan.max_stage
+        for policy in POLICIES.values():
+            heuristic = solver.run_sim.simulate(1, cps=cps, perm_levels=perm, policy=policy, keyboard_ratio=ratio)
+            assert heuristic.max_stage[0] <= plan.max_stage
+
+
+def test_level_costs_match_in_run_purchase_prices():
+    """DP 비용표 (level_costs) = 런 중 구매 가격 (next_costs), 할인 포함"""
+    sim = RunSimulator()
+    levels = np.array([[0, 0], [3, 7], [40, 12]])
+    for discount in (0.0, 12.0):
+        table = np.stack([sim.level_costs(sid, discount) for sid in sim.table.ids])
+        expected = sim.next_costs(levels, np.full(len(levels), discount))
+        assert np.array_equal(table[np.arange(len(sim.table))[None, :], levels + 1], expected)
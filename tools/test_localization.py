@@ -0,0 +1,50 @@
+"""
+로컬라이제이션 컴파일/조회 검증 테스트
+"""
+
+import json
+import os
+
+from localization import Localizer, Template
+
+
+def _write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+
+
+def test_lazy_locale_fallback_and_templates(tmp_path):
+    config = tmp_path / 'config'
+    _write(config / 'localization' / 'ko-KR.json', {'ui': {'level': 'Lv.{0}', 'gain': '+{value} 골드'}})
+    _write(config / 'localization' / 'en-US.json',
+           {'ui': {'level': 'Lv.{0}', 'only_en': 'English', 'lines': ['a', 'b']}})
+    _write(config / 'Achievements.json',
+           {'achievements': [{'id': 'first', 'localization': {'ko-KR': {'name': '첫 피'}}}]})
+
+    loc = Localizer('ko-KR', config_dir=config, cache_dir=tmp_path / 'cache')
+    assert loc.loaded_locales == ['ko-KR']
+    level = loc.key_id('ui.level')
+    assert level >= 0 and loc.format(level, 12) == 'Lv.12'
+    assert loc.format('ui.gain', value=50) == '+50 골드'
+    assert loc.get('achievement.first.name') == '첫 피'
+    assert loc.loaded_locales == ['ko-KR']             # 폴백 로케일은 필요할 때만
+
+    assert loc.get('ui.only_en') == 'English'
+    assert loc.get_list('ui.lines') == ['a', 'b']
+    assert loc.loaded_locales == ['en-US', 'ko-KR']
+    assert loc.get('ui.unknown') == 'ui.unknown' and loc.key_id('ui.unknown') == -1
+
+    parsed = Template.parse('{0}/{1} {missing}')
+    assert Template.from_json(parsed.to_json()).format(1, 2) == '1/2 {missing}'
+    assert Template.parse('plain') == 'plain'
+
+
+def test_recompiles_when_sources_change(tmp_path):
+    config = tmp_path / 'config'
+    source = config / 'localization' / 'en-US.json'
+    _write(source, {'title': 'Old'})
+    assert Localizer('en-US', config_dir=config, cache_dir=tmp_path / 'cache').get('title') == 'Old'
+
+    _write(source, {'title': 'New title'})
+    os.utime(source, ns=(source.stat().st_atime_ns, source.stat().st_mtime_ns + 10**9))
+    assert Localizer('en-US', config_dir=config, cache_dir=tmp_path / 'cache').get('title') == 'New title'
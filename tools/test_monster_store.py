@@ -0,0 +1,61 @@
+"""
+몬스터 DB 저장소 검증 테스트
+"""
+
+import shutil
+
+import pytest
+
+from monster_store import DB_FILE, MonsterStore, make_species
+from merge_config import merge_monsters
+
+
+def _store(tmp_path):
+    shutil.copy(DB_FILE, tmp_path / "monster_db.json")
+    return MonsterStore(tmp_path / "store.sqlite", tmp_path / "monster_db.json")
+
+
+def test_roundtrip_and_single_record_upsert(tmp_path):
+    store = _store(tmp_path)
+    json_path = tmp_path / "monster_db.json"
+    original = json_path.read_text(encoding='utf-8')
+    assert store.export_json(force=True)
+    assert json_path.read_text(encoding='utf-8') == original
+    assert not store.export_json()          # 변경 없음 → 쓰지 않음
+
+    names = {a: f"{a} 테스트" for a in ('Normal', 'Fire', 'Ice', 'Wind', 'Holy', 'Dark')}
+    entry = make_species('monster_testling', names)
+    assert store.upsert_species(entry) == 'added'
+    assert store.upsert_species(entry) == 'unchanged'
+    assert store.upsert_species(dict(entry, base_file='x.png'), overwrite=False) == 'skipped'
+    assert store.monster('monster_testling_fire')['hue'] == 358
+    assert len(store.find(attribute='Ice')) == len(store)
+    assert store.export_json()
+    assert store.species_ids()[-1] == 'monster_testling'
+
+    # JSON 을 직접 고치면 다음 열 때 다시 가져옴
+    json_path.write_text(original, encoding='utf-8')
+    store.close()
+    store = MonsterStore(tmp_path / "store.sqlite", json_path)
+    assert 'monster_testling' not in store
+
+
+def test_transaction_rolls_back(tmp_path):
+    store = _store(tmp_path)
+    before = store.get_species('monster_slime')
+    with pytest.raises(RuntimeError):
+        with store.transaction():
+            store.update_variation('monster_slime', 'B', name='변경')
+            raise RuntimeError
+    assert store.get_species('monster_slime') == before
+
+
+def test_merge_keeps_existing_records():
+    existing = [{"Id": "monster_a_normal", "Name": "A", "Sprite": "a.png", "BaseHp": 99}]
+    merged, changes = merge_monsters(existing, [
+        {"Id": "monster_a_normal", "Name": "A", "Sprite": "a.png"},
+        {"Id": "monster_b_fire", "Name": "B", "Sprite": "b.png"},
+    ])
+    assert merged[0] is existing[0]
+    assert changes == {'added': ['monster_b_fire'], 'updated': [], 'removed': []}
+    assert merged[1]['BaseHp'] == 20 + 2 + 10
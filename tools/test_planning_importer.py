@@ -0,0 +1,49 @@
+"""
+기획서 증분 가져오기 검증 테스트
+"""
+
+import shutil
+
+from monster_store import DB_FILE, MonsterStore
+from planning_importer import PLANNING_FILE, PlanningImporter, parse_row
+
+
+def test_parse_row_uses_last_parenthesis():
+    row = parse_row("| 28 | **인어(여) (MermaidF)** | 인어(여) | 화 | 빙 | 풍 | 성 | 암 |")
+    assert row.species == 'MermaidF' and row.names['Normal'] == '인어(여)'
+    assert parse_row("| 223 | **- (Reserved)** | - | - | - | - | - | - |") is None
+
+
+def test_only_changed_sections_are_reparsed(tmp_path):
+    shutil.copy(DB_FILE, tmp_path / "monster_db.json")
+    doc = tmp_path / "planning.md"
+    shutil.copy(PLANNING_FILE, doc)
+    store = MonsterStore(tmp_path / "store.sqlite", tmp_path / "monster_db.json")
+    importer = PlanningImporter(store, doc)
+
+    first = importer.sync()
+    assert first.parsed_sections == first.sections
+    # 첫 동기화는 손으로 고친 DB 이름을 덮어쓰지 않음
+    assert first.kept_names == first.count('changed') > 0
+    assert store.monster('monster_goblin_wind')['name'] == '고블린 정찰병'
+    again = importer.sync()
+    assert again.parsed_rows == 0 and not again.changes and not again.exported
+    renamed = importer.sync(force=True, update_names=True)
+    assert renamed.kept_names == 0 and store.monster('monster_goblin_wind')['name'] == '고블린 약탈자'
+
+    text = doc.read_text(encoding='utf-8')
+    doc.write_text(text.replace("| 동굴 박쥐 |", "| 큰 박쥐 |")
+                   + "\n### Batch 10\n**A. 일반**\n| 226 | **새 (Newbie)** | a | b | c | d | e | f |\n",
+                   encoding='utf-8')
+    report = importer.sync(update_names=True)
+    assert report.parsed_sections == 2
+    assert [(c.kind, c.species_id) for c in report.changes] == [('changed', 'monster_bat'), ('added', 'monster_newbie')]
+    assert report.changes[0].names == {'Normal': ('동굴 박쥐', '큰 박쥐')}
+    assert store.monster('monster_bat_normal')['name'] == '큰 박쥐'
+    assert store.monster('monster_bat_normal')['filename'] == 'monster_bat_normal.png'
+    assert report.exported
+
+    doc.write_text(text, encoding='utf-8')
+    report = importer.sync(prune=True)
+    assert ('removed', 'monster_newbie') in [(c.kind, c.species_id) for c in report.changes]
+    assert 'monster_newbie' not in store
@@ -0,0 +1,43 @@
+"""
+플레이어 집단 시뮬레이터 검증 테스트
+"""
+
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from population_simulator import PopulationConfig, simulate_population
+from result_cache import RESULT_CACHE
+
+
+@pytest.fixture(autouse=True)
+def _temp_result_cache(tmp_path, monkeypatch):
+    """개발자의 .cache 대신 임시 캐시 (워커 프로세스는 환경 변수로 같은 곳)"""
+    monkeypatch.setenv('DESKWARRIOR_CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(RESULT_CACHE, 'path', tmp_path / 'sim_results.sqlite')
+    RESULT_CACHE.close()
+    yield
+    RESULT_CACHE.close()
+
+
+def test_population_independent_of_workers():
+    """워커 수/배치 크기와 무관하게 같은 집계"""
+    config = PopulationConfig(players=3000, days=7, batch=1000, runs=2000, start_crystals=300, seed=4)
+    a = simulate_population(config, workers=1)
+    b = simulate_population(replace(config, batch=700), workers=2)
+    assert a.players == b.players == 3000
+    assert np.array_equal(a.stage_counts, b.stage_counts)
+    assert a.income.count == b.income.count
+    assert abs(a.income.moments.mean - b.income.moments.mean) < 1e-9 * max(1.0, a.income.moments.mean)
+
+
+def test_boss_pass_rate_grows_with_days():
+    """체크포인트가 늦을수록 보스 통과 비율이 줄지 않음"""
+    config = PopulationConfig(players=2000, days=14, batch=500, runs=2000, start_crystals=300, seed=1)
+    stats = simulate_population(config, workers=1)
+    first, last = stats.past_boss(0), stats.past_boss(-1)
+    assert last
+    for boss, rate in first.items():
+        assert last.get(boss, 0.0) >= rate
+    assert stats.first_purchase.count + stats.never_purchased == stats.players
@@ -0,0 +1,48 @@
+"""
+프레스티지 루프 시뮬레이터 검증 테스트
+"""
+
+import numpy as np
+
+from prestige_simulator import PrestigeSimulator, _fast_forward, pity_chain
+
+
+def test_pity_chain_matches_sampling():
+    """피티 체인 기대 드롭 = 몬테카를로 평균"""
+    chances = np.array([0.3, 0.3, 0.3, 0.3, 0.3])
+    amounts = np.array([5.0, 6.0, 7.0, 8.0, 9.0])
+    P, r = pity_chain(chances, amounts, pity=3)
+    assert np.allclose(P.sum(axis=1), 1)
+
+    rng = np.random.default_rng(1)
+    total = 0.0
+    for _ in range(40000):
+        counter = 0
+        for p, a in zip(chances, amounts):
+            counter += 1
+            if counter >= 3 or rng.random() < p:
+                total += a
+                counter = 0
+    assert abs(total / 40000 - r[0]) < 0.1
+
+
+def test_fast_forward_equals_stepping():
+    """정상 상태 빨리 감기 = 런 단위 반복"""
+    P, r = pity_chain(np.full(4, 0.5), np.full(4, 10.0), pity=10)
+    dist = np.eye(10)[0]
+    n, total, _ = _fast_forward(dist, P, r, 2.0, need=5000.0, limit=100000)
+
+    step_total, step_n = 0.0, 0
+    while step_total < 5000.0:
+        step_total += dist @ r + 2.0
+        dist = dist @ P
+        step_n += 1
+    assert n == step_n
+    assert abs(total - step_total) < 1e-6 * step_total
+
+
+def test_expected_loop_progresses():
+    """크리스탈 보유 시 구매 후 스테이지 단조 증가"""
+    result = PrestigeSimulator(cps=8).simulate(500, crystals=200)
+    assert result.purchases[-1] > 0
+    assert np.all(np.diff(result.max_stage) >= 0)
@@ -0,0 +1,109 @@
+"""
+대시보드 구간 계측 / cProfile 캡처 검증 테스트
+"""
+
+from profiler import Profiler
+
+
+def test_ring_buffer_percentiles_and_slot_args():
+    ticks = iter(range(0, 10_000, 1))
+    profiler = Profiler(ring_size=4, clock=lambda: next(ticks) / 1000.0)
+
+    class Tab:
+        @profiler.instrument()
+        def _update_graph(self):
+            return 'drawn'
+
+    tab = Tab()
+    assert tab._update_graph(7) == 'drawn'          # valueChanged 값은 버려짐
+    for _ in range(9):
+        tab._update_graph()
+
+    stats = profiler.stats('Tab._update_graph')
+    assert stats.count == 10 and len(profiler.samples['Tab._update_graph']) == 4
+    assert all(abs(v - 1.0) < 1e-9 for v in (stats.p50, stats.p95, stats.last))   # 진입~종료 1 tick = 1ms
+
+    with profiler.measure('export'):
+        pass
+    assert {r.name for r in profiler.rows()} == {'Tab._update_graph', 'export'}
+
+
+def _leaf(n):
+    return sum(i * i for i in range(n))
+
+
+def _compute():
+    return _leaf(20000) + _leaf(20000)
+
+
+def test_capture_next_interaction_to_collapsed_stacks(tmp_path):
+    profiler = Profiler()
+    captured = []
+    profiler.on_capture = captured.append
+
+    with profiler.measure('before'):
+        _compute()
+    profiler.arm_capture(tmp_path / 'next')
+    assert profiler.capturing
+    with profiler.measure('outer'):
+        with profiler.measure('inner'):
+            _compute()
+    assert not profiler.capturing
+    with profiler.measure('after'):
+        _compute()
+
+    assert captured == [tmp_path / 'next.collapsed']
+    assert (tmp_path / 'next.prof').exists()
+    lines = captured[0].read_text(encoding='utf-8').splitlines()
+    stacks = dict(line.rsplit(' ', 1) for line in lines)
+    leaf_stacks = [s for s in stacks if '_leaf (' in s]
+    assert leaf_stacks and all(s.index('_compute (') < s.index('_leaf (') for s in leaf_stacks)
+    assert all(int(v) > 0 for v in stacks.values())
+
+
+def test_collapsed_stacks_on_matplotlib_savefig_is_bounded():
+    import cProfile
+    import io
+    import pstats
+    import time
+
+    import numpy as np
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    from profiler import collapsed_stacks
+
+    fig = Figure(figsize=(6, 4))
+    FigureCanvasAgg(fig)
+    for ax in fig.subplots(2, 2).ravel():
+        ax.plot(np.arange(1000), np.sqrt(np.arange(1000)), label='a')
+        ax.legend()
+    profile = cProfile.Profile()
+    profile.enable()
+    fig.savefig(io.BytesIO(), format='png')
+    profile.disable()
+    stats = pstats.Stats(profile)
+    assert len(stats.stats) > 500                       # 호출 그래프가 큰 실제 프로파일
+
+    start = time.perf_counter()
+    stacks = collapsed_stacks(stats)
+    assert time.perf_counter() - start < 5.0
+    total_tt = sum(entry[2] for entry in stats.stats.values()) * 1e6
+    assert abs(sum(stacks.values()) - total_tt) < 0.01 * total_tt + len(stats.stats)   # 자기 시간 보존
+    assert any('savefig' in s for s in stacks)
+
+
+def test_background_export_calls_back_from_worker_thread(tmp_path):
+    import threading
+
+    profiler = Profiler()
+    profiler.background_export = True
+    done = threading.Event()
+    threads = []
+    profiler.on_capture = lambda path: (threads.append(threading.current_thread()), done.set())
+
+    profiler.arm_capture(tmp_path / 'bg')
+    with profiler.measure('outer'):
+        _compute()
+    assert done.wait(10)
+    assert threads[0] is not threading.main_thread() and (tmp_path / 'bg.collapsed').exists()
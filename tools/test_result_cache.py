@@ -0,0 +1,85 @@
+"""
+시뮬레이션 결과 캐시 검증 테스트
+"""
+
+import json
+from concurrent.futures import ProcessPoolExecutor
+
+from result_cache import ResultCache
+
+
+def _read_key(args):
+    path, key = args
+    return ResultCache(path).get(key)
+
+
+def test_config_change_invalidates(tmp_path):
+    """config 내용이 바뀌면 다른 키 → 재계산"""
+    config = tmp_path / "config"
+    config.mkdir()
+    (config / "A.json").write_text(json.dumps({'x': 1}))
+    cache = ResultCache(tmp_path / "c.sqlite", config_dir=config)
+    calls = []
+
+    @cache.memoize("A.json")
+    def compute(n):
+        calls.append(n)
+        return n * 2
+
+    assert compute(3) == 6 and compute(3) == 6
+    assert calls == [3]
+    (config / "A.json").write_text(json.dumps({'x': 2}))
+    assert compute(3) == 6
+    assert calls == [3, 3]
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 2
+
+
+def test_lru_eviction_bounds_size(tmp_path):
+    """크기 상한 초과 시 가장 오래 접근하지 않은 항목부터 제거"""
+    cache = ResultCache(tmp_path / "c.sqlite", max_bytes=3000)
+    keys = [cache.make_key('f', i) for i in range(5)]
+    for i, key in enumerate(keys[:3]):
+        cache.put(key, 'f', b'x' * 900)
+    cache.get(keys[0])                      # 0번 최근 접근
+    cache.put(keys[3], 'f', b'x' * 900)     # 상한 초과 → 1번 제거
+    assert cache.get(keys[0])[0]
+    assert not cache.get(keys[1])[0]
+    assert cache.stats()['bytes'] <= 3000
+
+
+def test_concurrent_process_readers(tmp_path):
+    """여러 프로세스가 동시에 읽어도 같은 값"""
+    path = tmp_path / "c.sqlite"
+    cache = ResultCache(path)
+    key = cache.make_key('table', [10])
+    cache.put(key, 'table', list(range(1000)))
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(_read_key, [(path, key)] * 16))
+    assert all(hit and value == list(range(1000)) for hit, value in results)
+
+
+def test_code_change_invalidates(tmp_path):
+    """계산 함수의 모듈이나 그 모듈이 쓰는 프로젝트 모듈 소스가 바뀌면 다른 키 → 재계산"""
+    import importlib
+    import sys
+
+    code = tmp_path / "code"
+    code.mkdir()
+    (code / "fp_consts.py").write_text("HP_GROWTH = 1.2\n")
+    (code / "fp_sim.py").write_text("import fp_consts\n\ndef table(n):\n    CALLS.append(n)\n"
+                                    "    return n * fp_consts.HP_GROWTH\n\nCALLS = []\n")
+    sys.path.insert(0, str(code))
+    try:
+        import fp_consts
+        import fp_sim
+        cache = ResultCache(tmp_path / "c.sqlite", code_root=code)
+        assert cache.memoize()(fp_sim.table)(10) == 12.0
+        assert cache.memoize()(fp_sim.table)(10) == 12.0 and fp_sim.CALLS == [10]
+
+        (code / "fp_consts.py").write_text("HP_GROWTH = 1.3\n")      # 의존 모듈(생성 상수 등) 수정
+        importlib.reload(fp_consts)
+        assert cache.memoize()(fp_sim.table)(10) == 13.0 and fp_sim.CALLS == [10, 10]
+    finally:
+        sys.path.remove(str(code))
+        sys.modules.pop('fp_sim', None)
+        sys.modules.pop('fp_consts', None)
@@ -0,0 +1,34 @@
+"""
+난수 스트림 분할 검증 테스트
+"""
+
+import numpy as np
+
+from rng_streams import RandomStreams, categorical, normals
+
+
+def test_uniforms_independent_of_chunking():
+    """어떤 구간으로 나눠 요청해도 항목별 난수가 같음"""
+    streams = RandomStreams(11, 'test')
+    whole = streams.uniforms('players', 0, 1000, width=5)
+    parts = np.concatenate([streams.uniforms('players', s, n, width=5) for s, n in ((0, 3), (3, 400), (403, 597))])
+    assert np.array_equal(whole, parts)
+    assert whole.min() >= 0 and whole.max() < 1
+    assert not np.array_equal(whole, streams.uniforms('other', 0, 1000, width=5))
+    assert not np.array_equal(whole, RandomStreams(12, 'test').uniforms('players', 0, 1000, width=5))
+
+
+def test_keyed_generators_are_reproducible():
+    a, b = RandomStreams(5, 'x'), RandomStreams(5, 'x')
+    assert np.array_equal(a.generator('session', 3).random(8), b.generator('session', 3).random(8))
+    assert not np.array_equal(a.generator('session', 3).random(8), a.generator('session', 4).random(8))
+    assert a.python_random('monster_slime', 'Fire').random() == b.python_random('monster_slime', 'Fire').random()
+    assert [s.spawn_key for s in a.spawn(3, 'trace', start=2)] == [a.seed_sequence('trace', i).spawn_key for i in (2, 3, 4)]
+
+
+def test_uniform_transforms():
+    u = RandomStreams(1).uniforms('t', 0, 200000, width=3)
+    idx = categorical(u[:, 0], [1, 3])
+    assert abs(idx.mean() - 0.75) < 0.01
+    z = normals(u[:, 1], u[:, 2])
+    assert abs(z.mean()) < 0.01 and abs(z.std() - 1) < 0.01
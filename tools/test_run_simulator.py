@@ -0,0 +1,41 @@
+"""
+인게임 런 시뮬레이터 검증 테스트
+"""
+
+import math
+
+import numpy as np
+
+from run_simulator import RunSimulator
+import stat_formulas_generated as SF
+
+
+def _scalar_run(cps: float, attack: int) -> int:
+    """업그레이드 없는 단일 세션 (SF 공식으로 직접 계산)"""
+    stage = 1
+    damage = (1 + attack) * (1 + SF.BASE_CRIT_CHANCE * (SF.BASE_CRIT_MULTIPLIER - 1))
+    while True:
+        hp = SF.calc_boss_hp(stage) if stage % SF.BOSS_INTERVAL == 0 else SF.calc_monster_hp(stage)
+        if math.ceil(hp / damage) / cps > SF.BASE_TIME_LIMIT:
+            return stage
+        stage += 1
+
+
+def test_no_spending_matches_scalar_formulas():
+    """정책 'none' 결과 = SF 공식 스칼라 루프"""
+    sim = RunSimulator()
+    cps = np.array([2.0, 5.0, 9.0, 14.0])
+    result = sim.simulate(len(cps), cps=cps, perm_levels={'base_attack': 3}, policy='none')
+    for c, stage in zip(cps, result.max_stage):
+        assert stage == _scalar_run(c, 3)
+
+
+def test_spending_never_overdraws():
+    """구매 후 골드 음수 없음 + 지출 ≤ 획득"""
+    sim = RunSimulator()
+    result = sim.simulate(2000, cps=np.linspace(2, 15, 2000),
+                          perm_levels={'base_attack': 20, 'start_gold': 10}, policy='cheapest')
+    start_gold = 10 * sim.perm_config['stats']['start_gold']['effect_per_level']
+    assert np.all(result.gold_spent <= result.gold_earned + start_gold)
+    assert sum(lv.sum() for lv in result.levels.values()) > 0
+
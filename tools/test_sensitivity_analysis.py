@@ -0,0 +1,47 @@
+"""
+경제 모델 / 민감도 분석 검증 테스트
+"""
+
+import numpy as np
+
+from economy_model import StatTable, cumulative_costs, upgrade_costs
+from sensitivity_analysis import EconomySpace, cost_elasticities, sobol_indices
+from stat_formulas_generated import calc_upgrade_cost
+
+
+def test_vectorized_cost_matches_formula():
+    """벡터화 비용 = calc_upgrade_cost"""
+    params = np.array([[100, 0.5, 1.5, 10], [1, 0.3, 1.3, 20]], dtype=float)
+    costs = upgrade_costs(params, np.arange(1, 51))
+    for row, p in enumerate(params):
+        for lv in range(1, 51):
+            assert costs[row, lv - 1] == calc_upgrade_cost(*p, lv)
+
+
+def test_elasticities_match_finite_difference():
+    """해석적 탄력성 ≈ 중앙 차분"""
+    params = np.array([[1, 0.3, 1.3, 20, 1], [1, 1.0, 1.8, 5, 0.1]], dtype=float)
+    analytic = cost_elasticities(params, 30)
+    h = 1e-6
+    for i in range(4):
+        up, down = params.copy(), params.copy()
+        up[:, i] *= 1 + h
+        down[:, i] *= 1 - h
+        c_up = cumulative_costs(up, 30, truncate=False)
+        c_down = cumulative_costs(down, 30, truncate=False)
+        numeric = (np.log(c_up) - np.log(c_down)) / (2 * h)
+        assert np.allclose(analytic[:, i], numeric, rtol=1e-4)
+
+
+def test_sobol_ranks_effect_over_cost_for_cps():
+    """필요 CPS에는 비용 파라미터가 영향을 주지 않음"""
+    space = EconomySpace(
+        perm=StatTable.load('PermanentStatGrowth.json'),
+        ingame=StatTable.load('InGameStatGrowth.json'),
+    )
+    indices = sobol_indices(space, samples=256, workers=1)['required_cps']
+    labels = space.labels()
+    cost_st = [indices['ST'][i] for i, (_, _, p) in enumerate(labels) if p != 'effect_per_level']
+    assert max(cost_st) < 1e-9
+    top = labels[int(np.argmax(indices['ST']))]
+    assert top[2] == 'effect_per_level'
@@ -0,0 +1,107 @@
+"""
+로컬 시뮬레이션 서버 검증 테스트
+"""
+
+import json
+import shutil
+import socket
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+import economy_model
+import sim_server
+from result_cache import RESULT_CACHE
+from run_simulator import RunSimulator
+from sim_server import SimServer
+
+
+def _post(url: str, method: str, params=None) -> dict:
+    body = json.dumps({'jsonrpc': '2.0', 'id': 1, 'method': method, 'params': params}).encode('utf-8')
+    with urllib.request.urlopen(urllib.request.Request(url + '/rpc', body), timeout=60) as response:
+        return json.loads(response.read())
+
+
+def _events(url: str, job_id: str) -> list:
+    with urllib.request.urlopen(f"{url}/jobs/{job_id}/events", timeout=60) as response:
+        text = response.read().decode('utf-8')
+    return [block.split('\n')[0][len('event: '):] for block in text.split('\n\n') if block]
+
+
+def test_stage_reach_matches_simulator_and_dedups():
+    server = SimServer(port=0, executor=ThreadPoolExecutor(2))
+    url = server.start_in_thread()
+    try:
+        params = {'cps': [3, 9], 'levels': {'base_attack': 5}, 'policy': 'none'}
+        rows = _post(url, 'stage_reach', params)['result']['rows']
+        direct = RunSimulator().simulate(2, cps=np.array([3.0, 9.0]), perm_levels={'base_attack': 5}, policy='none')
+        assert [r['p50'] for r in rows] == [float(s) for s in direct.max_stage]
+
+        first = _post(url, 'submit', {'method': 'sweep', 'params': {'stat': 'base_attack', 'values': {'stop': 40}}})
+        again = _post(url, 'submit', {'method': 'sweep', 'params': {'values': {'stop': 40}, 'stat': 'base_attack'}})
+        assert again['result']['job'] == first['result']['job']
+        assert again['result']['deduplicated'] or again['result']['state'] == 'done'
+
+        events = _events(url, first['result']['job'])
+        assert events[-1] == 'result'
+        status = _post(url, 'status', {'job': first['result']['job']})['result']
+        assert status['state'] == 'done' and len(status['result']['rows']) == 41
+    finally:
+        server.stop()
+
+
+def test_cancel_and_errors():
+    server = SimServer(port=0, executor=ThreadPoolExecutor(1))
+    url = server.start_in_thread()
+    try:
+        job = _post(url, 'submit', {'method': 'sweep', 'params': {
+            'stat': 'base_attack', 'values': list(range(0, 400)), 'cps': [4, 8, 12], 'sessions': 20}})['result']
+        cancelled = _post(url, 'cancel', {'job': job['job']})['result']
+        assert cancelled['state'] == 'cancelled' and cancelled['done'] < cancelled['total']
+        assert _events(url, job['job']) == ['cancelled']
+
+        assert _post(url, 'nope')['error']['code'] == -32601
+        assert _post(url, 'stage_reach', {'cps': [-1]})['error']['code'] == -32602
+
+        # 잘못된 Content-Length 는 연결을 끊지 않고 400 + JSON-RPC 오류
+        host, port = url[len('http://'):].split(':')
+        for length in ('abc', '-5', str(sim_server.MAX_BODY + 1)):
+            with socket.create_connection((host, int(port)), timeout=10) as sock:
+                sock.sendall(f"POST /rpc HTTP/1.1\r\nContent-Length: {length}\r\n\r\n".encode('latin-1'))
+                response = sock.makefile('rb').read().decode('utf-8')
+            assert response.startswith('HTTP/1.1 400') and '-32600' in response
+
+        # CORS 는 로컬 출처만
+        def origin_status(origin):
+            request = urllib.request.Request(url + '/health', headers={'Origin': origin})
+            try:
+                with urllib.request.urlopen(request, timeout=10) as response:
+                    return response.status, response.headers['Access-Control-Allow-Origin']
+            except urllib.error.HTTPError as e:
+                return e.code, e.headers['Access-Control-Allow-Origin']
+        assert origin_status('http://localhost:5500') == (200, 'http://localhost:5500')
+        assert origin_status('null') == (200, 'null')
+        assert origin_status('https://evil.example') == (403, None)
+    finally:
+        server.stop()
+
+
+def test_worker_picks_up_saved_configs(tmp_path, monkeypatch):
+    shutil.copytree(economy_model.CONFIG_DIR, tmp_path / 'config')
+    monkeypatch.setattr(economy_model, 'CONFIG_DIR', tmp_path / 'config')
+    monkeypatch.setattr(RESULT_CACHE, 'config_dir', tmp_path / 'config')
+    monkeypatch.setattr(sim_server, '_RUN_SIM', None)
+
+    before = sim_server._simulate({'base_attack': 20}, [6.0], 1, 'none', 0.5, 0.0)
+    assert sim_server._simulate({'base_attack': 20}, [6.0], 1, 'none', 0.5, 0.0) == before
+    cached = sim_server._RUN_SIM
+
+    path = tmp_path / 'config' / 'PermanentStatGrowth.json'
+    data = json.loads(path.read_text(encoding='utf-8'))
+    data['stats']['base_attack']['effect_per_level'] *= 10          # 대시보드 저장 (서버는 계속 실행 중)
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding='utf-8')
+    after = sim_server._simulate({'base_attack': 20}, [6.0], 1, 'none', 0.5, 0.0)
+    assert sim_server._RUN_SIM is not cached
+    assert after[0]['mean'] > before[0]['mean']
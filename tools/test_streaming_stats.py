@@ -0,0 +1,42 @@
+"""
+스트리밍 통계 스케치 검증 테스트
+"""
+
+import pickle
+
+import numpy as np
+
+from streaming_stats import Histogram, Moments, Summary, TDigest, merge_all
+
+
+def test_merged_moments_match_single_pass():
+    """분할 집계 후 병합 = 한 번에 계산"""
+    x = np.random.default_rng(1).normal(50, 7, 100000)
+    merged = merge_all(Moments().update(c) for c in np.array_split(x, 13))
+    assert merged.count == len(x)
+    assert abs(merged.mean - x.mean()) < 1e-9
+    assert abs(merged.std - x.std(ddof=1)) < 1e-9
+    assert merged.min == x.min() and merged.max == x.max()
+
+
+def test_tdigest_quantiles_after_merge():
+    """워커별 t-digest 병합 후 분위수 오차 (꼬리 포함)"""
+    x = np.random.default_rng(2).lognormal(0, 1, 500000)
+    parts = [pickle.loads(pickle.dumps(TDigest().update(c))) for c in np.array_split(x, 29)]
+    digest = merge_all(parts)
+    qs = np.array([0.01, 0.1, 0.5, 0.9, 0.99])
+    ref = np.quantile(x, qs)
+    assert np.all(np.abs(digest.quantile(qs) / ref - 1) < 0.01)
+    assert len(digest.means) <= digest.compression
+
+
+def test_histogram_merge_and_summary():
+    x = np.random.default_rng(3).uniform(0, 100, 200000)
+    a, b = Histogram.linear(0, 100, 50), Histogram.linear(0, 100, 50)
+    a.update(x[:1000])
+    b.update(x[1000:])
+    hist = a.merge(b)
+    assert hist.count == len(x)
+    assert np.all(np.abs(hist.quantile([0.1, 0.5, 0.9]) - [10, 50, 90]) < 1.0)
+    summary = Summary().update(x)
+    assert set(summary.to_dict()) >= {'count', 'mean', 'p10', 'p50', 'p90'}
@@ -0,0 +1,26 @@
+"""
+클릭 기록 재생 검증 테스트
+"""
+
+import numpy as np
+
+from cps_engine import ClickTrace
+from trace_replay import replay, synthesize_traces
+
+
+def test_replay_independent_of_chunking():
+    """청크 크기/워커 수와 무관하게 같은 결과"""
+    traces = synthesize_traces(40, cps=8, duration=120, seed=2)
+    perm = {'base_attack': 20, 'start_gold': 5}
+    a = replay(traces, perm, workers=1, chunk=7, seed=9)
+    b = replay(traces, perm, workers=2, chunk=16, seed=9)
+    assert np.array_equal(a.max_stage, b.max_stage)
+    assert np.array_equal(a.gold_earned, b.gold_earned)
+
+
+def test_rhythm_combo_beats_irregular_input():
+    """같은 CPS라도 일정한 리듬(콤보)이 더 멀리 진행"""
+    steady = ClickTrace.from_intervals(np.full(2400, 0.125))
+    irregular = ClickTrace.from_intervals(np.tile([0.1, 0.15], 1200))
+    result = replay([steady, irregular], {'base_attack': 10}, workers=1)
+    assert result.max_stage[0] > result.max_stage[1]
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DeskWarrior 클릭 기록 재생 시뮬레이터
+- CpsMeasureTab 기록(.dwct) 또는 합성 기록을 클릭 단위로 재생
+- 클릭마다 DamageCalculator와 동일한 파이프라인: 파워+base_attack → ×공격력% → 크리 → 멀티히트 → 콤보
+- 콤보 스택은 실제 입력 리듬으로 계산 (cps_engine.combo_stacks = ComboTracker)
+- 몬스터별 제한시간 창 안의 클릭을 배열 단위로 누적해 처치 시점 계산
+- 처치 골드로 run_simulator 소비 정책에 따라 인게임 업그레이드
+- 여러 기록을 프로세스 풀에서 청크 단위로 병렬 처리
+
+사용법:
+    python tools/trace_replay.py --synth 2000 --cps 7 --workers 4
+    python tools/trace_replay.py traces/*.dwct
+"""
+
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from cps_engine import SOURCE_KEYBOARD, ClickTrace, combo_stacks
+from economy_model import is_boss_stage, load_json, stage_hp
+from rng_streams import RandomStreams
+from run_simulator import MAX_STAGE, POLICIES, RunBatch, RunSimulator, build_effects
+import stat_formulas_generated as SF
+
+DEFAULT_CHUNK = 128
+
+
+# ============================================================
+# 합성 기록
+# ============================================================
+
+def synthesize_traces(count: int, cps: float = 6.0, cps_spread: float = 1.5, jitter: float = 0.15,
+                      fatigue: float = 0.1, duration: float = 600.0, seed: int = 0) -> List[ClickTrace]:
+    """
+    사람 입력을 흉내낸 클릭 기록 생성
+    cps_spread: 플레이어 간 평균 CPS 표준편차
+    jitter: 입력 간격 변동계수 (리듬 흔들림)
+    fatigue: 기록 끝까지의 속도 감소율 (0.1 = 10% 느려짐)
+    """
+    seeds = RandomStreams(seed, 'synthesize_traces').spawn(count)
+    traces = []
+    for ss in seeds:
+        rng = np.random.default_rng(ss)
+        player_cps = max(0.5, rng.normal(cps, cps_spread))
+        n = int(player_cps * duration * 1.2) + 1
+        shape = 1 / max(jitter, 1e-3) ** 2
+        base = rng.gamma(shape, 1 / (shape * player_cps), size=n)
+        slow = 1 + fatigue * np.minimum(np.cumsum(base) / duration, 1.0)
+        intervals = base * slow
+        keep = np.searchsorted(np.cumsum(intervals), duration)
+        sources = (rng.random(keep + 1) < 0.5).astype(np.uint8)
+        traces.append(ClickTrace.from_intervals(intervals[:keep], sources))
+    return traces
+
+
+def tile_trace(trace: ClickTrace, duration: float) -> ClickTrace:
+    """짧은 측정 기록을 duration초 길이가 되도록 반복 (기록 사이 간격은 평균 간격)"""
+    intervals = trace.intervals()
+    if not len(intervals):
+        return trace
+    gap = np.array([intervals.mean()])
+    cycle = np.concatenate([intervals, gap])
+    repeats = int(np.ceil(duration / cycle.sum()))
+    tiled = np.tile(cycle, repeats)
+    keep = int(np.searchsorted(np.cumsum(tiled), duration))
+    return ClickTrace.from_intervals(tiled[:keep], np.tile(trace.sources, repeats + 1)[:keep + 1])
+
+
+# ============================================================
+# 결과
+# ============================================================
+
+@dataclass
+class ReplayResult:
+    """기록별 결과 배열"""
+    max_stage: np.ndarray       # 실패한 스테이지
+    kills: np.ndarray
+    bosses: np.ndarray
+    clicks_used: np.ndarray     # 게임 오버까지 사용한 클릭 수
+    seconds: np.ndarray         # 게임 오버 시각 (기록 시작 기준)
+    gold_earned: np.ndarray
+    levels: Dict[str, np.ndarray]
+
+    def __len__(self) -> int:
+        return len(self.max_stage)
+
+    @classmethod
+    def concat(cls, parts: Sequence['ReplayResult']) -> 'ReplayResult':
+        cat = lambda key: np.concatenate([getattr(p, key) for p in parts])
+        return cls(
+            max_stage=cat('max_stage'), kills=cat('kills'), bosses=cat('bosses'),
+            clicks_used=cat('clicks_used'), seconds=cat('seconds'), gold_earned=cat('gold_earned'),
+            levels={k: np.concatenate([p.levels[k] for p in parts]) for k in parts[0].levels},
+        )
+
+
+# ============================================================
+# 재생
+# ============================================================
+
+def _click_multipliers(trace: ClickTrace, eff: Dict[str, float], tolerance: float,
+                       rng: np.random.Generator) -> np.ndarray:
+    """클릭별 파워 이후 배율: ×공격력% × 크리 × 멀티히트 × 콤보 (DamageCalculator 순서)"""
+    n = len(trace)
+    crit_chance = SF.BASE_CRIT_CHANCE + eff.get('crit_chance', 0) / 100
+    crit_multi = SF.BASE_CRIT_MULTIPLIER + eff.get('crit_damage', 0)
+    multi_hit = eff.get('multi_hit', 0) / 100
+    combo_damage = eff.get('start_combo_damage', 0) / 100
+
+    stacks = np.concatenate([[0], combo_stacks(trace.intervals(), tolerance)])
+    m = np.full(n, 1 + eff.get('attack_percent', 0) / 100)
+    m *= np.where(rng.random(n) < crit_chance, crit_multi, 1.0)
+    m *= np.where(rng.random(n) < multi_hit, 2.0, 1.0)
+    m *= np.where(stacks > 0, (1 + combo_damage) * np.power(2.0, stacks), 1.0)
+    return m
+
+
+def _replay_chunk(traces: Sequence[ClickTrace], seeds: Sequence[np.random.SeedSequence],
+                  perm_levels: Dict[str, int], policy: str, max_stage: int,
+                  run_sim: Optional[RunSimulator] = None) -> ReplayResult:
+    """기록 묶음을 몬스터 단위로 동시에 진행"""
+    sim = run_sim or RunSimulator()
+    eff = {k: float(v) for k, v in build_effects(perm_levels, sim.perm_config).items()}
+    n = len(traces)
+    length = max(len(t) for t in traces)
+    tolerance = SF.calc_combo_tolerance(eff.get('start_combo_flex', 0))
+
+    # (N, L) 패딩 배열: 시각 / 입력 장치 / 파워 이후 배율
+    times = np.full((n, length + 1), np.inf)
+    source = np.zeros((n, length + 1), dtype=np.uint8)
+    multi = np.zeros((n, length + 1))
+    for i, (trace, ss) in enumerate(zip(traces, seeds)):
+        k = len(trace)
+        times[i, :k] = trace.seconds()
+        source[i, :k] = trace.sources
+        multi[i, :k] = _click_multipliers(trace, eff, tolerance, np.random.default_rng(ss))
+    lengths = np.array([len(t) for t in traces])
+
+    base_time = SF.BASE_TIME_LIMIT + eff.get('time_extend', 0)
+    # 제한시간 창 안에 들어올 수 있는 최대 클릭 수 (창 너비)
+    window = 1
+    for i in range(n):
+        t = times[i, :lengths[i]]
+        if len(t):
+            window = max(window, int((np.searchsorted(t, t + base_time * 2, side='right') - np.arange(len(t))).max()))
+    offsets = np.arange(window)
+
+    n_stats = len(sim.table)
+    levels = np.zeros((n, n_stats), dtype=np.int64)
+    for stat_id, perm_id in (('keyboard_power', 'start_keyboard'), ('mouse_power', 'start_mouse')):
+        if stat_id in sim.table.ids:
+            levels[:, sim.table.index(stat_id)] = int(eff.get(perm_id, 0))
+    batch = RunBatch(
+        stat_ids=list(sim.table.ids),
+        effect_per_level=sim.table.params[:, 4].copy(),
+        keyboard_ratio=np.array([float(np.mean(t.sources == SOURCE_KEYBOARD)) if len(t) else 0.5 for t in traces]),
+        stage=np.full(n, 1 + int(eff.get('start_level', 0)), dtype=np.int64),
+        gold=np.full(n, float(int(eff.get('start_gold', 0)))),
+        levels=levels,
+        alive=lengths > 0,
+        elapsed=np.zeros(n),
+        kills=np.zeros(n, dtype=np.int64),
+        bosses=np.zeros(n, dtype=np.int64),
+        gold_earned=np.zeros(n),
+        gold_spent=np.zeros(n),
+    )
+    discount = np.full(n, eff.get('upgrade_discount', 0))
+    spend_policy = POLICIES[policy] if isinstance(policy, str) else policy
+
+    pos = np.zeros(n, dtype=np.int64)            # 다음 몬스터의 첫 클릭
+    spawn = np.zeros(n)                          # 몬스터 등장 시각
+    timer = np.full(n, base_time)
+    max_reached = np.zeros(n, dtype=np.int64)
+    end_seconds = np.zeros(n)
+    base_attack = eff.get('base_attack', 0)
+
+    while batch.alive.any():
+        idx = np.flatnonzero(batch.alive)
+        lv = batch.levels[idx]
+        kb = 1 + sim.ingame_effect(lv, 'keyboard_power') + base_attack
+        ms = 1 + sim.ingame_effect(lv, 'mouse_power') + base_attack
+
+        # 제한시간 창 안의 클릭 누적 데미지 (클릭마다 int 절삭)
+        cols = np.minimum(pos[idx, None] + offsets[None, :], length)
+        t = times[idx[:, None], cols]
+        in_time = t <= (spawn[idx] + timer[idx])[:, None]
+        power = np.where(source[idx[:, None], cols] == SOURCE_KEYBOARD, kb[:, None], ms[:, None])
+        damage = np.where(in_time, np.trunc(power * multi[idx[:, None], cols]), 0.0)
+        cum = np.cumsum(damage, axis=1)
+        hp = stage_hp(batch.stage[idx])
+        dead = cum >= hp[:, None]
+        killed = dead.any(axis=1) & (batch.stage[idx] < max_stage)
+
+        failed = idx[~killed]
+        batch.alive[failed] = False
+        max_reached[failed] = batch.stage[failed]
+        end_seconds[failed] = spawn[failed] + timer[failed]  # 입력이 끊겨도 타이머는 흐름
+        won = idx[killed]
+        if not len(won):
+            continue
+
+        kill_click = pos[won] + np.argmax(dead[killed], axis=1)
+        stage = batch.stage[won]
+        won_lv = batch.levels[won]
+        base_gold = np.trunc(stage * SF.BASE_GOLD_MULTI)
+        gold = np.trunc(
+            (base_gold + sim.ingame_effect(won_lv, 'gold_flat') + eff.get('gold_flat_perm', 0))
+            * (1 + sim.ingame_effect(won_lv, 'gold_multi') / 100 + eff.get('gold_multi_perm', 0) / 100)
+        )
+        batch.gold[won] += gold
+        batch.gold_earned[won] += gold
+        batch.kills[won] += 1
+        batch.bosses[won] += is_boss_stage(stage)
+        batch.stage[won] += 1
+        spawn[won] = times[won, kill_click]
+        pos[won] = kill_click + 1
+        thief = sim.ingame_effect(won_lv, 'time_thief')
+        timer[won] = np.minimum(base_time + thief, base_time * 2)
+        sim.spend(batch, won, spend_policy, discount)
+
+    return ReplayResult(
+        max_stage=max_reached,
+        kills=batch.kills,
+        bosses=batch.bosses,
+        clicks_used=np.minimum(pos, lengths),
+        seconds=end_seconds,
+        gold_earned=batch.gold_earned,
+        levels={sid: batch.levels[:, i].copy() for i, sid in enumerate(batch.stat_ids)},
+    )
+
+
+def _replay_task(args) -> ReplayResult:
+    return _replay_chunk(*args)
+
+
+def replay(traces: Sequence[ClickTrace], perm_levels: Optional[Dict[str, int]] = None,
+           policy: str = 'efficient', seed: int = 0, workers: int = 0,
+           chunk: int = DEFAULT_CHUNK, max_stage: int = MAX_STAGE) -> ReplayResult:
+    """
+    클릭 기록들을 재생해 기록별 도달 스테이지 계산
+    크리/멀티히트 난수는 기록 번호별 스트림에서 생성 (workers/chunk와 무관하게 동일 결과)
+    workers: 0 = CPU 수, 1 = 현재 프로세스
+    """
+    perm_levels = perm_levels or {}
+    seeds = RandomStreams(seed, 'replay').spawn(len(traces))
+    tasks = [
+        (traces[i:i + chunk], seeds[i:i + chunk], perm_levels, policy, max_stage)
+        for i in range(0, len(traces), chunk)
+    ]
+    if workers == 1 or len(tasks) <= 1:
+        sim = RunSimulator()
+        parts = [_replay_chunk(*task, run_sim=sim) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers or None) as pool:
+            parts = list(pool.map(_replay_task, tasks))
+    return ReplayResult.concat(parts)
+
+
+# ============================================================
+# 메인
+# ============================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="DeskWarrior 클릭 기록 재생 시뮬레이터")
+    parser.add_argument('traces', nargs='*', type=Path, help=".dwct 기록 파일")
+    parser.add_argument('--synth', type=int, default=0, help="합성 기록 수")
+    parser.add_argument('--cps', type=float, default=6.0, help="합성 기록 평균 CPS")
+    parser.add_argument('--duration', type=float, default=600.0, help="합성 기록 길이 (초)")
+    parser.add_argument('--policy', choices=sorted(POLICIES), default='efficient')
+    parser.add_argument('--levels', choices=['none', 'player'], default='player')
+    parser.add_argument('--workers', type=int, default=0)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    traces = [ClickTrace.load(p) for p in args.traces]
+    if args.synth:
+        traces += synthesize_traces(args.synth, cps=args.cps, duration=args.duration, seed=args.seed)
+    if not traces:
+        parser.error("기록 파일 또는 --synth 개수를 지정하세요")
+
+    perm_levels = load_json('PlayerLevels.json').get('permanent_levels', {}) if args.levels == 'player' else {}
+    started = time.perf_counter()
+    result = replay(traces, perm_levels, policy=args.policy, seed=args.seed, workers=args.workers)
+    elapsed = time.perf_counter() - started
+
+    print(f"\n{'='*60}")
+    print(f" 클릭 기록 재생 ({len(result):,}개 기록, {elapsed:.2f}초)")
+    print(f"{'='*60}")
+    if len(traces) <= 20:
+        for i, trace in enumerate(traces):
+            name = args.traces[i].name if i < len(args.traces) else f"synth#{i - len(args.traces)}"
+            print(f" {name:<24} 스테이지 {result.max_stage[i]:>4}  처치 {result.kills[i]:>4}  "
+                  f"클릭 {result.clicks_used[i]:>6,}/{len(trace):,}")
+    else:
+        for p in (10, 25, 50, 75, 90):
+            print(f" p{p:<3} 스테이지 {np.percentile(result.max_stage, p):>6.0f}")
+        stages, counts = np.unique(result.max_stage, return_counts=True)
+        print("\n 도달 스테이지 분포")
+        for s, c in zip(stages, counts):
+            print(f"  {s:>5} | {'█' * max(1, int(c / counts.max() * 40))} {c}")
+
+
+if __name__ == '__main__':
+    main()
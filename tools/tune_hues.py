@@ -1,6 +1,8 @@
-
+import argparse
 import json
-import random
+import os
+
+from rng_streams import RandomStreams
 
 DB_FILE = os.path.join(os.path.dirname(__file__), "monster_db.json")
 
@@ -21,6 +23,13 @@ SPECIES_TWEAKS = {
 }
 
 def main():
+    parser = argparse.ArgumentParser(description="Tune monster variation hues")
+    parser.add_argument('--seed', type=int, default=0, help="jitter seed (same seed = same hues)")
+    args = parser.parse_args()
+
+    # One stream per (species, attribute): adding monsters never reshuffles existing hues
+    streams = RandomStreams(args.seed, 'tune_hues')
+
     with open(DB_FILE, 'r', encoding='utf-8') as f:
         data = json.load(f)
 
@@ -42,8 +51,8 @@ def main():
                 if species_id in SPECIES_TWEAKS and attr in SPECIES_TWEAKS[species_id]:
                     final_hue = SPECIES_TWEAKS[species_id][attr]
                 else:
-                    # 2. Add random jitter (-10 to +10) for natural variety
-                    jitter = random.randint(-5, 5) 
+                    # 2. Add random jitter (-5 to +5) for natural variety
+                    jitter = streams.python_random(species_id, attr).randint(-5, 5)
                     final_hue = base_hue + jitter
                     
                     # Wrap around 360
@@ -54,7 +63,7 @@ def main():
     with open(DB_FILE, 'w', encoding='utf-8') as f:
         json.dump(data, f, indent=4, ensure_ascii=False)
         
-    print(f"Tuned hues with natural variety in {DB_FILE}")
+    print(f"Tuned hues with natural variety in {DB_FILE} (seed {args.seed})")
 
 if __name__ == "__main__":
     main()
@@ -1,31 +1,24 @@
 
-import json
 import os
 
-DB_FILE = os.path.join(os.path.dirname(__file__), "monster_db.json")
+from monster_store import MonsterStore
 
-def main():
-    with open(DB_FILE, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-
-    for entry in data:
-        base_file = entry['base_file']
-        # monster_slimeA.png -> monster_slime
-        base_name_no_ext = os.path.splitext(base_file)[0]
-        if base_name_no_ext.endswith('A'):
-            core_name = base_name_no_ext[:-1]
-        else:
-            core_name = base_name_no_ext
+def explicit_filename(species_id, base_file, var):
+    # monster_slimeA.png -> monster_slime
+    base_name_no_ext = os.path.splitext(base_file)[0]
+    if base_name_no_ext.endswith('A'):
+        core_name = base_name_no_ext[:-1]
+    else:
+        core_name = base_name_no_ext
+    # Explicitly define the filename
+    return f"{core_name}{var['suffix']}.png"
 
-        for var in entry['variations']:
-            suffix = var['suffix']
-            # Explicitly define the filename
-            var['filename'] = f"{core_name}{suffix}.png"
+def main():
+    with MonsterStore() as store:
+        changed = store.rename_files(explicit_filename)
+        store.export_json()
 
-    with open(DB_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
-    
-    print(f"Updated {DB_FILE} with explicit filenames.")
+    print(f"Updated {changed} filenames in {store.json_path} (explicit filenames).")
 
 if __name__ == "__main__":
     main()